@@ -4,26 +4,36 @@ import ctypes
 import gc
 import functools
 import gzip
+import csv
 import hashlib
 import io
 import json
 import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import shutil
 import tarfile
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Callable, Iterator
+from typing import IO, Any, Callable, Iterator
 from uuid import UUID
 
 from django.conf import settings
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import Q
 from django.utils import timezone
 
-from catalog.models import Track
-from catalog.services.identity import IdentityResolver
+from catalog.models import Track, TrackExternalIdentifier
 from mlcore.models import (
+    CanonicalItem,
     ListenBrainzEventLedger,
     ListenBrainzSessionTrack,
     SourceIngestionRun,
@@ -41,7 +51,11 @@ LISTENBRAINZ_SOURCE_ID = 'listenbrainz'
 DEFAULT_BATCH_SIZE = 500
 DEFAULT_SESSION_WINDOW_SECONDS = 30 * 60
 DEFAULT_RESOLUTION_CACHE_MAX_SIZE = 50_000
+LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE = 'mlcore_listenbrainz_ledger_batch'
 DEFAULT_MEMORY_TRIM_EVERY_ROWS = 100_000
+DEFAULT_PIPELINE_DEPTH = 2
+DEFAULT_MEMBER_WORKERS = 1
+PIPELINE_PUT_POLL_SECONDS = 0.1
 PROGRESS_REPORT_EVERY_ROWS = 100_000
 PROGRESS_REPORT_EVERY_SECONDS = 30
 SUPPORTED_JSON_LINE_SUFFIXES = ('.jsonl', '.ndjson', '.json', '.listens')
@@ -97,6 +111,38 @@ class ResumeCheckpoint:
     canonicalized_row_count: int
     unresolved_row_count: int
     malformed_row_count: int
+    # Uncompressed byte offset of line_number within origin, and for tar
+    # dumps the header offset of the origin member in the tar stream. None
+    # for checkpoints written before offsets were recorded.
+    line_offset: int | None = None
+    member_offset: int | None = None
+
+
+@dataclass
+class PayloadCursor:
+    """Byte position of the payload most recently yielded by _iter_listen_payloads()."""
+
+    line_offset: int = 0
+    member_offset: int | None = None
+
+
+@dataclass(frozen=True)
+class ParsedListenBatch:
+    """Parsed listens plus the parse-side counts and position of its last payload."""
+
+    parsed: list[ParsedListen]
+    source_row_count: int
+    malformed_row_count: int
+    duplicate_row_count: int
+    end_origin: str
+    end_line_number: int
+    end_entry_index: int
+    end_line_offset: int | None
+    end_member_offset: int | None
+    is_last: bool = False
+    # Messages for malformed rows, kept when the malformed limit is checked by
+    # the consumer rather than where the batch was parsed.
+    malformed_errors: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -323,7 +369,7 @@ def _ingest_dump(
     progress_callback: Callable[[dict[str, Any]], None] | None,
     resume_checkpoint: ResumeCheckpoint | None,
 ) -> dict[str, int]:
-    resolve_track_juke_id = _build_track_resolver(
+    track_resolver = _build_track_resolver(
         maxsize=getattr(
             settings,
             'MLCORE_LISTENBRAINZ_RESOLUTION_CACHE_MAX_SIZE',
@@ -332,11 +378,7 @@ def _ingest_dump(
     )
     counts = _counts_from_resume_checkpoint(resume_checkpoint)
     max_malformed = getattr(settings, 'MLCORE_LISTENBRAINZ_MAX_MALFORMED_ROWS', 0)
-    parsed_batch: list[ParsedListen] = []
-    seen_in_batch: set[bytes] = set()
-    last_origin = dump_path.name
-    last_line_number = 0
-    last_entry_index = 0
+    pipeline_depth = max(0, int(getattr(settings, 'MLCORE_LISTENBRAINZ_PIPELINE_DEPTH', DEFAULT_PIPELINE_DEPTH)))
     last_reported_source_rows = counts['source_row_count']
     last_reported_at = time.monotonic()
     last_trimmed_source_rows = counts['source_row_count']
@@ -354,122 +396,381 @@ def _ingest_dump(
             resume_checkpoint.unresolved_row_count,
             resume_checkpoint.malformed_row_count,
         )
-        last_origin = resume_checkpoint.origin
-        last_line_number = resume_checkpoint.line_number
-        last_entry_index = resume_checkpoint.entry_index
 
-    for payload, error, origin, line_number, entry_index in _iter_listen_payloads(
+    member_workers = max(1, int(getattr(settings, 'MLCORE_LISTENBRAINZ_MEMBER_WORKERS', DEFAULT_MEMBER_WORKERS)))
+    member_pool: ProcessPoolExecutor | None = None
+    if member_workers > 1 and _is_tar_archive(dump_path):
+        member_pool = _start_member_worker_pool(member_workers)
+        batch_source = functools.partial(
+            _iter_parallel_member_listen_batches,
+            workers=member_workers,
+            executor=member_pool,
+        )
+    else:
+        batch_source = _iter_parsed_listen_batches
+    batches = functools.partial(
+        batch_source,
         dump_path,
-        resume_after=resume_checkpoint,
-    ):
-        last_origin = origin
-        last_line_number = line_number
-        last_entry_index = entry_index
-        if error:
-            counts['malformed_row_count'] += 1
-            if counts['malformed_row_count'] > max_malformed:
-                raise ValueError(error)
+        resume_checkpoint=resume_checkpoint,
+        batch_size=batch_size,
+        malformed_row_count=counts['malformed_row_count'],
+        max_malformed=max_malformed,
+    )
+    batch_iter = (
+        _iter_pipelined_listen_batches(batches, depth=pipeline_depth)
+        if pipeline_depth > 0
+        else batches()
+    )
+
+    # Batches arrive in dump order whether they were parsed inline or by the
+    # producer thread, so each flush commits the counts and checkpoint of
+    # exactly the rows up to its last payload.
+    try:
+        for batch in batch_iter:
+            counts['source_row_count'] += batch.source_row_count
+            counts['malformed_row_count'] += batch.malformed_row_count
+            counts['duplicate_row_count'] += batch.duplicate_row_count
+            if not batch.parsed:
+                continue
+            _flush_batch(
+                run,
+                source_version=source_version,
+                parsed_batch=batch.parsed,
+                counts=counts,
+                track_resolver=track_resolver,
+                batch_end_origin=batch.end_origin,
+                batch_end_line_number=batch.end_line_number,
+                batch_end_entry_index=batch.end_entry_index,
+                batch_end_line_offset=batch.end_line_offset,
+                batch_end_member_offset=batch.end_member_offset,
+            )
+            last_trimmed_source_rows = _maybe_release_memory(
+                counts=counts,
+                last_trimmed_source_rows=last_trimmed_source_rows,
+                force=batch.is_last,
+            )
             last_reported_source_rows, last_reported_at = _maybe_report_progress(
                 run,
                 counts=counts,
                 batch_size=batch_size,
-                last_origin=last_origin,
-                last_line_number=last_line_number,
-                last_entry_index=last_entry_index,
+                last_origin=batch.end_origin,
+                last_line_number=batch.end_line_number,
+                last_entry_index=batch.end_entry_index,
                 progress_callback=progress_callback,
                 last_reported_source_rows=last_reported_source_rows,
                 last_reported_at=last_reported_at,
+                force=batch.is_last,
             )
+    finally:
+        # Stop the producer thread before the pool it submits to goes away.
+        batch_iter.close()
+        if member_pool is not None:
+            member_pool.shutdown(wait=True, cancel_futures=True)
+
+    if counts['source_row_count'] == 0 and resume_checkpoint is None:
+        raise ValueError(f'No listen events found in {dump_path}')
+
+    return counts
+
+
+def _iter_parsed_listen_batches(
+    dump_path: Path,
+    *,
+    resume_checkpoint: ResumeCheckpoint | None,
+    batch_size: int,
+    malformed_row_count: int,
+    max_malformed: int,
+) -> Iterator[ParsedListenBatch]:
+    payload_cursor = PayloadCursor()
+    position: tuple[str, int, int, int | None, int | None] = (dump_path.name, 0, 0, None, None)
+    if resume_checkpoint is not None:
+        position = (
+            resume_checkpoint.origin,
+            resume_checkpoint.line_number,
+            resume_checkpoint.entry_index,
+            resume_checkpoint.line_offset,
+            resume_checkpoint.member_offset,
+        )
+    yield from _batch_listen_payloads(
+        _iter_listen_payloads(dump_path, resume_after=resume_checkpoint, cursor=payload_cursor),
+        cursor=payload_cursor,
+        position=position,
+        batch_size=batch_size,
+        malformed_row_count=malformed_row_count,
+        max_malformed=max_malformed,
+    )
+
+
+def _batch_listen_payloads(
+    payloads: Iterator[tuple[dict[str, Any] | None, str | None, str, int, int]],
+    *,
+    cursor: PayloadCursor,
+    position: tuple[str, int, int, int | None, int | None],
+    batch_size: int,
+    malformed_row_count: int = 0,
+    max_malformed: int | None = None,
+) -> Iterator[ParsedListenBatch]:
+    """
+    Group parsed payloads into batches of at most batch_size unique events.
+    With max_malformed=None malformed rows are recorded on their batch
+    instead of raising, for callers that only know the running total later.
+    """
+    parsed_batch: list[ParsedListen] = []
+    seen_in_batch: set[bytes] = set()
+    malformed_errors: list[str] = []
+    source_rows = malformed_rows = duplicate_rows = 0
+
+    def take_batch(*, is_last: bool = False) -> ParsedListenBatch:
+        nonlocal parsed_batch, malformed_errors, source_rows, malformed_rows, duplicate_rows
+        batch = ParsedListenBatch(
+            parsed=parsed_batch,
+            source_row_count=source_rows,
+            malformed_row_count=malformed_rows,
+            duplicate_row_count=duplicate_rows,
+            end_origin=position[0],
+            end_line_number=position[1],
+            end_entry_index=position[2],
+            end_line_offset=position[3],
+            end_member_offset=position[4],
+            is_last=is_last,
+            malformed_errors=tuple(malformed_errors),
+        )
+        parsed_batch = []
+        malformed_errors = []
+        seen_in_batch.clear()
+        source_rows = malformed_rows = duplicate_rows = 0
+        return batch
+
+    for payload, error, origin, line_number, entry_index in payloads:
+        position = (origin, line_number, entry_index, cursor.line_offset, cursor.member_offset)
+        if error:
+            malformed_rows += 1
+            malformed_row_count += 1
+            if max_malformed is None:
+                malformed_errors.append(error)
+            elif malformed_row_count > max_malformed:
+                raise ValueError(error)
             continue
 
-        counts['source_row_count'] += 1
+        source_rows += 1
         try:
             parsed = _parse_listen(payload)
         except ValueError as exc:
-            counts['malformed_row_count'] += 1
-            if counts['malformed_row_count'] > max_malformed:
+            malformed_rows += 1
+            malformed_row_count += 1
+            if max_malformed is None:
+                malformed_errors.append(str(exc))
+            elif malformed_row_count > max_malformed:
                 raise ValueError(str(exc)) from exc
             continue
 
         if parsed.source_event_signature in seen_in_batch:
-            counts['duplicate_row_count'] += 1
-            last_reported_source_rows, last_reported_at = _maybe_report_progress(
-                run,
-                counts=counts,
-                batch_size=batch_size,
-                last_origin=last_origin,
-                last_line_number=last_line_number,
-                last_entry_index=last_entry_index,
-                progress_callback=progress_callback,
-                last_reported_source_rows=last_reported_source_rows,
-                last_reported_at=last_reported_at,
-            )
+            duplicate_rows += 1
             continue
 
         seen_in_batch.add(parsed.source_event_signature)
         parsed_batch.append(parsed)
         if len(parsed_batch) >= batch_size:
-            _flush_batch(
-                run,
-                source_version=source_version,
-                parsed_batch=parsed_batch,
-                counts=counts,
-                resolve_track_juke_id=resolve_track_juke_id,
-                batch_end_origin=last_origin,
-                batch_end_line_number=last_line_number,
-                batch_end_entry_index=last_entry_index,
-            )
-            parsed_batch.clear()
-            seen_in_batch.clear()
-            last_trimmed_source_rows = _maybe_release_memory(
-                counts=counts,
-                last_trimmed_source_rows=last_trimmed_source_rows,
-            )
-            last_reported_source_rows, last_reported_at = _maybe_report_progress(
-                run,
-                counts=counts,
-                batch_size=batch_size,
-                last_origin=last_origin,
-                last_line_number=last_line_number,
-                last_entry_index=last_entry_index,
-                progress_callback=progress_callback,
-                last_reported_source_rows=last_reported_source_rows,
-                last_reported_at=last_reported_at,
-            )
+            yield take_batch()
 
-    if parsed_batch:
-        _flush_batch(
-            run,
-            source_version=source_version,
-            parsed_batch=parsed_batch,
-            counts=counts,
-            resolve_track_juke_id=resolve_track_juke_id,
-            batch_end_origin=last_origin,
-            batch_end_line_number=last_line_number,
-            batch_end_entry_index=last_entry_index,
-        )
-        last_trimmed_source_rows = _maybe_release_memory(
-            counts=counts,
-            last_trimmed_source_rows=last_trimmed_source_rows,
-            force=True,
+    yield take_batch(is_last=True)
+
+
+def _iter_parallel_member_listen_batches(
+    dump_path: Path,
+    *,
+    resume_checkpoint: ResumeCheckpoint | None,
+    batch_size: int,
+    malformed_row_count: int,
+    max_malformed: int,
+    workers: int,
+    executor: ProcessPoolExecutor,
+) -> Iterator[ParsedListenBatch]:
+    """
+    Parse tar members in worker processes and yield their batches in archive
+    order. The tar stream is still read once, sequentially, to spool each
+    member; workers pickle their batches to disk so only the member at the
+    head of the queue is held in memory while the rest are parsed. Each batch
+    is held back until the next one arrives, so only the archive's final batch
+    is marked last.
+    """
+    awaiting_resume_origin = resume_checkpoint is not None
+    resume_origin_found = False
+    pending: deque[Future[str]] = deque()
+    held: ParsedListenBatch | None = None
+    spool_root = Path(tempfile.mkdtemp(prefix='listenbrainz-members-', dir=dump_path.parent))
+
+    def member_batches(future: Future[str]) -> Iterator[ParsedListenBatch]:
+        nonlocal malformed_row_count, held
+        batch_path = Path(future.result())
+        try:
+            with batch_path.open('rb') as handle:
+                while True:
+                    try:
+                        batch = pickle.load(handle)
+                    except EOFError:
+                        return
+                    for error in batch.malformed_errors:
+                        malformed_row_count += 1
+                        if malformed_row_count > max_malformed:
+                            # Everything before the offending batch still
+                            # commits, as it would in a sequential parse.
+                            if held is not None:
+                                yield held
+                                held = None
+                            raise ValueError(error)
+                    if held is not None:
+                        yield held
+                    held = batch
+        finally:
+            batch_path.unlink(missing_ok=True)
+
+    try:
+        with tarfile.open(dump_path, 'r:*') as archive:
+            for member in _iter_tar_members(
+                archive,
+                start_offset=resume_checkpoint.member_offset if resume_checkpoint is not None else None,
+            ):
+                if not member.isfile() or not member.name.endswith(SUPPORTED_JSON_LINE_SUFFIXES):
+                    continue
+                if awaiting_resume_origin:
+                    if member.name != resume_checkpoint.origin:
+                        continue
+                    awaiting_resume_origin = False
+                    resume_origin_found = True
+                extracted = archive.extractfile(member)
+                if extracted is None:
+                    continue
+
+                spool_path = spool_root / f'{member.offset:012d}.listens'
+                with extracted, spool_path.open('wb') as spool_handle:
+                    shutil.copyfileobj(extracted, spool_handle, length=1024 * 1024)
+                resuming_member = resume_checkpoint is not None and member.name == resume_checkpoint.origin
+                pending.append(
+                    executor.submit(
+                        _parse_listen_member_batches,
+                        str(spool_path),
+                        origin=member.name,
+                        member_offset=member.offset,
+                        batch_size=batch_size,
+                        skip_through_line=resume_checkpoint.line_number if resuming_member else 0,
+                        skip_through_entry_index=resume_checkpoint.entry_index if resuming_member else 0,
+                        skip_to_offset=resume_checkpoint.line_offset if resuming_member else None,
+                    )
+                )
+                # Keep every worker busy with one member queued behind it,
+                # without spooling the whole archive ahead of the committer.
+                while len(pending) > workers * 2:
+                    yield from member_batches(pending.popleft())
+
+        if resume_checkpoint is not None and not resume_origin_found:
+            raise ValueError(f'Resume checkpoint origin not found in tar dump: {resume_checkpoint.origin}')
+        while pending:
+            yield from member_batches(pending.popleft())
+        if held is not None:
+            yield replace(held, is_last=True)
+    finally:
+        for future in pending:
+            future.cancel()
+        shutil.rmtree(spool_root, ignore_errors=True)
+
+
+def _start_member_worker_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Start the member parse pool on the calling thread. A fork pool launches
+    every worker on its first submit, so submitting a no-op here forks them
+    before the pipeline producer thread exists rather than from inside it.
+    """
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+    executor.submit(os.getpid).result()
+    return executor
+
+
+def _parse_listen_member_batches(
+    spool_path: str,
+    *,
+    origin: str,
+    member_offset: int,
+    batch_size: int,
+    skip_through_line: int,
+    skip_through_entry_index: int,
+    skip_to_offset: int | None,
+) -> str:
+    batch_path = f'{spool_path}.batches'
+    cursor = PayloadCursor(member_offset=member_offset)
+    with open(spool_path, 'rb') as handle, open(batch_path, 'wb') as batch_handle:
+        payloads = _iter_json_line_payloads(
+            handle,
+            origin=origin,
+            skip_through_line=skip_through_line,
+            skip_through_entry_index=skip_through_entry_index,
+            skip_to_offset=skip_to_offset,
+            cursor=cursor,
         )
-        last_reported_source_rows, last_reported_at = _maybe_report_progress(
-            run,
-            counts=counts,
+        for batch in _batch_listen_payloads(
+            payloads,
+            cursor=cursor,
+            position=(origin, 0, 0, None, member_offset),
             batch_size=batch_size,
-            last_origin=last_origin,
-            last_line_number=last_line_number,
-            last_entry_index=last_entry_index,
-            progress_callback=progress_callback,
-            last_reported_source_rows=last_reported_source_rows,
-            last_reported_at=last_reported_at,
-            force=True,
-        )
+        ):
+            # A member's last batch is not the archive's; the consumer marks that one.
+            pickle.dump(replace(batch, is_last=False), batch_handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.unlink(spool_path)
+    return batch_path
 
-    if counts['source_row_count'] == 0 and resume_checkpoint is None:
-        raise ValueError(f'No listen events found in {dump_path}')
 
-    return counts
+def _iter_pipelined_listen_batches(
+    batches: Callable[[], Iterator[ParsedListenBatch]],
+    *,
+    depth: int,
+) -> Iterator[ParsedListenBatch]:
+    """Parse batches on a producer thread, keeping at most ``depth`` ready ahead of the caller.
+
+    The caller stays the only thread touching the database. A producer
+    failure is re-raised here once every batch parsed before it has been
+    handed over, which matches where the inline loop would have raised.
+    """
+    ready: queue.Queue[Any] = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    finished = object()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                ready.put(item, timeout=PIPELINE_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = batches()
+        try:
+            for batch in iterator:
+                if not put(batch):
+                    return
+        except BaseException as exc:  # noqa: BLE001 - handed to the consuming thread
+            put(exc)
+            return
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+        put(finished)
+
+    producer = threading.Thread(target=produce, name='listenbrainz-parse', daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is finished:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
 
 
 def _flush_batch(
@@ -478,93 +779,23 @@ def _flush_batch(
     source_version: str,
     parsed_batch: list[ParsedListen],
     counts: dict[str, int],
-    resolve_track_juke_id: Callable[[dict[str, Any]], UUID | None],
+    track_resolver: _TrackResolver,
     batch_end_origin: str,
     batch_end_line_number: int,
     batch_end_entry_index: int,
+    batch_end_line_offset: int | None = None,
+    batch_end_member_offset: int | None = None,
 ) -> None:
     with transaction.atomic():
-        signatures = [parsed.source_event_signature for parsed in parsed_batch]
-        existing_signatures = set(
-            _as_binary(value)
-            for value in ListenBrainzEventLedger.objects.filter(event_signature__in=signatures).values_list(
-                'event_signature',
-                flat=True,
-            )
-        )
+        if connection.vendor == 'postgresql':
+            inserted, unresolved = _write_listen_batch_with_copy(run, parsed_batch, track_resolver=track_resolver)
+        else:
+            inserted, unresolved = _write_listen_batch_with_orm(run, parsed_batch, track_resolver=track_resolver)
 
-        new_listens = [parsed for parsed in parsed_batch if parsed.source_event_signature not in existing_signatures]
-        counts['duplicate_row_count'] += len(parsed_batch) - len(new_listens)
-        if new_listens:
-            ledger_rows: list[ListenBrainzEventLedger] = []
-            session_track_aggregates: dict[tuple[bytes, UUID], SessionTrackAggregate] = {}
-            unresolved = 0
-            resolved_payloads: list[tuple[ParsedListen, UUID | None, CanonicalItemIdentity | None]] = []
-            identity_assignments: list[tuple[CanonicalItemIdentity, UUID | None]] = []
-            for parsed in new_listens:
-                track_juke_id = resolve_track_juke_id(parsed.track_identifier_candidates)
-                identity = identity_from_listenbrainz_candidates(
-                    recording_mbid=str(parsed.recording_mbid or ''),
-                    spotify_id=str(parsed.track_identifier_candidates.get('spotify_id') or ''),
-                    recording_msid=parsed.recording_msid,
-                )
-                resolved_payloads.append((parsed, track_juke_id, identity))
-                if identity is not None:
-                    identity_assignments.append((identity, track_juke_id))
-
-            canonical_items_by_key = bulk_ensure_canonical_items(identity_assignments)
-            for parsed, track_juke_id, identity in resolved_payloads:
-                canonical_item = (
-                    canonical_items_by_key.get(identity.canonical_key)
-                    if identity is not None
-                    else None
-                )
-                if canonical_item is None:
-                    unresolved += 1
-                ledger_rows.append(
-                    ListenBrainzEventLedger(
-                        import_run=run,
-                        event_signature=parsed.source_event_signature,
-                        played_at=parsed.played_at,
-                        session_key=parsed.session_key,
-                        canonical_item=canonical_item,
-                        track_id=track_juke_id,
-                        resolution_state=1 if canonical_item is not None else 0,
-                    )
-                )
-                if canonical_item is None:
-                    continue
-
-                aggregate_key = (parsed.session_key, canonical_item.pk)
-                aggregate = session_track_aggregates.get(aggregate_key)
-                if aggregate is None:
-                    session_track_aggregates[aggregate_key] = SessionTrackAggregate(
-                        session_key=parsed.session_key,
-                        canonical_item_id=canonical_item.pk,
-                        first_played_at=parsed.played_at,
-                        last_played_at=parsed.played_at,
-                        track_juke_id=track_juke_id,
-                    )
-                    continue
-                if parsed.played_at < aggregate.first_played_at:
-                    aggregate.first_played_at = parsed.played_at
-                if parsed.played_at > aggregate.last_played_at:
-                    aggregate.last_played_at = parsed.played_at
-                if aggregate.track_juke_id is None and track_juke_id is not None:
-                    aggregate.track_juke_id = track_juke_id
-                aggregate.play_count += 1
-
-            ListenBrainzEventLedger.objects.bulk_create(ledger_rows)
-            _upsert_session_tracks(run, session_track_aggregates)
-
-            counts['imported_row_count'] += len(ledger_rows)
-            counts['canonicalized_row_count'] += len(ledger_rows)
-            counts['unresolved_row_count'] += unresolved
-            del session_track_aggregates
-            del ledger_rows
-        del new_listens
-        del existing_signatures
-        del signatures
+        counts['duplicate_row_count'] += len(parsed_batch) - inserted
+        counts['imported_row_count'] += inserted
+        counts['canonicalized_row_count'] += inserted
+        counts['unresolved_row_count'] += unresolved
 
         _persist_run_progress(
             run,
@@ -572,7 +803,251 @@ def _flush_batch(
             last_origin=batch_end_origin,
             last_line_number=batch_end_line_number,
             last_entry_index=batch_end_entry_index,
+            last_line_offset=batch_end_line_offset,
+            last_member_offset=batch_end_member_offset,
+        )
+
+
+def _resolve_listen_batch(
+    parsed_listens: list[ParsedListen],
+    *,
+    track_resolver: _TrackResolver,
+) -> list[tuple[ParsedListen, UUID | None, CanonicalItem | None]]:
+    track_juke_ids = track_resolver.resolve_many([parsed.track_identifier_candidates for parsed in parsed_listens])
+    resolved_payloads: list[tuple[ParsedListen, UUID | None, CanonicalItemIdentity | None]] = []
+    identity_assignments: list[tuple[CanonicalItemIdentity, UUID | None]] = []
+    for parsed, track_juke_id in zip(parsed_listens, track_juke_ids):
+        identity = identity_from_listenbrainz_candidates(
+            recording_mbid=str(parsed.recording_mbid or ''),
+            spotify_id=str(parsed.track_identifier_candidates.get('spotify_id') or ''),
+            recording_msid=parsed.recording_msid,
+        )
+        resolved_payloads.append((parsed, track_juke_id, identity))
+        if identity is not None:
+            identity_assignments.append((identity, track_juke_id))
+
+    canonical_items_by_key = bulk_ensure_canonical_items(identity_assignments)
+    return [
+        (
+            parsed,
+            track_juke_id,
+            canonical_items_by_key.get(identity.canonical_key) if identity is not None else None,
+        )
+        for parsed, track_juke_id, identity in resolved_payloads
+    ]
+
+
+def _write_listen_batch_with_copy(
+    run: SourceIngestionRun,
+    parsed_batch: list[ParsedListen],
+    *,
+    track_resolver: _TrackResolver,
+) -> tuple[int, int]:
+    """
+    COPY the batch into a session temp table and insert bare ledger rows with
+    ON CONFLICT DO NOTHING. Only the rows that insert returns are resolved to
+    canonical items; their resolutions go back through the same temp table,
+    are applied to the new ledger rows and folded into session tracks with one
+    ON CONFLICT DO UPDATE. Returns (inserted, unresolved).
+    """
+    with connection.cursor() as cursor:
+        _stage_ledger_batch(cursor, [(parsed, None, None) for parsed in parsed_batch])
+        cursor.execute(
+            f'''
+            INSERT INTO mlcore_listenbrainz_event_ledger (
+                id,
+                import_run_id,
+                event_signature,
+                played_at,
+                session_key,
+                canonical_item_id,
+                track_id,
+                resolution_state,
+                cold_ref,
+                created_at
+            )
+            SELECT
+                md5(encode(batch.event_signature, 'hex'))::uuid,
+                %s,
+                batch.event_signature,
+                batch.played_at,
+                batch.session_key,
+                NULL,
+                NULL,
+                0,
+                '',
+                NOW()
+            FROM {LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE} batch
+            ON CONFLICT (event_signature) DO NOTHING
+            RETURNING event_signature
+            ''',
+            [str(run.pk)],
+        )
+        inserted_signatures = {_as_binary(row[0]) for row in cursor.fetchall()}
+        if not inserted_signatures:
+            return 0, 0
+
+        new_listens: list[ParsedListen] = []
+        for parsed in parsed_batch:
+            # A signature repeated inside the batch lands once; resolve it once.
+            if parsed.source_event_signature in inserted_signatures:
+                inserted_signatures.discard(parsed.source_event_signature)
+                new_listens.append(parsed)
+
+        resolved = _resolve_listen_batch(new_listens, track_resolver=track_resolver)
+        unresolved = sum(1 for _, _, canonical_item in resolved if canonical_item is None)
+        _stage_ledger_batch(cursor, resolved)
+        cursor.execute(
+            f'''
+            UPDATE mlcore_listenbrainz_event_ledger ledger
+            SET
+                canonical_item_id = batch.canonical_item_id,
+                track_id = batch.track_id,
+                resolution_state = batch.resolution_state
+            FROM {LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE} batch
+            WHERE ledger.event_signature = batch.event_signature
+              AND (batch.canonical_item_id IS NOT NULL OR batch.track_id IS NOT NULL)
+            '''
+        )
+        cursor.execute(
+            f'''
+            INSERT INTO mlcore_listenbrainz_session_track (
+                id,
+                import_run_id,
+                session_key,
+                canonical_item_id,
+                track_id,
+                first_played_at,
+                last_played_at,
+                play_count,
+                created_at
+            )
+            SELECT
+                md5(encode(session_key, 'hex') || ':' || canonical_item_id::text)::uuid,
+                %s,
+                session_key,
+                canonical_item_id,
+                (ARRAY_AGG(track_id ORDER BY played_at) FILTER (WHERE track_id IS NOT NULL))[1],
+                MIN(played_at),
+                MAX(played_at),
+                COUNT(*),
+                NOW()
+            FROM {LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE}
+            WHERE canonical_item_id IS NOT NULL
+            GROUP BY session_key, canonical_item_id
+            ON CONFLICT (session_key, canonical_item_id) DO UPDATE
+            SET
+                track_id = COALESCE(mlcore_listenbrainz_session_track.track_id, EXCLUDED.track_id),
+                first_played_at = LEAST(mlcore_listenbrainz_session_track.first_played_at, EXCLUDED.first_played_at),
+                last_played_at = GREATEST(mlcore_listenbrainz_session_track.last_played_at, EXCLUDED.last_played_at),
+                play_count = mlcore_listenbrainz_session_track.play_count + EXCLUDED.play_count
+            ''',
+            [str(run.pk)],
+        )
+    return len(new_listens), unresolved
+
+
+def _stage_ledger_batch(
+    cursor,
+    rows: list[tuple[ParsedListen, UUID | None, CanonicalItem | None]],
+) -> None:
+    """
+    Replace the contents of the session temp table with ``rows``. The table is
+    ON COMMIT DELETE ROWS, but inside an outer atomic() or savepoint nothing has
+    committed yet, so it is truncated explicitly before every COPY.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    for parsed, track_juke_id, canonical_item in rows:
+        writer.writerow(
+            [
+                '\\x' + parsed.source_event_signature.hex(),
+                parsed.played_at.isoformat(),
+                '\\x' + parsed.session_key.hex(),
+                str(canonical_item.pk) if canonical_item is not None else '',
+                str(track_juke_id) if track_juke_id is not None else '',
+                1 if canonical_item is not None else 0,
+            ]
+        )
+    buffer.seek(0)
+
+    cursor.execute(
+        f'''
+        CREATE TEMP TABLE IF NOT EXISTS {LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE} (
+            event_signature bytea NOT NULL,
+            played_at timestamptz NOT NULL,
+            session_key bytea NOT NULL,
+            canonical_item_id uuid NULL,
+            track_id uuid NULL,
+            resolution_state smallint NOT NULL
+        ) ON COMMIT DELETE ROWS
+        '''
+    )
+    cursor.execute(f'TRUNCATE {LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE}')
+    raw_cursor = getattr(cursor, 'cursor', cursor)
+    raw_cursor.copy_expert(f'COPY {LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE} FROM STDIN WITH (FORMAT csv)', buffer)
+
+
+def _write_listen_batch_with_orm(
+    run: SourceIngestionRun,
+    parsed_batch: list[ParsedListen],
+    *,
+    track_resolver: _TrackResolver,
+) -> tuple[int, int]:
+    signatures = [parsed.source_event_signature for parsed in parsed_batch]
+    existing_signatures = set(
+        _as_binary(value)
+        for value in ListenBrainzEventLedger.objects.filter(event_signature__in=signatures).values_list(
+            'event_signature',
+            flat=True,
         )
+    )
+    new_listens = [parsed for parsed in parsed_batch if parsed.source_event_signature not in existing_signatures]
+    if not new_listens:
+        return 0, 0
+
+    ledger_rows: list[ListenBrainzEventLedger] = []
+    session_track_aggregates: dict[tuple[bytes, UUID], SessionTrackAggregate] = {}
+    unresolved = 0
+    for parsed, track_juke_id, canonical_item in _resolve_listen_batch(new_listens, track_resolver=track_resolver):
+        if canonical_item is None:
+            unresolved += 1
+        ledger_rows.append(
+            ListenBrainzEventLedger(
+                import_run=run,
+                event_signature=parsed.source_event_signature,
+                played_at=parsed.played_at,
+                session_key=parsed.session_key,
+                canonical_item=canonical_item,
+                track_id=track_juke_id,
+                resolution_state=1 if canonical_item is not None else 0,
+            )
+        )
+        if canonical_item is None:
+            continue
+
+        aggregate_key = (parsed.session_key, canonical_item.pk)
+        aggregate = session_track_aggregates.get(aggregate_key)
+        if aggregate is None:
+            session_track_aggregates[aggregate_key] = SessionTrackAggregate(
+                session_key=parsed.session_key,
+                canonical_item_id=canonical_item.pk,
+                first_played_at=parsed.played_at,
+                last_played_at=parsed.played_at,
+                track_juke_id=track_juke_id,
+            )
+            continue
+        if parsed.played_at < aggregate.first_played_at:
+            aggregate.first_played_at = parsed.played_at
+        if parsed.played_at > aggregate.last_played_at:
+            aggregate.last_played_at = parsed.played_at
+        if aggregate.track_juke_id is None and track_juke_id is not None:
+            aggregate.track_juke_id = track_juke_id
+        aggregate.play_count += 1
+
+    ListenBrainzEventLedger.objects.bulk_create(ledger_rows)
+    _upsert_session_tracks(run, session_track_aggregates)
+    return len(ledger_rows), unresolved
 
 
 def _upsert_session_tracks(
@@ -635,38 +1110,99 @@ def _as_binary(value: bytes | memoryview) -> bytes:
     return bytes(value)
 
 
-def _build_track_resolver(maxsize: int) -> Callable[[dict[str, Any]], UUID | None]:
-    if maxsize > 0:
-        resolve_track_by_mbid = functools.lru_cache(maxsize=maxsize)(_resolve_track_by_mbid_uncached)
-        resolve_track_by_spotify = functools.lru_cache(maxsize=maxsize)(_resolve_track_by_spotify_uncached)
-    else:
-        resolve_track_by_mbid = _resolve_track_by_mbid_uncached
-        resolve_track_by_spotify = _resolve_track_by_spotify_uncached
+def _build_track_resolver(maxsize: int) -> _TrackResolver:
+    return _TrackResolver(maxsize=maxsize)
 
-    def _resolve(candidates: dict[str, Any]) -> UUID | None:
-        recording_mbid = str(candidates.get('recording_mbid') or '').strip()
-        if recording_mbid:
-            return resolve_track_by_mbid(recording_mbid)
 
-        spotify_id = str(candidates.get('spotify_id') or '').strip()
-        if spotify_id:
-            return resolve_track_by_spotify(spotify_id)
+class _TrackResolver:
+    """
+    Resolves listen track candidates to catalog juke_ids one batch at a time.
+    Identifiers missing from the LRU maps are looked up with one set-based
+    query per identifier kind, and both hits and misses are remembered.
+    """
 
-        return None
+    def __init__(self, *, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.by_mbid: OrderedDict[str, UUID | None] = OrderedDict()
+        self.by_spotify: OrderedDict[str, UUID | None] = OrderedDict()
+
+    def resolve_many(self, candidates_list: list[dict[str, Any]]) -> list[UUID | None]:
+        keys = [_track_resolution_key(candidates) for candidates in candidates_list]
+        missing_mbids = {value for kind, value in filter(None, keys) if kind == 'mbid' and value not in self.by_mbid}
+        missing_spotify_ids = {
+            value for kind, value in filter(None, keys) if kind == 'spotify' and value not in self.by_spotify
+        }
+        fetched = {
+            'mbid': _resolve_tracks_by_mbid(missing_mbids),
+            'spotify': _resolve_tracks_by_spotify(missing_spotify_ids),
+        }
+
+        resolved: list[UUID | None] = []
+        for key in keys:
+            if key is None:
+                resolved.append(None)
+                continue
+            kind, value = key
+            cache = self.by_mbid if kind == 'mbid' else self.by_spotify
+            if value in cache:
+                cache.move_to_end(value)
+                resolved.append(cache[value])
+            else:
+                resolved.append(fetched[kind].get(value))
+
+        self._remember(self.by_mbid, {value: fetched['mbid'].get(value) for value in missing_mbids})
+        self._remember(self.by_spotify, {value: fetched['spotify'].get(value) for value in missing_spotify_ids})
+        return resolved
+
+    def _remember(self, cache: OrderedDict[str, UUID | None], entries: dict[str, UUID | None]) -> None:
+        if self.maxsize <= 0:
+            return
+        cache.update(entries)
+        while len(cache) > self.maxsize:
+            cache.popitem(last=False)
+
+
+def _track_resolution_key(candidates: dict[str, Any]) -> tuple[str, str] | None:
+    recording_mbid = str(candidates.get('recording_mbid') or '').strip()
+    if recording_mbid:
+        return 'mbid', recording_mbid
+
+    spotify_id = str(candidates.get('spotify_id') or '').strip()
+    if spotify_id:
+        return 'spotify', spotify_id
 
-    return _resolve
+    return None
 
 
-def _resolve_track_by_mbid_uncached(recording_mbid: str) -> UUID | None:
-    track = IdentityResolver.resolve_track(mbid=_maybe_uuid(recording_mbid))
-    return track.juke_id if track else None
+def _resolve_tracks_by_mbid(recording_mbids: set[str]) -> dict[str, UUID]:
+    mbids_by_uuid = {mbid: value for value in recording_mbids if (mbid := _maybe_uuid(value)) is not None}
+    if not mbids_by_uuid:
+        return {}
 
+    resolved: dict[str, UUID] = {}
+    for mbid, juke_id in Track.objects.filter(mbid__in=list(mbids_by_uuid)).order_by('pk').values_list('mbid', 'juke_id'):
+        resolved.setdefault(mbids_by_uuid[mbid], juke_id)
+    return resolved
 
-def _resolve_track_by_spotify_uncached(spotify_id: str) -> UUID | None:
-    track = IdentityResolver.resolve_track(source='spotify', external_id=spotify_id)
-    if track is None:
-        track = Track.objects.filter(spotify_id=spotify_id).first()
-    return track.juke_id if track else None
+
+def _resolve_tracks_by_spotify(spotify_ids: set[str]) -> dict[str, UUID]:
+    if not spotify_ids:
+        return {}
+
+    resolved: dict[str, UUID] = dict(
+        TrackExternalIdentifier.objects.filter(source='spotify', external_id__in=list(spotify_ids)).values_list(
+            'external_id',
+            'track_id',
+        )
+    )
+    unlinked = [spotify_id for spotify_id in spotify_ids if spotify_id not in resolved]
+    if unlinked:
+        for spotify_id, juke_id in Track.objects.filter(spotify_id__in=unlinked).order_by('pk').values_list(
+            'spotify_id',
+            'juke_id',
+        ):
+            resolved.setdefault(spotify_id, juke_id)
+    return resolved
 
 
 def _maybe_release_memory(
@@ -730,6 +1266,8 @@ def _persist_run_progress(
     last_origin: str,
     last_line_number: int,
     last_entry_index: int,
+    last_line_offset: int | None = None,
+    last_member_offset: int | None = None,
 ) -> None:
     run.source_row_count = counts['source_row_count']
     run.imported_row_count = counts['imported_row_count']
@@ -751,6 +1289,8 @@ def _persist_run_progress(
                 canonicalized_row_count=counts['canonicalized_row_count'],
                 unresolved_row_count=counts['unresolved_row_count'],
                 malformed_row_count=counts['malformed_row_count'],
+                line_offset=last_line_offset,
+                member_offset=last_member_offset,
             )
         ),
     }
@@ -798,6 +1338,8 @@ def _checkpoint_to_metadata(checkpoint: ResumeCheckpoint) -> dict[str, Any]:
         'canonicalized_row_count': checkpoint.canonicalized_row_count,
         'unresolved_row_count': checkpoint.unresolved_row_count,
         'malformed_row_count': checkpoint.malformed_row_count,
+        'line_offset': checkpoint.line_offset,
+        'member_offset': checkpoint.member_offset,
     }
 
 
@@ -842,12 +1384,21 @@ def _find_resume_candidate(
                 canonicalized_row_count=int(checkpoint_data.get('canonicalized_row_count') or 0),
                 unresolved_row_count=int(checkpoint_data.get('unresolved_row_count') or 0),
                 malformed_row_count=int(checkpoint_data.get('malformed_row_count') or 0),
+                line_offset=_optional_offset(checkpoint_data.get('line_offset')),
+                member_offset=_optional_offset(checkpoint_data.get('member_offset')),
             ),
         )
 
     return None
 
 
+def _optional_offset(value: Any) -> int | None:
+    if value in (None, ''):
+        return None
+    offset = int(value)
+    return offset if offset >= 0 else None
+
+
 def _parse_listen(payload: dict[str, Any]) -> ParsedListen:
     user_name = str(payload.get('user_name') or payload.get('user_id') or '').strip()
     if not user_name:
@@ -931,31 +1482,27 @@ def _iter_listen_payloads(
     path: Path,
     *,
     resume_after: ResumeCheckpoint | None = None,
+    cursor: PayloadCursor | None = None,
 ) -> Iterator[tuple[dict[str, Any] | None, str | None, str, int, int]]:
     if _is_tar_archive(path):
-        yield from _iter_tar_payloads(path, resume_after=resume_after)
+        yield from _iter_tar_payloads(path, resume_after=resume_after, cursor=cursor)
         return
 
-    if path.suffix == '.gz':
-        with gzip.open(path, 'rt', encoding='utf-8') as handle:
-            if resume_after is not None and resume_after.origin != path.name:
-                raise ValueError(f'Resume checkpoint origin not found in gzip dump: {resume_after.origin}')
-            yield from _iter_json_line_payloads(
-                handle,
-                origin=path.name,
-                skip_through_line=resume_after.line_number if resume_after is not None else 0,
-                skip_through_entry_index=resume_after.entry_index if resume_after is not None else 0,
-            )
-        return
+    if resume_after is not None and resume_after.origin != path.name:
+        kind = 'gzip dump' if path.suffix == '.gz' else 'dump'
+        raise ValueError(f'Resume checkpoint origin not found in {kind}: {resume_after.origin}')
 
-    with path.open('rt', encoding='utf-8') as handle:
-        if resume_after is not None and resume_after.origin != path.name:
-            raise ValueError(f'Resume checkpoint origin not found in dump: {resume_after.origin}')
+    # Plain files seek straight to the checkpoint line; gzip streams have no
+    # block index, so GzipFile.seek() decompresses forward but skips the JSON work.
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rb') as handle:
         yield from _iter_json_line_payloads(
             handle,
             origin=path.name,
             skip_through_line=resume_after.line_number if resume_after is not None else 0,
             skip_through_entry_index=resume_after.entry_index if resume_after is not None else 0,
+            skip_to_offset=resume_after.line_offset if resume_after is not None else None,
+            cursor=cursor,
         )
 
 
@@ -963,11 +1510,15 @@ def _iter_tar_payloads(
     path: Path,
     *,
     resume_after: ResumeCheckpoint | None = None,
+    cursor: PayloadCursor | None = None,
 ) -> Iterator[tuple[dict[str, Any] | None, str | None, str, int, int]]:
     awaiting_resume_origin = resume_after is not None
     resume_origin_found = False
     with tarfile.open(path, 'r:*') as archive:
-        for member in archive:
+        for member in _iter_tar_members(
+            archive,
+            start_offset=resume_after.member_offset if resume_after is not None else None,
+        ):
             if not member.isfile():
                 continue
             if not member.name.endswith(SUPPORTED_JSON_LINE_SUFFIXES):
@@ -982,35 +1533,70 @@ def _iter_tar_payloads(
             if extracted is None:
                 continue
 
-            with io.TextIOWrapper(extracted, encoding='utf-8') as handle:
+            resuming_member = resume_after is not None and member.name == resume_after.origin
+            if cursor is not None:
+                cursor.member_offset = member.offset
+            with extracted:
                 yield from _iter_json_line_payloads(
-                    handle,
+                    extracted,
                     origin=member.name,
-                    skip_through_line=resume_after.line_number if resume_after and member.name == resume_after.origin else 0,
-                    skip_through_entry_index=(
-                        resume_after.entry_index
-                        if resume_after and member.name == resume_after.origin
-                        else 0
-                    ),
+                    skip_through_line=resume_after.line_number if resuming_member else 0,
+                    skip_through_entry_index=resume_after.entry_index if resuming_member else 0,
+                    skip_to_offset=resume_after.line_offset if resuming_member else None,
+                    cursor=cursor,
                 )
     if resume_after is not None and not resume_origin_found:
         raise ValueError(f'Resume checkpoint origin not found in tar dump: {resume_after.origin}')
 
 
+def _iter_tar_members(archive: tarfile.TarFile, *, start_offset: int | None) -> Iterator[tarfile.TarInfo]:
+    """
+    Iterate tar members, optionally starting at the member whose header sits
+    at start_offset in the (uncompressed) tar stream instead of walking every
+    earlier header. Plain tars seek there directly; compressed streams
+    fast-forward without extracting member bodies.
+    """
+    if start_offset:
+        archive.firstmember = None
+        archive.offset = start_offset
+        archive.fileobj.seek(start_offset)
+    while True:
+        member = archive.next()
+        if member is None:
+            return
+        yield member
+
+
 def _iter_json_line_payloads(
-    handle: io.TextIOBase,
+    handle: IO[bytes] | io.TextIOBase,
     *,
     origin: str,
     skip_through_line: int = 0,
     skip_through_entry_index: int = 0,
+    skip_to_offset: int | None = None,
+    cursor: PayloadCursor | None = None,
 ) -> Iterator[tuple[dict[str, Any] | None, str | None, str, int, int]]:
-    for line_number, raw_line in enumerate(handle, start=1):
+    """
+    Yield listen payloads from a JSON-lines handle. Binary handles track byte
+    offsets into cursor, and a known skip_to_offset seeks straight to the
+    checkpoint line instead of re-reading every earlier line.
+    """
+    first_line_number = 1
+    offset = 0
+    if skip_to_offset is not None and skip_through_line > 0:
+        handle.seek(skip_to_offset)
+        first_line_number = skip_through_line
+        offset = skip_to_offset
+
+    for line_number, raw_line in enumerate(handle, start=first_line_number):
+        if cursor is not None:
+            cursor.line_offset = offset
+            offset += len(raw_line)
         if line_number < skip_through_line:
             continue
         line = raw_line.strip()
         if not line:
             continue
-
         try:
             record = json.loads(line)
         except json.JSONDecodeError as exc:
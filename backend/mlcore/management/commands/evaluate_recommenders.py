@@ -1,4 +1,5 @@
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
 
 from mlcore.models import TrainingRun
 from mlcore.services.cooccurrence import (
@@ -11,11 +12,21 @@ from mlcore.services.cooccurrence import (
 )
 from mlcore.services.evaluation import (
     DEFAULT_COLD_THRESHOLD,
+    DEFAULT_CONFIDENCE_LEVEL,
+    DEFAULT_ENGINE_CONCURRENCY,
     DEFAULT_EVALUATION_BATCH_SIZE,
     DEFAULT_K,
+    DEFAULT_SAMPLE_SEED,
+    DEFAULT_SEQUENTIAL_MIN_TRIALS,
+    METRIC_NDCG,
+    METRIC_RECALL,
     RANKERS,
+    HttpEngineTransport,
+    InProcessEngineTransport,
+    RankedListCache,
     run_offline_evaluation,
 )
+from mlcore.services.promotion import sequential_promotion_gates
 
 
 class Command(BaseCommand):
@@ -29,6 +40,29 @@ class Command(BaseCommand):
             '--ranker', action='append', dest='rankers', choices=sorted(RANKERS),
             help='Ranker label to evaluate (repeatable). Default: all.',
         )
+        parser.add_argument(
+            '--engine-ranker', action='append', dest='engine_rankers', choices=sorted(RANKERS), default=[],
+            help=(
+                'Also evaluate this ranker through the serving engine as engine:<ranker>, recording '
+                'latency percentiles and throughput (repeatable). Without --ranker, only engine rankers run.'
+            ),
+        )
+        parser.add_argument(
+            '--engine-url',
+            default=None,
+            help='Engine base URL for --engine-ranker. Default: RECOMMENDER_ENGINE_BASE_URL.',
+        )
+        parser.add_argument(
+            '--engine-in-process',
+            action='store_true',
+            help='Drive the engine FastAPI app in-process via TestClient instead of over HTTP.',
+        )
+        parser.add_argument(
+            '--engine-concurrency',
+            type=int,
+            default=DEFAULT_ENGINE_CONCURRENCY,
+            help='Concurrent in-flight engine requests per scoring batch.',
+        )
         parser.add_argument('--k', type=int, default=DEFAULT_K)
         parser.add_argument('--cold-threshold', type=int, default=DEFAULT_COLD_THRESHOLD)
         parser.add_argument(
@@ -48,6 +82,27 @@ class Command(BaseCommand):
             default=None,
             help='Evaluate a deterministic prefix sample of eligible baskets instead of materializing the full split.',
         )
+        parser.add_argument(
+            '--sample-rate',
+            type=float,
+            default=None,
+            help=(
+                'Evaluate a stratified sample (by basket size, session hash bucket and item popularity) '
+                'of this fraction of baskets. Mutually exclusive with --max-baskets.'
+            ),
+        )
+        parser.add_argument(
+            '--sample-seed',
+            type=int,
+            default=DEFAULT_SAMPLE_SEED,
+            help='Seed for --sample-rate basket selection; the sample hash depends on it.',
+        )
+        parser.add_argument(
+            '--confidence-level',
+            type=float,
+            default=DEFAULT_CONFIDENCE_LEVEL,
+            help='Two-sided confidence level for the per-metric intervals stored with each evaluation.',
+        )
         parser.add_argument(
             '--max-basket-items',
             type=int,
@@ -70,10 +125,54 @@ class Command(BaseCommand):
             default=None,
             help='Optional Prometheus textfile path for evaluation progress metrics.',
         )
+        parser.add_argument(
+            '--show-segments',
+            action='store_true',
+            help='Also print recall/nDCG broken down by basket size and held-out item popularity decile.',
+        )
+        parser.add_argument(
+            '--sequential',
+            action='store_true',
+            help=(
+                'Score exactly two rankers (candidate first, baseline second; --ranker then --engine-ranker) '
+                'on one shuffled trial stream and stop once the promotion lift/regression gates are decided '
+                'at --confidence-level. Both partial evaluations are persisted as usual.'
+            ),
+        )
+        parser.add_argument(
+            '--sequential-min-trials',
+            type=int,
+            default=DEFAULT_SEQUENTIAL_MIN_TRIALS,
+            help='Minimum trials per gate slice before --sequential may stop early.',
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Rescore every trial instead of replaying ranked lists cached under MLCORE_EVALUATION_CACHE_DIR.',
+        )
 
     def handle(self, *args, **options):
+        if options['sample_rate'] is not None and options['max_baskets'] is not None:
+            raise CommandError('--sample-rate and --max-baskets are mutually exclusive')
         labels = options.get('rankers')
+        engine_rankers = options['engine_rankers']
+        if options['sequential'] and len(labels or []) + len(engine_rankers) != 2:
+            raise CommandError('--sequential needs exactly two rankers: candidate first, then baseline')
+        engine_transport = None
+        if engine_rankers:
+            if labels is None:
+                labels = []
+            if options['engine_in_process']:
+                try:
+                    engine_transport = InProcessEngineTransport()
+                except ImportError as exc:
+                    raise CommandError(f'--engine-in-process needs the engine serving dependencies: {exc}')
+            else:
+                engine_transport = HttpEngineTransport(base_url=options['engine_url'])
         sources = options.get('sources') or list(DEFAULT_BEHAVIOR_SOURCES)
+        ranked_list_cache = None
+        if settings.MLCORE_EVALUATION_CACHE_DIR and not options['no_cache']:
+            ranked_list_cache = RankedListCache(settings.MLCORE_EVALUATION_CACHE_DIR)
         cooccurrence_training_run = None
 
         if labels is None or 'cooccurrence' in labels:
@@ -87,7 +186,7 @@ class Command(BaseCommand):
                         'No cooccurrence training run found. Run train_cooccurrence() before evaluating the cooccurrence ranker.'
                     )
                 )
-            elif not options['skip_hash_check'] and options['max_baskets'] is None:
+            elif not options['skip_hash_check'] and options['max_baskets'] is None and options['sample_rate'] is None:
                 current_baskets, _ = baskets_from_behavioral_sources_with_count(
                     split='train',
                     split_buckets=_SPLIT_BUCKET_COUNT,
@@ -115,6 +214,15 @@ class Command(BaseCommand):
             batch_size=options['batch_size'],
             metrics_path=options['metrics_path'],
             persist=not options['no_persist'],
+            sample_rate=options['sample_rate'],
+            sample_seed=options['sample_seed'],
+            confidence_level=options['confidence_level'],
+            engine_rankers=engine_rankers,
+            engine_transport=engine_transport,
+            engine_concurrency=options['engine_concurrency'],
+            ranked_list_cache=ranked_list_cache,
+            sequential_gates=sequential_promotion_gates() if options['sequential'] else None,
+            sequential_min_trials=options['sequential_min_trials'],
         )
 
         if not results:
@@ -126,7 +234,24 @@ class Command(BaseCommand):
         for r in results:
             self.stdout.write(self.style.SUCCESS(
                 f"{r.candidate_label}: trials={r.n_trials} (cold={r.n_cold_trials}) "
-                f"dataset={r.dataset_hash[:12]}"
+                f"dataset={r.dataset_hash[:12]}{' (cached ranked lists)' if r.ranked_lists_cached else ''}"
             ))
             for name, value in sorted(r.metrics.items()):
-                self.stdout.write(f"  {name:<24} {value:.4f}")
+                interval = r.confidence_intervals.get(name)
+                suffix = f"  [{interval[0]:.4f}, {interval[1]:.4f}]" if interval else ''
+                self.stdout.write(f"  {name:<24} {value:.4f}{suffix}")
+            for decision in r.sequential_decisions:
+                outcome = {True: 'PASS', False: 'FAIL', None: 'UNDECIDED'}[decision.passed]
+                self.stdout.write(
+                    f"  sequential {decision.name:<22} {outcome:<9} margin={decision.margin:+.4f} "
+                    f"[{decision.margin_interval[0]:+.4f}, {decision.margin_interval[1]:+.4f}] "
+                    f"trials={decision.n_trials}"
+                )
+            if options['show_segments']:
+                for segment_name, breakdown in r.segments.items():
+                    self.stdout.write(f"  {segment_name}:")
+                    for segment, values in breakdown.items():
+                        self.stdout.write(
+                            f"    {segment:<8} trials={int(values['n_trials']):<8} "
+                            f"{METRIC_RECALL}={values[METRIC_RECALL]:.4f} {METRIC_NDCG}={values[METRIC_NDCG]:.4f}"
+                        )
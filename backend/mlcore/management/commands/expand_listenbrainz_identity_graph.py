@@ -11,7 +11,7 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument('--source-version', help='ListenBrainz source version to expand.')
-        parser.add_argument('--batch-size', type=int, default=100_000, help='Canonical items to insert per batch.')
+        parser.add_argument('--batch-size', type=int, default=100_000, help='Missing MSIDs staged between progress reports.')
         parser.add_argument('--dry-run', action='store_true', help='Count work without inserting rows.')
         parser.add_argument('--json', action='store_true', help='Emit machine-readable final output.')
 
@@ -21,7 +21,7 @@ class Command(BaseCommand):
         def report(progress):
             if progress.get('event') == 'msid_canonical_batch':
                 self.stderr.write(
-                    'event=msid_canonical_batch created={created_msid_count}/{missing_msid_count} '
+                    'event=msid_canonical_batch staged={staged_msid_count}/{missing_msid_count} '
                     'batch_size={batch_size}'.format(**progress)
                 )
 
@@ -7,13 +7,10 @@ from django.utils import timezone
 
 from mlcore.models import ProviderHydrationItem, ProviderHydrationRun
 from mlcore.services.provider_hydration import (
-    ProviderHydrationError,
-    RequestPacer,
+    ProviderTokenBucket,
     SpotifyClient,
-    claim_hydration_item,
-    hydrate_spotify_item,
+    drain_spotify_hydration_queue,
     seed_spotify_hydration_queue,
-    spotify_worker_lock,
     worker_identity,
     write_hydration_metrics,
 )
@@ -30,7 +27,18 @@ class Command(BaseCommand):
         parser.add_argument('--skip-seed', action='store_true')
         parser.add_argument('--seed-limit', type=int)
         parser.add_argument('--max-items', type=int)
-        parser.add_argument('--rps', type=float, default=settings.SPOTIFY_HYDRATION_INITIAL_RPS)
+        parser.add_argument(
+            '--rps',
+            type=float,
+            default=settings.SPOTIFY_HYDRATION_INITIAL_RPS,
+            help='Rate for a newly created shared bucket; an existing bucket keeps its rate unless --set-rate is given.',
+        )
+        parser.add_argument(
+            '--set-rate',
+            action='store_true',
+            help='Re-point the shared Spotify rate-limit bucket at --rps for every worker draining it.',
+        )
+        parser.add_argument('--concurrency', type=int, default=settings.SPOTIFY_HYDRATION_CONCURRENCY)
         parser.add_argument('--batch-size', type=int, default=10_000)
         parser.add_argument('--json', action='store_true')
         parser.add_argument(
@@ -53,36 +61,30 @@ class Command(BaseCommand):
         client = SpotifyClient(
             settings.SPOTIFY_HYDRATION_CLIENT_ID,
             settings.SPOTIFY_HYDRATION_CLIENT_SECRET,
+            pool_size=options['concurrency'],
         )
+        limiter = ProviderTokenBucket('spotify', rps=options['rps']).ensure()
+        if options['set_rate']:
+            limiter.reconfigure(options['rps'])
         run = ProviderHydrationRun.objects.create(
             provider='spotify',
             requested_limit=options['max_items'],
-            configured_rps=options['rps'],
+            configured_rps=limiter.configured_rps,
             metadata={'seeded_at_start': seeded},
         )
-        pacer = RequestPacer(options['rps'])
-        worker_id = worker_identity()
         try:
-            with spotify_worker_lock() as acquired:
-                if not acquired:
-                    raise CommandError('Another Spotify hydration worker already owns the global provider lease.')
-                while options['max_items'] is None or run.attempted_count < options['max_items']:
-                    item = claim_hydration_item(run=run, worker_id=worker_id)
-                    if item is None:
-                        break
-                    pacer.wait()
-                    try:
-                        hydrate_spotify_item(item, run=run, client=client)
-                        pacer.success()
-                    except ProviderHydrationError as exc:
-                        if exc.http_status == 429:
-                            pacer.rate_limited(exc.retry_after)
-                        elif not exc.retryable:
-                            self.stderr.write(str(exc))
-                    self._metrics(run, options['metrics_path'])
+            drain_spotify_hydration_queue(
+                run=run,
+                client=client,
+                limiter=limiter,
+                worker_id=worker_identity(),
+                concurrency=options['concurrency'],
+                max_items=options['max_items'],
+                progress_callback=lambda progress: self._metrics(progress, options['metrics_path']),
+            )
             run.status = 'succeeded'
             run.completed_at = timezone.now()
-            run.metadata = {**run.metadata, 'final_rps': pacer.current_rps}
+            run.metadata = {**run.metadata, 'final_rps': limiter.current_rps}
             run.save()
         except Exception as exc:
             run.status = 'failed'
@@ -98,7 +100,7 @@ class Command(BaseCommand):
     def _validate(options):
         if options['rps'] <= 0:
             raise CommandError('--rps must be greater than zero.')
-        for option in ('seed_limit', 'max_items', 'batch_size'):
+        for option in ('seed_limit', 'max_items', 'batch_size', 'concurrency'):
             if options.get(option) is not None and options[option] < 1:
                 raise CommandError(f'--{option.replace("_", "-")} must be greater than zero.')
         if options['seed_only'] and options['skip_seed']:
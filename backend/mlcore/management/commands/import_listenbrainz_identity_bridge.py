@@ -15,6 +15,7 @@ class Command(BaseCommand):
         parser.add_argument('--output-root', help='Cold output root for per-shard pair files.')
         parser.add_argument('--max-shards', type=int, help='Limit processing for a bounded validation run.')
         parser.add_argument('--force', action='store_true', help='Replace this source version and re-extract every shard.')
+        parser.add_argument('--extract-workers', type=int, help='Processes that extract shards in parallel.')
         parser.add_argument('--json', action='store_true', help='Emit machine-readable final output.')
 
     def handle(self, *args, **options):
@@ -44,6 +45,7 @@ class Command(BaseCommand):
             output_root=options.get('output_root'),
             max_shards=options.get('max_shards'),
             force=options['force'],
+            extract_workers=options.get('extract_workers'),
             progress_callback=report,
         )
         payload = result.__dict__
@@ -12,6 +12,12 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument('--manifest', help='Path to a staged MusicBrainz manifest.json.')
+        parser.add_argument('--load-workers', type=int, help='Connections that load archive members concurrently.')
+        parser.add_argument(
+            '--no-resume',
+            action='store_true',
+            help='Reload every member instead of reusing members checkpointed by the last failed run.',
+        )
         parser.add_argument('--json', action='store_true', help='Emit machine-readable JSON.')
 
     def handle(self, *args, **options):
@@ -24,7 +30,12 @@ class Command(BaseCommand):
                 'url_relationship_rows={url_relationship_rows}'.format(**progress)
             )
 
-        result = import_musicbrainz_bridge(manifest_path, progress_callback=report)
+        result = import_musicbrainz_bridge(
+            manifest_path,
+            resume=not options['no_resume'],
+            load_workers=options.get('load_workers'),
+            progress_callback=report,
+        )
         payload = result.__dict__
         if options['json']:
             self.stdout.write(json.dumps(payload, indent=2, sort_keys=True))
@@ -61,7 +61,7 @@ class Command(BaseCommand):
             '--partition-workers',
             type=int,
             default=configured_full_ingestion_partition_workers(),
-            help='Target process count for archive -> compact chunk extraction after member spooling.',
+            help='Target process count for archive -> compact chunk extraction (members streamed or spooled to workers).',
         )
         parser.add_argument(
             '--load-workers',
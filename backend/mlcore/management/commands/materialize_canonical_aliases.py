@@ -12,6 +12,7 @@ from mlcore.models import CanonicalAliasMaterializationRun
 from mlcore.services.canonical_items import (
     AliasMaterializationProgress,
     CANONICAL_ALIAS_SOURCE_MAPPINGS,
+    CATALOG_TRACK_CHECKPOINT_NAME,
     count_canonical_alias_source_items,
     materialize_canonical_item_self_aliases,
     materialize_track_aliases,
@@ -48,6 +49,12 @@ class Command(BaseCommand):
             default=os.environ.get('MLCORE_CANONICAL_ALIAS_TEXTFILE_METRICS_PATH', DEFAULT_METRICS_PATH),
             help='Prometheus textfile path for canonical alias materialization progress metrics.',
         )
+        parser.add_argument(
+            '--range-count',
+            type=int,
+            default=1,
+            help='Split each source id space into this many disjoint ranges materialized in parallel.',
+        )
         parser.add_argument(
             '--resume-run-id',
             type=UUID,
@@ -147,6 +154,7 @@ class Command(BaseCommand):
             include_catalog_tracks=options['include_catalog_tracks'],
             batch_size=options['batch_size'],
             total_items=total_items,
+            checkpoints={'range_count': options['range_count']},
         )
 
     def _materialize_canonical_phase(self, run, metrics_progress):
@@ -156,13 +164,13 @@ class Command(BaseCommand):
 
         base = self._counter_snapshot(run)
 
-        def checkpoint(mapping, last_id, progress):
+        def checkpoint(checkpoint_key, last_id, progress):
             with transaction.atomic():
                 run.checkpoints = {
                     **(run.checkpoints or {}),
                     'canonical': {
                         **(run.checkpoints or {}).get('canonical', {}),
-                        mapping.item_type: str(last_id),
+                        checkpoint_key: str(last_id),
                     },
                 }
                 self._apply_phase_progress(run, progress, base, phase=progress.phase)
@@ -172,8 +180,9 @@ class Command(BaseCommand):
             source_version=run.source_version,
             batch_size=run.batch_size,
             progress_callback=lambda progress: metrics_progress(),
-            start_after_by_item_type=checkpoints.get('canonical', {}),
+            start_after_by_range=checkpoints.get('canonical', {}),
             checkpoint_callback=checkpoint,
+            range_count=int(checkpoints.get('range_count') or 1),
         )
         run.checkpoints = {**(run.checkpoints or {}), 'canonical_complete': True}
         run.save(update_fields=['checkpoints', 'updated_at'])
@@ -186,11 +195,14 @@ class Command(BaseCommand):
 
         base = self._counter_snapshot(run)
 
-        def checkpoint(last_track_id, progress):
+        def checkpoint(checkpoint_key, last_track_id, progress):
             with transaction.atomic():
                 run.checkpoints = {
                     **(run.checkpoints or {}),
-                    'catalog_last_id': str(last_track_id),
+                    'catalog': {
+                        **(run.checkpoints or {}).get('catalog', {}),
+                        checkpoint_key: str(last_track_id),
+                    },
                 }
                 self._apply_phase_progress(run, progress, base, phase='catalog_tracks')
                 run.save()
@@ -199,13 +211,22 @@ class Command(BaseCommand):
             source_version=run.source_version,
             batch_size=run.batch_size,
             progress_callback=lambda progress: metrics_progress(),
-            start_after_track_id=checkpoints.get('catalog_last_id'),
+            start_after_by_range=self._catalog_checkpoints(checkpoints),
             checkpoint_callback=checkpoint,
+            range_count=int(checkpoints.get('range_count') or 1),
         )
         run.checkpoints = {**(run.checkpoints or {}), 'catalog_complete': True}
         run.save(update_fields=['checkpoints', 'updated_at'])
         return materialized
 
+    @staticmethod
+    def _catalog_checkpoints(checkpoints):
+        catalog = dict(checkpoints.get('catalog') or {})
+        # Runs checkpointed before range support stored a single track id.
+        if checkpoints.get('catalog_last_id') and CATALOG_TRACK_CHECKPOINT_NAME not in catalog:
+            catalog[CATALOG_TRACK_CHECKPOINT_NAME] = checkpoints['catalog_last_id']
+        return catalog
+
     @staticmethod
     def _counter_snapshot(run):
         return {
@@ -27,7 +27,7 @@ class Command(BaseCommand):
         def report(progress):
             if progress.get('event') == 'conflict_msid_canonical_batch':
                 self.stderr.write(
-                    'event=conflict_msid_canonical_batch created={created_msid_count} '
+                    'event=conflict_msid_canonical_batch staged={staged_msid_count} '
                     'batch_size={batch_size} policy={policy_version}'.format(**progress)
                 )
 
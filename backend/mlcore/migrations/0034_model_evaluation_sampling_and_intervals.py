@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mlcore', '0033_providerhydrationrun_providerhydrationitem'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='modelevaluation',
+            name='ci_lower',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='modelevaluation',
+            name='ci_upper',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='modelevaluation',
+            name='confidence_level',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='modelevaluation',
+            name='sample_rate',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='modelevaluation',
+            name='sample_seed',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+MAX_REDIRECT_DEPTH = 8
+
+
+def backfill_redirect_closure(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        """
+        INSERT INTO mlcore_canonical_item_redirect_closure (
+            from_canonical_item_id,
+            terminal_canonical_item_id,
+            depth,
+            updated_at
+        )
+        WITH RECURSIVE chain AS (
+            SELECT
+                from_canonical_item_id AS origin_id,
+                to_canonical_item_id AS current_id,
+                ARRAY[from_canonical_item_id, to_canonical_item_id]::uuid[] AS path,
+                1 AS depth,
+                FALSE AS cyclic
+            FROM mlcore_canonical_item_redirect
+            WHERE status = 'active'
+            UNION ALL
+            SELECT
+                chain.origin_id,
+                redirect.to_canonical_item_id,
+                chain.path || redirect.to_canonical_item_id,
+                chain.depth + 1,
+                redirect.to_canonical_item_id = ANY(chain.path)
+            FROM chain
+            JOIN mlcore_canonical_item_redirect redirect
+              ON redirect.from_canonical_item_id = chain.current_id
+             AND redirect.status = 'active'
+            WHERE NOT chain.cyclic
+              AND chain.depth < %s
+        )
+        SELECT chain.origin_id, chain.current_id, chain.depth, NOW()
+        FROM chain
+        WHERE NOT chain.cyclic
+          AND NOT EXISTS (
+              SELECT 1
+              FROM mlcore_canonical_item_redirect next_redirect
+              WHERE next_redirect.from_canonical_item_id = chain.current_id
+                AND next_redirect.status = 'active'
+          )
+        """,
+        [MAX_REDIRECT_DEPTH],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mlcore', '0034_model_evaluation_sampling_and_intervals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CanonicalItemRedirectClosure',
+            fields=[
+                ('from_canonical_item', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='redirect_closure', serialize=False, to='mlcore.canonicalitem')),
+                ('depth', models.PositiveSmallIntegerField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('terminal_canonical_item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='redirect_closure_sources', to='mlcore.canonicalitem')),
+            ],
+            options={
+                'db_table': 'mlcore_canonical_item_redirect_closure',
+                'db_tablespace': 'juke_mlcore_hot',
+                'indexes': [models.Index(fields=['terminal_canonical_item'], name='mlcore_circ_terminal_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_redirect_closure, migrations.RunPython.noop),
+    ]
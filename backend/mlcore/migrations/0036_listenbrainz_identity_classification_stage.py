@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mlcore', '0035_canonical_item_redirect_closure'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                CREATE UNLOGGED TABLE mlcore_listenbrainz_identity_classification (
+                    recording_msid uuid NOT NULL,
+                    recording_mbid uuid NOT NULL,
+                    shard_observation_count bigint NOT NULL,
+                    total_shard_observation_count bigint NOT NULL,
+                    candidate_count integer NOT NULL,
+                    candidate_rank integer NOT NULL,
+                    status varchar(16) NOT NULL,
+                    source_item_id uuid,
+                    target_item_id uuid
+                ) TABLESPACE juke_mlcore_cold;
+            ''',
+            reverse_sql='DROP TABLE IF EXISTS mlcore_listenbrainz_identity_classification;',
+        ),
+    ]
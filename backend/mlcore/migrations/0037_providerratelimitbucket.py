@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mlcore', '0036_listenbrainz_identity_classification_stage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderRateLimitBucket',
+            fields=[
+                ('provider', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('configured_rps', models.FloatField(default=1.0)),
+                ('current_rps', models.FloatField(default=1.0)),
+                ('capacity', models.FloatField(default=1.0)),
+                ('tokens', models.FloatField(default=0.0)),
+                ('refilled_at', models.DateTimeField()),
+                ('blocked_until', models.DateTimeField(blank=True, null=True)),
+                ('grants_since_limit', models.BigIntegerField(default=0)),
+                ('rate_limited_count', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'mlcore_provider_rate_limit_bucket',
+                'db_tablespace': 'juke_mlcore_hot',
+            },
+        ),
+    ]
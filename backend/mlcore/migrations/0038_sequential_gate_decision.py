@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mlcore', '0037_providerratelimitbucket'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SequentialGateDecision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('candidate_label', models.CharField(max_length=64)),
+                ('baseline_label', models.CharField(max_length=64)),
+                ('dataset_hash', models.CharField(max_length=64)),
+                ('gate_name', models.CharField(max_length=64)),
+                ('metric_name', models.CharField(max_length=64)),
+                ('threshold', models.FloatField()),
+                ('passed', models.BooleanField(blank=True, null=True)),
+                ('margin', models.FloatField()),
+                ('margin_lower', models.FloatField()),
+                ('margin_upper', models.FloatField()),
+                ('critical_z', models.FloatField()),
+                ('confidence_level', models.FloatField()),
+                ('n_trials', models.BigIntegerField(default=0)),
+                ('trials_scored', models.BigIntegerField(default=0)),
+                ('dataset_n_trials', models.BigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'mlcore_sequential_gate_decision',
+                'indexes': [models.Index(fields=['candidate_label', 'baseline_label', 'dataset_hash', 'gate_name'], name='mlcore_sgd_pair_gate_idx')],
+            },
+        ),
+    ]
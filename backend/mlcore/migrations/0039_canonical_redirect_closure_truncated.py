@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+MAX_REDIRECT_DEPTH = 8
+
+
+def backfill_truncated_redirect_closure(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    # 0035 left chains that cycle or run too deep out of the closure; add them
+    # pointing at the deepest item reached.
+    schema_editor.execute(
+        """
+        INSERT INTO mlcore_canonical_item_redirect_closure (
+            from_canonical_item_id,
+            terminal_canonical_item_id,
+            depth,
+            truncated,
+            updated_at
+        )
+        WITH RECURSIVE chain AS (
+            SELECT
+                from_canonical_item_id AS origin_id,
+                to_canonical_item_id AS current_id,
+                ARRAY[from_canonical_item_id, to_canonical_item_id]::uuid[] AS path,
+                1 AS depth,
+                FALSE AS cyclic
+            FROM mlcore_canonical_item_redirect
+            WHERE status = 'active'
+            UNION ALL
+            SELECT
+                chain.origin_id,
+                redirect.to_canonical_item_id,
+                chain.path || redirect.to_canonical_item_id,
+                chain.depth + 1,
+                redirect.to_canonical_item_id = ANY(chain.path)
+            FROM chain
+            JOIN mlcore_canonical_item_redirect redirect
+              ON redirect.from_canonical_item_id = chain.current_id
+             AND redirect.status = 'active'
+            WHERE NOT chain.cyclic
+              AND chain.depth < %s
+        )
+        SELECT deepest.origin_id, deepest.current_id, deepest.depth, TRUE, NOW()
+        FROM (
+            SELECT DISTINCT ON (chain.origin_id) chain.origin_id, chain.current_id, chain.depth
+            FROM chain
+            WHERE NOT chain.cyclic
+            ORDER BY chain.origin_id, chain.depth DESC
+        ) deepest
+        WHERE EXISTS (
+            SELECT 1
+            FROM mlcore_canonical_item_redirect next_redirect
+            WHERE next_redirect.from_canonical_item_id = deepest.current_id
+              AND next_redirect.status = 'active'
+        )
+        ON CONFLICT (from_canonical_item_id) DO NOTHING
+        """,
+        [MAX_REDIRECT_DEPTH],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mlcore', '0038_sequential_gate_decision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='canonicalitemredirectclosure',
+            name='truncated',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_truncated_redirect_closure, migrations.RunPython.noop),
+    ]
@@ -558,6 +558,25 @@ class ProviderHydrationItem(models.Model):
         ordering = ['priority', 'id']
 
 
+class ProviderRateLimitBucket(models.Model):
+    """Token bucket shared by every hydration worker that calls one provider."""
+
+    provider = models.CharField(max_length=32, primary_key=True)
+    configured_rps = models.FloatField(default=1.0)
+    current_rps = models.FloatField(default=1.0)
+    capacity = models.FloatField(default=1.0)
+    tokens = models.FloatField(default=0.0)
+    refilled_at = models.DateTimeField()
+    blocked_until = models.DateTimeField(null=True, blank=True)
+    grants_since_limit = models.BigIntegerField(default=0)
+    rate_limited_count = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'mlcore_provider_rate_limit_bucket'
+        db_tablespace = 'juke_mlcore_hot'
+
+
 class CanonicalItemRedirect(models.Model):
     """Non-destructive preference edge between equivalent canonical items."""
 
@@ -599,6 +618,41 @@ class CanonicalItemRedirect(models.Model):
         return f'{self.from_canonical_item_id}->{self.to_canonical_item_id}:{self.status}'
 
 
+class CanonicalItemRedirectClosure(models.Model):
+    """
+    Flattened active redirect chain: each redirected item mapped to its terminal target.
+
+    Chains that cycle or run past the redirect depth limit are kept as
+    ``truncated`` rows pointing at the deepest item reached, so SQL readers
+    still resolve them while ``resolve_canonical_item_id`` refuses to.
+    """
+
+    from_canonical_item = models.OneToOneField(
+        CanonicalItem,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='redirect_closure',
+    )
+    terminal_canonical_item = models.ForeignKey(
+        CanonicalItem,
+        on_delete=models.CASCADE,
+        related_name='redirect_closure_sources',
+    )
+    depth = models.PositiveSmallIntegerField()
+    truncated = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'mlcore_canonical_item_redirect_closure'
+        db_tablespace = 'juke_mlcore_hot'
+        indexes = [
+            models.Index(fields=['terminal_canonical_item'], name='mlcore_circ_terminal_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.from_canonical_item_id}=>{self.terminal_canonical_item_id}'
+
+
 class CanonicalAliasMaterializationRun(models.Model):
     """Persistent checkpoint and provenance for canonical alias materialization."""
 
@@ -1010,6 +1064,14 @@ class ModelEvaluation(models.Model):
     evaluation_started_at = models.DateTimeField(null=True, blank=True)
     evaluation_elapsed_seconds = models.FloatField(null=True, blank=True)
     evaluation_trials_per_second = models.FloatField(null=True, blank=True)
+    # Clustered normal-approximation interval around metric_value; null for
+    # catalog-level metrics such as coverage.
+    ci_lower = models.FloatField(null=True, blank=True)
+    ci_upper = models.FloatField(null=True, blank=True)
+    confidence_level = models.FloatField(null=True, blank=True)
+    # Set when the dataset is a stratified sample rather than the full split.
+    sample_rate = models.FloatField(null=True, blank=True)
+    sample_seed = models.BigIntegerField(null=True, blank=True)
     training_run = models.ForeignKey(
         TrainingRun,
         null=True,
@@ -1029,6 +1091,45 @@ class ModelEvaluation(models.Model):
         return f"{self.candidate_label}:{self.metric_name}={self.metric_value:.4f}"
 
 
+class SequentialGateDecision(models.Model):
+    """
+    A promotion gate decided by a sequential paired evaluation. dataset_hash
+    matches the ModelEvaluation rows written with it; for a run that stopped
+    early that is the hash of the scored prefix, never the full split's.
+    """
+    candidate_label = models.CharField(max_length=64)
+    baseline_label = models.CharField(max_length=64)
+    dataset_hash = models.CharField(max_length=64)
+    gate_name = models.CharField(max_length=64)
+    metric_name = models.CharField(max_length=64)
+    threshold = models.FloatField()
+    # Null when the stream ended before the gate was decided.
+    passed = models.BooleanField(null=True, blank=True)
+    # Mean per-trial margin and its interval at the Bonferroni-adjusted z; the
+    # gate is decided once the interval clears zero.
+    margin = models.FloatField()
+    margin_lower = models.FloatField()
+    margin_upper = models.FloatField()
+    critical_z = models.FloatField()
+    confidence_level = models.FloatField()
+    n_trials = models.BigIntegerField(default=0)
+    trials_scored = models.BigIntegerField(default=0)
+    dataset_n_trials = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'mlcore_sequential_gate_decision'
+        indexes = [
+            models.Index(
+                fields=['candidate_label', 'baseline_label', 'dataset_hash', 'gate_name'],
+                name='mlcore_sgd_pair_gate_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.candidate_label} vs {self.baseline_label}:{self.gate_name}={self.passed}"
+
+
 class ModelPromotion(models.Model):
     """
     Promotion approval workflow record (arch decisions #7, #18).
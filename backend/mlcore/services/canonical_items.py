@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import uuid
 import hashlib
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -10,7 +12,7 @@ import time
 from typing import Iterable
 from uuid import UUID
 
-from django.db import connection, transaction
+from django.db import close_old_connections, connection, transaction
 
 from catalog.models import Track, TrackExternalIdentifier
 from mlcore.models import CanonicalItem, CanonicalItemAlias
@@ -28,6 +30,7 @@ ALIAS_RESOURCE_TRACK = 'track'
 ALIAS_RESOURCE_RECORDING = 'recording'
 ALIAS_STATUS_ACTIVE = 'active'
 ALIAS_STATUS_CONFLICT = 'conflict'
+CATALOG_TRACK_CHECKPOINT_NAME = 'catalog'
 
 @dataclass(frozen=True)
 class CanonicalItemIdentity:
@@ -74,6 +77,16 @@ class CanonicalAliasSourceMapping:
     resource_type: str
 
 
+@dataclass(frozen=True)
+class CanonicalAliasRange:
+    """One disjoint slice of the UUID key space: ``lower_id <= id < upper_id``."""
+
+    index: int
+    count: int
+    lower_id: UUID | None = None
+    upper_id: UUID | None = None
+
+
 CANONICAL_ALIAS_SOURCE_MAPPINGS = (
     CanonicalAliasSourceMapping(
         item_type=ITEM_TYPE_RECORDING_MBID,
@@ -416,11 +429,51 @@ def _uuid_sql_from_alias_parts() -> str:
     )
 
 
-def _acquire_alias_materialization_lock() -> None:
+def _acquire_alias_materialization_lock(*, shared: bool = False) -> None:
     if connection.vendor != 'postgresql':
         return
+    lock_function = 'pg_advisory_xact_lock_shared' if shared else 'pg_advisory_xact_lock'
     with connection.cursor() as cursor:
-        cursor.execute("SELECT pg_advisory_xact_lock(hashtext('mlcore-canonical-alias-materialization'))")
+        cursor.execute(f"SELECT {lock_function}(hashtext('mlcore-canonical-alias-materialization'))")
+
+
+def canonical_alias_id_ranges(range_count: int) -> list[CanonicalAliasRange]:
+    """Split the 128-bit UUID space into ``range_count`` contiguous, disjoint ranges."""
+    if range_count < 1:
+        raise ValueError('range_count must be greater than 0')
+    key_space = 1 << 128
+    bounds = [UUID(int=key_space * index // range_count) for index in range(1, range_count)]
+    return [
+        CanonicalAliasRange(
+            index=index,
+            count=range_count,
+            lower_id=bounds[index - 1] if index > 0 else None,
+            upper_id=bounds[index] if index < range_count - 1 else None,
+        )
+        for index in range(range_count)
+    ]
+
+
+def canonical_alias_checkpoint_key(name: str, alias_range: CanonicalAliasRange) -> str:
+    if alias_range.count == 1:
+        return name
+    return f'{name}:{alias_range.index}/{alias_range.count}'
+
+
+def _fetch_alias_owners(keys: Iterable[tuple[str, str, str]]) -> dict[tuple[str, str, str], UUID]:
+    wanted = set(keys)
+    if not wanted:
+        return {}
+    rows = CanonicalItemAlias.objects.filter(
+        source__in=sorted({key[0] for key in wanted}),
+        resource_type__in=sorted({key[1] for key in wanted}),
+        source_id__in=sorted({key[2] for key in wanted}),
+    ).values_list('source', 'resource_type', 'source_id', 'canonical_item_id')
+    return {
+        (source, resource_type, source_id): canonical_item_id
+        for source, resource_type, source_id, canonical_item_id in rows
+        if (source, resource_type, source_id) in wanted
+    }
 
 
 def count_canonical_alias_source_items(mappings: Iterable[CanonicalAliasSourceMapping]) -> int:
@@ -445,8 +498,11 @@ def _materialize_canonical_item_alias_batch(
     last_id: UUID | None,
     batch_size: int,
     source_version: str,
+    alias_range: CanonicalAliasRange | None = None,
 ) -> tuple[AliasMaterializationResult, UUID | None, int]:
     alias_uuid_sql = _uuid_sql_from_alias_parts()
+    lower_id = alias_range.lower_id if alias_range is not None else None
+    upper_id = alias_range.upper_id if alias_range is not None else None
     with connection.cursor() as cursor:
         cursor.execute(
             f"""
@@ -459,6 +515,8 @@ def _materialize_canonical_item_alias_batch(
                 FROM mlcore_canonical_item
                 WHERE item_type = %s
                   AND (%s::uuid IS NULL OR id > %s::uuid)
+                  AND (%s::uuid IS NULL OR id >= %s::uuid)
+                  AND (%s::uuid IS NULL OR id < %s::uuid)
                 ORDER BY id
                 LIMIT %s
             ),
@@ -500,7 +558,7 @@ def _materialize_canonical_item_alias_batch(
                     now()
                 FROM candidates
                 ON CONFLICT (source, resource_type, source_id) DO NOTHING
-                RETURNING 1
+                RETURNING canonical_item_id
             )
             SELECT
                 count(*)::bigint AS processed_count,
@@ -520,7 +578,13 @@ def _materialize_canonical_item_alias_batch(
                     SELECT count(*)::bigint
                     FROM existing
                     WHERE existing_canonical_item_id <> canonical_item_id
-                ) AS conflict_count
+                ) AS conflict_count,
+                (
+                    SELECT array_agg(c.source_id || ':' || c.canonical_item_id::text)
+                    FROM candidates c
+                    WHERE NOT EXISTS (SELECT 1 FROM existing e WHERE e.canonical_item_id = c.canonical_item_id)
+                      AND NOT EXISTS (SELECT 1 FROM inserted i WHERE i.canonical_item_id = c.canonical_item_id)
+                ) AS contended
             FROM candidates
             """,
             [
@@ -530,18 +594,38 @@ def _materialize_canonical_item_alias_batch(
                 mapping.item_type,
                 last_id,
                 last_id,
+                lower_id,
+                lower_id,
+                upper_id,
+                upper_id,
                 batch_size,
                 source_version,
                 ALIAS_STATUS_ACTIVE,
             ],
         )
-        processed_count, next_last_id, created_count, existing_count, conflict_count = cursor.fetchone()
+        processed_count, next_last_id, created_count, existing_count, conflict_count, contended = cursor.fetchone()
+
+    existing_count = int(existing_count or 0)
+    conflict_count = int(conflict_count or 0)
+    if contended:
+        # A concurrent writer committed these keys after this statement's
+        # snapshot; ON CONFLICT waited on their index entries, so the owner is
+        # visible now and can be classified exactly as the join above would.
+        desired = {}
+        for value in contended:
+            source_id, _, canonical_item_id = value.rpartition(':')
+            desired[(mapping.source, mapping.resource_type, source_id)] = UUID(canonical_item_id)
+        for key, owner_id in _fetch_alias_owners(desired).items():
+            if owner_id == desired[key]:
+                existing_count += 1
+            else:
+                conflict_count += 1
 
     return (
         AliasMaterializationResult(
             created_count=int(created_count or 0),
-            existing_count=int(existing_count or 0),
-            conflict_count=int(conflict_count or 0),
+            existing_count=existing_count,
+            conflict_count=conflict_count,
         ),
         next_last_id,
         int(processed_count or 0),
@@ -554,11 +638,9 @@ def materialize_canonical_item_self_aliases(
     batch_size: int = 100_000,
     progress_callback: Callable[[AliasMaterializationProgress], None] | None = None,
     mappings: Iterable[CanonicalAliasSourceMapping] = CANONICAL_ALIAS_SOURCE_MAPPINGS,
-    start_after_by_item_type: dict[str, UUID | str] | None = None,
-    checkpoint_callback: Callable[
-        [CanonicalAliasSourceMapping, UUID, AliasMaterializationProgress],
-        None,
-    ] | None = None,
+    start_after_by_range: dict[str, UUID | str] | None = None,
+    checkpoint_callback: Callable[[str, UUID, AliasMaterializationProgress], None] | None = None,
+    range_count: int = 1,
 ) -> AliasMaterializationResult:
     """
     Materialize aliases directly from MLCore canonical keys.
@@ -566,12 +648,21 @@ def materialize_canonical_item_self_aliases(
     This is the Neptune-scale path: it turns canonical keys like
     ``recording_msid:<id>`` into external lookup aliases without copying the
     100M+ row corpus into Python.
+
+    With ``range_count > 1`` each mapping's id space is split into disjoint
+    ranges that run on their own connections. Alias keys are derived from
+    canonical keys, so ranges never write the same key and only share the
+    materialization lock; checkpoints are kept per range under
+    ``canonical_alias_checkpoint_key``.
     """
     if batch_size < 1:
         raise ValueError('batch_size must be greater than 0')
 
+    alias_ranges = canonical_alias_id_ranges(range_count)
+    parallel = len(alias_ranges) > 1
     materialized_mappings = list(mappings)
-    checkpoints = start_after_by_item_type or {}
+    checkpoints = start_after_by_range or {}
+    state_lock = threading.Lock()
     result = AliasMaterializationResult()
     progress = AliasMaterializationProgress(
         status='running',
@@ -582,34 +673,47 @@ def materialize_canonical_item_self_aliases(
     if progress_callback is not None:
         progress_callback(progress)
 
-    for mapping in materialized_mappings:
-        checkpoint = checkpoints.get(mapping.item_type)
+    def _materialize_range(mapping: CanonicalAliasSourceMapping, alias_range: CanonicalAliasRange) -> None:
+        nonlocal result
+        checkpoint_key = canonical_alias_checkpoint_key(mapping.item_type, alias_range)
+        checkpoint = checkpoints.get(checkpoint_key)
         last_id = UUID(str(checkpoint)) if checkpoint else None
-        progress.phase = f'canonical:{mapping.item_type}'
+        with state_lock:
+            progress.phase = f'canonical:{mapping.item_type}'
         while True:
             with transaction.atomic():
-                _acquire_alias_materialization_lock()
+                _acquire_alias_materialization_lock(shared=parallel)
                 batch_result, next_last_id, processed_count = _materialize_canonical_item_alias_batch(
                     mapping,
                     last_id=last_id,
                     batch_size=batch_size,
                     source_version=source_version,
+                    alias_range=alias_range,
                 )
                 if processed_count:
                     last_id = next_last_id
-                    result = merge_alias_materialization_results(result, batch_result)
-                    progress.processed_items += processed_count
-                    progress.created_count = result.created_count
-                    progress.existing_count = result.existing_count
-                    progress.conflict_count = result.conflict_count
-                    progress.batches_processed += 1
-                    progress.updated_at = time.monotonic()
-                    if checkpoint_callback is not None and last_id is not None:
-                        checkpoint_callback(mapping, last_id, progress)
+                    with state_lock:
+                        result = merge_alias_materialization_results(result, batch_result)
+                        progress.phase = f'canonical:{mapping.item_type}'
+                        progress.processed_items += processed_count
+                        progress.created_count = result.created_count
+                        progress.existing_count = result.existing_count
+                        progress.conflict_count = result.conflict_count
+                        progress.batches_processed += 1
+                        progress.updated_at = time.monotonic()
+                        if checkpoint_callback is not None and last_id is not None:
+                            checkpoint_callback(checkpoint_key, last_id, progress)
             if processed_count == 0:
                 break
             if progress_callback is not None:
-                progress_callback(progress)
+                with state_lock:
+                    progress_callback(progress)
+
+    _run_alias_range_work(
+        _materialize_range,
+        [(mapping, alias_range) for mapping in materialized_mappings for alias_range in alias_ranges],
+        workers=len(alias_ranges),
+    )
 
     progress.status = 'succeeded'
     progress.updated_at = time.monotonic()
@@ -618,11 +722,41 @@ def materialize_canonical_item_self_aliases(
     return result
 
 
+def _run_alias_range_work(
+    materialize_range: Callable[..., None],
+    work: list[tuple],
+    *,
+    workers: int,
+) -> None:
+    if workers <= 1:
+        for args in work:
+            materialize_range(*args)
+        return
+
+    def _range_lane(*args) -> None:
+        close_old_connections()
+        try:
+            materialize_range(*args)
+        finally:
+            close_old_connections()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_range_lane, *args) for args in work]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
 @transaction.atomic
 def _materialize_track_alias_batch(
     track_list: list[Track],
     *,
     source_version: str = '',
+    shared_lock: bool = False,
 ) -> AliasMaterializationResult:
     """
     Build external-ID aliases for one batch of shared MLCore serving tracks.
@@ -634,7 +768,7 @@ def _materialize_track_alias_batch(
     if not track_list:
         return AliasMaterializationResult()
 
-    _acquire_alias_materialization_lock()
+    _acquire_alias_materialization_lock(shared=shared_lock)
 
     canonical_items_by_track_id = bulk_ensure_canonical_items_for_tracks(track_list)
 
@@ -745,6 +879,7 @@ def _materialize_track_alias_batch(
                         id, canonical_item_id, source, resource_type, source_id,
                         1.0, %s, %s, '{}'::jsonb, now(), now()
                     FROM incoming
+                    ORDER BY source, resource_type, source_id
                     ON CONFLICT (source, resource_type, source_id) DO NOTHING
                     RETURNING id
                     """,
@@ -758,7 +893,28 @@ def _materialize_track_alias_batch(
                         ALIAS_STATUS_ACTIVE,
                     ],
                 )
-                created_count = len(cursor.fetchall())
+                created_ids = {row[0] for row in cursor.fetchall()}
+            created_count = len(created_ids)
+            contended = {
+                (row.source, row.resource_type, row.source_id): row.canonical_item_id
+                for row in rows_to_create
+                if row.id not in created_ids
+            }
+            # Keys a concurrent writer committed after the read above lost the
+            # insert race; classify them against the winning row instead.
+            for key, owner_id in _fetch_alias_owners(contended).items():
+                existing_count += 1
+                if owner_id != contended[key]:
+                    conflicts.append(
+                        CanonicalAliasConflict(
+                            source=key[0],
+                            resource_type=key[1],
+                            source_id=key[2],
+                            existing_canonical_item_id=owner_id,
+                            desired_canonical_item_id=contended[key],
+                            reason='existing_mapping',
+                        )
+                    )
         else:  # pragma: no cover - production and CI use PostgreSQL
             CanonicalItemAlias.objects.bulk_create(rows_to_create, ignore_conflicts=True)
             created_count = len(rows_to_create)
@@ -771,14 +927,26 @@ def _materialize_track_alias_batch(
     )
 
 
+def _track_range_queryset(alias_range: CanonicalAliasRange, *, start_after: UUID | str | None):
+    queryset = Track.objects.order_by('juke_id')
+    if alias_range.lower_id is not None:
+        queryset = queryset.filter(juke_id__gte=alias_range.lower_id)
+    if alias_range.upper_id is not None:
+        queryset = queryset.filter(juke_id__lt=alias_range.upper_id)
+    if start_after:
+        queryset = queryset.filter(juke_id__gt=start_after)
+    return queryset
+
+
 def materialize_track_aliases(
     tracks: Iterable[Track] | None = None,
     *,
     source_version: str = '',
     batch_size: int = 10_000,
     progress_callback: Callable[[AliasMaterializationProgress], None] | None = None,
-    start_after_track_id: UUID | str | None = None,
-    checkpoint_callback: Callable[[UUID, AliasMaterializationProgress], None] | None = None,
+    start_after_by_range: dict[str, UUID | str] | None = None,
+    checkpoint_callback: Callable[[str, UUID, AliasMaterializationProgress], None] | None = None,
+    range_count: int = 1,
 ) -> AliasMaterializationResult:
     """
     Build external-ID aliases for shared MLCore serving.
@@ -786,20 +954,35 @@ def materialize_track_aliases(
     The default path streams tracks in bounded batches so this can run against
     the shared Neptune corpus without loading the full catalog into Python
     memory or generating one huge alias lookup query.
+
+    With ``range_count > 1`` the ``juke_id`` space is split into disjoint
+    ranges streamed on their own connections. Unlike canonical self-aliases,
+    two tracks can claim the same external id, so each batch reclassifies any
+    key it lost an insert race on instead of serializing every batch.
     """
     if batch_size < 1:
         raise ValueError('batch_size must be greater than 0')
 
+    alias_ranges = canonical_alias_id_ranges(range_count)
+    parallel = len(alias_ranges) > 1
+    if tracks is not None and parallel:
+        raise ValueError('range_count requires streaming tracks from the database')
+    checkpoints = start_after_by_range or {}
+
     if tracks is None:
-        queryset = Track.objects.order_by('juke_id')
-        if start_after_track_id:
-            queryset = queryset.filter(juke_id__gt=start_after_track_id)
-        total_tracks = queryset.count()
-        track_iterable = queryset.iterator(chunk_size=batch_size)
+        range_querysets = {
+            alias_range.index: _track_range_queryset(
+                alias_range,
+                start_after=checkpoints.get(canonical_alias_checkpoint_key(CATALOG_TRACK_CHECKPOINT_NAME, alias_range)),
+            )
+            for alias_range in alias_ranges
+        }
+        total_tracks = sum(queryset.count() for queryset in range_querysets.values())
     else:
+        range_querysets = {}
         total_tracks = len(tracks) if hasattr(tracks, '__len__') else 0
-        track_iterable = iter(tracks)
 
+    state_lock = threading.Lock()
     result = AliasMaterializationResult()
     progress = AliasMaterializationProgress(
         status='running',
@@ -811,20 +994,39 @@ def materialize_track_aliases(
     if progress_callback is not None:
         progress_callback(progress)
 
-    for track_batch in _iter_track_batches(track_iterable, batch_size=batch_size):
-        with transaction.atomic():
-            batch_result = _materialize_track_alias_batch(track_batch, source_version=source_version)
-            result = merge_alias_materialization_results(result, batch_result)
-            progress.processed_items += len(track_batch)
-            progress.created_count = result.created_count
-            progress.existing_count = result.existing_count
-            progress.conflict_count = result.conflict_count
-            progress.batches_processed += 1
-            progress.updated_at = time.monotonic()
-            if checkpoint_callback is not None:
-                checkpoint_callback(track_batch[-1].juke_id, progress)
-        if progress_callback is not None:
-            progress_callback(progress)
+    def _materialize_range(alias_range: CanonicalAliasRange) -> None:
+        nonlocal result
+        checkpoint_key = canonical_alias_checkpoint_key(CATALOG_TRACK_CHECKPOINT_NAME, alias_range)
+        if tracks is None:
+            track_iterable = range_querysets[alias_range.index].iterator(chunk_size=batch_size)
+        else:
+            track_iterable = iter(tracks)
+        for track_batch in _iter_track_batches(track_iterable, batch_size=batch_size):
+            with transaction.atomic():
+                batch_result = _materialize_track_alias_batch(
+                    track_batch,
+                    source_version=source_version,
+                    shared_lock=parallel,
+                )
+                with state_lock:
+                    result = merge_alias_materialization_results(result, batch_result)
+                    progress.processed_items += len(track_batch)
+                    progress.created_count = result.created_count
+                    progress.existing_count = result.existing_count
+                    progress.conflict_count = result.conflict_count
+                    progress.batches_processed += 1
+                    progress.updated_at = time.monotonic()
+                    if checkpoint_callback is not None:
+                        checkpoint_callback(checkpoint_key, track_batch[-1].juke_id, progress)
+            if progress_callback is not None:
+                with state_lock:
+                    progress_callback(progress)
+
+    _run_alias_range_work(
+        _materialize_range,
+        [(alias_range,) for alias_range in alias_ranges],
+        workers=len(alias_ranges),
+    )
 
     progress.status = 'succeeded'
     progress.updated_at = time.monotonic()
@@ -1,25 +1,128 @@
 from __future__ import annotations
 
+import logging
 from uuid import UUID
 
-from django.db import transaction
+from django.db import connection, transaction
 
-from mlcore.models import CanonicalItemRedirect
+from mlcore.models import CanonicalItemRedirect, CanonicalItemRedirectClosure
+
+logger = logging.getLogger(__name__)
 
 MAX_REDIRECT_DEPTH = 8
 
+# Follows every active redirect as far as it goes and keeps the deepest item
+# reached from each origin. Redirects are one-to-one, so that item is the
+# terminal unless it still redirects: the chain either revisits an item (a
+# cycle) or is still redirecting after MAX_REDIRECT_DEPTH hops, and the row is
+# marked truncated.
+_REDIRECT_CLOSURE_SQL = """
+    WITH RECURSIVE chain AS (
+        SELECT
+            from_canonical_item_id AS origin_id,
+            to_canonical_item_id AS current_id,
+            ARRAY[from_canonical_item_id, to_canonical_item_id]::uuid[] AS path,
+            1 AS depth,
+            FALSE AS cyclic
+        FROM mlcore_canonical_item_redirect
+        WHERE status = 'active'
+        UNION ALL
+        SELECT
+            chain.origin_id,
+            redirect.to_canonical_item_id,
+            chain.path || redirect.to_canonical_item_id,
+            chain.depth + 1,
+            redirect.to_canonical_item_id = ANY(chain.path)
+        FROM chain
+        JOIN mlcore_canonical_item_redirect redirect
+          ON redirect.from_canonical_item_id = chain.current_id
+         AND redirect.status = 'active'
+        WHERE NOT chain.cyclic
+          AND chain.depth < %s
+    )
+    SELECT DISTINCT ON (chain.origin_id)
+        chain.origin_id,
+        chain.current_id,
+        chain.depth,
+        EXISTS (
+            SELECT 1
+            FROM mlcore_canonical_item_redirect next_redirect
+            WHERE next_redirect.from_canonical_item_id = chain.current_id
+              AND next_redirect.status = 'active'
+        ) AS truncated
+    FROM chain
+    WHERE NOT chain.cyclic
+    ORDER BY chain.origin_id, chain.depth DESC
+"""
+
+_REDIRECT_FORWARD_SQL = """
+    WITH RECURSIVE forward AS (
+        SELECT %s::uuid AS id, 0 AS distance, ARRAY[%s::uuid] AS path
+        UNION ALL
+        SELECT
+            redirect.to_canonical_item_id,
+            forward.distance + 1,
+            forward.path || redirect.to_canonical_item_id
+        FROM forward
+        JOIN mlcore_canonical_item_redirect redirect
+          ON redirect.from_canonical_item_id = forward.id
+         AND redirect.status = 'active'
+        WHERE forward.distance < %s
+          AND NOT redirect.to_canonical_item_id = ANY(forward.path)
+    )
+    SELECT id FROM forward ORDER BY distance
+"""
+
+_REDIRECT_ANCESTORS_SQL = """
+    WITH RECURSIVE ancestors AS (
+        SELECT %s::uuid AS id, 0 AS distance, ARRAY[%s::uuid] AS path
+        UNION ALL
+        SELECT
+            redirect.from_canonical_item_id,
+            ancestors.distance + 1,
+            ancestors.path || redirect.from_canonical_item_id
+        FROM ancestors
+        JOIN mlcore_canonical_item_redirect redirect
+          ON redirect.to_canonical_item_id = ancestors.id
+         AND redirect.status = 'active'
+        WHERE ancestors.distance < %s
+          AND NOT redirect.from_canonical_item_id = ANY(ancestors.path)
+    )
+    SELECT id, distance FROM ancestors
+"""
+
+
+def _lock_redirect_closure(cursor) -> None:
+    # Readers keep going; closure writers (bulk rebuilds and upserts) take turns.
+    cursor.execute('LOCK TABLE mlcore_canonical_item_redirect_closure IN SHARE ROW EXCLUSIVE MODE')
+
 
 def resolve_canonical_item_id(item_id: UUID, *, max_depth: int = MAX_REDIRECT_DEPTH) -> UUID:
     current = UUID(str(item_id))
+    closure = CanonicalItemRedirectClosure.objects.filter(
+        from_canonical_item_id=current,
+    ).values_list('terminal_canonical_item_id', 'depth', 'truncated').first()
+    if closure is None:
+        return current
+    terminal_id, depth, truncated = closure
+    if truncated:
+        # Walk the chain itself so the error names the cycle or the depth.
+        return _walk_redirect_chain(current, max_depth=max_depth)
+    if depth > max_depth:
+        raise ValueError(f'Canonical redirect depth exceeds {max_depth}')
+    return terminal_id
+
+
+def _walk_redirect_chain(item_id: UUID, *, max_depth: int) -> UUID:
+    current = item_id
     visited = {current}
     for _ in range(max_depth):
-        redirect = CanonicalItemRedirect.objects.filter(
+        target = CanonicalItemRedirect.objects.filter(
             from_canonical_item_id=current,
             status='active',
-        ).only('to_canonical_item_id').first()
-        if redirect is None:
+        ).values_list('to_canonical_item_id', flat=True).first()
+        if target is None:
             return current
-        target = redirect.to_canonical_item_id
         if target in visited:
             raise ValueError(f'Canonical redirect cycle detected at {target}')
         visited.add(target)
@@ -27,6 +130,112 @@ def resolve_canonical_item_id(item_id: UUID, *, max_depth: int = MAX_REDIRECT_DE
     raise ValueError(f'Canonical redirect depth exceeds {max_depth}')
 
 
+@transaction.atomic
+def rebuild_canonical_redirect_closure() -> tuple[int, int]:
+    """
+    Recompute the redirect closure from every active redirect.
+
+    Returns the number of redirected items that resolve to a terminal and the
+    number whose chain cycles or is too deep, which are stored truncated.
+    """
+    with connection.cursor() as cursor:
+        _lock_redirect_closure(cursor)
+        cursor.execute('DELETE FROM mlcore_canonical_item_redirect_closure')
+        cursor.execute(
+            f"""
+            INSERT INTO mlcore_canonical_item_redirect_closure (
+                from_canonical_item_id,
+                terminal_canonical_item_id,
+                depth,
+                truncated,
+                updated_at
+            )
+            SELECT origin_id, current_id, depth, truncated, NOW()
+            FROM ({_REDIRECT_CLOSURE_SQL}) closure
+            """,
+            [MAX_REDIRECT_DEPTH],
+        )
+        cursor.execute(
+            """
+            SELECT
+                COUNT(*) FILTER (WHERE NOT truncated),
+                COUNT(*) FILTER (WHERE truncated)
+            FROM mlcore_canonical_item_redirect_closure
+            """
+        )
+        closure_count, truncated_count = (int(value) for value in cursor.fetchone())
+    if truncated_count:
+        logger.warning(
+            'canonical redirect closure rebuilt with %d chain(s) that cycle or exceed depth %d',
+            truncated_count,
+            MAX_REDIRECT_DEPTH,
+        )
+    return closure_count, truncated_count
+
+
+def _refresh_redirect_closure(item_id: UUID) -> None:
+    """Re-point the closure rows of ``item_id`` and every item redirecting through it."""
+    target_id = CanonicalItemRedirect.objects.filter(
+        from_canonical_item_id=item_id,
+        status='active',
+    ).values_list('to_canonical_item_id', flat=True).first()
+    terminal_id = item_id
+    terminal_depth = 0
+    chain_ends = True
+    if target_id is not None:
+        target_closure = CanonicalItemRedirectClosure.objects.filter(
+            from_canonical_item_id=target_id,
+        ).values_list('terminal_canonical_item_id', 'depth', 'truncated').first()
+        terminal_id, terminal_depth, target_truncated = target_closure or (target_id, 0, False)
+        terminal_depth += 1
+        chain_ends = not target_truncated
+
+    with connection.cursor() as cursor:
+        _lock_redirect_closure(cursor)
+        cursor.execute(_REDIRECT_ANCESTORS_SQL, [item_id, item_id, MAX_REDIRECT_DEPTH])
+        ancestors = cursor.fetchall()
+        cursor.execute(
+            'DELETE FROM mlcore_canonical_item_redirect_closure WHERE from_canonical_item_id = ANY(%s::uuid[])',
+            [[ancestor_id for ancestor_id, _ in ancestors]],
+        )
+        forward: list[UUID] | None = None
+        rows = []
+        for ancestor_id, distance in ancestors:
+            if chain_ends and distance + terminal_depth <= MAX_REDIRECT_DEPTH:
+                if ancestor_id != terminal_id:
+                    rows.append((ancestor_id, terminal_id, distance + terminal_depth, False))
+                continue
+            # Too deep or never ending: keep the deepest item within reach,
+            # as the bulk rebuild does.
+            if forward is None:
+                cursor.execute(_REDIRECT_FORWARD_SQL, [item_id, item_id, MAX_REDIRECT_DEPTH])
+                forward = [row[0] for row in cursor.fetchall()]
+            hops = min(MAX_REDIRECT_DEPTH - distance, len(forward) - 1)
+            if distance + hops > 0:
+                rows.append((ancestor_id, forward[hops], distance + hops, True))
+        if rows:
+            cursor.execute(
+                """
+                INSERT INTO mlcore_canonical_item_redirect_closure (
+                    from_canonical_item_id,
+                    terminal_canonical_item_id,
+                    depth,
+                    truncated,
+                    updated_at
+                )
+                SELECT from_id, terminal_id, depth, truncated, NOW()
+                FROM unnest(%s::uuid[], %s::uuid[], %s::int[], %s::boolean[])
+                    AS closure(from_id, terminal_id, depth, truncated)
+                """,
+                [
+                    [row[0] for row in rows],
+                    [row[1] for row in rows],
+                    [row[2] for row in rows],
+                    [row[3] for row in rows],
+                ],
+            )
+
+
 @transaction.atomic
 def upsert_canonical_redirect(
     *,
@@ -41,6 +250,8 @@ def upsert_canonical_redirect(
     target_id = UUID(str(to_item_id))
     if source_id == target_id:
         raise ValueError('Canonical item cannot redirect to itself')
+    with connection.cursor() as cursor:
+        _lock_redirect_closure(cursor)
     resolved_target = resolve_canonical_item_id(target_id)
     if resolved_target == source_id:
         raise ValueError('Canonical redirect would create a cycle')
@@ -49,7 +260,7 @@ def upsert_canonical_redirect(
         from_canonical_item_id=source_id,
     ).first()
     if redirect is None:
-        return CanonicalItemRedirect.objects.create(
+        redirect = CanonicalItemRedirect.objects.create(
             from_canonical_item_id=source_id,
             to_canonical_item_id=target_id,
             source=source,
@@ -58,7 +269,7 @@ def upsert_canonical_redirect(
             status='active',
             evidence=evidence or {},
         )
-    if redirect.to_canonical_item_id != target_id:
+    elif redirect.to_canonical_item_id != target_id:
         redirect.status = 'conflict'
         redirect.evidence = {
             **redirect.evidence,
@@ -67,19 +278,19 @@ def upsert_canonical_redirect(
             'conflicting_source_version': source_version,
         }
         redirect.save(update_fields=['status', 'evidence', 'updated_at'])
-        return redirect
-
-    redirect.status = 'active'
-    redirect.source = source
-    redirect.source_version = source_version
-    redirect.confidence = confidence
-    redirect.evidence = evidence or {}
-    redirect.save(update_fields=[
-        'status',
-        'source',
-        'source_version',
-        'confidence',
-        'evidence',
-        'updated_at',
-    ])
+    else:
+        redirect.status = 'active'
+        redirect.source = source
+        redirect.source_version = source_version
+        redirect.confidence = confidence
+        redirect.evidence = evidence or {}
+        redirect.save(update_fields=[
+            'status',
+            'source',
+            'source_version',
+            'confidence',
+            'evidence',
+            'updated_at',
+        ])
+    _refresh_redirect_closure(source_id)
     return redirect
@@ -188,9 +188,10 @@ def _append_search_history_baskets(
     split: str,
     split_buckets: int,
     session_to_jukes: dict[tuple[str, str | bytes], set[UUID]],
+    session_users: dict[tuple[str, str | bytes], str] | None = None,
 ) -> int:
     rows = SearchHistoryResource.objects.filter(resource_type=resource_type).values_list(
-        "search_history_id", "resource_id"
+        "search_history_id", "resource_id", "search_history__user_id"
     )
 
     if not rows:
@@ -200,10 +201,12 @@ def _append_search_history_baskets(
         raise ValueError(f"resource_type '{resource_type}' not supported in Phase 1")
 
     session_to_pks: dict[int, set[int]] = defaultdict(set)
+    user_by_session: dict[int, int] = {}
     source_row_count = 0
-    for session_id, pk in rows:
+    for session_id, pk, user_id in rows:
         if _is_in_split(session_id, split, split_buckets):
             session_to_pks[session_id].add(pk)
+            user_by_session[session_id] = user_id
             source_row_count += 1
 
     all_pks: set[int] = set()
@@ -225,6 +228,10 @@ def _append_search_history_baskets(
         session_to_jukes[(BEHAVIOR_SOURCE_SEARCH_HISTORY, str(session_id))].update(
             pk_to_canonical_item_id[pk] for pk in pks if pk in pk_to_canonical_item_id
         )
+        if session_users is not None:
+            session_users[(BEHAVIOR_SOURCE_SEARCH_HISTORY, str(session_id))] = (
+                f"{BEHAVIOR_SOURCE_SEARCH_HISTORY}:{user_by_session[session_id]}"
+            )
 
     return source_row_count
 
@@ -870,8 +877,46 @@ def baskets_from_behavioral_sources_with_count(
     split_buckets: int = _SPLIT_BUCKET_COUNT,
     sources: Iterable[str] | None = None,
 ) -> tuple[list[list[UUID]], int]:
+    keyed_baskets, source_row_count = _user_keyed_behavioral_baskets(
+        resource_type=resource_type,
+        split=split,
+        split_buckets=split_buckets,
+        sources=sources,
+    )
+    return [basket for _, basket in keyed_baskets], source_row_count
+
+
+def user_keyed_baskets_from_behavioral_sources(
+    resource_type: str = DEFAULT_RESOURCE_TYPE,
+    split: str = "all",
+    split_buckets: int = _SPLIT_BUCKET_COUNT,
+    sources: Iterable[str] | None = None,
+) -> list[tuple[str, list[UUID]]]:
+    """
+    The baskets of baskets_from_behavioral_sources(), in the same order, each
+    paired with the key of the user it came from. Search-history baskets key
+    on the Juke user. ListenBrainz session facts do not retain the (hashed)
+    user, so each session's key stands in for its user.
+    """
+    keyed_baskets, _ = _user_keyed_behavioral_baskets(
+        resource_type=resource_type,
+        split=split,
+        split_buckets=split_buckets,
+        sources=sources,
+    )
+    return keyed_baskets
+
+
+def _user_keyed_behavioral_baskets(
+    *,
+    resource_type: str,
+    split: str,
+    split_buckets: int,
+    sources: Iterable[str] | None,
+) -> tuple[list[tuple[str, list[UUID]]], int]:
     normalized_sources = _normalized_sources(sources)
     session_to_jukes: dict[tuple[str, str | bytes], set[UUID]] = defaultdict(set)
+    session_users: dict[tuple[str, str | bytes], str] = {}
     source_row_count = 0
 
     if BEHAVIOR_SOURCE_SEARCH_HISTORY in normalized_sources:
@@ -880,6 +925,7 @@ def baskets_from_behavioral_sources_with_count(
             split=split,
             split_buckets=split_buckets,
             session_to_jukes=session_to_jukes,
+            session_users=session_users,
         )
 
     if BEHAVIOR_SOURCE_LISTENBRAINZ in normalized_sources:
@@ -889,13 +935,15 @@ def baskets_from_behavioral_sources_with_count(
             session_to_jukes=session_to_jukes,
         )
 
-    baskets: list[list[UUID]] = []
+    keyed_baskets: list[tuple[str, list[UUID]]] = []
     for session_key in sorted(session_to_jukes.keys()):
         juke_ids = sorted(session_to_jukes[session_key], key=str)
         if len(juke_ids) >= MIN_BASKET_SIZE:
-            baskets.append(juke_ids)
+            source, key = session_key
+            user_key = session_users.get(session_key) or f"{source}:{key.hex() if isinstance(key, bytes) else key}"
+            keyed_baskets.append((user_key, juke_ids))
 
-    return baskets, source_row_count
+    return keyed_baskets, source_row_count
 
 
 def compute_pmi_table(
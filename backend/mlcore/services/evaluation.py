@@ -12,26 +12,39 @@ mix MusicProfile.favorite_tracks in once those become resolvable to juke_ids.
 
 Ranker adapters call the same pure scorers the engine uses
 (recommender_engine/app/scorers.py) so offline scores match serving scores
-without an HTTP round-trip per trial.
+without an HTTP round-trip per trial. EngineRanker is the exception: it
+benchmarks the real serving path and adds latency/throughput metrics.
 """
 from __future__ import annotations
 
 import hashlib
 import logging
 import math
+import threading
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Iterable, Protocol
+from statistics import NormalDist
+from typing import Callable, Iterable, Protocol
 from uuid import UUID
 
-from django.db import connection
+import numpy as np
+import requests
+from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import Q
 
 from catalog.models import Track
-from mlcore.models import CanonicalItem, ItemCoOccurrence, ModelEvaluation, TrainingRun
+from mlcore.models import (
+    CanonicalItem,
+    ItemCoOccurrence,
+    ModelEvaluation,
+    SequentialGateDecision,
+    TrainingRun,
+)
 from mlcore.services.canonical_items import bulk_ensure_canonical_items_for_tracks
 from mlcore.services.cooccurrence import (
     BEHAVIOR_SOURCE_LISTENBRAINZ,
@@ -40,6 +53,7 @@ from mlcore.services.cooccurrence import (
     _SPLIT_BUCKET_COUNT,
     _sql_split_predicate,
     baskets_from_behavioral_sources,
+    user_keyed_baskets_from_behavioral_sources,
 )
 from recommender_engine.app.scorers import (
     extract_seed_feature_ids,
@@ -53,6 +67,14 @@ DEFAULT_K = 10
 # A held-out item is "cold" if it appears in at most this many baskets.
 DEFAULT_COLD_THRESHOLD = 2
 DEFAULT_EVALUATION_BATCH_SIZE = 1000
+DEFAULT_SAMPLE_SEED = 0
+# Baskets at or above this size share one segment / sampling stratum ("10+") —
+# the long tail is too sparse per exact size to be worth splitting further.
+BASKET_SIZE_SEGMENT_CAP = 10
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+# Stratified sampling cells: basket size (capped) x session hash bucket x basket popularity tier.
+SAMPLE_HASH_BUCKETS = 8
+SAMPLE_POPULARITY_TIERS = 4
 
 # Metric names as stored in mlcore_model_evaluation.metric_name.
 # Stage 5 promotion gates join on these — keep stable.
@@ -60,6 +82,19 @@ METRIC_RECALL = 'recall@10'
 METRIC_NDCG = 'ndcg@10'
 METRIC_COVERAGE = 'coverage'
 METRIC_COLD_RECALL = 'cold_start_recall@10'
+# Serving metrics — only EngineRanker evaluations record these.
+METRIC_LATENCY_P50 = 'latency_p50_ms'
+METRIC_LATENCY_P95 = 'latency_p95_ms'
+METRIC_LATENCY_P99 = 'latency_p99_ms'
+METRIC_THROUGHPUT = 'throughput_rps'
+SERVING_METRICS = (METRIC_LATENCY_P50, METRIC_LATENCY_P95, METRIC_LATENCY_P99, METRIC_THROUGHPUT)
+
+DEFAULT_ENGINE_CONCURRENCY = 8
+# Sequential paired evaluation never decides a gate on fewer trials than this
+# (per gate slice) unless the trial stream runs out first.
+DEFAULT_SEQUENTIAL_MIN_TRIALS = 2000
+SEQUENTIAL_RELATIVE_LIFT = 'relative_lift'
+SEQUENTIAL_MAX_REGRESSION = 'max_regression'
 
 
 # --- pure metric math (no DB) ---
@@ -104,6 +139,9 @@ class Trial:
     seeds: tuple[UUID, ...]
     held_out: UUID
     is_cold: bool
+    # Source basket position within the dataset; LOO trials from one basket are
+    # correlated, so confidence intervals cluster on it. -1 = own cluster.
+    basket_index: int = -1
 
 
 @dataclass
@@ -112,6 +150,9 @@ class Dataset:
     dataset_hash: str
     item_frequency: dict[UUID, int] = field(default_factory=dict)
     n_baskets: int = 0
+    sample_rate: float | None = None
+    sample_seed: int | None = None
+    population_n_baskets: int = 0
 
 
 def _sample_listenbrainz_baskets(
@@ -153,6 +194,64 @@ def _sample_listenbrainz_baskets(
     ]
 
 
+def _basket_line(basket: list[UUID]) -> str:
+    return ','.join(sorted(str(item) for item in basket))
+
+
+def stratified_basket_sample(
+    baskets: list[list[UUID]],
+    item_frequency: dict[UUID, int],
+    *,
+    sample_rate: float,
+    seed: int = DEFAULT_SAMPLE_SEED,
+    users: list[str] | None = None,
+) -> list[list[UUID]]:
+    """
+    Deterministic stratified sample of baskets. Cells are (basket size capped
+    at BASKET_SIZE_SEGMENT_CAP, user hash bucket, popularity tier of the
+    basket's median item frequency); each non-empty cell keeps
+    max(1, round(sample_rate * cell size)) baskets, chosen by a seeded hash so
+    the same (baskets, rate, seed) always yields the same sample.
+
+    users holds one user key per basket, so every basket of a user hashes to
+    the same bucket. Without it each basket counts as its own user.
+    """
+    if users is not None and len(users) != len(baskets):
+        raise ValueError(f"users has {len(users)} entries for {len(baskets)} baskets")
+    if not 0.0 < sample_rate <= 1.0:
+        raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}")
+    if sample_rate == 1.0 or not baskets:
+        return list(baskets)
+
+    medians = [
+        sorted(item_frequency.get(item, 0) for item in basket)[len(basket) // 2]
+        for basket in baskets
+    ]
+    tier_edges = np.quantile(
+        np.asarray(medians, dtype=np.float64),
+        np.linspace(0.0, 1.0, SAMPLE_POPULARITY_TIERS + 1)[1:-1],
+    )
+    cells: dict[tuple[int, int, int], list[tuple[str, int]]] = {}
+    for position, (basket, median) in enumerate(zip(baskets, medians)):
+        line = _basket_line(basket)
+        user = users[position] if users is not None else line
+        user_hash = hashlib.sha256(user.encode('utf-8')).hexdigest()
+        cell = (
+            min(len(basket), BASKET_SIZE_SEGMENT_CAP),
+            int(user_hash[:8], 16) % SAMPLE_HASH_BUCKETS,
+            int(np.searchsorted(tier_edges, median, side='right')),
+        )
+        order_key = hashlib.sha256(f'{seed}|{line}'.encode('utf-8')).hexdigest()
+        cells.setdefault(cell, []).append((order_key, position))
+
+    selected: list[int] = []
+    for members in cells.values():
+        members.sort()
+        keep = max(1, int(sample_rate * len(members) + 0.5))
+        selected.extend(position for _, position in members[:keep])
+    return [baskets[position] for position in sorted(selected)]
+
+
 def build_loo_dataset(
     baskets: list[list[UUID]] | None = None,
     cold_threshold: int = DEFAULT_COLD_THRESHOLD,
@@ -161,6 +260,9 @@ def build_loo_dataset(
     sources: Iterable[str] | None = None,
     max_baskets: int | None = None,
     max_basket_items: int | None = None,
+    sample_rate: float | None = None,
+    sample_seed: int = DEFAULT_SAMPLE_SEED,
+    basket_users: list[str] | None = None,
 ) -> Dataset:
     """
     Leave-one-out trials from behavioral baskets. For each basket of size n,
@@ -170,10 +272,21 @@ def build_loo_dataset(
     basket inputs always produce the same hash regardless of dict iteration
     order inside baskets_from_search_history().
 
+    sample_rate switches on stratified_basket_sample() after the population is
+    built, stratifying on the user behind each basket: basket_users for
+    explicit baskets, the behavioral sources' user keys otherwise. Cold
+    tagging and item_frequency stay population-level, and the sample
+    parameters are folded into the hash so a sample never shares a
+    dataset_hash with the full split. max_baskets (a biased session_key
+    prefix) cannot be combined with it.
+
     Phase 1 defaults to blended SearchHistoryResource plus external
     ListenBrainz session-track facts. See module docstring for the planned
     MusicProfile.favorite_tracks follow-up.
     """
+    if sample_rate is not None and max_baskets is not None:
+        raise ValueError("sample_rate and max_baskets are mutually exclusive")
+
     if baskets is None and max_baskets is not None:
         normalized_sources = set(sources or (BEHAVIOR_SOURCE_SEARCH_HISTORY, BEHAVIOR_SOURCE_LISTENBRAINZ))
         if normalized_sources == {BEHAVIOR_SOURCE_LISTENBRAINZ}:
@@ -189,18 +302,22 @@ def build_loo_dataset(
                 sources=sources,
             )[:max_baskets]
     elif baskets is None:
-        baskets = baskets_from_behavioral_sources(
+        keyed_baskets = user_keyed_baskets_from_behavioral_sources(
             split=split,
             split_buckets=split_buckets,
             sources=sources,
         )
+        basket_users = [user for user, _ in keyed_baskets]
+        baskets = [basket for _, basket in keyed_baskets]
+
+    if basket_users is not None and len(basket_users) != len(baskets):
+        raise ValueError(f"basket_users has {len(basket_users)} entries for {len(baskets)} baskets")
 
     if max_basket_items is not None:
-        baskets = [
-            basket
-            for basket in baskets
-            if len(set(basket)) <= max_basket_items
-        ]
+        kept = [position for position, basket in enumerate(baskets) if len(set(basket)) <= max_basket_items]
+        baskets = [baskets[position] for position in kept]
+        if basket_users is not None:
+            basket_users = [basket_users[position] for position in kept]
 
     # Frequency over baskets (not raw occurrences — baskets are already deduped sets).
     freq: Counter[UUID] = Counter()
@@ -208,8 +325,18 @@ def build_loo_dataset(
         for jid in set(basket):
             freq[jid] += 1
 
+    population_n_baskets = len(baskets)
+    if sample_rate is not None:
+        baskets = stratified_basket_sample(
+            [sorted(set(basket), key=str) for basket in baskets],
+            freq,
+            sample_rate=sample_rate,
+            seed=sample_seed,
+            users=basket_users,
+        )
+
     trials: list[Trial] = []
-    for basket in baskets:
+    for basket_index, basket in enumerate(baskets):
         unique = sorted(set(basket), key=str)  # sorted → deterministic trial order
         if len(unique) < 2:
             continue
@@ -219,9 +346,12 @@ def build_loo_dataset(
                 seeds=seeds,
                 held_out=held_out,
                 is_cold=freq[held_out] <= cold_threshold,
+                basket_index=basket_index,
             ))
 
     hasher = hashlib.sha256()
+    if sample_rate is not None:
+        hasher.update(f'sample|rate={sample_rate!r}|seed={sample_seed}\n'.encode('utf-8'))
     # Canonical string per trial: sorted seeds joined + held-out, one line each, whole stream sorted.
     lines = sorted(
         ','.join(sorted(str(s) for s in t.seeds)) + '|' + str(t.held_out)
@@ -237,7 +367,356 @@ def build_loo_dataset(
         dataset_hash=dataset_hash,
         item_frequency=dict(freq),
         n_baskets=len(baskets),
+        sample_rate=sample_rate,
+        sample_seed=sample_seed if sample_rate is not None else None,
+        population_n_baskets=population_n_baskets,
+    )
+
+
+# --- vectorized metric kernel (no DB) ---
+#
+# The driver hands each scored batch to the kernel as an (n_trials x k) int
+# matrix of ranked item ids plus the matching held-out id vector, so recall,
+# nDCG, cold recall and coverage come out of a handful of array operations
+# instead of a Python loop per trial. recall_at_k()/ndcg_at_k() above remain
+# the reference definitions; for the single-relevant LOO case they agree.
+
+# Fills matrix slots past the end of a short ranked list. ItemIndex never
+# hands out a negative id, so padding can never match a held-out item.
+RANKED_PAD_ID = -1
+
+SEGMENT_BASKET_SIZE = 'basket_size'
+SEGMENT_POPULARITY_DECILE = 'popularity_decile'
+
+
+class ItemIndex:
+    """Interns item UUIDs into dense non-negative int ids for the metric kernel."""
+
+    def __init__(self) -> None:
+        self._ids: dict[UUID, int] = {}
+        self.items: list[UUID] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def encode(self, item_id: UUID) -> int:
+        code = self._ids.get(item_id)
+        if code is None:
+            code = len(self._ids)
+            self._ids[item_id] = code
+            self.items.append(item_id)
+        return code
+
+
+def ranked_matrix(ranked_lists: list[list[UUID]], k: int, index: ItemIndex) -> np.ndarray:
+    """Pack ranked lists into an (n x k) int64 matrix, truncating at k and padding with RANKED_PAD_ID."""
+    matrix = np.full((len(ranked_lists), k), RANKED_PAD_ID, dtype=np.int64)
+    for row, ranked in enumerate(ranked_lists):
+        codes = [index.encode(item_id) for item_id in ranked[:k]]
+        if codes:
+            matrix[row, :len(codes)] = codes
+    return matrix
+
+
+def hit_positions(ranked: np.ndarray, held_out: np.ndarray) -> np.ndarray:
+    """0-indexed rank of each trial's held-out id within its ranked row, -1 on a miss."""
+    hits = ranked == held_out[:, np.newaxis]
+    found = hits.any(axis=1)
+    return np.where(found, hits.argmax(axis=1), -1)
+
+
+def loo_metric_arrays(positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-trial (recall, nDCG) vectors for single-relevant LOO trials. A hit at
+    0-indexed position p scores recall 1 and nDCG 1/log2(p+2); IDCG is 1.
+    """
+    found = positions >= 0
+    recall = found.astype(np.float64)
+    ndcg = np.zeros(len(positions), dtype=np.float64)
+    ndcg[found] = 1.0 / np.log2(positions[found] + 2.0)
+    return recall, ndcg
+
+
+def basket_size_segments(trials: list[Trial]) -> np.ndarray:
+    """Per-trial basket size (seeds + held-out), capped at BASKET_SIZE_SEGMENT_CAP."""
+    sizes = np.fromiter((len(trial.seeds) + 1 for trial in trials), dtype=np.int64, count=len(trials))
+    return np.minimum(sizes, BASKET_SIZE_SEGMENT_CAP)
+
+
+def popularity_decile_segments(trials: list[Trial], item_frequency: dict[UUID, int]) -> np.ndarray:
+    """
+    Per-trial popularity decile (0 = least popular) of the held-out item.
+    Edges are quantiles over the distinct items' basket frequencies, so items
+    with identical frequency always land in the same decile.
+    """
+    frequencies = np.fromiter(
+        (item_frequency.get(trial.held_out, 0) for trial in trials),
+        dtype=np.int64,
+        count=len(trials),
     )
+    if not item_frequency:
+        return np.zeros(len(trials), dtype=np.int64)
+    catalog_frequencies = np.fromiter(item_frequency.values(), dtype=np.int64, count=len(item_frequency))
+    edges = np.quantile(catalog_frequencies, np.linspace(0.1, 0.9, 9))
+    return np.searchsorted(edges, frequencies, side='right')
+
+
+def segment_metric_breakdown(
+    segment_ids: np.ndarray,
+    recall: np.ndarray,
+    ndcg: np.ndarray,
+    *,
+    label_format: str = '{}',
+) -> dict[str, dict[str, float]]:
+    """Mean recall/nDCG and trial count per segment id, via one bincount per statistic."""
+    if not len(segment_ids):
+        return {}
+    counts = np.bincount(segment_ids)
+    recall_sums = np.bincount(segment_ids, weights=recall, minlength=len(counts))
+    ndcg_sums = np.bincount(segment_ids, weights=ndcg, minlength=len(counts))
+    return {
+        label_format.format(segment): {
+            'n_trials': float(counts[segment]),
+            METRIC_RECALL: float(recall_sums[segment] / counts[segment]),
+            METRIC_NDCG: float(ndcg_sums[segment] / counts[segment]),
+        }
+        for segment in np.flatnonzero(counts)
+    }
+
+
+def cluster_mean_half_width(values: np.ndarray, clusters: np.ndarray, z: float) -> tuple[float, float]:
+    """
+    Mean of values and the half-width of its normal-approximation interval, using
+    the cluster-robust standard error sqrt(sum_c (sum_{i in c} (x_i - mean))^2) / n.
+    """
+    if not len(values):
+        return (0.0, 0.0)
+    mean = float(values.mean())
+    _, inverse = np.unique(clusters, return_inverse=True)
+    residual_sums = np.bincount(inverse, weights=values - mean)
+    return mean, z * math.sqrt(float((residual_sums ** 2).sum())) / len(values)
+
+
+def cluster_mean_interval(values: np.ndarray, clusters: np.ndarray, z: float) -> tuple[float, float]:
+    """cluster_mean_half_width() as an interval, clamped for metrics bounded to [0, 1]."""
+    if not len(values):
+        return (0.0, 0.0)
+    mean, half_width = cluster_mean_half_width(values, clusters, z)
+    return (max(0.0, mean - half_width), min(1.0, mean + half_width))
+
+
+class RankedMetricKernel:
+    """
+    Accumulates per-trial recall/nDCG over a trial list as ranked batches land.
+
+    Trials must be fed in dataset order via add_batch(); running sums are
+    available after every batch for progress reporting, and metrics() /
+    segments() aggregate whatever has been scored so far.
+    """
+
+    def __init__(self, trials: list[Trial], *, k: int) -> None:
+        n = len(trials)
+        self.k = k
+        self.trials = trials
+        self.index = ItemIndex()
+        self.held_out = np.fromiter((self.index.encode(t.held_out) for t in trials), dtype=np.int64, count=n)
+        self.is_cold = np.fromiter((t.is_cold for t in trials), dtype=bool, count=n)
+        basket_index = np.fromiter((t.basket_index for t in trials), dtype=np.int64, count=n)
+        # Trials without a source basket each get a private cluster id past any real basket index.
+        self.clusters = np.where(basket_index >= 0, basket_index, basket_index.max(initial=0) + 1 + np.arange(n))
+        self.recall = np.zeros(n, dtype=np.float64)
+        self.ndcg = np.zeros(n, dtype=np.float64)
+        # Scored ranked lists in index codes, kept so RankedListCache can store them.
+        self.ranked = np.full((n, k), RANKED_PAD_ID, dtype=np.int64)
+        self._recommended = np.zeros(len(self.index), dtype=bool)
+        self.recommended_slots = 0
+        self.scored = 0
+
+    def add_batch(self, ranked_lists: list[list[UUID]]) -> None:
+        self.add_matrix(ranked_matrix(ranked_lists, self.k, self.index))
+
+    def add_cached(self, matrix: np.ndarray, items: list[UUID]) -> None:
+        """Feed ranked rows coded against another ItemIndex (e.g. a RankedListCache entry)."""
+        remap = np.fromiter((self.index.encode(item_id) for item_id in items), dtype=np.int64, count=len(items))
+        remap = np.append(remap, RANKED_PAD_ID)
+        # RANKED_PAD_ID (-1) indexes the appended sentinel, so padding survives the remap.
+        self.add_matrix(remap[matrix])
+
+    def add_matrix(self, matrix: np.ndarray) -> None:
+        start = self.scored
+        stop = start + len(matrix)
+        self.ranked[start:stop] = matrix
+        positions = hit_positions(matrix, self.held_out[start:stop])
+        self.recall[start:stop], self.ndcg[start:stop] = loo_metric_arrays(positions)
+
+        recommended = matrix[matrix != RANKED_PAD_ID]
+        if len(self.index) > len(self._recommended):
+            grown = np.zeros(len(self.index), dtype=bool)
+            grown[:len(self._recommended)] = self._recommended
+            self._recommended = grown
+        self._recommended[recommended] = True
+        self.recommended_slots += len(recommended)
+        self.scored = stop
+
+    @property
+    def recall_sum(self) -> float:
+        return float(self.recall[:self.scored].sum())
+
+    @property
+    def ndcg_sum(self) -> float:
+        return float(self.ndcg[:self.scored].sum())
+
+    @property
+    def cold_trials_scored(self) -> int:
+        return int(self.is_cold[:self.scored].sum())
+
+    @property
+    def cold_recall_sum(self) -> float:
+        return float(self.recall[:self.scored][self.is_cold[:self.scored]].sum())
+
+    @property
+    def distinct_recommended_count(self) -> int:
+        return int(self._recommended.sum())
+
+    def metrics(self, catalog_size: int) -> dict[str, float]:
+        n = self.scored
+        n_cold = self.cold_trials_scored
+        return {
+            METRIC_RECALL: self.recall_sum / n if n else 0.0,
+            METRIC_NDCG: self.ndcg_sum / n if n else 0.0,
+            METRIC_COVERAGE: self.distinct_recommended_count / catalog_size if catalog_size > 0 else 0.0,
+            METRIC_COLD_RECALL: self.cold_recall_sum / n_cold if n_cold else 0.0,
+        }
+
+    def confidence_intervals(self, level: float = DEFAULT_CONFIDENCE_LEVEL) -> dict[str, tuple[float, float]]:
+        """
+        Per-metric intervals at the given two-sided level, clustered on source
+        basket (LOO trials from one basket share most of their seeds). Coverage
+        is a catalog-level count with no per-trial variance, so it has none.
+        """
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        n = self.scored
+        clusters = self.clusters[:n]
+        cold = self.is_cold[:n]
+        return {
+            METRIC_RECALL: cluster_mean_interval(self.recall[:n], clusters, z),
+            METRIC_NDCG: cluster_mean_interval(self.ndcg[:n], clusters, z),
+            METRIC_COLD_RECALL: cluster_mean_interval(self.recall[:n][cold], clusters[cold], z),
+        }
+
+    def segments(self, item_frequency: dict[UUID, int] | None = None) -> dict[str, dict[str, dict[str, float]]]:
+        trials = self.trials[:self.scored]
+        recall = self.recall[:self.scored]
+        ndcg = self.ndcg[:self.scored]
+        breakdown = {
+            SEGMENT_BASKET_SIZE: segment_metric_breakdown(basket_size_segments(trials), recall, ndcg),
+        }
+        if item_frequency:
+            breakdown[SEGMENT_POPULARITY_DECILE] = segment_metric_breakdown(
+                popularity_decile_segments(trials, item_frequency),
+                recall,
+                ndcg,
+                label_format='d{}',
+            )
+        cap_label = str(BASKET_SIZE_SEGMENT_CAP)
+        if cap_label in breakdown[SEGMENT_BASKET_SIZE]:
+            breakdown[SEGMENT_BASKET_SIZE][f'{cap_label}+'] = breakdown[SEGMENT_BASKET_SIZE].pop(cap_label)
+        return breakdown
+
+
+# --- ranked-list cache ---
+#
+# A ranker pinned to a training run is deterministic over a given dataset, so
+# its ranked lists are stored once per (label, training run, dataset hash, k)
+# and re-fed through the kernel on later runs. Re-evaluating an unchanged
+# promotion baseline, or adding a metric over the same lists, skips scoring.
+
+@dataclass(frozen=True)
+class RankedListCacheKey:
+    candidate_label: str
+    training_run_id: str
+    dataset_hash: str
+    k: int
+
+    @property
+    def digest(self) -> str:
+        raw = f'{self.candidate_label}|{self.training_run_id}|{self.dataset_hash}|{self.k}'
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def trial_sequence_digest(trials: list[Trial]) -> str:
+    """
+    SHA256 over the trials in order. dataset_hash ignores trial order, but a
+    cached matrix is row-aligned with the trials it was scored on.
+    """
+    hasher = hashlib.sha256()
+    for trial in trials:
+        hasher.update(','.join(str(seed) for seed in trial.seeds).encode('utf-8'))
+        hasher.update(f'|{trial.held_out}\n'.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+class RankedListCache:
+    """
+    One .npz per key under root: the ranked code matrix, the item UUIDs it
+    indexes, and the digest of the trial sequence its rows belong to.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path(self, key: RankedListCacheKey) -> Path:
+        return self.root / f'{key.digest}.npz'
+
+    def load(self, key: RankedListCacheKey, trials: list[Trial]) -> tuple[np.ndarray, list[UUID]] | None:
+        path = self.path(key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                stored_key = str(entry['key'])
+                stored_trials = str(entry['trials'])
+                ranked = entry['ranked']
+                item_bytes = entry['items']
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning('ranked-list cache entry unreadable path=%s: %s', path, exc)
+            return None
+        if (
+            stored_key != key.digest
+            or stored_trials != trial_sequence_digest(trials)
+            or ranked.shape != (len(trials), key.k)
+        ):
+            logger.warning('ranked-list cache entry mismatch path=%s shape=%s', path, ranked.shape)
+            return None
+        return ranked, [UUID(bytes=row.tobytes()) for row in item_bytes]
+
+    def store(self, key: RankedListCacheKey, kernel: RankedMetricKernel, trials: list[Trial]) -> Path:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        temp_path = path.with_name(path.name + '.tmp')
+        items = np.frombuffer(b''.join(item_id.bytes for item_id in kernel.index.items), dtype=np.uint8)
+        with temp_path.open('wb') as handle:
+            np.savez(
+                handle,
+                key=np.array(key.digest),
+                trials=np.array(trial_sequence_digest(trials)),
+                ranked=kernel.ranked[:kernel.scored],
+                items=items.reshape(-1, 16),
+            )
+        temp_path.replace(path)
+        return path
+
+
+def _ranked_list_cache_key(ranker: Ranker, dataset: Dataset, k: int) -> RankedListCacheKey | None:
+    """
+    Only rankers pinned to a training run are cacheable; engine scoring is
+    measured, never replayed. MetadataRanker reads the live catalog, which no
+    key short of a catalog snapshot would pin, so it always rescores.
+    """
+    training_run = getattr(ranker, 'training_run', None)
+    if training_run is None or isinstance(ranker, EngineRanker):
+        return None
+    return RankedListCacheKey(ranker.label, str(training_run.pk), dataset.dataset_hash, k)
 
 
 # --- ranker adapters ---
@@ -377,6 +856,117 @@ RANKERS: dict[str, type] = {
 }
 
 
+# --- engine-backed ranker ---
+#
+# Scores trials through the serving engine's /engine/recommend/<ranker>
+# endpoints instead of the ORM mirrors above, so an evaluation measures what
+# production actually serves and how fast it serves it.
+
+class EngineTransport(Protocol):
+    def post(self, path: str, payload: dict) -> dict: ...
+
+
+class HttpEngineTransport:
+    """POSTs to a running engine. One requests.Session per worker thread."""
+
+    def __init__(self, base_url: str | None = None, timeout: float | None = None) -> None:
+        self.base_url = (base_url or settings.RECOMMENDER_ENGINE_BASE_URL).rstrip('/')
+        self.timeout = timeout if timeout is not None else settings.RECOMMENDER_ENGINE_TIMEOUT
+        self._local = threading.local()
+
+    def post(self, path: str, payload: dict) -> dict:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        response = session.post(f'{self.base_url}{path}', json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class InProcessEngineTransport:
+    """
+    Drives the engine's FastAPI app through TestClient in this process. Needs
+    the engine's serving dependencies (fastapi, httpx, psycopg) installed.
+    """
+
+    def __init__(self) -> None:
+        from fastapi.testclient import TestClient
+
+        from recommender_engine.app.main import app
+
+        self.client = TestClient(app)
+
+    def post(self, path: str, payload: dict) -> dict:
+        response = self.client.post(path, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+
+class EngineRanker:
+    """
+    Ranker adapter over the engine's canonical-id baseline endpoints. Trials
+    are sent in batches of concurrent requests; every request's wall-clock
+    latency is kept so serving_metrics() can report percentiles and throughput.
+    """
+
+    def __init__(
+        self,
+        engine_ranker: str,
+        transport: EngineTransport,
+        *,
+        concurrency: int = DEFAULT_ENGINE_CONCURRENCY,
+        training_run: TrainingRun | None = None,
+    ) -> None:
+        if engine_ranker not in RANKERS:
+            raise ValueError(f"unknown engine ranker '{engine_ranker}' (known: {sorted(RANKERS)})")
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.engine_ranker = engine_ranker
+        self.label = f'engine:{engine_ranker}'
+        self.transport = transport
+        self.concurrency = concurrency
+        self.training_run = training_run
+        self.latencies: list[float] = []
+        self.busy_seconds = 0.0
+
+    def _request(self, seeds: tuple[UUID, ...], exclude: set[UUID], limit: int) -> list[UUID]:
+        if not seeds:
+            return []  # BaselineRequest requires at least one seed
+        payload = {
+            'seed_item_ids': [str(seed) for seed in seeds],
+            'exclude_ids': sorted(str(item) for item in exclude),
+            'limit': limit,
+        }
+        started = time.perf_counter()
+        data = self.transport.post(f'/engine/recommend/{self.engine_ranker}', payload)
+        self.latencies.append(time.perf_counter() - started)
+        return [UUID(item['juke_id']) for item in data['items']]
+
+    def rank_batch(self, queries: list[tuple[tuple[UUID, ...], set[UUID]]], limit: int) -> list[list[UUID]]:
+        started = time.perf_counter()
+        if self.concurrency == 1 or len(queries) <= 1:
+            ranked = [self._request(seeds, exclude, limit) for seeds, exclude in queries]
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                ranked = list(pool.map(lambda query: self._request(query[0], query[1], limit), queries))
+        self.busy_seconds += time.perf_counter() - started
+        return ranked
+
+    def rank(self, seeds: tuple[UUID, ...], exclude: set[UUID], limit: int) -> list[UUID]:
+        return self.rank_batch([(seeds, exclude)], limit)[0]
+
+    def serving_metrics(self) -> dict[str, float]:
+        if not self.latencies:
+            return {}
+        p50, p95, p99 = np.percentile(np.asarray(self.latencies) * 1000.0, [50, 95, 99])
+        return {
+            METRIC_LATENCY_P50: float(p50),
+            METRIC_LATENCY_P95: float(p95),
+            METRIC_LATENCY_P99: float(p99),
+            METRIC_THROUGHPUT: len(self.latencies) / self.busy_seconds if self.busy_seconds > 0 else 0.0,
+        }
+
+
 # --- evaluation driver ---
 
 @dataclass
@@ -391,6 +981,16 @@ class EvaluationResult:
     evaluation_started_at: datetime | None = None
     evaluation_elapsed_seconds: float | None = None
     evaluation_trials_per_second: float | None = None
+    # Per-segment breakdowns from RankedMetricKernel.segments(); reported, not persisted.
+    segments: dict[str, dict[str, dict[str, float]]] = field(default_factory=dict)
+    confidence_level: float | None = None
+    confidence_intervals: dict[str, tuple[float, float]] = field(default_factory=dict)
+    sample_rate: float | None = None
+    sample_seed: int | None = None
+    # True when ranked lists were replayed from a RankedListCache instead of scored.
+    ranked_lists_cached: bool = False
+    # Candidate side of a sequential paired evaluation: per-gate early-stopping outcomes.
+    sequential_decisions: list[SequentialDecision] = field(default_factory=list)
 
 
 @dataclass
@@ -520,123 +1120,95 @@ def write_evaluation_metrics(
     return path
 
 
-def _score_trials_with_ranker(
-    ranker: Ranker,
-    trials: list[Trial],
+def _record_batch_progress(
+    kernel: RankedMetricKernel,
     *,
-    k: int,
-    batch_size: int,
-    progress: EvaluationProgress | None = None,
-    metrics_path: str | Path | None = None,
-) -> tuple[float, float, float, int, set[UUID]]:
-    recall_sum = 0.0
-    ndcg_sum = 0.0
-    cold_recall_sum = 0.0
-    n_cold = 0
-    all_recommended: set[UUID] = set()
+    progress: EvaluationProgress | None,
+    metrics_path: str | Path | None,
+) -> None:
+    if progress is None:
+        return
+    progress.trials_scored = kernel.scored
+    progress.cold_trials_scored = kernel.cold_trials_scored
+    progress.recall_sum = kernel.recall_sum
+    progress.ndcg_sum = kernel.ndcg_sum
+    progress.cold_recall_sum = kernel.cold_recall_sum
+    progress.recommended_count = kernel.recommended_slots
+    progress.distinct_recommended_count = kernel.distinct_recommended_count
+    progress.updated_at = time.monotonic()
+    write_evaluation_metrics(progress, metrics_path=metrics_path)
+
+
+def _rank_batch_with_ranker(ranker: Ranker, batch: list[Trial], k: int) -> list[list[UUID]]:
+    return [ranker.rank(trial.seeds, set(trial.seeds), k) for trial in batch]
+
+
+def _rank_batch_with_cooccurrence(ranker: CoOccurrenceRanker, batch: list[Trial], k: int) -> list[list[UUID]]:
+    seed_ids = sorted({seed for trial in batch for seed in trial.seeds}, key=str)
+    neighbours_by_seed: dict[UUID, list[dict]] = {seed: [] for seed in seed_ids}
+    if seed_ids:
+        rows_a = (
+            ItemCoOccurrence.objects
+            .filter(item_a_juke_id__in=seed_ids)
+            .values('item_a_juke_id', 'item_b_juke_id', 'pmi_score', 'co_count')
+            .iterator(chunk_size=10000)
+        )
+        for row in rows_a:
+            neighbours_by_seed[row['item_a_juke_id']].append({
+                'neighbour': row['item_b_juke_id'],
+                'pmi_score': row['pmi_score'],
+                'co_count': row['co_count'],
+            })
 
-    for start in range(0, len(trials), batch_size):
-        batch = trials[start:start + batch_size]
-        for trial in batch:
-            exclude = set(trial.seeds)
-            ranked = ranker.rank(trial.seeds, exclude, k)
-            all_recommended.update(ranked)
-            relevant = {trial.held_out}
-            r = recall_at_k(ranked, relevant, k)
-            recall_sum += r
-            ndcg_sum += ndcg_at_k(ranked, relevant, k)
-            if trial.is_cold:
-                n_cold += 1
-                cold_recall_sum += r
-
-        if progress is not None:
-            progress.trials_scored += len(batch)
-            progress.cold_trials_scored = n_cold
-            progress.recall_sum = recall_sum
-            progress.ndcg_sum = ndcg_sum
-            progress.cold_recall_sum = cold_recall_sum
-            progress.recommended_count += len(all_recommended)
-            progress.distinct_recommended_count = len(all_recommended)
-            progress.updated_at = time.monotonic()
-            write_evaluation_metrics(progress, metrics_path=metrics_path)
-
-    return recall_sum, ndcg_sum, cold_recall_sum, n_cold, all_recommended
-
-
-def _score_trials_with_cooccurrence_batches(
-    ranker: CoOccurrenceRanker,
-    trials: list[Trial],
+        rows_b = (
+            ItemCoOccurrence.objects
+            .filter(item_b_juke_id__in=seed_ids)
+            .values('item_a_juke_id', 'item_b_juke_id', 'pmi_score', 'co_count')
+            .iterator(chunk_size=10000)
+        )
+        for row in rows_b:
+            neighbours_by_seed[row['item_b_juke_id']].append({
+                'neighbour': row['item_a_juke_id'],
+                'pmi_score': row['pmi_score'],
+                'co_count': row['co_count'],
+            })
+
+    ranked_batch: list[list[UUID]] = []
+    for trial in batch:
+        neighbour_rows = [
+            neighbour
+            for seed in trial.seeds
+            for neighbour in neighbours_by_seed.get(seed, [])
+        ]
+        ranked_batch.append([s.juke_id for s in score_cooccurrence(neighbour_rows, set(trial.seeds), k)])
+    return ranked_batch
+
+
+def _rank_batch_with_engine(ranker: EngineRanker, batch: list[Trial], k: int) -> list[list[UUID]]:
+    return ranker.rank_batch([(trial.seeds, set(trial.seeds)) for trial in batch], k)
+
+
+def _batch_ranking_fn(ranker: Ranker) -> Callable[[Ranker, list[Trial], int], list[list[UUID]]]:
+    if isinstance(ranker, CoOccurrenceRanker):
+        return _rank_batch_with_cooccurrence
+    if isinstance(ranker, EngineRanker):
+        return _rank_batch_with_engine
+    return _rank_batch_with_ranker
+
+
+def _score_trials(
+    ranker: Ranker,
+    kernel: RankedMetricKernel,
     *,
-    k: int,
     batch_size: int,
     progress: EvaluationProgress | None = None,
     metrics_path: str | Path | None = None,
-) -> tuple[float, float, float, int, set[UUID]]:
-    recall_sum = 0.0
-    ndcg_sum = 0.0
-    cold_recall_sum = 0.0
-    n_cold = 0
-    all_recommended: set[UUID] = set()
-
+) -> None:
+    rank_batch = _batch_ranking_fn(ranker)
+    trials = kernel.trials
     for start in range(0, len(trials), batch_size):
-        batch = trials[start:start + batch_size]
-        seed_ids = sorted({seed for trial in batch for seed in trial.seeds}, key=str)
-        neighbours_by_seed: dict[UUID, list[dict]] = {seed: [] for seed in seed_ids}
-        if seed_ids:
-            rows_a = (
-                ItemCoOccurrence.objects
-                .filter(item_a_juke_id__in=seed_ids)
-                .values('item_a_juke_id', 'item_b_juke_id', 'pmi_score', 'co_count')
-                .iterator(chunk_size=10000)
-            )
-            for row in rows_a:
-                neighbours_by_seed[row['item_a_juke_id']].append({
-                    'neighbour': row['item_b_juke_id'],
-                    'pmi_score': row['pmi_score'],
-                    'co_count': row['co_count'],
-                })
-
-            rows_b = (
-                ItemCoOccurrence.objects
-                .filter(item_b_juke_id__in=seed_ids)
-                .values('item_a_juke_id', 'item_b_juke_id', 'pmi_score', 'co_count')
-                .iterator(chunk_size=10000)
-            )
-            for row in rows_b:
-                neighbours_by_seed[row['item_b_juke_id']].append({
-                    'neighbour': row['item_a_juke_id'],
-                    'pmi_score': row['pmi_score'],
-                    'co_count': row['co_count'],
-                })
-
-        for trial in batch:
-            exclude = set(trial.seeds)
-            neighbour_rows = [
-                neighbour
-                for seed in trial.seeds
-                for neighbour in neighbours_by_seed.get(seed, [])
-            ]
-            ranked = [s.juke_id for s in score_cooccurrence(neighbour_rows, exclude, k)]
-            all_recommended.update(ranked)
-            relevant = {trial.held_out}
-            r = recall_at_k(ranked, relevant, k)
-            recall_sum += r
-            ndcg_sum += ndcg_at_k(ranked, relevant, k)
-            if trial.is_cold:
-                n_cold += 1
-                cold_recall_sum += r
-
-        if progress is not None:
-            progress.trials_scored += len(batch)
-            progress.cold_trials_scored = n_cold
-            progress.recall_sum = recall_sum
-            progress.ndcg_sum = ndcg_sum
-            progress.cold_recall_sum = cold_recall_sum
-            progress.distinct_recommended_count = len(all_recommended)
-            progress.updated_at = time.monotonic()
-            write_evaluation_metrics(progress, metrics_path=metrics_path)
-
-    return recall_sum, ndcg_sum, cold_recall_sum, n_cold, all_recommended
+        kernel.add_batch(rank_batch(ranker, trials[start:start + batch_size], kernel.k))
+        _record_batch_progress(kernel, progress=progress, metrics_path=metrics_path)
 
 
 def evaluate_ranker(
@@ -646,48 +1218,63 @@ def evaluate_ranker(
     catalog_size: int | None = None,
     batch_size: int = DEFAULT_EVALUATION_BATCH_SIZE,
     metrics_path: str | Path | None = None,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    cache: RankedListCache | None = None,
 ) -> EvaluationResult:
-    """Run a ranker over every trial and aggregate metrics."""
+    """
+    Run a ranker over every trial and aggregate metrics with the vectorized kernel.
+
+    With a cache, a ranker pinned to a training run replays stored ranked lists
+    for this dataset and k when present, and stores them after a full scoring pass.
+    """
     if catalog_size is None:
         catalog_size = Track.objects.count()
 
     n = len(dataset.trials)
+    kernel = RankedMetricKernel(dataset.trials, k=k)
     progress = EvaluationProgress(
         candidate_label=ranker.label,
         dataset_hash=dataset.dataset_hash,
         n_baskets=dataset.n_baskets,
         n_trials=n,
-        n_cold_trials=sum(1 for trial in dataset.trials if trial.is_cold),
+        n_cold_trials=int(kernel.is_cold.sum()),
         training_run_id=str(getattr(ranker, "training_run", None).pk) if getattr(ranker, "training_run", None) else "",
     ) if metrics_path else None
     if progress is not None:
         write_evaluation_metrics(progress, metrics_path=metrics_path)
 
-    if isinstance(ranker, CoOccurrenceRanker):
-        recall_sum, ndcg_sum, cold_recall_sum, n_cold, all_recommended = _score_trials_with_cooccurrence_batches(
-            ranker,
-            dataset.trials,
-            k=k,
-            batch_size=batch_size,
-            progress=progress,
-            metrics_path=metrics_path,
-        )
+    cache_key = _ranked_list_cache_key(ranker, dataset, k) if cache is not None else None
+    cached = cache.load(cache_key, dataset.trials) if cache_key is not None else None
+    if cached is not None:
+        kernel.add_cached(*cached)
+        _record_batch_progress(kernel, progress=progress, metrics_path=metrics_path)
+        logger.info('evaluate_ranker label=%s replayed ranked lists from %s', ranker.label, cache.path(cache_key))
     else:
-        recall_sum, ndcg_sum, cold_recall_sum, n_cold, all_recommended = _score_trials_with_ranker(
+        _score_trials(
             ranker,
-            dataset.trials,
-            k=k,
+            kernel,
             batch_size=batch_size,
             progress=progress,
             metrics_path=metrics_path,
         )
+        if cache_key is not None:
+            cache.store(cache_key, kernel, dataset.trials)
 
-    metrics = {
-        METRIC_RECALL: recall_sum / n if n else 0.0,
-        METRIC_NDCG: ndcg_sum / n if n else 0.0,
-        METRIC_COVERAGE: coverage(all_recommended, catalog_size),
-        METRIC_COLD_RECALL: cold_recall_sum / n_cold if n_cold else 0.0,
-    }
+    if progress is not None:
+        progress.status = "complete"
+        _record_batch_progress(kernel, progress=progress, metrics_path=metrics_path)
+
+    result = _kernel_result(
+        ranker,
+        dataset,
+        kernel,
+        catalog_size=catalog_size,
+        confidence_level=confidence_level,
+        progress=progress,
+        ranked_lists_cached=cached is not None,
+    )
+    metrics = result.metrics
+    n_cold = result.n_cold_trials
 
     logger.info(
         'evaluate_ranker label=%s trials=%d cold=%d recall@%d=%.4f ndcg@%d=%.4f '
@@ -695,29 +1282,234 @@ def evaluate_ranker(
         ranker.label, n, n_cold, k, metrics[METRIC_RECALL], k, metrics[METRIC_NDCG],
         metrics[METRIC_COVERAGE], metrics[METRIC_COLD_RECALL], dataset.dataset_hash[:12],
     )
+    if METRIC_LATENCY_P95 in metrics:
+        logger.info(
+            'evaluate_ranker label=%s latency_ms p50=%.1f p95=%.1f p99=%.1f throughput_rps=%.1f',
+            ranker.label, metrics[METRIC_LATENCY_P50], metrics[METRIC_LATENCY_P95],
+            metrics[METRIC_LATENCY_P99], metrics[METRIC_THROUGHPUT],
+        )
+    return result
 
-    if progress is not None:
-        progress.status = "complete"
-        progress.trials_scored = n
-        progress.cold_trials_scored = n_cold
-        progress.recall_sum = recall_sum
-        progress.ndcg_sum = ndcg_sum
-        progress.cold_recall_sum = cold_recall_sum
-        progress.distinct_recommended_count = len(all_recommended)
-        progress.updated_at = time.monotonic()
-        write_evaluation_metrics(progress, metrics_path=metrics_path)
 
+def _kernel_result(
+    ranker: Ranker,
+    dataset: Dataset,
+    kernel: RankedMetricKernel,
+    *,
+    catalog_size: int,
+    confidence_level: float,
+    progress: EvaluationProgress | None = None,
+    ranked_lists_cached: bool = False,
+) -> EvaluationResult:
+    """Aggregate whatever prefix of the trials the kernel has scored into an EvaluationResult."""
+    metrics = kernel.metrics(catalog_size)
+    if isinstance(ranker, EngineRanker):
+        metrics.update(ranker.serving_metrics())
     return EvaluationResult(
         candidate_label=ranker.label,
         dataset_hash=dataset.dataset_hash,
         n_baskets=dataset.n_baskets,
-        n_trials=n,
-        n_cold_trials=n_cold,
+        n_trials=kernel.scored,
+        n_cold_trials=kernel.cold_trials_scored,
         training_run=getattr(ranker, "training_run", None),
         evaluation_started_at=progress.wall_started_at if progress is not None else None,
         evaluation_elapsed_seconds=progress.elapsed_seconds if progress is not None else None,
         evaluation_trials_per_second=progress.trials_per_second if progress is not None else None,
         metrics=metrics,
+        segments=kernel.segments(dataset.item_frequency),
+        confidence_level=confidence_level,
+        confidence_intervals=kernel.confidence_intervals(confidence_level),
+        sample_rate=dataset.sample_rate,
+        sample_seed=dataset.sample_seed,
+        ranked_lists_cached=ranked_lists_cached,
+    )
+
+
+# --- sequential paired evaluation ---
+#
+# Candidate and baseline score the same shuffled trial stream in lockstep
+# batches. After each batch, every gate's mean per-trial margin gets a
+# cluster-robust interval; a gate is decided once the interval clears zero.
+# Looks and gates share the error budget (Bonferroni), so stopping at the first
+# decisive look keeps the configured confidence.
+
+@dataclass(frozen=True)
+class SequentialGate:
+    """A paired promotion gate: it passes when the mean per-trial margin is >= 0."""
+    name: str
+    metric: str
+    kind: str
+    threshold: float
+
+    def margins(self, candidate: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+        if self.kind == SEQUENTIAL_RELATIVE_LIFT:
+            # mean(c) >= (1 + lift) * mean(b)
+            return candidate - (1.0 + self.threshold) * baseline
+        if self.kind == SEQUENTIAL_MAX_REGRESSION:
+            # mean(b) - mean(c) <= max_regression
+            return candidate - baseline + self.threshold
+        raise ValueError(f"unknown sequential gate kind '{self.kind}'")
+
+
+@dataclass
+class SequentialDecision:
+    name: str
+    metric: str
+    # None when the stream stopped (or ran out) before the gate was decided.
+    passed: bool | None
+    margin: float
+    margin_interval: tuple[float, float]
+    n_trials: int
+    threshold: float = 0.0
+
+
+@dataclass
+class SequentialEvaluation:
+    candidate: EvaluationResult
+    baseline: EvaluationResult
+    decisions: list[SequentialDecision]
+    trials_scored: int
+    n_trials: int
+    # Hash both results are stored under: the dataset's own when every trial
+    # was scored, sequential_prefix_dataset_hash() when the stream stopped early.
+    dataset_hash: str = ''
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL
+    critical_z: float = 0.0
+
+    @property
+    def stopped_early(self) -> bool:
+        return self.trials_scored < self.n_trials
+
+
+def sequential_prefix_dataset_hash(dataset_hash: str, seed: int, trials_scored: int) -> str:
+    """
+    Identity of the shuffled prefix a sequential run stopped at. Metrics over
+    a prefix are not full-split metrics, so they never share the split's hash.
+    """
+    raw = f'{dataset_hash}|sequential|seed={seed}|trials={trials_scored}'
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _paired_metric_values(kernel: RankedMetricKernel, metric: str) -> tuple[np.ndarray, np.ndarray]:
+    """Per-trial values and clusters of a metric over the scored prefix."""
+    n = kernel.scored
+    if metric == METRIC_RECALL:
+        return kernel.recall[:n], kernel.clusters[:n]
+    if metric == METRIC_NDCG:
+        return kernel.ndcg[:n], kernel.clusters[:n]
+    if metric == METRIC_COLD_RECALL:
+        cold = kernel.is_cold[:n]
+        return kernel.recall[:n][cold], kernel.clusters[:n][cold]
+    raise ValueError(f"sequential gates need a per-trial metric, not '{metric}'")
+
+
+def _sequential_decisions(
+    gates: list[SequentialGate],
+    candidate: RankedMetricKernel,
+    baseline: RankedMetricKernel,
+    *,
+    z: float,
+    min_trials: int,
+    exhausted: bool,
+) -> list[SequentialDecision]:
+    decisions = []
+    for gate in gates:
+        cand_values, clusters = _paired_metric_values(candidate, gate.metric)
+        base_values, _ = _paired_metric_values(baseline, gate.metric)
+        margins = gate.margins(cand_values, base_values)
+        mean, half_width = cluster_mean_half_width(margins, clusters, z)
+        lower, upper = mean - half_width, mean + half_width
+        passed = None
+        if len(margins) and (exhausted or len(margins) >= min_trials):
+            if lower > 0.0:
+                passed = True
+            elif upper < 0.0:
+                passed = False
+        decisions.append(SequentialDecision(
+            gate.name, gate.metric, passed, mean, (lower, upper), len(margins), gate.threshold,
+        ))
+    return decisions
+
+
+def evaluate_sequential_pair(
+    candidate: Ranker,
+    baseline: Ranker,
+    dataset: Dataset,
+    gates: Iterable[SequentialGate],
+    *,
+    k: int = DEFAULT_K,
+    catalog_size: int | None = None,
+    batch_size: int = DEFAULT_EVALUATION_BATCH_SIZE,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    min_trials: int = DEFAULT_SEQUENTIAL_MIN_TRIALS,
+    seed: int = DEFAULT_SAMPLE_SEED,
+) -> SequentialEvaluation:
+    """
+    Score candidate and baseline on one seeded shuffle of the dataset's trials,
+    a batch at a time, until any gate is decided failed, every gate is decided
+    passed, or the trials run out. Both results cover the same scored prefix
+    and, when that prefix is short of the dataset, carry its own hash.
+    """
+    gates = list(gates)
+    if not gates:
+        raise ValueError('sequential evaluation needs at least one gate to decide')
+    if catalog_size is None:
+        catalog_size = Track.objects.count()
+
+    n = len(dataset.trials)
+    order = np.random.default_rng(seed).permutation(n)
+    trials = [dataset.trials[i] for i in order]
+    cand_kernel = RankedMetricKernel(trials, k=k)
+    base_kernel = RankedMetricKernel(trials, k=k)
+    cand_rank_batch = _batch_ranking_fn(candidate)
+    base_rank_batch = _batch_ranking_fn(baseline)
+
+    looks = max(1, math.ceil(n / batch_size)) * max(1, len(gates))
+    z = NormalDist().inv_cdf(1.0 - (1.0 - confidence_level) / (2 * looks))
+
+    decisions: list[SequentialDecision] = []
+    for start in range(0, n, batch_size):
+        batch = trials[start:start + batch_size]
+        cand_kernel.add_batch(cand_rank_batch(candidate, batch, k))
+        base_kernel.add_batch(base_rank_batch(baseline, batch, k))
+        decisions = _sequential_decisions(
+            gates,
+            cand_kernel,
+            base_kernel,
+            z=z,
+            min_trials=min_trials,
+            exhausted=cand_kernel.scored == n,
+        )
+        if any(d.passed is False for d in decisions) or all(d.passed for d in decisions):
+            break
+
+    logger.info(
+        'evaluate_sequential_pair candidate=%s baseline=%s scored=%d/%d dataset=%s decisions=%s',
+        candidate.label, baseline.label, cand_kernel.scored, n, dataset.dataset_hash[:12],
+        {d.name: d.passed for d in decisions},
+    )
+    scored = cand_kernel.scored
+    dataset_hash = (
+        dataset.dataset_hash if scored == n
+        else sequential_prefix_dataset_hash(dataset.dataset_hash, seed, scored)
+    )
+    cand_result = _kernel_result(
+        candidate, dataset, cand_kernel, catalog_size=catalog_size, confidence_level=confidence_level,
+    )
+    base_result = _kernel_result(
+        baseline, dataset, base_kernel, catalog_size=catalog_size, confidence_level=confidence_level,
+    )
+    cand_result.dataset_hash = base_result.dataset_hash = dataset_hash
+    cand_result.sequential_decisions = decisions
+    return SequentialEvaluation(
+        candidate=cand_result,
+        baseline=base_result,
+        decisions=decisions,
+        trials_scored=scored,
+        n_trials=n,
+        dataset_hash=dataset_hash,
+        confidence_level=confidence_level,
+        critical_z=z,
     )
 
 
@@ -737,12 +1529,44 @@ def persist_evaluation(result: EvaluationResult) -> list[ModelEvaluation]:
             evaluation_started_at=result.evaluation_started_at,
             evaluation_elapsed_seconds=result.evaluation_elapsed_seconds,
             evaluation_trials_per_second=result.evaluation_trials_per_second,
+            ci_lower=result.confidence_intervals[name][0] if name in result.confidence_intervals else None,
+            ci_upper=result.confidence_intervals[name][1] if name in result.confidence_intervals else None,
+            confidence_level=result.confidence_level if name in result.confidence_intervals else None,
+            sample_rate=result.sample_rate,
+            sample_seed=result.sample_seed,
         )
         for name, value in result.metrics.items()
     ]
     return ModelEvaluation.objects.bulk_create(rows)
 
 
+def persist_sequential_evaluation(sequential: SequentialEvaluation) -> list[SequentialGateDecision]:
+    """Both sides' metric rows plus one SequentialGateDecision per gate, under the same dataset_hash."""
+    with transaction.atomic():
+        persist_evaluation(sequential.candidate)
+        persist_evaluation(sequential.baseline)
+        return SequentialGateDecision.objects.bulk_create([
+            SequentialGateDecision(
+                candidate_label=sequential.candidate.candidate_label,
+                baseline_label=sequential.baseline.candidate_label,
+                dataset_hash=sequential.dataset_hash,
+                gate_name=decision.name,
+                metric_name=decision.metric,
+                threshold=decision.threshold,
+                passed=decision.passed,
+                margin=decision.margin,
+                margin_lower=decision.margin_interval[0],
+                margin_upper=decision.margin_interval[1],
+                critical_z=sequential.critical_z,
+                confidence_level=sequential.confidence_level,
+                n_trials=decision.n_trials,
+                trials_scored=sequential.trials_scored,
+                dataset_n_trials=sequential.n_trials,
+            )
+            for decision in sequential.decisions
+        ])
+
+
 def run_offline_evaluation(
     labels: Iterable[str] | None = None,
     k: int = DEFAULT_K,
@@ -756,10 +1580,28 @@ def run_offline_evaluation(
     batch_size: int = DEFAULT_EVALUATION_BATCH_SIZE,
     metrics_path: str | Path | None = None,
     persist: bool = True,
+    sample_rate: float | None = None,
+    sample_seed: int = DEFAULT_SAMPLE_SEED,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    engine_rankers: Iterable[str] = (),
+    engine_transport: EngineTransport | None = None,
+    engine_concurrency: int = DEFAULT_ENGINE_CONCURRENCY,
+    ranked_list_cache: RankedListCache | None = None,
+    sequential_gates: Iterable[SequentialGate] | None = None,
+    sequential_min_trials: int = DEFAULT_SEQUENTIAL_MIN_TRIALS,
 ) -> list[EvaluationResult]:
     """
     Build the LOO dataset once, evaluate each requested ranker against it,
-    optionally persist. Returns results in the order labels were given.
+    optionally persist. Returns results in the order labels were given,
+    followed by one 'engine:<ranker>' result per engine_rankers entry, scored
+    through engine_transport (HTTP to RECOMMENDER_ENGINE_BASE_URL by default).
+    ranked_list_cache lets rankers pinned to a training run reuse ranked lists
+    from an earlier run over the same dataset (see evaluate_ranker).
+
+    With sequential_gates, exactly two rankers must be requested (candidate
+    first, baseline second); they are scored by evaluate_sequential_pair and
+    both stop at the same trial once the gates are decided. The gate decisions
+    are persisted next to the metric rows for check_promotion_gates.
     """
     if labels is None:
         labels = list(RANKERS.keys())
@@ -775,6 +1617,9 @@ def run_offline_evaluation(
         dataset_kwargs['max_baskets'] = max_baskets
     if max_basket_items is not None:
         dataset_kwargs['max_basket_items'] = max_basket_items
+    if sample_rate is not None:
+        dataset_kwargs['sample_rate'] = sample_rate
+        dataset_kwargs['sample_seed'] = sample_seed
 
     dataset = build_loo_dataset(**dataset_kwargs)
     if not dataset.trials:
@@ -782,7 +1627,7 @@ def run_offline_evaluation(
         return []
 
     catalog_size = Track.objects.count()
-    results: list[EvaluationResult] = []
+    rankers: list[Ranker] = []
     for label in labels:
         ranker_cls = RANKERS.get(label)
         if ranker_cls is None:
@@ -795,6 +1640,45 @@ def run_offline_evaluation(
             ranker = cooccurrence_training_run and CoOccurrenceRanker(cooccurrence_training_run) or CoOccurrenceRanker()
         else:
             ranker = ranker_cls()
+        rankers.append(ranker)
+
+    engine_rankers = list(engine_rankers)
+    if engine_rankers and engine_transport is None:
+        engine_transport = HttpEngineTransport()
+    for engine_ranker in engine_rankers:
+        training_run = None
+        if engine_ranker == 'cooccurrence':
+            training_run = cooccurrence_training_run or TrainingRun.objects.filter(
+                ranker_label='cooccurrence',
+            ).order_by('-created_at').first()
+        rankers.append(EngineRanker(
+            engine_ranker,
+            engine_transport,
+            concurrency=engine_concurrency,
+            training_run=training_run,
+        ))
+
+    if sequential_gates is not None:
+        if len(rankers) != 2:
+            raise ValueError(f'sequential evaluation compares exactly two rankers, got {[r.label for r in rankers]}')
+        sequential = evaluate_sequential_pair(
+            rankers[0],
+            rankers[1],
+            dataset,
+            sequential_gates,
+            k=k,
+            catalog_size=catalog_size,
+            batch_size=batch_size,
+            confidence_level=confidence_level,
+            min_trials=sequential_min_trials,
+            seed=sample_seed,
+        )
+        if persist:
+            persist_sequential_evaluation(sequential)
+        return [sequential.candidate, sequential.baseline]
+
+    results: list[EvaluationResult] = []
+    for ranker in rankers:
         result = evaluate_ranker(
             ranker,
             dataset,
@@ -802,6 +1686,8 @@ def run_offline_evaluation(
             catalog_size=catalog_size,
             batch_size=batch_size,
             metrics_path=metrics_path,
+            confidence_level=confidence_level,
+            cache=ranked_list_cache,
         )
         if persist:
             persist_evaluation(result)
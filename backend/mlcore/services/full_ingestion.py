@@ -2,20 +2,28 @@ from __future__ import annotations
 
 import csv
 import hashlib
+import heapq
+import io
 import json
+import math
+import mmap
 import multiprocessing
 import os
+import queue
+import re
 import shutil
+import struct
 import tarfile
 import threading
 import time
 import uuid
 from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass, replace
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
+import numpy as np
 from django.conf import settings
 from django.db import IntegrityError, close_old_connections, connection, transaction
 from django.utils import timezone
@@ -52,8 +60,13 @@ PROGRESS_COUNTER_FIELDS = (
     'artifacts_partitioned',
     'input_bytes_partitioned',
     'chunk_bytes_written',
+    'session_runs_written',
+    'session_run_bytes_written',
     'spool_bytes_estimated',
     'spooled_members_in_flight',
+    'stream_bytes_in_flight',
+    'streamed_members_in_flight',
+    'stream_buffer_budget_bytes',
     'scratch_actual_bytes',
     'host_device_util_milli_pct',
     'host_iowait_milli_pct',
@@ -64,6 +77,7 @@ PROGRESS_COUNTER_FIELDS = (
     'rows_with_spotify_candidate',
     'rows_with_no_candidate',
     'rows_staged',
+    'rows_deduplicated_before_load',
     'session_rows_loaded',
     'rows_merged',
     'rows_deduplicated',
@@ -74,6 +88,8 @@ PROGRESS_COUNTER_FIELDS = (
     'rows_malformed',
     'chunks_written',
     'chunks_loaded',
+    'partitions_split',
+    'partitions_coalesced',
     'partitions_completed',
     'partitions_loaded',
     'partitions_merged',
@@ -82,6 +98,7 @@ PROGRESS_COUNTER_FIELDS = (
     'hot_stage_complete',
     'hot_build_partitions_completed',
     'hot_build_complete',
+    'shadow_indexes_built',
     'shadow_indexes_complete',
     'swap_completed',
 )
@@ -100,6 +117,7 @@ LISTENBRAINZ_FINALIZE_PHASE_PARTITION_DRAIN = 'partition_drain'
 LISTENBRAINZ_FINALIZE_PHASE_HOT_BUILD = 'hot_build_partition'
 LISTENBRAINZ_FINALIZE_PHASE_HOT_BUILD_LEGACY = 'hot_build_legacy'
 LISTENBRAINZ_FINALIZE_PHASE_SHADOW_INDEXES = 'shadow_indexes'
+LISTENBRAINZ_FINALIZE_PHASE_SHADOW_INDEX_PREFIX = 'shadow_index:'
 LISTENBRAINZ_FINALIZE_PHASE_SWAP = 'swap'
 FULL_INGESTION_POLICY_INTERACTIVE = 'interactive'
 FULL_INGESTION_POLICY_THROUGHPUT = 'throughput'
@@ -107,6 +125,63 @@ FULL_INGESTION_POLICY_CHOICES = (
     FULL_INGESTION_POLICY_INTERACTIVE,
     FULL_INGESTION_POLICY_THROUGHPUT,
 )
+# Archive members reach extract workers either streamed through in-memory
+# queues (decompression overlaps parsing) or copied to spool/ first.
+FULL_INGESTION_EXTRACT_MODE_STREAM = 'stream'
+FULL_INGESTION_EXTRACT_MODE_SPOOL = 'spool'
+FULL_INGESTION_EXTRACT_MODE_CHOICES = (
+    FULL_INGESTION_EXTRACT_MODE_STREAM,
+    FULL_INGESTION_EXTRACT_MODE_SPOOL,
+)
+FULL_INGESTION_STREAM_CHUNK_BYTES = 1024 * 1024
+FULL_INGESTION_INDEX_BUILD_MIN_MEMORY_BYTES = 64 * 1024**2
+FULL_INGESTION_REBALANCE_MAX_SPLIT = 16
+FULL_INGESTION_REBALANCE_MIN_SPLIT_ROWS = 100_000
+LISTENBRAINZ_IDENTITY_SNAPSHOT_FILENAME = 'identity-snapshot.bin'
+# Event chunks are CSV (hex bytea, ISO timestamps) or Postgres binary COPY
+# tuples; each chunk manifest entry records which one it is.
+FULL_INGESTION_CHUNK_FORMAT_CSV = 'csv'
+FULL_INGESTION_CHUNK_FORMAT_BINARY = 'binary'
+FULL_INGESTION_CHUNK_FORMAT_CHOICES = (
+    FULL_INGESTION_CHUNK_FORMAT_CSV,
+    FULL_INGESTION_CHUNK_FORMAT_BINARY,
+)
+LISTENBRAINZ_EVENT_LOAD_COLUMNS = (
+    'run_id',
+    'partition_key',
+    'event_signature',
+    'played_at',
+    'session_key',
+    'canonical_item_id',
+    'canonical_item_type',
+    'canonical_item_key',
+    'track_id',
+    'resolution_state',
+    'cold_ref',
+)
+_PGCOPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_PGCOPY_BINARY_TRAILER = struct.pack('!h', -1)
+_PGCOPY_POSTGRES_EPOCH = datetime(2000, 1, 1, tzinfo=UTC)
+LISTENBRAINZ_SESSION_LOAD_COLUMNS = (
+    'run_id',
+    'partition_key',
+    'session_key',
+    'canonical_item_id',
+    'track_id',
+    'first_played_at',
+    'last_played_at',
+    'play_count',
+)
+# Session run record: a 65-byte key (session_key, canonical_item_id, has_track
+# flag, track_id) followed by first/last played_at (microseconds since
+# 2000-01-01 UTC) and play_count, so raw records sort and merge by key.
+_LISTENBRAINZ_SESSION_RUN_KEY_BYTES = 65
+_LISTENBRAINZ_SESSION_RUN_AGGREGATE = struct.Struct('!qqq')
+_LISTENBRAINZ_SESSION_RUN_RECORD_BYTES = _LISTENBRAINZ_SESSION_RUN_KEY_BYTES + _LISTENBRAINZ_SESSION_RUN_AGGREGATE.size
+# Rough CPython footprint of one in-memory session aggregate entry.
+_LISTENBRAINZ_SESSION_AGGREGATE_ENTRY_BYTES = 256
+_LISTENBRAINZ_IDENTITY_SNAPSHOT_MAGIC = b'LBIDSNP1'
+_LISTENBRAINZ_IDENTITY_SNAPSHOT_HEADER = struct.Struct('<8sQQ')
 _LISTENBRAINZ_EXTRACT_IDENTITY_SNAPSHOT: ListenBrainzIdentitySnapshot | None = None
 _LISTENBRAINZ_EXTRACT_PARTITION_ROOT: str = ''
 _LISTENBRAINZ_EXTRACT_RUN_ID: str = ''
@@ -158,6 +233,8 @@ class FullIngestionCopyResult:
     session_rows_loaded: int
     chunks_loaded: int
     copy_manifest_path: str
+    presorted: bool = False
+    rows_deduplicated: int = 0
 
 
 @dataclass(frozen=True)
@@ -175,6 +252,8 @@ class ListenBrainzMemberChunkResult:
     spool_size_bytes: int
     counters: dict[str, int]
     chunk_manifests_by_partition: dict[str, list[dict[str, int | str]]]
+    streamed_bytes: int = 0
+    session_run_manifests_by_partition: dict[str, list[dict[str, int | str]]] | None = None
 
 
 @dataclass(frozen=True)
@@ -337,6 +416,56 @@ def configured_full_ingestion_target_chunk_rows() -> int:
     return max(1, int(getattr(settings, 'MLCORE_FULL_INGESTION_TARGET_CHUNK_ROWS', 250000)))
 
 
+def configured_full_ingestion_session_aggregate_bytes() -> int:
+    return max(
+        _LISTENBRAINZ_SESSION_AGGREGATE_ENTRY_BYTES,
+        int(getattr(settings, 'MLCORE_FULL_INGESTION_SESSION_AGGREGATE_BYTES', 128 * 1024**2)),
+    )
+
+
+def configured_full_ingestion_extract_mode() -> str:
+    value = str(
+        getattr(settings, 'MLCORE_FULL_INGESTION_EXTRACT_MODE', FULL_INGESTION_EXTRACT_MODE_STREAM)
+    ).strip().casefold()
+    if value not in FULL_INGESTION_EXTRACT_MODE_CHOICES:
+        return FULL_INGESTION_EXTRACT_MODE_STREAM
+    return value
+
+
+def configured_full_ingestion_chunk_format() -> str:
+    value = str(
+        getattr(settings, 'MLCORE_FULL_INGESTION_CHUNK_FORMAT', FULL_INGESTION_CHUNK_FORMAT_CSV)
+    ).strip().casefold()
+    if value not in FULL_INGESTION_CHUNK_FORMAT_CHOICES:
+        return FULL_INGESTION_CHUNK_FORMAT_CSV
+    if connection.vendor != 'postgresql':
+        # Binary COPY tuples only load through Postgres COPY.
+        return FULL_INGESTION_CHUNK_FORMAT_CSV
+    return value
+
+
+def configured_full_ingestion_sorted_chunks() -> bool:
+    return bool(getattr(settings, 'MLCORE_FULL_INGESTION_SORTED_CHUNKS', False))
+
+
+def configured_full_ingestion_rebalance_skew_factor() -> float:
+    return max(0.0, float(getattr(settings, 'MLCORE_FULL_INGESTION_REBALANCE_SKEW_FACTOR', 2.0)))
+
+
+def configured_full_ingestion_stream_buffer_bytes() -> int:
+    return max(
+        FULL_INGESTION_STREAM_CHUNK_BYTES,
+        int(getattr(settings, 'MLCORE_FULL_INGESTION_STREAM_BUFFER_BYTES', 256 * 1024**2)),
+    )
+
+
+def configured_full_ingestion_index_build_memory_bytes() -> int:
+    return max(
+        FULL_INGESTION_INDEX_BUILD_MIN_MEMORY_BYTES,
+        int(getattr(settings, 'MLCORE_FULL_INGESTION_INDEX_BUILD_MEMORY_BYTES', 2 * 1024**3)),
+    )
+
+
 def configured_full_ingestion_metrics_path() -> Path | None:
     value = str(getattr(settings, 'MLCORE_FULL_INGESTION_TEXTFILE_METRICS_PATH', '') or '').strip()
     if not value:
@@ -1276,6 +1405,18 @@ def apply_full_ingestion_backpressure(plan: FullIngestionPlan) -> FullIngestionP
         load_budget = min(requested_load_budget, max(load_budget, configured_load_budget))
         merge_budget = min(requested_merge_budget, max(merge_budget, configured_merge_budget))
 
+    # Streamed extraction holds decompressed member bytes in memory rather than
+    # spool files: scale the in-flight byte budget with the active workers and
+    # shrink it to one chunk per worker under hard pressure.
+    stream_buffer_budget_bytes = max(
+        FULL_INGESTION_STREAM_CHUNK_BYTES * partition_budget,
+        configured_full_ingestion_stream_buffer_bytes() * partition_budget // max(1, plan.partition_workers),
+    )
+    if state.hard_pressure_streak >= 2:
+        stream_buffer_budget_bytes = FULL_INGESTION_STREAM_CHUNK_BYTES * partition_budget
+    elif state.soft_pressure_streak >= 3:
+        stream_buffer_budget_bytes = max(FULL_INGESTION_STREAM_CHUNK_BYTES * partition_budget, stream_buffer_budget_bytes // 2)
+
     write_full_ingestion_control(
         plan,
         policy_mode=policy_mode,
@@ -1298,6 +1439,7 @@ def apply_full_ingestion_backpressure(plan: FullIngestionPlan) -> FullIngestionP
             'host_iowait_milli_pct': host_sample['iowait_milli_pct'],
             'host_available_memory_bytes': host_sample['available_memory_bytes'],
             'host_swap_used_bytes': host_sample['swap_used_bytes'],
+            'stream_buffer_budget_bytes': stream_buffer_budget_bytes,
         },
     )
 
@@ -1336,6 +1478,9 @@ def execute_full_ingestion_partition_stage(
     if force and partition_root.exists():
         shutil.rmtree(partition_root)
     partition_root.mkdir(parents=True, exist_ok=True)
+    if force:
+        # Extract workers write to the hash buckets, not a previous rebalance.
+        plan = replace(plan, partitions=_hash_bucket_partitions(plan))
 
     running_plan = replace(
         plan,
@@ -1375,6 +1520,26 @@ def execute_full_ingestion_partition_stage(
         raise
 
 
+def _hash_bucket_partitions(plan: FullIngestionPlan) -> list[FullIngestionPartitionPlan]:
+    # Split sub-partitions keep their bucket's index and estimates.
+    partitions_by_index: dict[int, FullIngestionPartitionPlan] = {}
+    for partition in plan.partitions:
+        partitions_by_index.setdefault(partition.index, partition)
+    buckets: list[FullIngestionPartitionPlan] = []
+    for index in range(plan.partition_count):
+        partition = partitions_by_index.get(index)
+        buckets.append(
+            FullIngestionPartitionPlan(
+                partition_key=f'p{index:03d}',
+                index=index,
+                state='pending',
+                estimated_input_bytes=partition.estimated_input_bytes if partition else 0,
+                estimated_shard_count=partition.estimated_shard_count if partition else 0,
+            )
+        )
+    return buckets
+
+
 def full_ingestion_partition_manifest_path(
     plan: FullIngestionPlan,
     *,
@@ -1388,6 +1553,8 @@ def write_full_ingestion_partition_manifest(
     *,
     partition: FullIngestionPartitionPlan,
     chunks: list[dict[str, int | str]],
+    session_runs: list[dict[str, int | str]] | None = None,
+    rows_deduplicated: int = 0,
 ) -> Path:
     path = full_ingestion_partition_manifest_path(plan, partition_key=partition.partition_key)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -1402,6 +1569,12 @@ def write_full_ingestion_partition_manifest(
         'total_input_bytes': sum(int(chunk.get('size_bytes') or 0) for chunk in chunks),
         'event_chunks': list(chunks),
     }
+    if session_runs is not None:
+        payload['session_run_count'] = len(session_runs)
+        payload['session_runs'] = list(session_runs)
+    if rows_deduplicated:
+        # Rows sorted chunks dropped before a rebalance rewrote them.
+        payload['rows_deduplicated'] = rows_deduplicated
     temp_path = path.with_name(path.name + '.tmp')
     temp_path.write_text(
         json.dumps(payload, indent=2, sort_keys=True) + '\n',
@@ -1434,6 +1607,9 @@ def execute_full_ingestion_copy_stage(
         counters={
             **plan.counters,
             'rows_staged': 0 if force else int(plan.counters.get('rows_staged') or 0),
+            'rows_deduplicated_before_load': (
+                0 if force else int(plan.counters.get('rows_deduplicated_before_load') or 0)
+            ),
             'session_rows_loaded': 0 if force else int(plan.counters.get('session_rows_loaded') or 0),
             'chunks_loaded': 0 if force else int(plan.counters.get('chunks_loaded') or 0),
             'partitions_loaded': 0 if force else int(plan.counters.get('partitions_loaded') or 0),
@@ -1465,6 +1641,9 @@ def execute_full_ingestion_copy_stage(
         index = partition_index_by_key[partition_key]
         partition = finalized_partitions[index]
         counters['rows_staged'] = int(counters.get('rows_staged') or 0) + result.rows_loaded
+        counters['rows_deduplicated_before_load'] = (
+            int(counters.get('rows_deduplicated_before_load') or 0) + result.rows_deduplicated
+        )
         counters['session_rows_loaded'] = (
             int(counters.get('session_rows_loaded') or 0) + result.session_rows_loaded
         )
@@ -1681,9 +1860,10 @@ def execute_full_ingestion_pipeline(
 
 def cleanup_full_ingestion_partition_artifacts(plan: FullIngestionPlan) -> FullIngestionPlan:
     for partition in plan.partitions:
-        events_root = Path(plan.partition_root) / partition.partition_key / 'events'
-        if events_root.exists():
-            shutil.rmtree(events_root)
+        for artifact_dir in ('events', 'sessions'):
+            artifact_root = Path(plan.partition_root) / partition.partition_key / artifact_dir
+            if artifact_root.exists():
+                shutil.rmtree(artifact_root)
 
     spool_root = Path(plan.run_root) / 'spool'
     if spool_root.exists():
@@ -1776,6 +1956,8 @@ def write_full_ingestion_copy_manifest(
         'session_rows_loaded': result.session_rows_loaded,
         'chunks_loaded': result.chunks_loaded,
         'copy_manifest_path': result.copy_manifest_path,
+        'presorted': result.presorted,
+        'rows_deduplicated': result.rows_deduplicated,
     }
     temp_path = path.with_name(path.name + '.tmp')
     temp_path.write_text(
@@ -1786,6 +1968,13 @@ def write_full_ingestion_copy_manifest(
     return path
 
 
+def _read_full_ingestion_copy_manifest(plan: FullIngestionPlan, *, partition_key: str) -> dict[str, Any]:
+    path = full_ingestion_copy_manifest_path(plan, partition_key=partition_key)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
 def full_ingestion_merge_manifest_path(
     plan: FullIngestionPlan,
     *,
@@ -2101,10 +2290,46 @@ def write_full_ingestion_metrics(plan: FullIngestionPlan) -> Path | None:
     return path
 
 
-@dataclass(frozen=True)
 class ListenBrainzIdentitySnapshot:
-    mbid_to_track_id: dict[str, str]
-    spotify_to_track_id: dict[str, str]
+    """
+    Read-only catalog track lookup for extract workers, backed by a file
+    written by write_listenbrainz_identity_snapshot(). Keys are sorted
+    16-byte values (recording MBIDs, blake2b-128 of Spotify ids) stored as
+    big-endian hi/lo uint64 columns next to 16-byte track UUIDs. The file
+    is memory-mapped lazily in each process, so forked workers share the
+    page cache instead of copying Python dicts; pickling carries the path only.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = str(path)
+        self._mapped: mmap.mmap | None = None
+        self._sections: dict[str, tuple[np.ndarray, np.ndarray, memoryview]] = {}
+
+    def __getstate__(self) -> dict[str, str]:
+        return {'path': self.path}
+
+    def __setstate__(self, state: dict[str, str]) -> None:
+        self.__init__(state['path'])
+
+    @property
+    def mbid_count(self) -> int:
+        return len(self._section('mbid')[0])
+
+    @property
+    def spotify_count(self) -> int:
+        return len(self._section('spotify')[0])
+
+    def track_id_for_mbid(self, recording_mbid: str) -> str:
+        try:
+            key = uuid.UUID(str(recording_mbid)).bytes
+        except ValueError:
+            return ''
+        return self._lookup('mbid', key)
+
+    def track_id_for_spotify(self, spotify_id: str) -> str:
+        if not spotify_id:
+            return ''
+        return self._lookup('spotify', _listenbrainz_spotify_snapshot_key(spotify_id))
 
     def resolve(self, parsed_payload: Any) -> ListenBrainzIdentityResolution:
         spotify_id = str(parsed_payload.track_identifier_candidates.get('spotify_id') or '').strip()
@@ -2125,9 +2350,9 @@ class ListenBrainzIdentitySnapshot:
 
         track_id = ''
         if identity.item_type == 'recording_mbid':
-            track_id = self.mbid_to_track_id.get(str(parsed_payload.recording_mbid), '')
+            track_id = self.track_id_for_mbid(str(parsed_payload.recording_mbid))
         elif identity.item_type == 'spotify_track':
-            track_id = self.spotify_to_track_id.get(spotify_id, '')
+            track_id = self.track_id_for_spotify(spotify_id)
 
         return ListenBrainzIdentityResolution(
             canonical_item_id=str(identity.item_id),
@@ -2138,6 +2363,38 @@ class ListenBrainzIdentitySnapshot:
             resolution_type=identity.item_type,
         )
 
+    def _lookup(self, section: str, key: bytes) -> str:
+        key_hi, key_lo, values = self._section(section)
+        query_hi = int.from_bytes(key[:8], 'big')
+        query_lo = int.from_bytes(key[8:], 'big')
+        index = int(key_hi.searchsorted(query_hi))
+        while index < len(key_hi) and int(key_hi[index]) == query_hi:
+            if int(key_lo[index]) == query_lo:
+                return str(uuid.UUID(bytes=bytes(values[index * 16 : index * 16 + 16])))
+            index += 1
+        return ''
+
+    def _section(self, section: str) -> tuple[np.ndarray, np.ndarray, memoryview]:
+        if not self._sections:
+            self._open()
+        return self._sections[section]
+
+    def _open(self) -> None:
+        with open(self.path, 'rb') as handle:
+            self._mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        header = bytes(self._mapped[: _LISTENBRAINZ_IDENTITY_SNAPSHOT_HEADER.size])
+        magic, mbid_count, spotify_count = _LISTENBRAINZ_IDENTITY_SNAPSHOT_HEADER.unpack(header)
+        if magic != _LISTENBRAINZ_IDENTITY_SNAPSHOT_MAGIC:
+            raise ValueError(f'{self.path} is not a listenbrainz identity snapshot')
+
+        offset = _LISTENBRAINZ_IDENTITY_SNAPSHOT_HEADER.size
+        for section, count in (('mbid', mbid_count), ('spotify', spotify_count)):
+            key_hi = np.frombuffer(self._mapped, dtype='>u8', count=count, offset=offset)
+            key_lo = np.frombuffer(self._mapped, dtype='>u8', count=count, offset=offset + count * 8)
+            values = memoryview(self._mapped)[offset + count * 16 : offset + count * 32]
+            self._sections[section] = (key_hi, key_lo, values)
+            offset += count * 32
+
 
 @dataclass(frozen=True)
 class ListenBrainzIdentityResolution:
@@ -2157,25 +2414,42 @@ class _ListenBrainzPartitionChunkWriter:
         partition_key: str,
         chunk_target_rows: int,
         file_prefix: str,
+        chunk_format: str = FULL_INGESTION_CHUNK_FORMAT_CSV,
+        sort_rows: bool = False,
     ) -> None:
         self.partition_root = partition_root
         self.partition_key = partition_key
         self.chunk_target_rows = chunk_target_rows
         self.file_prefix = file_prefix
+        self.chunk_format = chunk_format
+        # Sorted chunks hold one chunk of rows in memory, ordered by
+        # (event_signature, cold_ref) with repeated signatures dropped on close.
+        self.sort_rows = sort_rows
         self.chunk_index = 0
         self.current_rows = 0
         self.current_path: Path | None = None
         self.current_handle = None
         self.current_writer = None
+        self.pending_rows: list[tuple[bytes, bytes, ListenBrainzEventChunkRow]] = []
         self.chunk_manifests: list[dict[str, int | str]] = []
 
-    def write_row(self, row: list[str]) -> None:
-        if self.current_writer is None or self.current_rows >= self.chunk_target_rows:
+    def write_row(self, row: ListenBrainzEventChunkRow) -> None:
+        if self.current_handle is None or self.current_rows >= self.chunk_target_rows:
             self._rotate_chunk()
-        assert self.current_writer is not None
-        self.current_writer.writerow(row)
+        assert self.current_handle is not None
+        if self.sort_rows:
+            self.pending_rows.append((row.event_signature, row.cold_ref.encode('utf-8'), row))
+        else:
+            self._write_encoded_row(row)
         self.current_rows += 1
 
+    def _write_encoded_row(self, row: ListenBrainzEventChunkRow) -> None:
+        if self.chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+            self.current_handle.write(_encode_listenbrainz_event_binary_row(row))
+        else:
+            assert self.current_writer is not None
+            self.current_writer.writerow(_encode_listenbrainz_event_csv_row(row))
+
     def finish(self) -> list[dict[str, int | str]]:
         self._close_current_chunk()
         return list(self.chunk_manifests)
@@ -2185,29 +2459,453 @@ class _ListenBrainzPartitionChunkWriter:
         self.chunk_index += 1
         events_root = self.partition_root / self.partition_key / 'events'
         events_root.mkdir(parents=True, exist_ok=True)
-        self.current_path = events_root / f'{self.file_prefix}-{self.chunk_index:05d}.csv'
-        self.current_handle = self.current_path.open('w', encoding='utf-8', newline='')
-        self.current_writer = csv.writer(self.current_handle)
+        if self.chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+            self.current_path = events_root / f'{self.file_prefix}-{self.chunk_index:05d}.pgcopy'
+            self.current_handle = self.current_path.open('wb')
+            self.current_handle.write(_PGCOPY_BINARY_HEADER)
+        else:
+            self.current_path = events_root / f'{self.file_prefix}-{self.chunk_index:05d}.csv'
+            self.current_handle = self.current_path.open('w', encoding='utf-8', newline='')
+            self.current_writer = csv.writer(self.current_handle)
         self.current_rows = 0
 
     def _close_current_chunk(self) -> None:
         if self.current_handle is None or self.current_path is None:
             return
+        rows_written = self.current_rows
+        if self.sort_rows:
+            rows_written = 0
+            previous_signature = None
+            self.pending_rows.sort(key=lambda entry: (entry[0], entry[1]))
+            for event_signature, _, row in self.pending_rows:
+                if event_signature == previous_signature:
+                    continue
+                previous_signature = event_signature
+                self._write_encoded_row(row)
+                rows_written += 1
+            self.pending_rows = []
+        if self.chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+            self.current_handle.write(_PGCOPY_BINARY_TRAILER)
         self.current_handle.close()
-        self.chunk_manifests.append(
-            {
-                'relative_path': self.current_path.relative_to(self.partition_root / self.partition_key).as_posix(),
-                'row_count': self.current_rows,
-                'size_bytes': self.current_path.stat().st_size,
-            }
-        )
+        chunk_manifest: dict[str, int | str] = {
+            'relative_path': self.current_path.relative_to(self.partition_root / self.partition_key).as_posix(),
+            'row_count': rows_written,
+            'size_bytes': self.current_path.stat().st_size,
+            'format': self.chunk_format,
+        }
+        if self.sort_rows:
+            chunk_manifest['sorted'] = True
+            chunk_manifest['rows_deduplicated'] = self.current_rows - rows_written
+        self.chunk_manifests.append(chunk_manifest)
         self.current_handle = None
         self.current_path = None
         self.current_writer = None
         self.current_rows = 0
 
 
-def build_listenbrainz_identity_snapshot() -> ListenBrainzIdentitySnapshot:
+class _ListenBrainzSessionAggregator:
+    """
+    Per-member (session_key, canonical_item_id, track_id) aggregates for
+    resolved events, keyed by partition. Once the estimated footprint passes
+    budget_bytes every partition is spilled to a sorted run file under
+    <partition>/sessions/. Runs from different members and spills overlap;
+    the copy stage merges them with merge_listenbrainz_session_runs().
+    """
+
+    def __init__(self, *, partition_root: Path, file_prefix: str, budget_bytes: int) -> None:
+        self.partition_root = partition_root
+        self.file_prefix = file_prefix
+        self.max_entries = max(1, budget_bytes // _LISTENBRAINZ_SESSION_AGGREGATE_ENTRY_BYTES)
+        self.entries = 0
+        self.run_index = 0
+        self.aggregates: dict[str, dict[bytes, list[int]]] = {}
+        self.run_manifests: dict[str, list[dict[str, int | str]]] = {}
+
+    def add(
+        self,
+        partition_key: str,
+        *,
+        session_key: bytes,
+        canonical_item_id: str,
+        track_id: str,
+        played_at: datetime,
+    ) -> None:
+        played_at_micros = (played_at - _PGCOPY_POSTGRES_EPOCH) // timedelta(microseconds=1)
+        key = b''.join(
+            (
+                session_key,
+                uuid.UUID(canonical_item_id).bytes,
+                b'\x01' if track_id else b'\x00',
+                uuid.UUID(track_id).bytes if track_id else bytes(16),
+            )
+        )
+        partition_aggregates = self.aggregates.setdefault(partition_key, {})
+        aggregate = partition_aggregates.get(key)
+        if aggregate is None:
+            partition_aggregates[key] = [played_at_micros, played_at_micros, 1]
+            self.entries += 1
+            if self.entries >= self.max_entries:
+                self._spill()
+            return
+        if played_at_micros < aggregate[0]:
+            aggregate[0] = played_at_micros
+        if played_at_micros > aggregate[1]:
+            aggregate[1] = played_at_micros
+        aggregate[2] += 1
+
+    def finish(self) -> dict[str, list[dict[str, int | str]]]:
+        self._spill()
+        return {partition_key: list(manifests) for partition_key, manifests in self.run_manifests.items()}
+
+    def _spill(self) -> None:
+        if not self.entries:
+            return
+        self.run_index += 1
+        for partition_key, partition_aggregates in self.aggregates.items():
+            if not partition_aggregates:
+                continue
+            sessions_root = self.partition_root / partition_key / 'sessions'
+            sessions_root.mkdir(parents=True, exist_ok=True)
+            run_path = sessions_root / f'{self.file_prefix}-{self.run_index:05d}.run'
+            with run_path.open('wb') as handle:
+                for key in sorted(partition_aggregates):
+                    handle.write(key + _LISTENBRAINZ_SESSION_RUN_AGGREGATE.pack(*partition_aggregates[key]))
+            self.run_manifests.setdefault(partition_key, []).append(
+                {
+                    'relative_path': run_path.relative_to(self.partition_root / partition_key).as_posix(),
+                    'row_count': len(partition_aggregates),
+                    'size_bytes': run_path.stat().st_size,
+                }
+            )
+        self.aggregates = {}
+        self.entries = 0
+
+
+def _iter_listenbrainz_session_run_records(run_path: Path) -> Iterator[bytes]:
+    record_size = _LISTENBRAINZ_SESSION_RUN_RECORD_BYTES
+    with run_path.open('rb') as handle:
+        while True:
+            block = handle.read(record_size * 8192)
+            if not block:
+                return
+            for offset in range(0, len(block), record_size):
+                yield block[offset : offset + record_size]
+
+
+def merge_listenbrainz_session_runs(run_paths: list[Path]) -> Iterator[tuple[bytes, bytes, str, int, int, int]]:
+    """
+    K-way merge of sorted session run files, combining equal keys. Yields
+    (session_key, canonical_item_id bytes, track_id text or '', first and
+    last played_at micros since 2000-01-01 UTC, play_count).
+    """
+    current_key = b''
+    current: list[int] = []
+    for record in heapq.merge(*(_iter_listenbrainz_session_run_records(path) for path in run_paths)):
+        key = record[:_LISTENBRAINZ_SESSION_RUN_KEY_BYTES]
+        first_played_at, last_played_at, play_count = _LISTENBRAINZ_SESSION_RUN_AGGREGATE.unpack_from(
+            record,
+            _LISTENBRAINZ_SESSION_RUN_KEY_BYTES,
+        )
+        if key == current_key:
+            current[0] = min(current[0], first_played_at)
+            current[1] = max(current[1], last_played_at)
+            current[2] += play_count
+            continue
+        if current_key:
+            yield _decode_listenbrainz_session_run_key(current_key, current)
+        current_key = key
+        current = [first_played_at, last_played_at, play_count]
+    if current_key:
+        yield _decode_listenbrainz_session_run_key(current_key, current)
+
+
+def _decode_listenbrainz_session_run_key(
+    key: bytes,
+    aggregate: list[int],
+) -> tuple[bytes, bytes, str, int, int, int]:
+    session_key, canonical_item_id, has_track, track_id = key[:32], key[32:48], key[48], key[49:65]
+    return (
+        session_key,
+        canonical_item_id,
+        str(uuid.UUID(bytes=track_id)) if has_track else '',
+        aggregate[0],
+        aggregate[1],
+        aggregate[2],
+    )
+
+
+def _write_listenbrainz_merged_session_rows(
+    output_path: Path,
+    *,
+    run_paths: list[Path],
+    run_id: str,
+    partition_key: str,
+    chunk_format: str,
+) -> int:
+    rows_written = 0
+    merged_rows = merge_listenbrainz_session_runs(run_paths)
+    if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+        run_id_field = _pgcopy_field(uuid.UUID(run_id).bytes)
+        partition_key_field = _pgcopy_field(partition_key.encode('utf-8'))
+        with output_path.open('wb') as handle:
+            handle.write(_PGCOPY_BINARY_HEADER)
+            for session_key, canonical_item_id, track_id, first_played_at, last_played_at, play_count in merged_rows:
+                handle.write(
+                    b''.join(
+                        (
+                            struct.pack('!h', len(LISTENBRAINZ_SESSION_LOAD_COLUMNS)),
+                            run_id_field,
+                            partition_key_field,
+                            _pgcopy_field(session_key),
+                            _pgcopy_field(canonical_item_id),
+                            _pgcopy_field(uuid.UUID(track_id).bytes if track_id else None),
+                            struct.pack('!iqiqii', 8, first_played_at, 8, last_played_at, 4, play_count),
+                        )
+                    )
+                )
+                rows_written += 1
+            handle.write(_PGCOPY_BINARY_TRAILER)
+        return rows_written
+
+    with output_path.open('w', encoding='utf-8', newline='') as handle:
+        writer = csv.writer(handle)
+        for session_key, canonical_item_id, track_id, first_played_at, last_played_at, play_count in merged_rows:
+            writer.writerow(
+                [
+                    run_id,
+                    partition_key,
+                    _bytea_hex(session_key),
+                    str(uuid.UUID(bytes=canonical_item_id)),
+                    track_id or r'\N',
+                    (_PGCOPY_POSTGRES_EPOCH + timedelta(microseconds=first_played_at)).isoformat(),
+                    (_PGCOPY_POSTGRES_EPOCH + timedelta(microseconds=last_played_at)).isoformat(),
+                    str(play_count),
+                ]
+            )
+            rows_written += 1
+    return rows_written
+
+
+@dataclass(frozen=True)
+class ListenBrainzEventChunkRow:
+    run_id: str
+    partition_key: str
+    event_signature: bytes
+    played_at: datetime
+    session_key: bytes
+    canonical_item_id: str
+    canonical_item_type: str
+    canonical_item_key: str
+    track_id: str
+    cold_ref: str
+
+
+def _encode_listenbrainz_event_csv_row(row: ListenBrainzEventChunkRow) -> list[str]:
+    return [
+        row.run_id,
+        row.partition_key,
+        _bytea_hex(row.event_signature),
+        row.played_at.isoformat(),
+        _bytea_hex(row.session_key),
+        row.canonical_item_id or r'\N',
+        row.canonical_item_type or r'\N',
+        row.canonical_item_key or r'\N',
+        row.track_id or r'\N',
+        '1' if row.canonical_item_id else '0',
+        row.cold_ref,
+    ]
+
+
+def _encode_listenbrainz_event_binary_row(row: ListenBrainzEventChunkRow) -> bytes:
+    """One Postgres binary COPY tuple in LISTENBRAINZ_EVENT_LOAD_COLUMNS order."""
+    played_at_micros = (row.played_at - _PGCOPY_POSTGRES_EPOCH) // timedelta(microseconds=1)
+    parts = [
+        struct.pack('!h', len(LISTENBRAINZ_EVENT_LOAD_COLUMNS)),
+        _pgcopy_field(uuid.UUID(row.run_id).bytes),
+        _pgcopy_field(row.partition_key.encode('utf-8')),
+        _pgcopy_field(row.event_signature),
+        struct.pack('!iq', 8, played_at_micros),
+        _pgcopy_field(row.session_key),
+        _pgcopy_field(uuid.UUID(row.canonical_item_id).bytes if row.canonical_item_id else None),
+        _pgcopy_field(row.canonical_item_type.encode('utf-8') if row.canonical_item_type else None),
+        _pgcopy_field(row.canonical_item_key.encode('utf-8') if row.canonical_item_key else None),
+        _pgcopy_field(uuid.UUID(row.track_id).bytes if row.track_id else None),
+        struct.pack('!ih', 2, 1 if row.canonical_item_id else 0),
+        _pgcopy_field(row.cold_ref.encode('utf-8')),
+    ]
+    return b''.join(parts)
+
+
+def _pgcopy_field(value: bytes | None) -> bytes:
+    if value is None:
+        return struct.pack('!i', -1)
+    return struct.pack('!i', len(value)) + value
+
+
+def _iter_pgcopy_binary_tuples(copy_path: Path) -> Iterator[tuple[list[bytes | None], bytes]]:
+    """Yield (fields, raw tuple bytes) for each tuple of a binary COPY file."""
+    with copy_path.open('rb') as handle:
+        header = handle.read(len(_PGCOPY_BINARY_HEADER))
+        if header != _PGCOPY_BINARY_HEADER:
+            raise ValueError(f'{copy_path} is not a binary COPY file')
+        while True:
+            field_count_bytes = handle.read(2)
+            (field_count,) = struct.unpack('!h', field_count_bytes)
+            if field_count == -1:
+                return
+            parts = [field_count_bytes]
+            fields: list[bytes | None] = []
+            for _ in range(field_count):
+                length_bytes = handle.read(4)
+                (length,) = struct.unpack('!i', length_bytes)
+                value = handle.read(length) if length >= 0 else None
+                parts.append(length_bytes)
+                if value is not None:
+                    parts.append(value)
+                fields.append(value)
+            yield fields, b''.join(parts)
+
+
+def _iter_listenbrainz_event_chunk_records(chunk_path: Path, *, chunk_format: str) -> Iterator[tuple[bytes, bytes, Any]]:
+    """
+    Yield (event_signature, cold_ref bytes, record) for each row of an event
+    chunk. record is the raw binary COPY tuple or the CSV field list, ready to
+    be written back out unchanged.
+    """
+    if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+        for fields, record in _iter_pgcopy_binary_tuples(chunk_path):
+            yield fields[2] or b'', fields[-1] or b'', record
+        return
+
+    with chunk_path.open('r', encoding='utf-8', newline='') as handle:
+        for fields in csv.reader(handle):
+            yield bytes.fromhex(fields[2][2:]), fields[-1].encode('utf-8'), fields
+
+
+def _iter_listenbrainz_event_chunk_rows(chunk_path: Path, *, chunk_format: str) -> Iterator[ListenBrainzEventChunkRow]:
+    if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+        for fields, _ in _iter_pgcopy_binary_tuples(chunk_path):
+            (played_at_micros,) = struct.unpack('!q', fields[3])
+            yield ListenBrainzEventChunkRow(
+                run_id=str(uuid.UUID(bytes=fields[0])),
+                partition_key=fields[1].decode('utf-8'),
+                event_signature=fields[2],
+                played_at=_PGCOPY_POSTGRES_EPOCH + timedelta(microseconds=played_at_micros),
+                session_key=fields[4],
+                canonical_item_id=str(uuid.UUID(bytes=fields[5])) if fields[5] is not None else '',
+                canonical_item_type=fields[6].decode('utf-8') if fields[6] is not None else '',
+                canonical_item_key=fields[7].decode('utf-8') if fields[7] is not None else '',
+                track_id=str(uuid.UUID(bytes=fields[8])) if fields[8] is not None else '',
+                cold_ref=fields[10].decode('utf-8'),
+            )
+        return
+
+    def _text(value: str) -> str:
+        return '' if value == r'\N' else value
+
+    with chunk_path.open('r', encoding='utf-8', newline='') as handle:
+        for fields in csv.reader(handle):
+            yield ListenBrainzEventChunkRow(
+                run_id=fields[0],
+                partition_key=fields[1],
+                event_signature=bytes.fromhex(fields[2][2:]),
+                played_at=datetime.fromisoformat(fields[3]),
+                session_key=bytes.fromhex(fields[4][2:]),
+                canonical_item_id=_text(fields[5]),
+                canonical_item_type=_text(fields[6]),
+                canonical_item_key=_text(fields[7]),
+                track_id=_text(fields[8]),
+                cold_ref=fields[10],
+            )
+
+
+def _write_listenbrainz_merged_event_rows(
+    output_path: Path,
+    *,
+    chunk_paths: list[Path],
+    chunk_format: str,
+) -> tuple[int, int]:
+    """
+    K-way merge of sorted event chunks into one COPY file, keeping the lowest
+    cold_ref for each event_signature. Returns (rows_written, rows_deduplicated).
+    """
+    merged_records = heapq.merge(
+        *(_iter_listenbrainz_event_chunk_records(path, chunk_format=chunk_format) for path in chunk_paths),
+        key=lambda entry: (entry[0], entry[1]),
+    )
+
+    def _unique_records() -> Iterator[Any]:
+        nonlocal rows_deduplicated
+        previous_signature = None
+        for event_signature, _, record in merged_records:
+            if event_signature == previous_signature:
+                rows_deduplicated += 1
+                continue
+            previous_signature = event_signature
+            yield record
+
+    rows_written = 0
+    rows_deduplicated = 0
+    if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+        with output_path.open('wb') as handle:
+            handle.write(_PGCOPY_BINARY_HEADER)
+            for record in _unique_records():
+                handle.write(record)
+                rows_written += 1
+            handle.write(_PGCOPY_BINARY_TRAILER)
+        return rows_written, rows_deduplicated
+
+    with output_path.open('w', encoding='utf-8', newline='') as handle:
+        writer = csv.writer(handle)
+        for record in _unique_records():
+            writer.writerow(record)
+            rows_written += 1
+    return rows_written, rows_deduplicated
+
+
+def _listenbrainz_spotify_snapshot_key(spotify_id: str) -> bytes:
+    return hashlib.blake2b(spotify_id.encode('utf-8'), digest_size=16).digest()
+
+
+def write_listenbrainz_identity_snapshot(
+    path: str | Path,
+    *,
+    mbid_to_track_id: dict[str, str],
+    spotify_to_track_id: dict[str, str],
+) -> ListenBrainzIdentitySnapshot:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sections = []
+    for keyed_track_ids in (
+        {uuid.UUID(mbid).bytes: track_id for mbid, track_id in mbid_to_track_id.items()},
+        {_listenbrainz_spotify_snapshot_key(spotify_id): track_id for spotify_id, track_id in spotify_to_track_id.items()},
+    ):
+        keys = np.frombuffer(b''.join(keyed_track_ids), dtype='>u8').reshape(-1, 2)
+        values = np.frombuffer(
+            b''.join(uuid.UUID(track_id).bytes for track_id in keyed_track_ids.values()),
+            dtype=np.uint8,
+        ).reshape(-1, 16)
+        order = np.lexsort((keys[:, 1], keys[:, 0]))
+        sections.append((keys[order], values[order]))
+
+    temp_path = path.with_suffix(f'{path.suffix}.tmp')
+    with temp_path.open('wb') as handle:
+        handle.write(
+            _LISTENBRAINZ_IDENTITY_SNAPSHOT_HEADER.pack(
+                _LISTENBRAINZ_IDENTITY_SNAPSHOT_MAGIC,
+                len(sections[0][0]),
+                len(sections[1][0]),
+            )
+        )
+        for keys, values in sections:
+            handle.write(np.ascontiguousarray(keys[:, 0]).tobytes())
+            handle.write(np.ascontiguousarray(keys[:, 1]).tobytes())
+            handle.write(values.tobytes())
+    temp_path.replace(path)
+    return ListenBrainzIdentitySnapshot(path)
+
+
+def build_listenbrainz_identity_snapshot(run_root: str | Path) -> ListenBrainzIdentitySnapshot:
     with connection.cursor() as cursor:
         cursor.execute("SELECT mbid::text, juke_id::text FROM catalog_track WHERE mbid IS NOT NULL")
         mbid_rows = cursor.fetchall()
@@ -2234,7 +2932,8 @@ def build_listenbrainz_identity_snapshot() -> ListenBrainzIdentitySnapshot:
         for external_id, track_id in [*spotify_rows, *spotify_track_rows]
         if external_id and track_id
     }
-    return ListenBrainzIdentitySnapshot(
+    return write_listenbrainz_identity_snapshot(
+        Path(run_root) / LISTENBRAINZ_IDENTITY_SNAPSHOT_FILENAME,
         mbid_to_track_id=mbid_to_track_id,
         spotify_to_track_id=spotify_to_track_id,
     )
@@ -2288,13 +2987,42 @@ def partition_index_for_event(
     event_signature: bytes,
     partition_count: int,
 ) -> int:
+    digest = _listenbrainz_event_partition_digest(
+        session_key,
+        canonical_item_id=canonical_item_id,
+        event_signature=event_signature,
+    )
+    return int.from_bytes(digest[:8], byteorder='big') % partition_count
+
+
+def _listenbrainz_event_partition_digest(session_key: bytes, *, canonical_item_id: str, event_signature: bytes) -> bytes:
     digest = hashlib.sha256()
     digest.update(session_key)
     if canonical_item_id:
         digest.update(canonical_item_id.encode('utf-8'))
     else:
         digest.update(event_signature)
-    return int.from_bytes(digest.digest()[:8], byteorder='big') % partition_count
+    return digest.digest()
+
+
+def listenbrainz_sub_partition_index(
+    session_key: bytes,
+    *,
+    canonical_item_id: str,
+    event_signature: bytes,
+    split_count: int,
+) -> int:
+    """
+    Sub-partition of an event inside a split partition. Uses the digest bits
+    partition_index_for_event() leaves unused, so rows of one session and
+    canonical item stay together.
+    """
+    digest = _listenbrainz_event_partition_digest(
+        session_key,
+        canonical_item_id=canonical_item_id,
+        event_signature=event_signature,
+    )
+    return int.from_bytes(digest[8:16], byteorder='big') % split_count
 
 
 def _process_listenbrainz_spooled_member(
@@ -2308,6 +3036,74 @@ def _process_listenbrainz_spooled_member(
     chunk_target_rows: int,
     identity_snapshot: ListenBrainzIdentitySnapshot,
 ) -> ListenBrainzMemberChunkResult:
+    with Path(spool_path).open('r', encoding='utf-8') as text_handle:
+        counters, chunk_manifests_by_partition, session_run_manifests_by_partition = _partition_listenbrainz_member_lines(
+            text_handle,
+            origin=origin,
+            member_token=member_token,
+            partition_root=partition_root,
+            run_id=run_id,
+            partition_count=partition_count,
+            chunk_target_rows=chunk_target_rows,
+            identity_snapshot=identity_snapshot,
+        )
+
+    return ListenBrainzMemberChunkResult(
+        member_token=member_token,
+        spool_size_bytes=Path(spool_path).stat().st_size,
+        counters=counters,
+        chunk_manifests_by_partition=chunk_manifests_by_partition,
+        session_run_manifests_by_partition=session_run_manifests_by_partition,
+    )
+
+
+def _process_listenbrainz_streamed_member(
+    *,
+    member_stream: io.RawIOBase,
+    origin: str,
+    member_token: str,
+    partition_root: str,
+    run_id: str,
+    partition_count: int,
+    chunk_target_rows: int,
+    identity_snapshot: ListenBrainzIdentitySnapshot,
+) -> ListenBrainzMemberChunkResult:
+    counting_stream = _CountingByteStream(member_stream)
+    text_handle = io.TextIOWrapper(
+        io.BufferedReader(counting_stream, buffer_size=FULL_INGESTION_STREAM_CHUNK_BYTES),
+        encoding='utf-8',
+    )
+    counters, chunk_manifests_by_partition, session_run_manifests_by_partition = _partition_listenbrainz_member_lines(
+        text_handle,
+        origin=origin,
+        member_token=member_token,
+        partition_root=partition_root,
+        run_id=run_id,
+        partition_count=partition_count,
+        chunk_target_rows=chunk_target_rows,
+        identity_snapshot=identity_snapshot,
+    )
+    return ListenBrainzMemberChunkResult(
+        member_token=member_token,
+        spool_size_bytes=0,
+        counters=counters,
+        chunk_manifests_by_partition=chunk_manifests_by_partition,
+        session_run_manifests_by_partition=session_run_manifests_by_partition,
+        streamed_bytes=counting_stream.bytes_read,
+    )
+
+
+def _partition_listenbrainz_member_lines(
+    text_handle: io.TextIOBase,
+    *,
+    origin: str,
+    member_token: str,
+    partition_root: str,
+    run_id: str,
+    partition_count: int,
+    chunk_target_rows: int,
+    identity_snapshot: ListenBrainzIdentitySnapshot,
+) -> tuple[dict[str, int], dict[str, list[dict[str, int | str]]], dict[str, list[dict[str, int | str]]]]:
     counters = {
         'rows_parsed': 0,
         'rows_with_mbid_candidate': 0,
@@ -2320,108 +3116,325 @@ def _process_listenbrainz_spooled_member(
         'rows_malformed': 0,
     }
     writers: dict[str, _ListenBrainzPartitionChunkWriter] = {}
+    chunk_format = configured_full_ingestion_chunk_format()
+    sort_rows = configured_full_ingestion_sorted_chunks()
+    session_aggregator = _ListenBrainzSessionAggregator(
+        partition_root=Path(partition_root),
+        file_prefix=f'{member_token}-sessions',
+        budget_bytes=configured_full_ingestion_session_aggregate_bytes(),
+    )
 
-    with Path(spool_path).open('r', encoding='utf-8') as text_handle:
-        for payload, error, _, line_number, entry_index in iter_listenbrainz_json_payloads(
-            text_handle,
-            origin=origin,
-        ):
-            if error:
-                counters['rows_malformed'] += 1
-                continue
+    for payload, error, _, line_number, entry_index in iter_listenbrainz_json_payloads(
+        text_handle,
+        origin=origin,
+    ):
+        if error:
+            counters['rows_malformed'] += 1
+            continue
 
-            assert payload is not None
-            try:
-                parsed = parse_listenbrainz_payload(payload)
-            except ValueError:
-                counters['rows_malformed'] += 1
-                continue
+        assert payload is not None
+        try:
+            parsed = parse_listenbrainz_payload(payload)
+        except ValueError:
+            counters['rows_malformed'] += 1
+            continue
+
+        counters['rows_parsed'] += 1
+        resolution = identity_snapshot.resolve(parsed)
+        canonical_item_id = resolution.canonical_item_id
+        track_id = resolution.track_id
+        if resolution.candidate_type == 'recording_mbid':
+            counters['rows_with_mbid_candidate'] += 1
+        elif resolution.candidate_type == 'spotify_track':
+            counters['rows_with_spotify_candidate'] += 1
+        else:
+            counters['rows_with_no_candidate'] += 1
+        if canonical_item_id:
+            counters['rows_resolved'] += 1
+            if resolution.resolution_type == 'recording_mbid':
+                counters['rows_resolved_by_mbid'] += 1
+            elif resolution.resolution_type == 'spotify_track':
+                counters['rows_resolved_by_spotify'] += 1
+        else:
+            counters['rows_unresolved'] += 1
+        partition_index = partition_index_for_event(
+            parsed.session_key,
+            canonical_item_id=canonical_item_id,
+            event_signature=parsed.source_event_signature,
+            partition_count=partition_count,
+        )
+        partition_key = f'p{partition_index:03d}'
+        writer = writers.get(partition_key)
+        if writer is None:
+            writer = _ListenBrainzPartitionChunkWriter(
+                partition_root=Path(partition_root),
+                partition_key=partition_key,
+                chunk_target_rows=chunk_target_rows,
+                file_prefix=f'{member_token}-events',
+                chunk_format=chunk_format,
+                sort_rows=sort_rows,
+            )
+            writers[partition_key] = writer
 
-            counters['rows_parsed'] += 1
-            resolution = identity_snapshot.resolve(parsed)
-            canonical_item_id = resolution.canonical_item_id
-            track_id = resolution.track_id
-            if resolution.candidate_type == 'recording_mbid':
-                counters['rows_with_mbid_candidate'] += 1
-            elif resolution.candidate_type == 'spotify_track':
-                counters['rows_with_spotify_candidate'] += 1
-            else:
-                counters['rows_with_no_candidate'] += 1
-            if canonical_item_id:
-                counters['rows_resolved'] += 1
-                if resolution.resolution_type == 'recording_mbid':
-                    counters['rows_resolved_by_mbid'] += 1
-                elif resolution.resolution_type == 'spotify_track':
-                    counters['rows_resolved_by_spotify'] += 1
-            else:
-                counters['rows_unresolved'] += 1
-            partition_index = partition_index_for_event(
-                parsed.session_key,
-                canonical_item_id=canonical_item_id,
+        writer.write_row(
+            ListenBrainzEventChunkRow(
+                run_id=run_id,
+                partition_key=partition_key,
                 event_signature=parsed.source_event_signature,
-                partition_count=partition_count,
+                played_at=parsed.played_at,
+                session_key=parsed.session_key,
+                canonical_item_id=canonical_item_id,
+                canonical_item_type=resolution.canonical_item_type,
+                canonical_item_key=resolution.canonical_item_key,
+                track_id=track_id,
+                cold_ref=f'{origin}:{line_number}:{entry_index}',
             )
-            partition_key = f'p{partition_index:03d}'
-            writer = writers.get(partition_key)
-            if writer is None:
-                writer = _ListenBrainzPartitionChunkWriter(
-                    partition_root=Path(partition_root),
-                    partition_key=partition_key,
-                    chunk_target_rows=chunk_target_rows,
-                    file_prefix=f'{member_token}-events',
-                )
-                writers[partition_key] = writer
-
-            writer.write_row(
-                [
-                    run_id,
-                    partition_key,
-                    _bytea_hex(parsed.source_event_signature),
-                    parsed.played_at.isoformat(),
-                    _bytea_hex(parsed.session_key),
-                    canonical_item_id or r'\N',
-                    resolution.canonical_item_type or r'\N',
-                    resolution.canonical_item_key or r'\N',
-                    track_id or r'\N',
-                    '1' if canonical_item_id else '0',
-                    f'{origin}:{line_number}:{entry_index}',
-                ]
+        )
+        if canonical_item_id:
+            session_aggregator.add(
+                partition_key,
+                session_key=parsed.session_key,
+                canonical_item_id=canonical_item_id,
+                track_id=track_id,
+                played_at=parsed.played_at,
             )
 
     chunk_manifests_by_partition: dict[str, list[dict[str, int | str]]] = {}
     for partition_key, writer in writers.items():
         chunk_manifests_by_partition[partition_key] = writer.finish()
-
-    return ListenBrainzMemberChunkResult(
-        member_token=member_token,
-        spool_size_bytes=Path(spool_path).stat().st_size,
-        counters=counters,
-        chunk_manifests_by_partition=chunk_manifests_by_partition,
-    )
+    return counters, chunk_manifests_by_partition, session_aggregator.finish()
+
+
+class _CountingByteStream(io.RawIOBase):
+    def __init__(self, raw: Any) -> None:
+        self.raw = raw
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.bytes_read += size
+        return size
+
+
+class _QueuedMemberStream(io.RawIOBase):
+    """
+    Reads one archive member's bytes from an extract worker's queue. Every
+    queued block holds one stream-budget permit, released as soon as the
+    block is taken off the queue; an empty block ends the member.
+    """
+
+    def __init__(self, member_queue: Any, budget_semaphore: Any) -> None:
+        self.member_queue = member_queue
+        self.budget_semaphore = budget_semaphore
+        self.pending = memoryview(b'')
+        self.exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self.pending:
+            if self.exhausted:
+                return 0
+            block = self.member_queue.get()
+            if not block:
+                self.exhausted = True
+                return 0
+            self.budget_semaphore.release()
+            self.pending = memoryview(block)
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+    def drain(self) -> None:
+        while self.readinto(bytearray(FULL_INGESTION_STREAM_CHUNK_BYTES)):
+            pass
 
 
-def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
-    plan = sync_full_ingestion_runtime_control(plan)
-    identity_snapshot = build_listenbrainz_identity_snapshot()
-    chunk_target_rows = configured_full_ingestion_target_chunk_rows()
-    counters = dict(plan.counters)
-    running_plan = plan
-    spool_root = Path(plan.run_root) / 'spool'
-    spool_root.mkdir(parents=True, exist_ok=True)
-    partition_chunk_manifests: dict[str, list[dict[str, int | str]]] = {
-        partition.partition_key: [] for partition in plan.partitions
-    }
-    max_in_flight = max(1, plan.partition_workers)
-    use_process_pool = max_in_flight > 1 and plan.archive_size_bytes >= 64 * 1024 * 1024
+def _run_listenbrainz_stream_extract_worker(
+    member_queue: Any,
+    result_queue: Any,
+    budget_semaphore: Any,
+    identity_snapshot: ListenBrainzIdentitySnapshot,
+    partition_root: str,
+    run_id: str,
+    partition_count: int,
+    chunk_target_rows: int,
+) -> None:
     close_old_connections()
-    host_counter_keys = (
-        'scratch_actual_bytes',
-        'host_device_util_milli_pct',
-        'host_iowait_milli_pct',
-        'host_available_memory_bytes',
-        'host_swap_used_bytes',
-    )
-
+    while True:
+        header = member_queue.get()
+        if header is None:
+            return
+        member_token, origin = header
+        member_stream = _QueuedMemberStream(member_queue, budget_semaphore)
+        try:
+            result = _process_listenbrainz_streamed_member(
+                member_stream=member_stream,
+                origin=origin,
+                member_token=member_token,
+                partition_root=partition_root,
+                run_id=run_id,
+                partition_count=partition_count,
+                chunk_target_rows=chunk_target_rows,
+                identity_snapshot=identity_snapshot,
+            )
+        except Exception as exc:  # noqa: BLE001 - reported to the parent, which raises
+            member_stream.drain()
+            result_queue.put(('error', member_token, f'{type(exc).__name__}: {exc}'))
+            continue
+        result_queue.put(('result', member_token, result))
+
+
+class _ListenBrainzStreamExtractPool:
+    """
+    Long-lived forked extract workers fed decompressed member bytes through
+    per-worker queues. The parent keeps decompressing while workers parse;
+    a shared semaphore caps in-flight blocks, and resize_budget() applies
+    the byte budget from apply_full_ingestion_backpressure().
+    """
+
+    def __init__(
+        self,
+        *,
+        worker_count: int,
+        budget_bytes: int,
+        identity_snapshot: ListenBrainzIdentitySnapshot,
+        partition_root: str,
+        run_id: str,
+        partition_count: int,
+        chunk_target_rows: int,
+    ) -> None:
+        context = multiprocessing.get_context('fork')
+        self.permits = max(1, budget_bytes // FULL_INGESTION_STREAM_CHUNK_BYTES)
+        self.withheld_permits = 0
+        self.budget_semaphore = context.Semaphore(self.permits)
+        self.result_queue = context.Queue()
+        self.member_queues = [context.Queue() for _ in range(worker_count)]
+        self.workers = [
+            context.Process(
+                target=_run_listenbrainz_stream_extract_worker,
+                args=(
+                    member_queue,
+                    self.result_queue,
+                    self.budget_semaphore,
+                    identity_snapshot,
+                    partition_root,
+                    run_id,
+                    partition_count,
+                    chunk_target_rows,
+                ),
+                daemon=True,
+            )
+            for member_queue in self.member_queues
+        ]
+        self.members_by_worker: list[set[str]] = [set() for _ in self.workers]
+        self.worker_by_member: dict[str, int] = {}
+
+    def __enter__(self) -> _ListenBrainzStreamExtractPool:
+        close_old_connections()
+        for worker in self.workers:
+            worker.start()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        for member_queue in self.member_queues:
+            member_queue.put(None)
+        for worker in self.workers:
+            worker.join(timeout=None if exc_type is None else 5)
+            if worker.is_alive():
+                worker.terminate()
+
+    @property
+    def members_in_flight(self) -> int:
+        return len(self.worker_by_member)
+
+    def resize_budget(self, budget_bytes: int) -> None:
+        target = max(1, budget_bytes // FULL_INGESTION_STREAM_CHUNK_BYTES)
+        while self.permits - self.withheld_permits > target and self.budget_semaphore.acquire(block=False):
+            self.withheld_permits += 1
+        while self.permits - self.withheld_permits < target:
+            self.budget_semaphore.release()
+            if self.withheld_permits:
+                self.withheld_permits -= 1
+            else:
+                self.permits += 1
+
+    def stream_member(self, member_token: str, origin: str, extracted: Any, *, active_workers: int) -> None:
+        worker_index = min(
+            range(max(1, min(active_workers, len(self.workers)))),
+            key=lambda index: len(self.members_by_worker[index]),
+        )
+        member_queue = self.member_queues[worker_index]
+        self.members_by_worker[worker_index].add(member_token)
+        self.worker_by_member[member_token] = worker_index
+        member_queue.put((member_token, origin))
+        while True:
+            block = extracted.read(FULL_INGESTION_STREAM_CHUNK_BYTES)
+            if not block:
+                break
+            while not self.budget_semaphore.acquire(timeout=1.0):
+                self._raise_if_worker_died()
+            member_queue.put(block)
+        member_queue.put(b'')
+
+    def collect(self, *, block: bool) -> list[ListenBrainzMemberChunkResult]:
+        results = []
+        while self.worker_by_member:
+            try:
+                kind, member_token, payload = self.result_queue.get(timeout=1.0 if block else 0.05)
+            except queue.Empty:
+                if not block:
+                    break
+                self._raise_if_worker_died()
+                continue
+            worker_index = self.worker_by_member.pop(member_token)
+            self.members_by_worker[worker_index].discard(member_token)
+            if kind == 'error':
+                raise RuntimeError(f'listenbrainz extract worker failed on member {member_token}: {payload}')
+            results.append(payload)
+            block = False
+        return results
+
+    def _raise_if_worker_died(self) -> None:
+        for worker in self.workers:
+            if not worker.is_alive():
+                raise RuntimeError(f'listenbrainz extract worker exited unexpectedly (exitcode={worker.exitcode})')
+
+
+def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
+    plan = sync_full_ingestion_runtime_control(plan)
+    identity_snapshot = build_listenbrainz_identity_snapshot(plan.run_root)
+    chunk_target_rows = configured_full_ingestion_target_chunk_rows()
+    extract_mode = configured_full_ingestion_extract_mode()
+    counters = dict(plan.counters)
+    running_plan = plan
+    spool_root = Path(plan.run_root) / 'spool'
+    if extract_mode == FULL_INGESTION_EXTRACT_MODE_SPOOL:
+        spool_root.mkdir(parents=True, exist_ok=True)
+    partition_chunk_manifests: dict[str, list[dict[str, int | str]]] = {
+        partition.partition_key: [] for partition in plan.partitions
+    }
+    partition_session_runs: dict[str, list[dict[str, int | str]]] = {
+        partition.partition_key: [] for partition in plan.partitions
+    }
+    max_in_flight = max(1, plan.partition_workers)
+    use_process_pool = max_in_flight > 1 and plan.archive_size_bytes >= 64 * 1024 * 1024
+    close_old_connections()
+    host_counter_keys = (
+        'scratch_actual_bytes',
+        'host_device_util_milli_pct',
+        'host_iowait_milli_pct',
+        'host_available_memory_bytes',
+        'host_swap_used_bytes',
+    )
+
     def _record_member_result(result: ListenBrainzMemberChunkResult) -> None:
         nonlocal counters, running_plan
         running_plan = apply_full_ingestion_backpressure(running_plan)
@@ -2444,24 +3457,40 @@ def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
         )
         counters['rows_unresolved'] = int(counters.get('rows_unresolved') or 0) + int(result.counters['rows_unresolved'])
         counters['rows_malformed'] = int(counters.get('rows_malformed') or 0) + int(result.counters['rows_malformed'])
-        counters['spool_bytes_estimated'] = max(
-            0,
-            int(counters.get('spool_bytes_estimated') or 0) - int(result.spool_size_bytes),
-        )
-        counters['spooled_members_in_flight'] = max(
-            0,
-            int(counters.get('spooled_members_in_flight') or 0) - 1,
-        )
+        if extract_mode == FULL_INGESTION_EXTRACT_MODE_SPOOL:
+            counters['spool_bytes_estimated'] = max(
+                0,
+                int(counters.get('spool_bytes_estimated') or 0) - int(result.spool_size_bytes),
+            )
+            counters['spooled_members_in_flight'] = max(
+                0,
+                int(counters.get('spooled_members_in_flight') or 0) - 1,
+            )
+        else:
+            counters['stream_bytes_in_flight'] = max(
+                0,
+                int(counters.get('stream_bytes_in_flight') or 0) - int(result.streamed_bytes),
+            )
+            counters['streamed_members_in_flight'] = max(
+                0,
+                int(counters.get('streamed_members_in_flight') or 0) - 1,
+            )
         for partition_key, chunk_manifests in result.chunk_manifests_by_partition.items():
             partition_chunk_manifests[partition_key].extend(chunk_manifests)
             counters['chunks_written'] = int(counters.get('chunks_written') or 0) + len(chunk_manifests)
             counters['chunk_bytes_written'] = int(counters.get('chunk_bytes_written') or 0) + sum(
                 int(chunk_manifest.get('size_bytes') or 0) for chunk_manifest in chunk_manifests
             )
+        for partition_key, run_manifests in (result.session_run_manifests_by_partition or {}).items():
+            partition_session_runs[partition_key].extend(run_manifests)
+            counters['session_runs_written'] = int(counters.get('session_runs_written') or 0) + len(run_manifests)
+            counters['session_run_bytes_written'] = int(counters.get('session_run_bytes_written') or 0) + sum(
+                int(run_manifest.get('size_bytes') or 0) for run_manifest in run_manifests
+            )
         spool_path = spool_root / f'{result.member_token}.listens'
         if spool_path.exists():
             spool_path.unlink()
-        for key in host_counter_keys:
+        for key in (*host_counter_keys, 'stream_buffer_budget_bytes'):
             counters[key] = int(running_plan.counters.get(key) or counters.get(key) or 0)
         running_plan = replace(
             running_plan,
@@ -2489,6 +3518,25 @@ def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
                 )
                 member_index += 1
                 member_token = f'm{member_index:05d}'
+                if extract_mode == FULL_INGESTION_EXTRACT_MODE_STREAM:
+                    counters['stream_bytes_in_flight'] = int(counters.get('stream_bytes_in_flight') or 0) + int(
+                        member.size or 0
+                    )
+                    counters['streamed_members_in_flight'] = int(counters.get('streamed_members_in_flight') or 0) + 1
+                    with extracted:
+                        result = _process_listenbrainz_streamed_member(
+                            member_stream=extracted,
+                            origin=relative_path.as_posix(),
+                            member_token=member_token,
+                            partition_root=plan.partition_root,
+                            run_id=plan.run_id,
+                            partition_count=plan.partition_count,
+                            chunk_target_rows=chunk_target_rows,
+                            identity_snapshot=identity_snapshot,
+                        )
+                    _record_member_result(result)
+                    continue
+
                 spool_path = spool_root / f'{member_token}.listens'
                 with extracted, spool_path.open('wb') as spool_handle:
                     shutil.copyfileobj(extracted, spool_handle, length=1024 * 1024)
@@ -2507,6 +3555,66 @@ def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
                         identity_snapshot=identity_snapshot,
                     )
                 )
+        elif extract_mode == FULL_INGESTION_EXTRACT_MODE_STREAM:
+            with _ListenBrainzStreamExtractPool(
+                worker_count=max_in_flight,
+                budget_bytes=int(
+                    running_plan.counters.get('stream_buffer_budget_bytes')
+                    or configured_full_ingestion_stream_buffer_bytes()
+                ),
+                identity_snapshot=identity_snapshot,
+                partition_root=plan.partition_root,
+                run_id=plan.run_id,
+                partition_count=plan.partition_count,
+                chunk_target_rows=chunk_target_rows,
+            ) as stream_pool:
+                member_index = 0
+                for member in archive:
+                    relative_path = listenbrainz_shard_relative_path(member.name)
+                    if relative_path is None:
+                        continue
+
+                    extracted = archive.extractfile(member)
+                    if extracted is None:
+                        continue
+
+                    counters['artifacts_discovered'] = int(counters.get('artifacts_discovered') or 0) + 1
+                    counters['artifacts_partitioned'] = int(counters.get('artifacts_partitioned') or 0) + 1
+                    counters['input_bytes_partitioned'] = int(counters.get('input_bytes_partitioned') or 0) + int(
+                        member.size or 0
+                    )
+                    member_index += 1
+                    member_token = f'm{member_index:05d}'
+                    counters['stream_bytes_in_flight'] = int(counters.get('stream_bytes_in_flight') or 0) + int(
+                        member.size or 0
+                    )
+                    counters['streamed_members_in_flight'] = int(counters.get('streamed_members_in_flight') or 0) + 1
+
+                    # Members may queue one deep behind each active worker so decompression
+                    # runs ahead of parsing; the byte budget bounds what that buffers.
+                    active_workers = max(1, min(max_in_flight, running_plan.partition_worker_budget))
+                    while stream_pool.members_in_flight >= 2 * active_workers:
+                        for result in stream_pool.collect(block=True):
+                            _record_member_result(result)
+                    stream_pool.resize_budget(
+                        int(
+                            running_plan.counters.get('stream_buffer_budget_bytes')
+                            or configured_full_ingestion_stream_buffer_bytes()
+                        )
+                    )
+                    with extracted:
+                        stream_pool.stream_member(
+                            member_token,
+                            relative_path.as_posix(),
+                            extracted,
+                            active_workers=active_workers,
+                        )
+                    for result in stream_pool.collect(block=False):
+                        _record_member_result(result)
+
+                while stream_pool.members_in_flight:
+                    for result in stream_pool.collect(block=True):
+                        _record_member_result(result)
         else:
             with ProcessPoolExecutor(
                 max_workers=max_in_flight,
@@ -2568,15 +3676,24 @@ def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
                         future_to_member.pop(done_future, None)
                         _record_member_result(done_future.result())
 
+    rebalanced_partitions, rebalance_rows_deduplicated, partitions_split, partitions_coalesced = (
+        rebalance_listenbrainz_partitions(
+            running_plan,
+            chunk_manifests=partition_chunk_manifests,
+            session_runs=partition_session_runs,
+        )
+    )
     finalized_partitions: list[FullIngestionPartitionPlan] = []
     total_chunks = 0
-    for partition in running_plan.partitions:
+    for partition in rebalanced_partitions:
         chunks = partition_chunk_manifests.get(partition.partition_key, [])
         total_chunks += len(chunks)
         write_full_ingestion_partition_manifest(
             running_plan,
             partition=partition,
             chunks=chunks,
+            session_runs=partition_session_runs.get(partition.partition_key, []),
+            rows_deduplicated=rebalance_rows_deduplicated.get(partition.partition_key, 0),
         )
         finalized_partitions.append(
             replace(
@@ -2593,6 +3710,8 @@ def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
         counters={
             **counters,
             'chunks_written': total_chunks,
+            'partitions_split': partitions_split,
+            'partitions_coalesced': partitions_coalesced,
             'partitions_completed': len(finalized_partitions),
             'partitions_failed': 0,
         },
@@ -2602,6 +3721,256 @@ def extract_listenbrainz_archive(plan: FullIngestionPlan) -> FullIngestionPlan:
     return completed_plan
 
 
+def plan_full_ingestion_partition_rebalance(
+    row_counts: dict[str, int],
+    *,
+    skew_factor: float,
+    min_split_rows: int = 0,
+    max_split: int = FULL_INGESTION_REBALANCE_MAX_SPLIT,
+) -> tuple[dict[str, int], list[list[str]]]:
+    """
+    Decide which partitions to split and which to coalesce from their actual
+    row counts. A partition above skew_factor times the mean (and above
+    min_split_rows) is split into about mean-sized sub-partitions; non-empty
+    partitions below the mean
+    divided by skew_factor are packed into groups of up to the mean. Returns
+    ({partition_key: split_count}, [[target_key, absorbed_key, ...], ...]).
+    """
+    total_rows = sum(row_counts.values())
+    if skew_factor <= 1.0 or len(row_counts) < 2 or total_rows <= 0:
+        return {}, []
+
+    mean_rows = total_rows / len(row_counts)
+    splits = {
+        partition_key: min(max(2, max_split), math.ceil(rows / mean_rows))
+        for partition_key, rows in sorted(row_counts.items())
+        if rows > skew_factor * mean_rows and rows > min_split_rows
+    }
+
+    groups: list[list[str]] = []
+    current_group: list[str] = []
+    current_rows = 0
+    for rows, partition_key in sorted(
+        (rows, partition_key)
+        for partition_key, rows in row_counts.items()
+        if 0 < rows < mean_rows / skew_factor
+    ):
+        if current_group and current_rows + rows > mean_rows:
+            groups.append(current_group)
+            current_group = []
+            current_rows = 0
+        current_group.append(partition_key)
+        current_rows += rows
+    if current_group:
+        groups.append(current_group)
+    return splits, [sorted(group) for group in groups if len(group) > 1]
+
+
+def rebalance_listenbrainz_partitions(
+    plan: FullIngestionPlan,
+    *,
+    chunk_manifests: dict[str, list[dict[str, int | str]]],
+    session_runs: dict[str, list[dict[str, int | str]]],
+) -> tuple[list[FullIngestionPartitionPlan], dict[str, int], int, int]:
+    """
+    Even out extracted partitions before the copy stage so copy, drain and
+    hot-build lanes finish together. Oversized partitions are rewritten into
+    <key>_NN sub-partitions by listenbrainz_sub_partition_index(); small ones
+    are rewritten into the lowest key of their group. chunk_manifests and
+    session_runs are updated in place. Returns the new partition list, rows
+    already deduplicated by rewritten sorted chunks per partition, and the
+    number of partitions split and coalesced.
+    """
+    chunk_target_rows = configured_full_ingestion_target_chunk_rows()
+    row_counts = {
+        partition.partition_key: sum(int(chunk.get('row_count') or 0) for chunk in chunk_manifests.get(partition.partition_key, []))
+        for partition in plan.partitions
+    }
+    splits, groups = plan_full_ingestion_partition_rebalance(
+        row_counts,
+        skew_factor=configured_full_ingestion_rebalance_skew_factor(),
+        # Splitting anything smaller than one chunk only adds lanes.
+        min_split_rows=max(chunk_target_rows, FULL_INGESTION_REBALANCE_MIN_SPLIT_ROWS),
+    )
+    if not splits and not groups:
+        return list(plan.partitions), {}, 0, 0
+
+    partition_root = Path(plan.partition_root)
+    absorbed_into = {partition_key: group[0] for group in groups for partition_key in group[1:]}
+    rows_deduplicated: dict[str, int] = {}
+    rebalanced_partitions: list[FullIngestionPartitionPlan] = []
+    for partition in plan.partitions:
+        partition_key = partition.partition_key
+        if partition_key in absorbed_into:
+            continue
+        if partition_key not in splits:
+            rebalanced_partitions.append(partition)
+            continue
+        source_chunks = chunk_manifests.pop(partition_key, [])
+        sub_chunks, sub_runs = _split_listenbrainz_partition(
+            partition_root,
+            partition_key=partition_key,
+            split_count=splits[partition_key],
+            chunks=source_chunks,
+            session_runs=session_runs.pop(partition_key, []),
+            chunk_target_rows=chunk_target_rows,
+        )
+        sub_keys = list(sub_chunks)
+        carried = sum(int(chunk.get('rows_deduplicated') or 0) for chunk in source_chunks)
+        if carried:
+            rows_deduplicated[sub_keys[0]] = carried
+        for sub_key in sub_keys:
+            chunk_manifests[sub_key] = sub_chunks[sub_key]
+            session_runs[sub_key] = sub_runs[sub_key]
+            rebalanced_partitions.append(replace(partition, partition_key=sub_key))
+
+    for partition_key, target_key in absorbed_into.items():
+        source_chunks = chunk_manifests.pop(partition_key, [])
+        moved_chunks, moved_runs = _coalesce_listenbrainz_partition(
+            partition_root,
+            partition_key=partition_key,
+            target_key=target_key,
+            chunks=source_chunks,
+            session_runs=session_runs.pop(partition_key, []),
+        )
+        chunk_manifests.setdefault(target_key, []).extend(moved_chunks)
+        session_runs.setdefault(target_key, []).extend(moved_runs)
+        carried = sum(int(chunk.get('rows_deduplicated') or 0) for chunk in source_chunks)
+        if carried:
+            rows_deduplicated[target_key] = rows_deduplicated.get(target_key, 0) + carried
+
+    return rebalanced_partitions, rows_deduplicated, len(splits), len(absorbed_into)
+
+
+def _split_listenbrainz_partition(
+    partition_root: Path,
+    *,
+    partition_key: str,
+    split_count: int,
+    chunks: list[dict[str, int | str]],
+    session_runs: list[dict[str, int | str]],
+    chunk_target_rows: int,
+) -> tuple[dict[str, list[dict[str, int | str]]], dict[str, list[dict[str, int | str]]]]:
+    source_root = partition_root / partition_key
+    sub_keys = [f'{partition_key}_{index:02d}' for index in range(split_count)]
+    writers: dict[tuple[str, str, bool], _ListenBrainzPartitionChunkWriter] = {}
+    for chunk in chunks:
+        chunk_format = str(chunk.get('format') or FULL_INGESTION_CHUNK_FORMAT_CSV)
+        sort_rows = bool(chunk.get('sorted'))
+        for row in _iter_listenbrainz_event_chunk_rows(source_root / str(chunk['relative_path']), chunk_format=chunk_format):
+            sub_key = sub_keys[
+                listenbrainz_sub_partition_index(
+                    row.session_key,
+                    canonical_item_id=row.canonical_item_id,
+                    event_signature=row.event_signature,
+                    split_count=split_count,
+                )
+            ]
+            writer_key = (sub_key, chunk_format, sort_rows)
+            writer = writers.get(writer_key)
+            if writer is None:
+                writer = _ListenBrainzPartitionChunkWriter(
+                    partition_root=partition_root,
+                    partition_key=sub_key,
+                    chunk_target_rows=chunk_target_rows,
+                    file_prefix=f'{chunk_format}{"-sorted" if sort_rows else ""}-events',
+                    chunk_format=chunk_format,
+                    sort_rows=sort_rows,
+                )
+                writers[writer_key] = writer
+            writer.write_row(replace(row, partition_key=sub_key))
+    sub_chunks: dict[str, list[dict[str, int | str]]] = {sub_key: [] for sub_key in sub_keys}
+    for (sub_key, _, _), writer in writers.items():
+        sub_chunks[sub_key].extend(writer.finish())
+
+    # Session run records are already sorted; routing each record keeps every
+    # output run sorted, so the copy stage merges them unchanged.
+    sub_runs: dict[str, list[dict[str, int | str]]] = {sub_key: [] for sub_key in sub_keys}
+    for session_run in session_runs:
+        run_path = source_root / str(session_run['relative_path'])
+        handles: dict[str, Any] = {}
+        row_counts: dict[str, int] = {}
+        try:
+            for record in _iter_listenbrainz_session_run_records(run_path):
+                sub_key = sub_keys[
+                    listenbrainz_sub_partition_index(
+                        record[:32],
+                        canonical_item_id=str(uuid.UUID(bytes=record[32:48])),
+                        event_signature=b'',
+                        split_count=split_count,
+                    )
+                ]
+                handle = handles.get(sub_key)
+                if handle is None:
+                    sessions_root = partition_root / sub_key / 'sessions'
+                    sessions_root.mkdir(parents=True, exist_ok=True)
+                    handle = (sessions_root / run_path.name).open('wb')
+                    handles[sub_key] = handle
+                handle.write(record)
+                row_counts[sub_key] = row_counts.get(sub_key, 0) + 1
+        finally:
+            for handle in handles.values():
+                handle.close()
+        for sub_key in handles:
+            sub_run_path = partition_root / sub_key / 'sessions' / run_path.name
+            sub_runs[sub_key].append(
+                {
+                    'relative_path': sub_run_path.relative_to(partition_root / sub_key).as_posix(),
+                    'row_count': row_counts[sub_key],
+                    'size_bytes': sub_run_path.stat().st_size,
+                }
+            )
+
+    shutil.rmtree(source_root, ignore_errors=True)
+    return sub_chunks, sub_runs
+
+
+def _coalesce_listenbrainz_partition(
+    partition_root: Path,
+    *,
+    partition_key: str,
+    target_key: str,
+    chunks: list[dict[str, int | str]],
+    session_runs: list[dict[str, int | str]],
+) -> tuple[list[dict[str, int | str]], list[dict[str, int | str]]]:
+    source_root = partition_root / partition_key
+    moved_chunks: list[dict[str, int | str]] = []
+    for chunk in chunks:
+        # partition_key is a COPY column, so the rows are rewritten one chunk
+        # at a time rather than moved.
+        chunk_path = source_root / str(chunk['relative_path'])
+        chunk_format = str(chunk.get('format') or FULL_INGESTION_CHUNK_FORMAT_CSV)
+        writer = _ListenBrainzPartitionChunkWriter(
+            partition_root=partition_root,
+            partition_key=target_key,
+            chunk_target_rows=max(1, int(chunk.get('row_count') or 0)),
+            file_prefix=f'{partition_key}-{chunk_path.stem}',
+            chunk_format=chunk_format,
+            sort_rows=bool(chunk.get('sorted')),
+        )
+        for row in _iter_listenbrainz_event_chunk_rows(chunk_path, chunk_format=chunk_format):
+            writer.write_row(replace(row, partition_key=target_key))
+        moved_chunks.extend(writer.finish())
+
+    moved_runs: list[dict[str, int | str]] = []
+    if session_runs:
+        sessions_root = partition_root / target_key / 'sessions'
+        sessions_root.mkdir(parents=True, exist_ok=True)
+    for session_run in session_runs:
+        run_path = source_root / str(session_run['relative_path'])
+        moved_path = partition_root / target_key / 'sessions' / f'{partition_key}-{run_path.name}'
+        run_path.replace(moved_path)
+        moved_runs.append(
+            {
+                **session_run,
+                'relative_path': moved_path.relative_to(partition_root / target_key).as_posix(),
+            }
+        )
+
+    shutil.rmtree(source_root, ignore_errors=True)
+    return moved_chunks, moved_runs
+
+
 def ensure_listenbrainz_load_tables() -> None:
     expected_event_columns = [
         'run_id',
@@ -2707,16 +4076,33 @@ def ensure_listenbrainz_load_tables() -> None:
         with connection.cursor() as cursor:
             cursor.execute(f'DROP TABLE IF EXISTS {LISTENBRAINZ_SESSION_STAGE_TABLE}')
 
+    def _drop_empty_unpartitioned_load_table(table_name: str) -> None:
+        # Load tables predating LIST partitioning are replaced once they are
+        # empty; a populated one keeps serving its run through the heap paths.
+        if connection.vendor != 'postgresql':
+            return
+        with connection.cursor() as cursor:
+            if _relation_kind(cursor, table_name) != 'r':
+                return
+            cursor.execute(f'SELECT EXISTS (SELECT 1 FROM {table_name})')
+            if not cursor.fetchone()[0]:
+                cursor.execute(f'DROP TABLE {table_name}')
+
     _drop_table_if_mismatched(LISTENBRAINZ_EVENT_LOAD_TABLE, expected_event_columns)
     _drop_table_if_mismatched(LISTENBRAINZ_SESSION_LOAD_TABLE, expected_session_columns)
+    _drop_empty_unpartitioned_load_table(LISTENBRAINZ_EVENT_LOAD_TABLE)
+    _drop_empty_unpartitioned_load_table(LISTENBRAINZ_SESSION_LOAD_TABLE)
     _reconcile_session_stage_table()
     _drop_table_if_mismatched(LISTENBRAINZ_FINALIZE_CHECKPOINT_TABLE, expected_checkpoint_columns)
 
     with connection.cursor() as cursor:
         if connection.vendor == 'postgresql':
+            # One UNLOGGED child per partition key is attached on first load
+            # (see _ensure_listenbrainz_load_partition); the parent itself
+            # holds no rows, so it cannot be UNLOGGED.
             cursor.execute(
                 f'''
-                CREATE UNLOGGED TABLE IF NOT EXISTS {LISTENBRAINZ_EVENT_LOAD_TABLE} (
+                CREATE TABLE IF NOT EXISTS {LISTENBRAINZ_EVENT_LOAD_TABLE} (
                     run_id uuid NOT NULL,
                     partition_key varchar(16) NOT NULL,
                     event_signature bytea NOT NULL,
@@ -2728,7 +4114,7 @@ def ensure_listenbrainz_load_tables() -> None:
                     track_id uuid NULL,
                     resolution_state smallint NOT NULL,
                     cold_ref text NOT NULL
-                )
+                ) PARTITION BY LIST (partition_key)
                 '''
             )
             cursor.execute(
@@ -2739,7 +4125,7 @@ def ensure_listenbrainz_load_tables() -> None:
             )
             cursor.execute(
                 f'''
-                CREATE UNLOGGED TABLE IF NOT EXISTS {LISTENBRAINZ_SESSION_LOAD_TABLE} (
+                CREATE TABLE IF NOT EXISTS {LISTENBRAINZ_SESSION_LOAD_TABLE} (
                     run_id uuid NOT NULL,
                     partition_key varchar(16) NOT NULL,
                     session_key bytea NOT NULL,
@@ -2748,7 +4134,7 @@ def ensure_listenbrainz_load_tables() -> None:
                     first_played_at timestamptz NOT NULL,
                     last_played_at timestamptz NOT NULL,
                     play_count integer NOT NULL
-                )
+                ) PARTITION BY LIST (partition_key)
                 '''
             )
             cursor.execute(
@@ -2883,70 +4269,120 @@ def load_listenbrainz_partition_to_load_tables(
         )
 
     with connection.cursor() as cursor:
-        cursor.execute(
-            f'DELETE FROM {LISTENBRAINZ_SESSION_LOAD_TABLE} WHERE run_id = %s AND partition_key = %s',
-            [plan.run_id, partition.partition_key],
+        _clear_listenbrainz_load_partition(
+            cursor,
+            LISTENBRAINZ_SESSION_LOAD_TABLE,
+            run_id=plan.run_id,
+            partition_key=partition.partition_key,
         )
-        cursor.execute(
-            f'DELETE FROM {LISTENBRAINZ_EVENT_LOAD_TABLE} WHERE run_id = %s AND partition_key = %s',
-            [plan.run_id, partition.partition_key],
+        _clear_listenbrainz_load_partition(
+            cursor,
+            LISTENBRAINZ_EVENT_LOAD_TABLE,
+            run_id=plan.run_id,
+            partition_key=partition.partition_key,
+        )
+        event_load_table = _ensure_listenbrainz_load_partition(
+            cursor,
+            LISTENBRAINZ_EVENT_LOAD_TABLE,
+            partition_key=partition.partition_key,
+        )
+        _ensure_listenbrainz_load_partition(
+            cursor,
+            LISTENBRAINZ_SESSION_LOAD_TABLE,
+            partition_key=partition.partition_key,
         )
 
     rows_loaded = 0
     chunks_loaded = 0
-    for chunk in event_chunks:
-        chunk_path = Path(plan.partition_root) / partition.partition_key / str(chunk['relative_path'])
-        _copy_csv_into_table(
-            chunk_path,
-            table_name=LISTENBRAINZ_EVENT_LOAD_TABLE,
-            columns=[
-                'run_id',
-                'partition_key',
-                'event_signature',
-                'played_at',
-                'session_key',
-                'canonical_item_id',
-                'canonical_item_type',
-                'canonical_item_key',
-                'track_id',
-                'resolution_state',
-                'cold_ref',
+    rows_deduplicated = int(manifest_payload.get('rows_deduplicated') or 0)
+    chunk_formats = {chunk.get('format') or FULL_INGESTION_CHUNK_FORMAT_CSV for chunk in event_chunks}
+    presorted = len(chunk_formats) == 1 and all(chunk.get('sorted') for chunk in event_chunks)
+    if presorted:
+        # Sorted, per-chunk deduplicated extract output: merge the chunks and
+        # drop signatures repeated across them so the drain can skip DISTINCT ON.
+        chunk_format = chunk_formats.pop()
+        merged_path = Path(plan.partition_root) / partition.partition_key / 'events' / (
+            'merged.pgcopy' if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY else 'merged.csv'
+        )
+        rows_loaded, merge_rows_deduplicated = _write_listenbrainz_merged_event_rows(
+            merged_path,
+            chunk_paths=[
+                Path(plan.partition_root) / partition.partition_key / str(chunk['relative_path'])
+                for chunk in event_chunks
             ],
+            chunk_format=chunk_format,
+        )
+        rows_deduplicated += merge_rows_deduplicated + sum(int(chunk.get('rows_deduplicated') or 0) for chunk in event_chunks)
+        copy_into_table = (
+            _copy_binary_into_table if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY else _copy_csv_into_table
         )
+        copy_into_table(
+            merged_path,
+            table_name=event_load_table,
+            columns=list(LISTENBRAINZ_EVENT_LOAD_COLUMNS),
+        )
+        merged_path.unlink()
+        chunks_loaded = len(event_chunks)
+        event_chunks = []
+
+    for chunk in event_chunks:
+        chunk_path = Path(plan.partition_root) / partition.partition_key / str(chunk['relative_path'])
+        if chunk.get('format') == FULL_INGESTION_CHUNK_FORMAT_BINARY:
+            _copy_binary_into_table(
+                chunk_path,
+                table_name=event_load_table,
+                columns=list(LISTENBRAINZ_EVENT_LOAD_COLUMNS),
+            )
+        else:
+            _copy_csv_into_table(
+                chunk_path,
+                table_name=event_load_table,
+                columns=list(LISTENBRAINZ_EVENT_LOAD_COLUMNS),
+            )
         rows_loaded += int(chunk.get('row_count') or 0)
         chunks_loaded += 1
 
-    with connection.cursor() as cursor:
-        cursor.execute(
-            f'''
-            INSERT INTO {LISTENBRAINZ_SESSION_LOAD_TABLE} (
-                run_id,
-                partition_key,
-                session_key,
-                canonical_item_id,
-                track_id,
-                first_played_at,
-                last_played_at,
-                play_count
-            )
-            SELECT
-                run_id,
-                partition_key,
-                session_key,
-                canonical_item_id,
-                track_id,
-                MIN(played_at),
-                MAX(played_at),
-                COUNT(*)
-            FROM {LISTENBRAINZ_EVENT_LOAD_TABLE}
-            WHERE run_id = %s
-              AND partition_key = %s
-              AND canonical_item_id IS NOT NULL
-            GROUP BY run_id, partition_key, session_key, canonical_item_id, track_id
-            ''',
-            [plan.run_id, partition.partition_key],
+    session_runs = manifest_payload.get('session_runs')
+    if session_runs is not None:
+        # Extract workers pre-aggregated sessions into sorted runs; merge them
+        # here and COPY the result instead of grouping raw events in Postgres.
+        session_rows_loaded = _load_listenbrainz_session_runs(
+            plan,
+            partition_key=partition.partition_key,
+            session_runs=list(session_runs),
         )
-        session_rows_loaded = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
+    else:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'''
+                INSERT INTO {LISTENBRAINZ_SESSION_LOAD_TABLE} (
+                    run_id,
+                    partition_key,
+                    session_key,
+                    canonical_item_id,
+                    track_id,
+                    first_played_at,
+                    last_played_at,
+                    play_count
+                )
+                SELECT
+                    run_id,
+                    partition_key,
+                    session_key,
+                    canonical_item_id,
+                    track_id,
+                    MIN(played_at),
+                    MAX(played_at),
+                    COUNT(*)
+                FROM {LISTENBRAINZ_EVENT_LOAD_TABLE}
+                WHERE run_id = %s
+                  AND partition_key = %s
+                  AND canonical_item_id IS NOT NULL
+                GROUP BY run_id, partition_key, session_key, canonical_item_id, track_id
+                ''',
+                [plan.run_id, partition.partition_key],
+            )
+            session_rows_loaded = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
 
     copy_manifest_path = full_ingestion_copy_manifest_path(plan, partition_key=partition.partition_key)
     return FullIngestionCopyResult(
@@ -2955,6 +4391,8 @@ def load_listenbrainz_partition_to_load_tables(
         session_rows_loaded=session_rows_loaded,
         chunks_loaded=chunks_loaded,
         copy_manifest_path=str(copy_manifest_path),
+        presorted=presorted,
+        rows_deduplicated=rows_deduplicated,
     )
 
 
@@ -2988,6 +4426,68 @@ def _copy_csv_into_table(csv_path: Path, *, table_name: str, columns: list[str])
                     copy.write(chunk)
 
 
+def _load_listenbrainz_session_runs(
+    plan: FullIngestionPlan,
+    *,
+    partition_key: str,
+    session_runs: list[dict[str, Any]],
+) -> int:
+    if not session_runs:
+        return 0
+
+    sessions_root = Path(plan.partition_root) / partition_key / 'sessions'
+    chunk_format = configured_full_ingestion_chunk_format()
+    merged_path = sessions_root / (
+        'merged.pgcopy' if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY else 'merged.csv'
+    )
+    session_rows_loaded = _write_listenbrainz_merged_session_rows(
+        merged_path,
+        run_paths=[Path(plan.partition_root) / partition_key / str(run['relative_path']) for run in session_runs],
+        run_id=plan.run_id,
+        partition_key=partition_key,
+        chunk_format=chunk_format,
+    )
+    copy_into_table = (
+        _copy_binary_into_table if chunk_format == FULL_INGESTION_CHUNK_FORMAT_BINARY else _copy_csv_into_table
+    )
+    with connection.cursor() as cursor:
+        session_load_table = _ensure_listenbrainz_load_partition(
+            cursor,
+            LISTENBRAINZ_SESSION_LOAD_TABLE,
+            partition_key=partition_key,
+        )
+    copy_into_table(
+        merged_path,
+        table_name=session_load_table,
+        columns=list(LISTENBRAINZ_SESSION_LOAD_COLUMNS),
+    )
+    merged_path.unlink()
+    return session_rows_loaded
+
+
+def _copy_binary_into_table(copy_path: Path, *, table_name: str, columns: list[str]) -> None:
+    copy_sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT binary)"
+
+    connection.ensure_connection()
+    with copy_path.open('rb') as handle:
+        with connection.cursor() as cursor:
+            raw_cursor = getattr(cursor, 'cursor', cursor)
+            if hasattr(raw_cursor, 'copy_expert'):
+                raw_cursor.copy_expert(copy_sql, handle)
+                return
+
+    raw_connection = connection.connection
+    assert raw_connection is not None
+    with raw_connection.cursor() as raw_cursor:
+        with raw_cursor.copy(copy_sql) as copy:
+            with copy_path.open('rb') as handle:
+                while True:
+                    chunk = handle.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    copy.write(chunk)
+
+
 def ensure_full_ingestion_source_run(
     plan: FullIngestionPlan,
 ) -> tuple[SourceIngestionRun, str]:
@@ -3209,10 +4709,13 @@ def finalize_listenbrainz_full_ingestion(
     def _merge_partition_lane(partition_key: str) -> tuple[str, FullIngestionMergeResult]:
         close_old_connections()
         try:
+            copy_manifest = _read_full_ingestion_copy_manifest(running_plan, partition_key=partition_key)
             result = _finalize_listenbrainz_partition_into_build_tables(
                 run_id=running_plan.run_id,
                 partition_key=partition_key,
                 import_run_id=str(source_ingestion_run.pk),
+                presorted=bool(copy_manifest.get('presorted')),
+                rows_deduplicated_before_load=int(copy_manifest.get('rows_deduplicated') or 0),
             )
             return partition_key, result
         finally:
@@ -3429,7 +4932,14 @@ def finalize_listenbrainz_full_ingestion(
         _persist_full_ingestion_state(running_plan)
 
         if not _finalize_phase_completed(cursor, run_id=plan.run_id, phase=LISTENBRAINZ_FINALIZE_PHASE_SHADOW_INDEXES):
-            _create_listenbrainz_shadow_constraints_and_indexes(cursor)
+            counters['shadow_indexes_built'] = int(counters.get('shadow_indexes_built') or 0) + (
+                _create_listenbrainz_shadow_constraints_and_indexes(
+                    cursor,
+                    run_id=plan.run_id,
+                    lane_budget=max(1, running_plan.merge_worker_budget),
+                    maintenance_work_mem_bytes=configured_full_ingestion_index_build_memory_bytes(),
+                )
+            )
             _mark_finalize_checkpoint(cursor, run_id=plan.run_id, phase=LISTENBRAINZ_FINALIZE_PHASE_SHADOW_INDEXES)
             counters['shadow_indexes_complete'] = 1
             running_plan = replace(
@@ -3442,20 +4952,15 @@ def finalize_listenbrainz_full_ingestion(
 
         if not _finalize_phase_completed(cursor, run_id=plan.run_id, phase=LISTENBRAINZ_FINALIZE_PHASE_SWAP):
             _swap_listenbrainz_shadow_tables(cursor)
-            cursor.execute(
-                f'DELETE FROM {LISTENBRAINZ_SESSION_LOAD_TABLE} WHERE run_id = %s',
-                [plan.run_id],
-            )
-            cursor.execute(
-                f'DELETE FROM {LISTENBRAINZ_EVENT_LOAD_TABLE} WHERE run_id = %s',
-                [plan.run_id],
-            )
+            _clear_listenbrainz_load_run(cursor, LISTENBRAINZ_SESSION_LOAD_TABLE, run_id=plan.run_id)
+            _clear_listenbrainz_load_run(cursor, LISTENBRAINZ_EVENT_LOAD_TABLE, run_id=plan.run_id)
             cursor.execute(f'ANALYZE {LISTENBRAINZ_EVENT_LEDGER_TABLE}')
             cursor.execute(f'ANALYZE {LISTENBRAINZ_SESSION_TRACK_TABLE}')
             _mark_finalize_checkpoint(cursor, run_id=plan.run_id, phase=LISTENBRAINZ_FINALIZE_PHASE_SWAP)
             counters['swap_completed'] = 1
 
         staged_rows = int(plan.counters.get('rows_staged') or 0)
+        rows_deduplicated_before_load = int(plan.counters.get('rows_deduplicated_before_load') or 0)
         if counters['swap_completed']:
             inserted_rows = _count_table_rows(cursor, LISTENBRAINZ_EVENT_LEDGER_TABLE)
             resolved_rows = _count_table_rows(
@@ -3485,7 +4990,7 @@ def finalize_listenbrainz_full_ingestion(
 
         merge_totals = FullIngestionMergeResult(
             rows_merged=int(inserted_rows),
-            rows_deduplicated=max(0, staged_rows - int(inserted_rows)),
+            rows_deduplicated=rows_deduplicated_before_load + max(0, staged_rows - int(inserted_rows)),
             rows_resolved=int(resolved_rows),
             rows_unresolved=int(unresolved_rows),
             session_rows_merged=int(session_rows_merged),
@@ -3638,18 +5143,13 @@ def finalize_listenbrainz_full_ingestion_direct(
             ],
         )
         staged_rows, inserted_rows, resolved_rows, unresolved_rows, session_rows_merged = cursor.fetchone()
-        cursor.execute(
-            f'DELETE FROM {LISTENBRAINZ_SESSION_LOAD_TABLE} WHERE run_id = %s',
-            [plan.run_id],
-        )
-        cursor.execute(
-            f'DELETE FROM {LISTENBRAINZ_EVENT_LOAD_TABLE} WHERE run_id = %s',
-            [plan.run_id],
-        )
+        _clear_listenbrainz_load_run(cursor, LISTENBRAINZ_SESSION_LOAD_TABLE, run_id=plan.run_id)
+        _clear_listenbrainz_load_run(cursor, LISTENBRAINZ_EVENT_LOAD_TABLE, run_id=plan.run_id)
 
+    rows_deduplicated_before_load = int(plan.counters.get('rows_deduplicated_before_load') or 0)
     return FullIngestionMergeResult(
         rows_merged=int(inserted_rows or 0),
-        rows_deduplicated=max(0, int(staged_rows or 0) - int(inserted_rows or 0)),
+        rows_deduplicated=rows_deduplicated_before_load + max(0, int(staged_rows or 0) - int(inserted_rows or 0)),
         rows_resolved=int(resolved_rows or 0),
         rows_unresolved=int(unresolved_rows or 0),
         session_rows_merged=int(session_rows_merged or 0),
@@ -3814,6 +5314,60 @@ def _relation_exists(cursor, relation_name: str) -> bool:
     return cursor.fetchone()[0] is not None
 
 
+def _relation_kind(cursor, relation_name: str) -> str | None:
+    cursor.execute(
+        '''
+        SELECT c.relkind
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema()
+          AND c.relname = %s
+        ''',
+        [relation_name],
+    )
+    row = cursor.fetchone()
+    return str(row[0]) if row is not None else None
+
+
+def listenbrainz_load_partition_table_name(table_name: str, partition_key: str) -> str:
+    if not re.fullmatch(r'[a-z0-9_]+', partition_key):
+        raise ValueError(f'Invalid ListenBrainz partition key: {partition_key!r}')
+    return f'{table_name}_{partition_key}'
+
+
+def _ensure_listenbrainz_load_partition(cursor, table_name: str, *, partition_key: str) -> str:
+    """Return the table a partition's rows should be copied into, attaching its child if needed."""
+    if connection.vendor != 'postgresql' or _relation_kind(cursor, table_name) != 'p':
+        return table_name
+    child_table = listenbrainz_load_partition_table_name(table_name, partition_key)
+    cursor.execute(
+        f'CREATE UNLOGGED TABLE IF NOT EXISTS {child_table} PARTITION OF {table_name} FOR VALUES IN (%s)',
+        [partition_key],
+    )
+    return child_table
+
+
+def _clear_listenbrainz_load_partition(cursor, table_name: str, *, run_id: str, partition_key: str) -> None:
+    if connection.vendor == 'postgresql' and _relation_kind(cursor, table_name) == 'p':
+        child_table = listenbrainz_load_partition_table_name(table_name, partition_key)
+        if _relation_exists(cursor, child_table):
+            cursor.execute(f'TRUNCATE TABLE {child_table}')
+        return
+    cursor.execute(
+        f'DELETE FROM {table_name} WHERE run_id = %s AND partition_key = %s',
+        [run_id, partition_key],
+    )
+
+
+def _clear_listenbrainz_load_run(cursor, table_name: str, *, run_id: str) -> None:
+    # Full ingestion runs hold the load tables exclusively (see
+    # reclaim_full_ingestion_runtime_tables), so every child belongs to run_id.
+    if connection.vendor == 'postgresql' and _relation_kind(cursor, table_name) == 'p':
+        cursor.execute(f'TRUNCATE TABLE {table_name}')
+        return
+    cursor.execute(f'DELETE FROM {table_name} WHERE run_id = %s', [run_id])
+
+
 def _constraint_exists(cursor, relation_name: str, constraint_name: str) -> bool:
     cursor.execute(
         '''
@@ -3968,7 +5522,13 @@ def _finalize_listenbrainz_partition_into_build_tables(
     run_id: str,
     partition_key: str,
     import_run_id: str,
+    presorted: bool = False,
+    rows_deduplicated_before_load: int = 0,
 ) -> FullIngestionMergeResult:
+    # A presorted partition was already deduplicated by the copy stage's merge,
+    # so its load rows go straight into the build table without a sort.
+    distinct_clause = '' if presorted else 'DISTINCT ON (event_signature)'
+    order_clause = '' if presorted else 'ORDER BY event_signature, cold_ref'
     with transaction.atomic():
         with connection.cursor() as cursor:
             staged_rows = _count_partition_rows(cursor, LISTENBRAINZ_EVENT_LOAD_TABLE, run_id, partition_key)
@@ -3976,7 +5536,7 @@ def _finalize_listenbrainz_partition_into_build_tables(
             cursor.execute(
             f'''
             WITH deduplicated_events AS (
-                SELECT DISTINCT ON (event_signature)
+                SELECT {distinct_clause}
                     event_signature,
                     played_at,
                     session_key,
@@ -3987,7 +5547,7 @@ def _finalize_listenbrainz_partition_into_build_tables(
                 FROM {LISTENBRAINZ_EVENT_LOAD_TABLE}
                 WHERE run_id = %s
                   AND partition_key = %s
-                ORDER BY event_signature, cold_ref
+                {order_clause}
             ),
             inserted_events AS (
                 INSERT INTO {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE} (
@@ -4057,13 +5617,17 @@ def _finalize_listenbrainz_partition_into_build_tables(
                 [run_id, partition_key, run_id, partition_key],
             )
             session_rows_merged = int(cursor.fetchone()[0] or 0)
-            cursor.execute(
-                f'DELETE FROM {LISTENBRAINZ_SESSION_LOAD_TABLE} WHERE run_id = %s AND partition_key = %s',
-                [run_id, partition_key],
+            _clear_listenbrainz_load_partition(
+                cursor,
+                LISTENBRAINZ_SESSION_LOAD_TABLE,
+                run_id=run_id,
+                partition_key=partition_key,
             )
-            cursor.execute(
-                f'DELETE FROM {LISTENBRAINZ_EVENT_LOAD_TABLE} WHERE run_id = %s AND partition_key = %s',
-                [run_id, partition_key],
+            _clear_listenbrainz_load_partition(
+                cursor,
+                LISTENBRAINZ_EVENT_LOAD_TABLE,
+                run_id=run_id,
+                partition_key=partition_key,
             )
             _mark_finalize_checkpoint(
                 cursor,
@@ -4074,23 +5638,169 @@ def _finalize_listenbrainz_partition_into_build_tables(
 
     return FullIngestionMergeResult(
         rows_merged=rows_merged,
-        rows_deduplicated=max(0, staged_rows - rows_merged),
+        rows_deduplicated=rows_deduplicated_before_load + max(0, staged_rows - rows_merged),
         rows_resolved=rows_resolved,
         rows_unresolved=rows_unresolved,
         session_rows_merged=session_rows_merged,
     )
 
 
-def _create_listenbrainz_shadow_constraints_and_indexes(cursor) -> None:
+def _listenbrainz_shadow_index_statements() -> list[tuple[str, str]]:
     event_cold_ts = settings.MLCORE_PG_COLD_TABLESPACE_NAME
     session_hot_ts = settings.MLCORE_PG_HOT_TABLESPACE_NAME
 
-    cursor.execute(
+    statements = [
         (
+            'mlcore_lbe_build_pkey_idx',
             f'CREATE UNIQUE INDEX IF NOT EXISTS mlcore_lbe_build_pkey_idx '
-            f'ON {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE} (id) TABLESPACE {event_cold_ts}'
+            f'ON {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE} (id) TABLESPACE {event_cold_ts}',
+        ),
+        (
+            'mlcore_lbe_build_event_signature_idx',
+            f'CREATE UNIQUE INDEX IF NOT EXISTS mlcore_lbe_build_event_signature_idx '
+            f'ON {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE} (event_signature) '
+            f'TABLESPACE {event_cold_ts}',
+        ),
+    ]
+    for index_name, column_list in (
+        ('mlcore_lbe_build_import_idx', 'import_run_id'),
+        ('mlcore_lbe_build_canonical_item_idx', 'canonical_item_id'),
+        ('mlcore_lbe_build_track_idx', 'track_id'),
+        ('mlcore_lbe_build_resolution_idx', 'resolution_state'),
+        ('mlcore_lbe_build_import_run_fk_idx', 'import_run_id'),
+        ('mlcore_lbe_build_played_at_idx', 'played_at'),
+        ('mlcore_lbe_build_session_key_idx', 'session_key'),
+        ('mlcore_lbe_build_canonical_item_fk_idx', 'canonical_item_id'),
+        ('mlcore_lbe_build_track_fk_idx', 'track_id'),
+    ):
+        statements.append(
+            (
+                index_name,
+                (
+                    f'CREATE INDEX IF NOT EXISTS {index_name} '
+                    f'ON {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE} ({column_list}) '
+                    f'TABLESPACE {event_cold_ts}'
+                ),
+            )
         )
+
+    statements.extend(
+        [
+            (
+                'mlcore_lst_build_pkey_idx',
+                f'CREATE UNIQUE INDEX IF NOT EXISTS mlcore_lst_build_pkey_idx '
+                f'ON {LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE} (id) TABLESPACE {session_hot_ts}',
+            ),
+            (
+                'mlcore_lst_build_session_track_idx',
+                f'CREATE UNIQUE INDEX IF NOT EXISTS mlcore_lst_build_session_track_idx '
+                f'ON {LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE} (session_key, canonical_item_id) '
+                f'TABLESPACE {session_hot_ts}',
+            ),
+        ]
     )
+    for index_name, column_list in (
+        ('mlcore_lst_build_canonical_item_idx', 'canonical_item_id'),
+        ('mlcore_lst_build_track_idx', 'track_id'),
+        ('mlcore_lst_build_import_idx', 'import_run_id'),
+        ('mlcore_lst_build_last_played_idx', 'last_played_at'),
+        ('mlcore_lst_build_import_run_fk_idx', 'import_run_id'),
+        ('mlcore_lst_build_session_key_idx', 'session_key'),
+        ('mlcore_lst_build_canonical_item_fk_idx', 'canonical_item_id'),
+        ('mlcore_lst_build_track_fk_idx', 'track_id'),
+    ):
+        statements.append(
+            (
+                index_name,
+                (
+                    f'CREATE INDEX IF NOT EXISTS {index_name} '
+                    f'ON {LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE} ({column_list}) '
+                    f'TABLESPACE {session_hot_ts}'
+                ),
+            )
+        )
+    return statements
+
+
+def _listenbrainz_shadow_index_phase(index_name: str) -> str:
+    return f'{LISTENBRAINZ_FINALIZE_PHASE_SHADOW_INDEX_PREFIX}{index_name}'
+
+
+def _build_listenbrainz_shadow_index(
+    cursor,
+    *,
+    index_name: str,
+    statement: str,
+    run_id: str | None,
+    maintenance_work_mem_bytes: int | None,
+    parallel_maintenance_workers: int,
+) -> None:
+    if maintenance_work_mem_bytes is not None:
+        cursor.execute(f"SET maintenance_work_mem = '{max(1024, maintenance_work_mem_bytes // 1024)}kB'")
+    cursor.execute(f'SET max_parallel_maintenance_workers = {max(0, int(parallel_maintenance_workers))}')
+    try:
+        cursor.execute(statement)
+    finally:
+        cursor.execute('RESET maintenance_work_mem')
+        cursor.execute('RESET max_parallel_maintenance_workers')
+    if run_id is not None:
+        _mark_finalize_checkpoint(cursor, run_id=run_id, phase=_listenbrainz_shadow_index_phase(index_name))
+
+
+def _create_listenbrainz_shadow_constraints_and_indexes(
+    cursor,
+    *,
+    run_id: str | None = None,
+    lane_budget: int = 1,
+    maintenance_work_mem_bytes: int | None = None,
+) -> int:
+    """
+    Build the shadow-table indexes, one per connection across up to
+    lane_budget connections, then attach the constraints that depend on them.
+    With a run_id each index is checkpointed as it completes so a resumed
+    finalize only builds the missing ones. Returns the number of indexes built.
+    """
+    pending = [
+        (index_name, statement)
+        for index_name, statement in _listenbrainz_shadow_index_statements()
+        if run_id is None
+        or not _finalize_phase_completed(cursor, run_id=run_id, phase=_listenbrainz_shadow_index_phase(index_name))
+    ]
+    if pending:
+        # Split the lane budget between the concurrent builds: leftover lanes
+        # become parallel maintenance workers, and the memory budget is shared.
+        concurrent_builds = max(1, min(lane_budget, len(pending)))
+        build_kwargs = {
+            'run_id': run_id,
+            'maintenance_work_mem_bytes': (
+                max(FULL_INGESTION_INDEX_BUILD_MIN_MEMORY_BYTES, maintenance_work_mem_bytes // concurrent_builds)
+                if maintenance_work_mem_bytes is not None
+                else None
+            ),
+            'parallel_maintenance_workers': max(0, lane_budget // concurrent_builds - 1),
+        }
+        if concurrent_builds == 1:
+            for index_name, statement in pending:
+                _build_listenbrainz_shadow_index(cursor, index_name=index_name, statement=statement, **build_kwargs)
+        else:
+            def _build_index_lane(index_name: str, statement: str) -> None:
+                close_old_connections()
+                try:
+                    with connection.cursor() as lane_cursor:
+                        _build_listenbrainz_shadow_index(
+                            lane_cursor,
+                            index_name=index_name,
+                            statement=statement,
+                            **build_kwargs,
+                        )
+                finally:
+                    close_old_connections()
+
+            with ThreadPoolExecutor(max_workers=concurrent_builds) as executor:
+                futures = [executor.submit(_build_index_lane, index_name, statement) for index_name, statement in pending]
+                for future in futures:
+                    future.result()
+
     if not _constraint_exists(cursor, LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE, 'mlcore_lbe_build_pkey'):
         cursor.execute(
             (
@@ -4099,13 +5809,6 @@ def _create_listenbrainz_shadow_constraints_and_indexes(cursor) -> None:
                 f'PRIMARY KEY USING INDEX mlcore_lbe_build_pkey_idx'
             )
         )
-    cursor.execute(
-        (
-            f'CREATE UNIQUE INDEX IF NOT EXISTS mlcore_lbe_build_event_signature_idx '
-            f'ON {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE} (event_signature) '
-            f'TABLESPACE {event_cold_ts}'
-        )
-    )
     if not _constraint_exists(cursor, LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE, 'mlcore_lbe_build_event_signature_key'):
         cursor.execute(
             (
@@ -4149,27 +5852,6 @@ def _create_listenbrainz_shadow_constraints_and_indexes(cursor) -> None:
                 f'DEFERRABLE INITIALLY DEFERRED'
             )
         )
-    for index_name, column_list in (
-        ('mlcore_lbe_build_import_idx', 'import_run_id'),
-        ('mlcore_lbe_build_canonical_item_idx', 'canonical_item_id'),
-        ('mlcore_lbe_build_track_idx', 'track_id'),
-        ('mlcore_lbe_build_resolution_idx', 'resolution_state'),
-        ('mlcore_lbe_build_import_run_fk_idx', 'import_run_id'),
-        ('mlcore_lbe_build_played_at_idx', 'played_at'),
-        ('mlcore_lbe_build_session_key_idx', 'session_key'),
-        ('mlcore_lbe_build_canonical_item_fk_idx', 'canonical_item_id'),
-        ('mlcore_lbe_build_track_fk_idx', 'track_id'),
-    ):
-        cursor.execute(
-            f'CREATE INDEX IF NOT EXISTS {index_name} ON {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE} ({column_list}) TABLESPACE {event_cold_ts}'
-        )
-
-    cursor.execute(
-        (
-            f'CREATE UNIQUE INDEX IF NOT EXISTS mlcore_lst_build_pkey_idx '
-            f'ON {LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE} (id) TABLESPACE {session_hot_ts}'
-        )
-    )
     if not _constraint_exists(cursor, LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE, 'mlcore_lst_build_pkey'):
         cursor.execute(
             (
@@ -4178,13 +5860,6 @@ def _create_listenbrainz_shadow_constraints_and_indexes(cursor) -> None:
                 f'PRIMARY KEY USING INDEX mlcore_lst_build_pkey_idx'
             )
         )
-    cursor.execute(
-        (
-            f'CREATE UNIQUE INDEX IF NOT EXISTS mlcore_lst_build_session_track_idx '
-            f'ON {LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE} (session_key, canonical_item_id) '
-            f'TABLESPACE {session_hot_ts}'
-        )
-    )
     if not _constraint_exists(cursor, LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE, 'mlcore_lst_build_session_track_key'):
         cursor.execute(
             (
@@ -4220,23 +5895,7 @@ def _create_listenbrainz_shadow_constraints_and_indexes(cursor) -> None:
                 f'DEFERRABLE INITIALLY DEFERRED'
             )
         )
-    for index_name, column_list in (
-        ('mlcore_lst_build_canonical_item_idx', 'canonical_item_id'),
-        ('mlcore_lst_build_track_idx', 'track_id'),
-        ('mlcore_lst_build_import_idx', 'import_run_id'),
-        ('mlcore_lst_build_last_played_idx', 'last_played_at'),
-        ('mlcore_lst_build_import_run_fk_idx', 'import_run_id'),
-        ('mlcore_lst_build_session_key_idx', 'session_key'),
-        ('mlcore_lst_build_canonical_item_fk_idx', 'canonical_item_id'),
-        ('mlcore_lst_build_track_fk_idx', 'track_id'),
-    ):
-        cursor.execute(
-            (
-                f'CREATE INDEX IF NOT EXISTS {index_name} '
-                f'ON {LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE} ({column_list}) '
-                f'TABLESPACE {session_hot_ts}'
-            )
-        )
+    return len(pending)
 
 
 def _swap_listenbrainz_shadow_tables(cursor) -> None:
@@ -1,30 +1,44 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
-import os
+import multiprocessing
 import re
-import subprocess
+import shutil
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from uuid import UUID
 
+from django.conf import settings
 from django.db import connection, transaction
 from django.utils import timezone
 
-from mlcore.models import CanonicalItem, ListenBrainzIdentityShard, SourceIngestionRun
+from mlcore.models import ListenBrainzIdentityShard, SourceIngestionRun
 from mlcore.services.canonical_items import ITEM_TYPE_RECORDING_MSID, canonical_item_uuid
+from mlcore.services.canonical_redirects import rebuild_canonical_redirect_closure
 
 BRIDGE_SOURCE_ID = 'listenbrainz-identity-bridge'
 CONFLICT_RESOLVER_SOURCE_ID = 'listenbrainz-identity-conflict-resolver'
 CONFLICT_RESOLVER_POLICY_VERSION = 'shard-dominance-v1'
 PAIR_STAGE_TABLE = 'mlcore_listenbrainz_identity_pair_stage'
+IDENTITY_CLASSIFICATION_TABLE = 'mlcore_listenbrainz_identity_classification'
+MSID_ITEM_STAGE_TABLE = 'mlcore_listenbrainz_msid_item_stage'
 DEFAULT_OUTPUT_ROOT = '/srv/data/backups/juke/listenbrainz/identity-evidence'
 PROGRESS_INTERVAL_ROWS = 1_000_000
 EXTRACTION_SCHEMA_VERSION = 2
 ISRC_RE = re.compile(r'^[A-Z]{2}[A-Z0-9]{3}[0-9]{7}$')
+# (msid, mbid) as two raw UUIDs; (msid, isrc) as a raw UUID plus the NUL-padded ISRC.
+PAIR_RECORD_BYTES = 32
+# Approximate resident size of one record in a Python set: the bytes object plus its hash slot.
+PAIR_RECORD_MEMORY_BYTES = 112
+PAIR_RUN_READ_RECORDS = 65_536
+DEFAULT_IDENTITY_EXTRACT_WORKERS = 1
+DEFAULT_IDENTITY_SORT_MEMORY_BYTES = 512 * 1024 * 1024
 
 
 @dataclass(frozen=True)
@@ -59,6 +73,15 @@ class ShardExtractionResult:
     skipped: bool = False
 
 
+@dataclass(frozen=True)
+class _PendingShardExtraction:
+    checkpoint_pk: Any
+    shard_key: str
+    source_path: Path
+    output_path: Path
+    isrc_output_path: Path
+
+
 @dataclass(frozen=True)
 class IdentityGraphExpansionResult:
     source_version: str
@@ -105,6 +128,7 @@ def import_listenbrainz_identity_bridge(
     output_root: str | Path | None = None,
     max_shards: int | None = None,
     force: bool = False,
+    extract_workers: int | None = None,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> ListenBrainzIdentityBridgeResult:
     started = time.monotonic()
@@ -159,17 +183,16 @@ def import_listenbrainz_identity_bridge(
         'processed_bytes': 0,
     }
     try:
-        for index, shard in enumerate(shards, start=1):
-            source_path = shard_root / str(shard['relative_path'])
-            result = extract_listenbrainz_identity_shard(
-                source_path,
-                source_version=source_version,
-                shard_key=str(shard['relative_path']),
-                source_sha256=str(shard.get('sha256') or ''),
-                output_root=target_root,
-                force=force,
-                progress_callback=progress_callback,
-            )
+        extracted_shards = _iter_extracted_identity_shards(
+            shards,
+            shard_root=shard_root,
+            source_version=source_version,
+            output_root=target_root,
+            force=force,
+            workers=extract_workers or configured_identity_extract_workers(),
+            progress_callback=progress_callback,
+        )
+        for index, (shard, result) in enumerate(extracted_shards, start=1):
             _load_shard_pairs(result, source_version=source_version, source_sha256=str(shard.get('sha256') or ''))
             totals['source_row_count'] += result.source_row_count
             totals['mapped_row_count'] += result.mapped_row_count
@@ -265,40 +288,32 @@ def expand_listenbrainz_identity_graph(
     if batch_size < 1:
         raise ValueError('batch_size must be greater than zero')
     started = time.monotonic()
-    missing_msid_count = _count_missing_msid_canonical_items(source_version)
     created_count = 0
-    last_msid = None
-    if not dry_run:
-        while True:
-            msids = _fetch_missing_msid_batch(source_version, batch_size=batch_size, after_msid=last_msid)
-            if not msids:
-                break
-            rows = [
-                CanonicalItem(
-                    id=canonical_item_uuid(item_type=ITEM_TYPE_RECORDING_MSID, key_value=str(msid)),
-                    item_type=ITEM_TYPE_RECORDING_MSID,
-                    canonical_key=f'{ITEM_TYPE_RECORDING_MSID}:{msid}',
-                )
-                for msid in msids
-            ]
-            CanonicalItem.objects.bulk_create(rows, ignore_conflicts=True, batch_size=batch_size)
-            created_count += len(rows)
-            last_msid = msids[-1]
-            _report(progress_callback, {
-                'event': 'msid_canonical_batch',
-                'source_version': source_version,
-                'batch_size': len(msids),
-                'created_msid_count': created_count,
-                'missing_msid_count': missing_msid_count,
-            })
     summary = {
         'active_mapping_count': 0,
         'conflict_msid_count': 0,
         'redirect_count': 0,
         'redirect_conflict_count': 0,
     }
-    if not dry_run:
-        summary = _classify_and_materialize(source_version)
+    with transaction.atomic(), connection.cursor() as cursor:
+        _classify_identity_mappings(cursor, source_version)
+        missing_msid_condition = 'candidate_count = 1 AND target_item_id IS NOT NULL AND source_item_id IS NULL'
+        missing_msid_count = _classified_count(cursor, missing_msid_condition)
+        if not dry_run:
+            created_count = _create_missing_msid_items(
+                cursor,
+                f'SELECT recording_msid FROM {IDENTITY_CLASSIFICATION_TABLE} WHERE {missing_msid_condition}',
+                [],
+                batch_size=batch_size,
+                on_progress=lambda staged, total: _report(progress_callback, {
+                    'event': 'msid_canonical_batch',
+                    'source_version': source_version,
+                    'batch_size': staged,
+                    'staged_msid_count': total,
+                    'missing_msid_count': missing_msid_count,
+                }),
+            )
+            summary = _apply_identity_classification(cursor, source_version)
     return IdentityGraphExpansionResult(
         source_version=source_version,
         missing_msid_count=missing_msid_count,
@@ -326,32 +341,43 @@ def resolve_listenbrainz_identity_conflicts(
     if batch_size < 1:
         raise ValueError('batch_size must be greater than zero')
     started = time.monotonic()
-    eligible_conflict_msid_count = _count_conflict_msids(source_version)
-    resolved_msid_count = _count_resolvable_conflict_msids(
-        source_version,
-        min_winner_share=min_winner_share,
-        min_winner_shards=min_winner_shards,
-    )
+    winner_params = [min_winner_shards, min_winner_share]
     created_msid_count = 0
     redirect_count = 0
     redirect_conflict_count = 0
-    if not dry_run:
-        _write_conflict_resolutions(
-            source_version,
-            policy_version=policy_version,
-            min_winner_share=min_winner_share,
-            min_winner_shards=min_winner_shards,
-        )
-        created_msid_count = _ensure_conflict_resolution_msid_items(
-            source_version,
-            policy_version=policy_version,
-            batch_size=batch_size,
-            progress_callback=progress_callback,
-        )
-        redirect_count, redirect_conflict_count = _materialize_conflict_resolution_redirects(
-            source_version,
-            policy_version=policy_version,
-        )
+    with transaction.atomic(), connection.cursor() as cursor:
+        _classify_identity_mappings(cursor, source_version)
+        eligible_conflict_msid_count = _classified_count(cursor, 'candidate_count > 1 AND candidate_rank = 1')
+        cursor.execute(f'SELECT COUNT(*) FROM ({_conflict_winners_sql()}) winners', winner_params)
+        resolved_msid_count = int(cursor.fetchone()[0])
+        if not dry_run:
+            _write_conflict_resolutions(
+                cursor,
+                source_version,
+                policy_version=policy_version,
+                min_winner_share=min_winner_share,
+                min_winner_shards=min_winner_shards,
+            )
+            created_msid_count = _create_missing_msid_items(
+                cursor,
+                f'SELECT recording_msid FROM ({_conflict_winners_sql()}) winners WHERE source_item_id IS NULL',
+                winner_params,
+                batch_size=batch_size,
+                on_progress=lambda staged, total: _report(progress_callback, {
+                    'event': 'conflict_msid_canonical_batch',
+                    'source_version': source_version,
+                    'policy_version': policy_version,
+                    'batch_size': staged,
+                    'staged_msid_count': total,
+                }),
+            )
+            redirect_count, redirect_conflict_count = _materialize_conflict_resolution_redirects(
+                cursor,
+                source_version,
+                policy_version=policy_version,
+                min_winner_share=min_winner_share,
+                min_winner_shards=min_winner_shards,
+            )
     return ConflictResolutionResult(
         source_version=source_version,
         policy_version=policy_version,
@@ -545,6 +571,20 @@ def materialize_listenbrainz_isrc_aliases(source_version: str) -> ISRCAliasMater
     )
 
 
+def configured_identity_extract_workers() -> int:
+    return max(
+        1,
+        int(getattr(settings, 'MLCORE_LISTENBRAINZ_IDENTITY_EXTRACT_WORKERS', DEFAULT_IDENTITY_EXTRACT_WORKERS)),
+    )
+
+
+def configured_identity_sort_memory_bytes() -> int:
+    return max(
+        PAIR_RECORD_MEMORY_BYTES,
+        int(getattr(settings, 'MLCORE_LISTENBRAINZ_IDENTITY_SORT_MEMORY_BYTES', DEFAULT_IDENTITY_SORT_MEMORY_BYTES)),
+    )
+
+
 def extract_listenbrainz_identity_shard(
     source_path: str | Path,
     *,
@@ -553,8 +593,114 @@ def extract_listenbrainz_identity_shard(
     source_sha256: str,
     output_root: str | Path,
     force: bool = False,
+    memory_budget_bytes: int | None = None,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> ShardExtractionResult:
+    pending = _begin_identity_shard_extraction(
+        source_path,
+        source_version=source_version,
+        shard_key=shard_key,
+        source_sha256=source_sha256,
+        output_root=output_root,
+        force=force,
+    )
+    if isinstance(pending, ShardExtractionResult):
+        return pending
+    try:
+        counts = _extract_identity_shard_files(
+            pending.source_path,
+            shard_key=shard_key,
+            output_path=pending.output_path,
+            isrc_output_path=pending.isrc_output_path,
+            memory_budget_bytes=memory_budget_bytes or configured_identity_sort_memory_bytes(),
+            progress_callback=progress_callback,
+        )
+    except Exception as exc:
+        _fail_identity_shard_extraction(pending, exc)
+        raise
+    return _finish_identity_shard_extraction(pending, counts)
+
+
+def _iter_extracted_identity_shards(
+    shards: list[dict[str, Any]],
+    *,
+    shard_root: Path,
+    source_version: str,
+    output_root: Path,
+    force: bool,
+    workers: int,
+    progress_callback: Callable[[dict[str, Any]], None] | None,
+) -> Iterator[tuple[dict[str, Any], ShardExtractionResult]]:
+    """
+    Yield extracted shards in manifest order. With several workers the shards
+    are parsed and deduplicated in forked processes, which only touch files;
+    checkpoints are still written here so the database stays on one connection.
+    """
+    memory_budget_bytes = configured_identity_sort_memory_bytes() // max(1, workers)
+    if workers <= 1:
+        for shard in shards:
+            yield shard, extract_listenbrainz_identity_shard(
+                shard_root / str(shard['relative_path']),
+                source_version=source_version,
+                shard_key=str(shard['relative_path']),
+                source_sha256=str(shard.get('sha256') or ''),
+                output_root=output_root,
+                force=force,
+                memory_budget_bytes=memory_budget_bytes,
+                progress_callback=progress_callback,
+            )
+        return
+
+    pending_shards = [
+        (
+            shard,
+            _begin_identity_shard_extraction(
+                shard_root / str(shard['relative_path']),
+                source_version=source_version,
+                shard_key=str(shard['relative_path']),
+                source_sha256=str(shard.get('sha256') or ''),
+                output_root=output_root,
+                force=force,
+            ),
+        )
+        for shard in shards
+    ]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+        futures = [
+            None
+            if isinstance(pending, ShardExtractionResult)
+            else executor.submit(
+                _extract_identity_shard_files,
+                pending.source_path,
+                shard_key=pending.shard_key,
+                output_path=pending.output_path,
+                isrc_output_path=pending.isrc_output_path,
+                memory_budget_bytes=memory_budget_bytes,
+            )
+            for _, pending in pending_shards
+        ]
+        for (shard, pending), future in zip(pending_shards, futures):
+            if future is None:
+                yield shard, pending
+                continue
+            try:
+                counts = future.result()
+            except Exception as exc:
+                _fail_identity_shard_extraction(pending, exc)
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+            yield shard, _finish_identity_shard_extraction(pending, counts)
+
+
+def _begin_identity_shard_extraction(
+    source_path: str | Path,
+    *,
+    source_version: str,
+    shard_key: str,
+    source_sha256: str,
+    output_root: str | Path,
+    force: bool,
+) -> ShardExtractionResult | _PendingShardExtraction:
     source_path = Path(source_path)
     if not source_path.is_file():
         raise FileNotFoundError(f'ListenBrainz shard does not exist: {source_path}')
@@ -604,107 +750,173 @@ def extract_listenbrainz_identity_shard(
             'last_error': '',
         },
     )
+    return _PendingShardExtraction(
+        checkpoint_pk=checkpoint.pk,
+        shard_key=shard_key,
+        source_path=source_path,
+        output_path=output_path,
+        isrc_output_path=isrc_output_path,
+    )
+
+
+def _finish_identity_shard_extraction(pending: _PendingShardExtraction, counts: dict[str, int]) -> ShardExtractionResult:
+    ListenBrainzIdentityShard.objects.filter(pk=pending.checkpoint_pk).update(
+        status='running',
+        extraction_schema_version=EXTRACTION_SCHEMA_VERSION,
+        **counts,
+    )
+    return ShardExtractionResult(
+        shard_key=pending.shard_key,
+        output_path=str(pending.output_path),
+        isrc_output_path=str(pending.isrc_output_path),
+        **counts,
+    )
+
+
+def _fail_identity_shard_extraction(pending: _PendingShardExtraction, exc: Exception) -> None:
+    ListenBrainzIdentityShard.objects.filter(pk=pending.checkpoint_pk).update(
+        status='failed',
+        source_row_count=getattr(exc, 'source_row_count', 0),
+        mapped_row_count=getattr(exc, 'mapped_row_count', 0),
+        isrc_observation_count=getattr(exc, 'isrc_observation_count', 0),
+        malformed_row_count=getattr(exc, 'malformed_row_count', 0),
+        last_error=str(exc),
+        completed_at=timezone.now(),
+    )
+
+
+def _extract_identity_shard_files(
+    source_path: Path,
+    *,
+    shard_key: str,
+    output_path: Path,
+    isrc_output_path: Path,
+    memory_budget_bytes: int,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, int]:
+    """
+    Parse one shard into sorted, de-duplicated COPY text files.
+
+    Touches no database state, so it can run in a worker process. Output is
+    byte-identical to ``LC_ALL=C sort -u`` over the text pairs: raw UUID bytes
+    order the same way as their lowercase hex.
+    """
     temp_path = output_path.with_suffix(output_path.suffix + '.part')
     isrc_temp_path = isrc_output_path.with_suffix(isrc_output_path.suffix + '.part')
     temp_path.unlink(missing_ok=True)
     isrc_temp_path.unlink(missing_ok=True)
-    sort_tmp = output_path.parent / '.sort-tmp'
-    sort_tmp.mkdir(parents=True, exist_ok=True)
-    env = {**os.environ, 'LC_ALL': 'C'}
-    process = _start_unique_sort(temp_path, sort_tmp=sort_tmp, env=env)
-    isrc_process = _start_unique_sort(isrc_temp_path, sort_tmp=sort_tmp, env=env)
-    source_rows = 0
-    mapped_rows = 0
-    isrc_observations = 0
-    malformed_rows = 0
+    spill_root = Path(tempfile.mkdtemp(prefix='.identity-runs-', dir=output_path.parent))
+    pairs = _UniquePairSpool(spill_root / 'msid-mbid', memory_budget_bytes=memory_budget_bytes // 2)
+    isrc_pairs_spool = _UniquePairSpool(spill_root / 'msid-isrc', memory_budget_bytes=memory_budget_bytes // 2)
+    counts = {
+        'source_row_count': 0,
+        'mapped_row_count': 0,
+        'isrc_observation_count': 0,
+        'malformed_row_count': 0,
+    }
     try:
-        assert process.stdin is not None
-        assert isrc_process.stdin is not None
         with source_path.open('rb') as source:
             for raw_line in source:
-                source_rows += 1
+                counts['source_row_count'] += 1
                 try:
                     payload = json.loads(raw_line)
                     pair, isrc_pairs, invalid_isrc_count = _extract_identity_pairs(payload)
                 except (json.JSONDecodeError, UnicodeDecodeError, TypeError, ValueError):
-                    malformed_rows += 1
+                    counts['malformed_row_count'] += 1
                     continue
-                malformed_rows += invalid_isrc_count
+                counts['malformed_row_count'] += invalid_isrc_count
                 if pair is not None:
-                    mapped_rows += 1
-                    process.stdin.write(f'{pair[0]}\t{pair[1]}\n')
+                    counts['mapped_row_count'] += 1
+                    pairs.add(_uuid_text_bytes(pair[0]) + _uuid_text_bytes(pair[1]))
                 for msid, isrc in isrc_pairs:
-                    isrc_observations += 1
-                    isrc_process.stdin.write(f'{msid}\t{isrc}\n')
-                if source_rows % PROGRESS_INTERVAL_ROWS == 0:
-                    _report(progress_callback, {
-                        'event': 'extract_progress',
-                        'shard_key': shard_key,
-                        'source_row_count': source_rows,
-                        'mapped_row_count': mapped_rows,
-                        'isrc_observation_count': isrc_observations,
-                        'malformed_row_count': malformed_rows,
-                    })
-        process.stdin.close()
-        isrc_process.stdin.close()
-        return_code = process.wait()
-        isrc_return_code = isrc_process.wait()
-        if return_code or isrc_return_code:
-            raise RuntimeError(
-                f'sort failed for {shard_key} with exit codes {return_code}/{isrc_return_code}'
-            )
-        unique_pairs = _count_lines(temp_path)
-        unique_isrc_pairs = _count_lines(isrc_temp_path)
+                    counts['isrc_observation_count'] += 1
+                    isrc_pairs_spool.add(_uuid_text_bytes(msid) + isrc.encode('ascii').ljust(16, b'\0'))
+                if counts['source_row_count'] % PROGRESS_INTERVAL_ROWS == 0:
+                    _report(progress_callback, {'event': 'extract_progress', 'shard_key': shard_key, **counts})
+        unique_pairs = pairs.write_unique(temp_path, format_record=_format_msid_mbid_record)
+        unique_isrc_pairs = isrc_pairs_spool.write_unique(isrc_temp_path, format_record=_format_msid_isrc_record)
         temp_path.replace(output_path)
         isrc_temp_path.replace(isrc_output_path)
-        ListenBrainzIdentityShard.objects.filter(pk=checkpoint.pk).update(
-            status='running',
-            extraction_schema_version=EXTRACTION_SCHEMA_VERSION,
-            source_row_count=source_rows,
-            mapped_row_count=mapped_rows,
-            unique_pair_count=unique_pairs,
-            isrc_observation_count=isrc_observations,
-            unique_isrc_pair_count=unique_isrc_pairs,
-            malformed_row_count=malformed_rows,
-        )
-        return ShardExtractionResult(
-            shard_key=shard_key,
-            output_path=str(output_path),
-            isrc_output_path=str(isrc_output_path),
-            source_row_count=source_rows,
-            mapped_row_count=mapped_rows,
-            unique_pair_count=unique_pairs,
-            isrc_observation_count=isrc_observations,
-            unique_isrc_pair_count=unique_isrc_pairs,
-            malformed_row_count=malformed_rows,
-        )
     except Exception as exc:
-        for active_process in (process, isrc_process):
-            if active_process.poll() is None:
-                active_process.kill()
-                active_process.wait()
         temp_path.unlink(missing_ok=True)
         isrc_temp_path.unlink(missing_ok=True)
-        ListenBrainzIdentityShard.objects.filter(pk=checkpoint.pk).update(
-            status='failed',
-            source_row_count=source_rows,
-            mapped_row_count=mapped_rows,
-            isrc_observation_count=isrc_observations,
-            malformed_row_count=malformed_rows,
-            last_error=str(exc),
-            completed_at=timezone.now(),
-        )
+        for name, value in counts.items():
+            setattr(exc, name, value)
         raise
+    finally:
+        shutil.rmtree(spill_root, ignore_errors=True)
+    return {
+        **counts,
+        'unique_pair_count': unique_pairs,
+        'unique_isrc_pair_count': unique_isrc_pairs,
+    }
 
 
-def _start_unique_sort(output_path: Path, *, sort_tmp: Path, env: dict[str, str]) -> subprocess.Popen:
-    return subprocess.Popen(
-        ['sort', '-u', '-T', str(sort_tmp), '-o', str(output_path)],
-        stdin=subprocess.PIPE,
-        text=True,
-        encoding='utf-8',
-        env=env,
-    )
+class _UniquePairSpool:
+    """
+    De-duplicate fixed-width pair records. Records collect in a hash set until
+    the memory budget is reached, then spill to disk as a sorted binary run;
+    ``write_unique`` k-way merges the runs with whatever is still in memory.
+    """
+
+    def __init__(self, spill_root: Path, *, memory_budget_bytes: int):
+        self.spill_root = spill_root
+        self.max_records = max(1, memory_budget_bytes // PAIR_RECORD_MEMORY_BYTES)
+        self.records: set[bytes] = set()
+        self.run_paths: list[Path] = []
+
+    def add(self, record: bytes) -> None:
+        self.records.add(record)
+        if len(self.records) >= self.max_records:
+            self._spill()
+
+    def _spill(self) -> None:
+        self.spill_root.mkdir(parents=True, exist_ok=True)
+        run_path = self.spill_root / f'run-{len(self.run_paths):05d}.bin'
+        with run_path.open('wb') as handle:
+            handle.write(b''.join(sorted(self.records)))
+        self.run_paths.append(run_path)
+        self.records = set()
+
+    def write_unique(self, output_path: Path, *, format_record: Callable[[bytes], str]) -> int:
+        sources = [_iter_pair_run(run_path) for run_path in self.run_paths]
+        sources.append(iter(sorted(self.records)))
+        self.records = set()
+        unique_count = 0
+        previous = None
+        try:
+            with output_path.open('w', encoding='utf-8', newline='') as handle:
+                for record in heapq.merge(*sources):
+                    if record == previous:
+                        continue
+                    previous = record
+                    handle.write(format_record(record))
+                    unique_count += 1
+        finally:
+            for run_path in self.run_paths:
+                run_path.unlink(missing_ok=True)
+            self.run_paths = []
+        return unique_count
+
+
+def _iter_pair_run(run_path: Path) -> Iterator[bytes]:
+    with run_path.open('rb') as handle:
+        while block := handle.read(PAIR_RECORD_BYTES * PAIR_RUN_READ_RECORDS):
+            for offset in range(0, len(block), PAIR_RECORD_BYTES):
+                yield block[offset:offset + PAIR_RECORD_BYTES]
+
+
+def _uuid_text_bytes(value: str) -> bytes:
+    return bytes.fromhex(value.replace('-', ''))
+
+
+def _format_msid_mbid_record(record: bytes) -> str:
+    return f'{UUID(bytes=record[:16])}\t{UUID(bytes=record[16:])}\n'
+
+
+def _format_msid_isrc_record(record: bytes) -> str:
+    isrc = record[16:].rstrip(b'\0').decode('ascii')
+    return f'{UUID(bytes=record[:16])}\t{isrc}\n'
 
 
 def _isrc_output_path(msid_mbid_output_path: Path) -> Path:
@@ -813,525 +1025,477 @@ def _copy_isrc_file(cursor, path: Path) -> None:
     raise RuntimeError('ListenBrainz ISRC alias materialization requires PostgreSQL COPY support')
 
 
-def _count_missing_msid_canonical_items(source_version: str) -> int:
-    with connection.cursor() as cursor:
-        cursor.execute(
-            '''
-            SELECT COUNT(*)
-            FROM mlcore_listenbrainz_msid_mbid_mapping mapping
-            JOIN mlcore_canonical_item target_item
-              ON target_item.canonical_key = 'recording_mbid:' || mapping.recording_mbid::text
-            LEFT JOIN mlcore_canonical_item source_item
-              ON source_item.canonical_key = 'recording_msid:' || mapping.recording_msid::text
-            WHERE mapping.source_version = %s
-              AND mapping.status = 'active'
-              AND source_item.id IS NULL
-            ''',
-            [source_version],
-        )
-        return int(cursor.fetchone()[0])
-
-
-def _fetch_missing_msid_batch(source_version: str, *, batch_size: int, after_msid: UUID | None = None) -> list[UUID]:
-    after_clause = ''
-    params: list[Any] = [source_version]
-    if after_msid is not None:
-        after_clause = 'AND mapping.recording_msid > %s'
-        params.append(after_msid)
-    params.append(batch_size)
-    with connection.cursor() as cursor:
-        cursor.execute(
-            f'''
-            SELECT mapping.recording_msid
-            FROM mlcore_listenbrainz_msid_mbid_mapping mapping
-            JOIN mlcore_canonical_item target_item
-              ON target_item.canonical_key = 'recording_mbid:' || mapping.recording_mbid::text
-            LEFT JOIN mlcore_canonical_item source_item
-              ON source_item.canonical_key = 'recording_msid:' || mapping.recording_msid::text
-            WHERE mapping.source_version = %s
-              AND mapping.status = 'active'
-              AND source_item.id IS NULL
-              {after_clause}
-            ORDER BY mapping.recording_msid
-            LIMIT %s
-            ''',
-            params,
+def _classify_identity_mappings(cursor, source_version: str) -> None:
+    """
+    Rank every mapping of a source version in one window pass and store the
+    result, with the canonical items already on each side, in the UNLOGGED
+    classification table. Conflict status, resolver winners, and missing MSID
+    items are all read from that table instead of the mapping table.
+    """
+    cursor.execute(f'TRUNCATE TABLE {IDENTITY_CLASSIFICATION_TABLE}')
+    cursor.execute(
+        f'''
+        INSERT INTO {IDENTITY_CLASSIFICATION_TABLE} (
+            recording_msid,
+            recording_mbid,
+            shard_observation_count,
+            total_shard_observation_count,
+            candidate_count,
+            candidate_rank,
+            status,
+            source_item_id,
+            target_item_id
         )
-        return [row[0] for row in cursor.fetchall()]
-
-
-def _count_conflict_msids(source_version: str) -> int:
-    with connection.cursor() as cursor:
-        cursor.execute(
-            '''
-            SELECT COUNT(DISTINCT recording_msid)
-            FROM mlcore_listenbrainz_msid_mbid_mapping
-            WHERE source_version = %s
-              AND status = 'conflict'
-            ''',
-            [source_version],
-        )
-        return int(cursor.fetchone()[0])
-
-
-def _conflict_winners_sql() -> str:
-    return '''
-        WITH ranked AS (
+        SELECT
+            ranked.recording_msid,
+            ranked.recording_mbid,
+            ranked.shard_observation_count,
+            ranked.total_shard_observation_count,
+            ranked.candidate_count,
+            ranked.candidate_rank,
+            CASE WHEN ranked.candidate_count > 1 THEN 'conflict' ELSE 'active' END,
+            source_item.id,
+            target_item.id
+        FROM (
             SELECT
                 mapping.recording_msid,
                 mapping.recording_mbid,
                 mapping.shard_observation_count,
-                SUM(mapping.shard_observation_count) OVER (
-                    PARTITION BY mapping.recording_msid
-                ) AS total_shard_observation_count,
-                COUNT(*) OVER (PARTITION BY mapping.recording_msid) AS candidate_count,
+                SUM(mapping.shard_observation_count) OVER msid_window AS total_shard_observation_count,
+                COUNT(*) OVER msid_window AS candidate_count,
                 ROW_NUMBER() OVER (
                     PARTITION BY mapping.recording_msid
                     ORDER BY mapping.shard_observation_count DESC, mapping.recording_mbid
                 ) AS candidate_rank
             FROM mlcore_listenbrainz_msid_mbid_mapping mapping
             WHERE mapping.source_version = %s
-              AND mapping.status = 'conflict'
-        )
-        SELECT
-            ranked.recording_msid,
-            ranked.recording_mbid AS chosen_recording_mbid,
-            ranked.shard_observation_count AS winner_shard_observation_count,
-            ranked.total_shard_observation_count,
-            ranked.candidate_count,
-            ranked.shard_observation_count::double precision
-                / NULLIF(ranked.total_shard_observation_count, 0)::double precision AS winner_share
-        FROM ranked
-        JOIN mlcore_canonical_item target_item
+            WINDOW msid_window AS (PARTITION BY mapping.recording_msid)
+        ) ranked
+        LEFT JOIN mlcore_canonical_item source_item
+          ON source_item.canonical_key = 'recording_msid:' || ranked.recording_msid::text
+        LEFT JOIN mlcore_canonical_item target_item
           ON target_item.canonical_key = 'recording_mbid:' || ranked.recording_mbid::text
-        WHERE ranked.candidate_rank = 1
-          AND ranked.shard_observation_count >= %s
-          AND ranked.shard_observation_count::double precision
-                / NULLIF(ranked.total_shard_observation_count, 0)::double precision >= %s
+        ''',
+        [source_version],
+    )
+    cursor.execute(f'ANALYZE {IDENTITY_CLASSIFICATION_TABLE}')
+
+
+def _classified_count(cursor, condition: str, params: list[Any] | None = None) -> int:
+    cursor.execute(f'SELECT COUNT(*) FROM {IDENTITY_CLASSIFICATION_TABLE} WHERE {condition}', params or [])
+    return int(cursor.fetchone()[0])
+
+
+def _conflict_winners_sql() -> str:
+    return f'''
+        SELECT
+            recording_msid,
+            recording_mbid AS chosen_recording_mbid,
+            shard_observation_count AS winner_shard_observation_count,
+            total_shard_observation_count,
+            candidate_count,
+            shard_observation_count::double precision
+                / NULLIF(total_shard_observation_count, 0)::double precision AS winner_share,
+            source_item_id,
+            target_item_id
+        FROM {IDENTITY_CLASSIFICATION_TABLE}
+        WHERE candidate_count > 1
+          AND candidate_rank = 1
+          AND target_item_id IS NOT NULL
+          AND shard_observation_count >= %s
+          AND shard_observation_count::double precision
+                / NULLIF(total_shard_observation_count, 0)::double precision >= %s
     '''
 
 
-def _count_resolvable_conflict_msids(
-    source_version: str,
+class _MSIDItemSpool:
+    """COPY TO target that rewrites streamed MSID lines as (msid, canonical item id) rows."""
+
+    def __init__(self, spool, *, report_every: int, on_progress: Callable[[int, int], None]):
+        self.spool = spool
+        self.row_count = 0
+        self._partial = b''
+        self._report_every = report_every
+        self._on_progress = on_progress
+
+    def write(self, data: bytes | str) -> int:
+        if isinstance(data, str):
+            data = data.encode('ascii')
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        for line in lines:
+            msid = line.decode('ascii')
+            item_id = canonical_item_uuid(item_type=ITEM_TYPE_RECORDING_MSID, key_value=msid)
+            self.spool.write(f'{msid}\t{item_id}\n'.encode('ascii'))
+            self.row_count += 1
+            if self.row_count % self._report_every == 0:
+                self._on_progress(self._report_every, self.row_count)
+        return len(data)
+
+
+def _create_missing_msid_items(
+    cursor,
+    msids_sql: str,
+    params: list[Any],
     *,
-    min_winner_share: float,
-    min_winner_shards: int,
+    batch_size: int,
+    on_progress: Callable[[int, int], None],
 ) -> int:
-    with connection.cursor() as cursor:
-        cursor.execute(
-            f'SELECT COUNT(*) FROM ({_conflict_winners_sql()}) winners',
-            [source_version, min_winner_shards, min_winner_share],
-        )
-        return int(cursor.fetchone()[0])
+    """
+    Create canonical MSID items for the MSIDs selected from the classification
+    table, and point the classification rows at them. The MSIDs stream out
+    and back through COPY; only the deterministic uuid5 item ids are computed
+    in Python. Returns the number of items created.
+    """
+    raw_cursor = getattr(cursor, 'cursor', cursor)
+    if not hasattr(raw_cursor, 'copy_expert'):
+        raise RuntimeError('ListenBrainz identity graph expansion requires PostgreSQL COPY support')
+    cursor.execute(f'CREATE TEMPORARY TABLE {MSID_ITEM_STAGE_TABLE} (recording_msid uuid NOT NULL, id uuid NOT NULL)')
+    with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as spool:
+        writer = _MSIDItemSpool(spool, report_every=batch_size, on_progress=on_progress)
+        raw_cursor.copy_expert(raw_cursor.mogrify(f'COPY ({msids_sql}) TO STDOUT', params).decode(), writer)
+        if writer.row_count % batch_size:
+            on_progress(writer.row_count % batch_size, writer.row_count)
+        spool.seek(0)
+        raw_cursor.copy_expert(f'COPY {MSID_ITEM_STAGE_TABLE} (recording_msid, id) FROM STDIN', spool)
+    cursor.execute(
+        f'''
+        INSERT INTO mlcore_canonical_item (id, item_type, canonical_key, created_at, updated_at)
+        SELECT id, %s, %s || ':' || recording_msid::text, NOW(), NOW()
+        FROM {MSID_ITEM_STAGE_TABLE}
+        ON CONFLICT DO NOTHING
+        ''',
+        [ITEM_TYPE_RECORDING_MSID, ITEM_TYPE_RECORDING_MSID],
+    )
+    created_count = max(cursor.rowcount, 0)
+    cursor.execute(
+        f'''
+        UPDATE {IDENTITY_CLASSIFICATION_TABLE} classification
+        SET source_item_id = stage.id
+        FROM {MSID_ITEM_STAGE_TABLE} stage
+        WHERE classification.recording_msid = stage.recording_msid
+          AND classification.source_item_id IS NULL
+        '''
+    )
+    cursor.execute(f'DROP TABLE {MSID_ITEM_STAGE_TABLE}')
+    return created_count
 
 
 def _write_conflict_resolutions(
+    cursor,
     source_version: str,
     *,
     policy_version: str,
     min_winner_share: float,
     min_winner_shards: int,
 ) -> None:
-    with transaction.atomic(), connection.cursor() as cursor:
-        cursor.execute(
-            '''
-            UPDATE mlcore_listenbrainz_msid_mbid_conflict_resolution resolution
-            SET status = 'retired',
-                updated_at = NOW()
-            WHERE resolution.source_version = %s
-              AND resolution.policy_version = %s
-              AND resolution.status = 'active'
-            ''',
-            [source_version, policy_version],
-        )
-        cursor.execute(
-            f'''
-            INSERT INTO mlcore_listenbrainz_msid_mbid_conflict_resolution (
-                recording_msid,
-                chosen_recording_mbid,
-                source_version,
-                policy_version,
-                winner_shard_observation_count,
-                total_shard_observation_count,
-                candidate_count,
-                winner_share,
-                status,
-                evidence,
-                created_at,
-                updated_at
-            )
-            SELECT
-                winners.recording_msid,
-                winners.chosen_recording_mbid,
-                %s,
-                %s,
-                winners.winner_shard_observation_count,
-                winners.total_shard_observation_count,
-                winners.candidate_count,
-                winners.winner_share,
-                'active',
-                jsonb_build_object(
-                    'policy_version', %s,
-                    'min_winner_share', %s,
-                    'min_winner_shards', %s,
-                    'evidence_basis', 'shard_observation_count'
-                ),
-                NOW(),
-                NOW()
-            FROM ({_conflict_winners_sql()}) winners
-            ON CONFLICT (recording_msid, source_version, policy_version) DO UPDATE
-            SET chosen_recording_mbid = EXCLUDED.chosen_recording_mbid,
-                winner_shard_observation_count = EXCLUDED.winner_shard_observation_count,
-                total_shard_observation_count = EXCLUDED.total_shard_observation_count,
-                candidate_count = EXCLUDED.candidate_count,
-                winner_share = EXCLUDED.winner_share,
-                status = 'active',
-                evidence = EXCLUDED.evidence,
-                updated_at = NOW()
-            ''',
-            [
-                source_version,
-                policy_version,
-                policy_version,
-                min_winner_share,
-                min_winner_shards,
-                source_version,
-                min_winner_shards,
-                min_winner_share,
-            ],
-        )
-
-
-def _fetch_conflict_resolution_missing_msid_batch(
-    source_version: str,
-    *,
-    policy_version: str,
-    batch_size: int,
-    after_msid: UUID | None = None,
-) -> list[UUID]:
-    after_clause = ''
-    params: list[Any] = [source_version, policy_version]
-    if after_msid is not None:
-        after_clause = 'AND resolution.recording_msid > %s'
-        params.append(after_msid)
-    params.append(batch_size)
-    with connection.cursor() as cursor:
-        cursor.execute(
-            f'''
-            SELECT resolution.recording_msid
-            FROM mlcore_listenbrainz_msid_mbid_conflict_resolution resolution
-            LEFT JOIN mlcore_canonical_item source_item
-              ON source_item.canonical_key = 'recording_msid:' || resolution.recording_msid::text
-            WHERE resolution.source_version = %s
-              AND resolution.policy_version = %s
-              AND resolution.status = 'active'
-              AND source_item.id IS NULL
-              {after_clause}
-            ORDER BY resolution.recording_msid
-            LIMIT %s
-            ''',
-            params,
+    cursor.execute(
+        '''
+        UPDATE mlcore_listenbrainz_msid_mbid_conflict_resolution resolution
+        SET status = 'retired',
+            updated_at = NOW()
+        WHERE resolution.source_version = %s
+          AND resolution.policy_version = %s
+          AND resolution.status = 'active'
+        ''',
+        [source_version, policy_version],
+    )
+    cursor.execute(
+        f'''
+        INSERT INTO mlcore_listenbrainz_msid_mbid_conflict_resolution (
+            recording_msid,
+            chosen_recording_mbid,
+            source_version,
+            policy_version,
+            winner_shard_observation_count,
+            total_shard_observation_count,
+            candidate_count,
+            winner_share,
+            status,
+            evidence,
+            created_at,
+            updated_at
         )
-        return [row[0] for row in cursor.fetchall()]
+        SELECT
+            winners.recording_msid,
+            winners.chosen_recording_mbid,
+            %s,
+            %s,
+            winners.winner_shard_observation_count,
+            winners.total_shard_observation_count,
+            winners.candidate_count,
+            winners.winner_share,
+            'active',
+            jsonb_build_object(
+                'policy_version', %s,
+                'min_winner_share', %s,
+                'min_winner_shards', %s,
+                'evidence_basis', 'shard_observation_count'
+            ),
+            NOW(),
+            NOW()
+        FROM ({_conflict_winners_sql()}) winners
+        ON CONFLICT (recording_msid, source_version, policy_version) DO UPDATE
+        SET chosen_recording_mbid = EXCLUDED.chosen_recording_mbid,
+            winner_shard_observation_count = EXCLUDED.winner_shard_observation_count,
+            total_shard_observation_count = EXCLUDED.total_shard_observation_count,
+            candidate_count = EXCLUDED.candidate_count,
+            winner_share = EXCLUDED.winner_share,
+            status = 'active',
+            evidence = EXCLUDED.evidence,
+            updated_at = NOW()
+        ''',
+        [
+            source_version,
+            policy_version,
+            policy_version,
+            min_winner_share,
+            min_winner_shards,
+            min_winner_shards,
+            min_winner_share,
+        ],
+    )
 
 
-def _ensure_conflict_resolution_msid_items(
+def _materialize_conflict_resolution_redirects(
+    cursor,
     source_version: str,
     *,
     policy_version: str,
-    batch_size: int,
-    progress_callback: Callable[[dict[str, Any]], None] | None = None,
-) -> int:
-    created_count = 0
-    last_msid = None
-    while True:
-        msids = _fetch_conflict_resolution_missing_msid_batch(
-            source_version,
-            policy_version=policy_version,
-            batch_size=batch_size,
-            after_msid=last_msid,
-        )
-        if not msids:
-            break
-        rows = [
-            CanonicalItem(
-                id=canonical_item_uuid(item_type=ITEM_TYPE_RECORDING_MSID, key_value=str(msid)),
-                item_type=ITEM_TYPE_RECORDING_MSID,
-                canonical_key=f'{ITEM_TYPE_RECORDING_MSID}:{msid}',
-            )
-            for msid in msids
-        ]
-        CanonicalItem.objects.bulk_create(rows, ignore_conflicts=True, batch_size=batch_size)
-        created_count += len(rows)
-        last_msid = msids[-1]
-        _report(progress_callback, {
-            'event': 'conflict_msid_canonical_batch',
-            'source_version': source_version,
-            'policy_version': policy_version,
-            'batch_size': len(msids),
-            'created_msid_count': created_count,
-        })
-    return created_count
-
-
-def _materialize_conflict_resolution_redirects(source_version: str, *, policy_version: str) -> tuple[int, int]:
-    candidates_sql = '''
+    min_winner_share: float,
+    min_winner_shards: int,
+) -> tuple[int, int]:
+    candidates_sql = f'''
         SELECT
-            source_item.id AS from_id,
-            target_item.id AS to_id,
-            resolution.recording_msid,
-            resolution.chosen_recording_mbid,
-            resolution.winner_shard_observation_count,
-            resolution.total_shard_observation_count,
-            resolution.candidate_count,
-            resolution.winner_share
-        FROM mlcore_listenbrainz_msid_mbid_conflict_resolution resolution
-        JOIN mlcore_canonical_item source_item
-          ON source_item.canonical_key = 'recording_msid:' || resolution.recording_msid::text
-        JOIN mlcore_canonical_item target_item
-          ON target_item.canonical_key = 'recording_mbid:' || resolution.chosen_recording_mbid::text
-        WHERE resolution.source_version = %s
-          AND resolution.policy_version = %s
-          AND resolution.status = 'active'
+            winners.source_item_id AS from_id,
+            winners.target_item_id AS to_id,
+            winners.recording_msid,
+            winners.chosen_recording_mbid,
+            winners.winner_shard_observation_count,
+            winners.total_shard_observation_count,
+            winners.candidate_count,
+            winners.winner_share
+        FROM ({_conflict_winners_sql()}) winners
+        WHERE winners.source_item_id IS NOT NULL
     '''
-    with transaction.atomic(), connection.cursor() as cursor:
-        cursor.execute(
-            f'''
-            UPDATE mlcore_canonical_item_redirect redirect
-            SET status = 'retired',
-                updated_at = NOW()
-            WHERE redirect.source = %s
-              AND redirect.source_version = %s
-              AND redirect.status = 'active'
-              AND NOT EXISTS (
-                  SELECT 1
-                  FROM ({candidates_sql}) candidate
-                  WHERE candidate.from_id = redirect.from_canonical_item_id
-                    AND candidate.to_id = redirect.to_canonical_item_id
-              )
-            ''',
-            [CONFLICT_RESOLVER_SOURCE_ID, source_version, source_version, policy_version],
-        )
-        cursor.execute(
-            f'''
-            INSERT INTO mlcore_canonical_item_redirect (
-                from_canonical_item_id,
-                to_canonical_item_id,
-                relation,
-                confidence,
-                source,
-                source_version,
-                status,
-                evidence,
-                created_at,
-                updated_at
-            )
-            SELECT
-                candidate.from_id,
-                candidate.to_id,
-                'same_recording',
-                candidate.winner_share,
-                %s,
-                %s,
-                'active',
-                jsonb_build_object(
-                    'recording_msid', candidate.recording_msid,
-                    'recording_mbid', candidate.chosen_recording_mbid,
-                    'policy_version', %s,
-                    'winner_shard_observation_count', candidate.winner_shard_observation_count,
-                    'total_shard_observation_count', candidate.total_shard_observation_count,
-                    'candidate_count', candidate.candidate_count,
-                    'winner_share', candidate.winner_share,
-                    'evidence_basis', 'shard_observation_count'
-                ),
-                NOW(),
-                NOW()
-            FROM ({candidates_sql}) candidate
-            ON CONFLICT (from_canonical_item_id) DO UPDATE
-            SET status = CASE
-                    WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
-                    THEN 'active'
-                    ELSE 'conflict'
-                END,
-                confidence = CASE
-                    WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
-                    THEN EXCLUDED.confidence
-                    ELSE mlcore_canonical_item_redirect.confidence
-                END,
-                source = EXCLUDED.source,
-                source_version = EXCLUDED.source_version,
-                evidence = CASE
-                    WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
-                    THEN EXCLUDED.evidence
-                    ELSE mlcore_canonical_item_redirect.evidence || jsonb_build_object(
-                        'conflicting_target_id', EXCLUDED.to_canonical_item_id,
-                        'conflicting_source', EXCLUDED.source
-                    )
-                END,
-                updated_at = NOW()
-            ''',
-            [
-                CONFLICT_RESOLVER_SOURCE_ID,
-                source_version,
-                policy_version,
-                source_version,
-                policy_version,
-            ],
-        )
-        cursor.execute(
-            '''
-            SELECT COUNT(*) FILTER (WHERE status = 'active'),
-                   COUNT(*) FILTER (WHERE status = 'conflict')
-            FROM mlcore_canonical_item_redirect
-            WHERE source = %s AND source_version = %s
-            ''',
-            [CONFLICT_RESOLVER_SOURCE_ID, source_version],
+    cursor.execute(
+        f'''
+        UPDATE mlcore_canonical_item_redirect redirect
+        SET status = 'retired',
+            updated_at = NOW()
+        WHERE redirect.source = %s
+          AND redirect.source_version = %s
+          AND redirect.status = 'active'
+          AND NOT EXISTS (
+              SELECT 1
+              FROM ({candidates_sql}) candidate
+              WHERE candidate.from_id = redirect.from_canonical_item_id
+                AND candidate.to_id = redirect.to_canonical_item_id
+          )
+        ''',
+        [CONFLICT_RESOLVER_SOURCE_ID, source_version, min_winner_shards, min_winner_share],
+    )
+    cursor.execute(
+        f'''
+        INSERT INTO mlcore_canonical_item_redirect (
+            from_canonical_item_id,
+            to_canonical_item_id,
+            relation,
+            confidence,
+            source,
+            source_version,
+            status,
+            evidence,
+            created_at,
+            updated_at
         )
-        redirect_count, redirect_conflict_count = (int(value) for value in cursor.fetchone())
+        SELECT
+            candidate.from_id,
+            candidate.to_id,
+            'same_recording',
+            candidate.winner_share,
+            %s,
+            %s,
+            'active',
+            jsonb_build_object(
+                'recording_msid', candidate.recording_msid,
+                'recording_mbid', candidate.chosen_recording_mbid,
+                'policy_version', %s,
+                'winner_shard_observation_count', candidate.winner_shard_observation_count,
+                'total_shard_observation_count', candidate.total_shard_observation_count,
+                'candidate_count', candidate.candidate_count,
+                'winner_share', candidate.winner_share,
+                'evidence_basis', 'shard_observation_count'
+            ),
+            NOW(),
+            NOW()
+        FROM ({candidates_sql}) candidate
+        ON CONFLICT (from_canonical_item_id) DO UPDATE
+        SET status = CASE
+                WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
+                THEN 'active'
+                ELSE 'conflict'
+            END,
+            confidence = CASE
+                WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
+                THEN EXCLUDED.confidence
+                ELSE mlcore_canonical_item_redirect.confidence
+            END,
+            source = EXCLUDED.source,
+            source_version = EXCLUDED.source_version,
+            evidence = CASE
+                WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
+                THEN EXCLUDED.evidence
+                ELSE mlcore_canonical_item_redirect.evidence || jsonb_build_object(
+                    'conflicting_target_id', EXCLUDED.to_canonical_item_id,
+                    'conflicting_source', EXCLUDED.source
+                )
+            END,
+            updated_at = NOW()
+        ''',
+        [
+            CONFLICT_RESOLVER_SOURCE_ID,
+            source_version,
+            policy_version,
+            min_winner_shards,
+            min_winner_share,
+        ],
+    )
+    cursor.execute(
+        '''
+        SELECT COUNT(*) FILTER (WHERE status = 'active'),
+               COUNT(*) FILTER (WHERE status = 'conflict')
+        FROM mlcore_canonical_item_redirect
+        WHERE source = %s AND source_version = %s
+        ''',
+        [CONFLICT_RESOLVER_SOURCE_ID, source_version],
+    )
+    redirect_count, redirect_conflict_count = (int(value) for value in cursor.fetchone())
+    rebuild_canonical_redirect_closure()
     return redirect_count, redirect_conflict_count
 
 
 def _classify_and_materialize(source_version: str) -> dict[str, int]:
     with transaction.atomic(), connection.cursor() as cursor:
-        cursor.execute(
-            '''
-            UPDATE mlcore_listenbrainz_msid_mbid_mapping
-            SET status = 'active', updated_at = NOW()
-            WHERE source_version = %s
-            ''',
-            [source_version],
-        )
-        cursor.execute(
-            '''
-            WITH conflicts AS (
-                SELECT recording_msid
-                FROM mlcore_listenbrainz_msid_mbid_mapping
-                WHERE source_version = %s
-                GROUP BY recording_msid
-                HAVING COUNT(DISTINCT recording_mbid) > 1
-            )
-            UPDATE mlcore_listenbrainz_msid_mbid_mapping mapping
-            SET status = 'conflict', updated_at = NOW()
-            FROM conflicts
-            WHERE mapping.source_version = %s
-              AND mapping.recording_msid = conflicts.recording_msid
-            ''',
-            [source_version, source_version],
-        )
-        cursor.execute(
-            '''
-            SELECT COUNT(*)
-            FROM mlcore_listenbrainz_msid_mbid_mapping
-            WHERE source_version = %s AND status = 'active'
-            ''',
-            [source_version],
-        )
-        active_mapping_count = int(cursor.fetchone()[0])
-        cursor.execute(
-            '''
-            SELECT COUNT(DISTINCT recording_msid)
-            FROM mlcore_listenbrainz_msid_mbid_mapping
-            WHERE source_version = %s AND status = 'conflict'
-            ''',
-            [source_version],
-        )
-        conflict_msid_count = int(cursor.fetchone()[0])
-
-        candidates_sql = '''
-            SELECT
-                source_item.id AS from_id,
-                target_item.id AS to_id,
-                mapping.recording_msid,
-                mapping.recording_mbid,
-                mapping.shard_observation_count
-            FROM mlcore_listenbrainz_msid_mbid_mapping mapping
-            JOIN mlcore_canonical_item source_item
-              ON source_item.canonical_key = 'recording_msid:' || mapping.recording_msid::text
-            JOIN mlcore_canonical_item target_item
-              ON target_item.canonical_key = 'recording_mbid:' || mapping.recording_mbid::text
-            WHERE mapping.source_version = %s
-              AND mapping.status = 'active'
+        _classify_identity_mappings(cursor, source_version)
+        return _apply_identity_classification(cursor, source_version)
+
+
+def _apply_identity_classification(cursor, source_version: str) -> dict[str, int]:
+    cursor.execute(
+        f'''
+        UPDATE mlcore_listenbrainz_msid_mbid_mapping mapping
+        SET status = classification.status, updated_at = NOW()
+        FROM {IDENTITY_CLASSIFICATION_TABLE} classification
+        WHERE mapping.source_version = %s
+          AND mapping.recording_msid = classification.recording_msid
+          AND mapping.recording_mbid = classification.recording_mbid
+          AND mapping.status <> classification.status
+        ''',
+        [source_version],
+    )
+    cursor.execute(
+        f'''
+        SELECT COUNT(*) FILTER (WHERE candidate_count = 1),
+               COUNT(*) FILTER (WHERE candidate_count > 1 AND candidate_rank = 1)
+        FROM {IDENTITY_CLASSIFICATION_TABLE}
         '''
-        cursor.execute(
-            f'''
-            UPDATE mlcore_canonical_item_redirect redirect
-            SET status = 'retired',
-                updated_at = NOW()
-            WHERE redirect.source = %s
-              AND redirect.source_version = %s
-              AND redirect.status = 'active'
-              AND NOT EXISTS (
-                  SELECT 1
-                  FROM ({candidates_sql}) candidate
-                  WHERE candidate.from_id = redirect.from_canonical_item_id
-                    AND candidate.to_id = redirect.to_canonical_item_id
-              )
-            ''',
-            [BRIDGE_SOURCE_ID, source_version, source_version],
-        )
-        cursor.execute(
-            f'''
-            INSERT INTO mlcore_canonical_item_redirect (
-                from_canonical_item_id,
-                to_canonical_item_id,
-                relation,
-                confidence,
-                source,
-                source_version,
-                status,
-                evidence,
-                created_at,
-                updated_at
-            )
-            SELECT
-                candidate.from_id,
-                candidate.to_id,
-                'same_recording',
-                1.0,
-                %s,
-                %s,
-                'active',
-                jsonb_build_object(
-                    'recording_msid', candidate.recording_msid,
-                    'recording_mbid', candidate.recording_mbid,
-                    'shard_observation_count', candidate.shard_observation_count
-                ),
-                NOW(),
-                NOW()
-            FROM ({candidates_sql}) candidate
-            ON CONFLICT (from_canonical_item_id) DO UPDATE
-            SET status = CASE
-                    WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
-                    THEN 'active'
-                    ELSE 'conflict'
-                END,
-                confidence = CASE
-                    WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
-                    THEN EXCLUDED.confidence
-                    ELSE mlcore_canonical_item_redirect.confidence
-                END,
-                source_version = EXCLUDED.source_version,
-                evidence = CASE
-                    WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
-                    THEN EXCLUDED.evidence
-                    ELSE mlcore_canonical_item_redirect.evidence || jsonb_build_object(
-                        'conflicting_target_id', EXCLUDED.to_canonical_item_id
-                    )
-                END,
-                updated_at = NOW()
-            ''',
-            [BRIDGE_SOURCE_ID, source_version, source_version],
-        )
-        cursor.execute(
-            '''
-            SELECT COUNT(*) FILTER (WHERE status = 'active'),
-                   COUNT(*) FILTER (WHERE status = 'conflict')
-            FROM mlcore_canonical_item_redirect
-            WHERE source = %s AND source_version = %s
-            ''',
-            [BRIDGE_SOURCE_ID, source_version],
+    )
+    active_mapping_count, conflict_msid_count = (int(value) for value in cursor.fetchone())
+
+    candidates_sql = f'''
+        SELECT
+            source_item_id AS from_id,
+            target_item_id AS to_id,
+            recording_msid,
+            recording_mbid,
+            shard_observation_count
+        FROM {IDENTITY_CLASSIFICATION_TABLE}
+        WHERE candidate_count = 1
+          AND source_item_id IS NOT NULL
+          AND target_item_id IS NOT NULL
+    '''
+    cursor.execute(
+        f'''
+        UPDATE mlcore_canonical_item_redirect redirect
+        SET status = 'retired',
+            updated_at = NOW()
+        WHERE redirect.source = %s
+          AND redirect.source_version = %s
+          AND redirect.status = 'active'
+          AND NOT EXISTS (
+              SELECT 1
+              FROM ({candidates_sql}) candidate
+              WHERE candidate.from_id = redirect.from_canonical_item_id
+                AND candidate.to_id = redirect.to_canonical_item_id
+          )
+        ''',
+        [BRIDGE_SOURCE_ID, source_version],
+    )
+    cursor.execute(
+        f'''
+        INSERT INTO mlcore_canonical_item_redirect (
+            from_canonical_item_id,
+            to_canonical_item_id,
+            relation,
+            confidence,
+            source,
+            source_version,
+            status,
+            evidence,
+            created_at,
+            updated_at
         )
-        redirect_count, redirect_conflict_count = (int(value) for value in cursor.fetchone())
+        SELECT
+            candidate.from_id,
+            candidate.to_id,
+            'same_recording',
+            1.0,
+            %s,
+            %s,
+            'active',
+            jsonb_build_object(
+                'recording_msid', candidate.recording_msid,
+                'recording_mbid', candidate.recording_mbid,
+                'shard_observation_count', candidate.shard_observation_count
+            ),
+            NOW(),
+            NOW()
+        FROM ({candidates_sql}) candidate
+        ON CONFLICT (from_canonical_item_id) DO UPDATE
+        SET status = CASE
+                WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
+                THEN 'active'
+                ELSE 'conflict'
+            END,
+            confidence = CASE
+                WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
+                THEN EXCLUDED.confidence
+                ELSE mlcore_canonical_item_redirect.confidence
+            END,
+            source_version = EXCLUDED.source_version,
+            evidence = CASE
+                WHEN mlcore_canonical_item_redirect.to_canonical_item_id = EXCLUDED.to_canonical_item_id
+                THEN EXCLUDED.evidence
+                ELSE mlcore_canonical_item_redirect.evidence || jsonb_build_object(
+                    'conflicting_target_id', EXCLUDED.to_canonical_item_id
+                )
+            END,
+            updated_at = NOW()
+        ''',
+        [BRIDGE_SOURCE_ID, source_version],
+    )
+    cursor.execute(
+        '''
+        SELECT COUNT(*) FILTER (WHERE status = 'active'),
+               COUNT(*) FILTER (WHERE status = 'conflict')
+        FROM mlcore_canonical_item_redirect
+        WHERE source = %s AND source_version = %s
+        ''',
+        [BRIDGE_SOURCE_ID, source_version],
+    )
+    redirect_count, redirect_conflict_count = (int(value) for value in cursor.fetchone())
+    rebuild_canonical_redirect_closure()
     return {
         'active_mapping_count': active_mapping_count,
         'conflict_msid_count': conflict_msid_count,
@@ -1351,14 +1515,6 @@ def _load_manifest(path: Path) -> dict[str, Any]:
     return manifest
 
 
-def _count_lines(path: Path) -> int:
-    count = 0
-    with path.open('rb') as handle:
-        for count, _ in enumerate(handle, start=1):
-            pass
-    return count
-
-
 def _eta_seconds(*, processed: int, total: int, elapsed: float) -> float | None:
     if processed <= 0 or total <= processed:
         return 0.0 if total <= processed else None
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import csv
 import hashlib
 import io
 import json
+import queue
 import re
 import tarfile
+from concurrent.futures import ALL_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Iterable, Iterator
 
-from django.db import connection
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
 from django.utils import timezone
 
 from mlcore.models import SourceIngestionRun
@@ -18,7 +20,12 @@ from mlcore.services.musicbrainz_source import CORE_ARTIFACT_NAME, MUSICBRAINZ_S
 
 BRIDGE_SOURCE_ID = 'musicbrainz-identity-bridge'
 ISRC_RE = re.compile(r'^[A-Z]{2}[A-Z0-9]{3}[0-9]{7}$')
-COPY_BATCH_SIZE = 100_000
+ISRC_BYTES_RE = re.compile(ISRC_RE.pattern.encode())
+COPY_NULL = b'\\N'
+MEMBER_READ_BYTES = 1024 * 1024
+MEMBER_QUEUE_CHUNKS = 16
+STAGING_TABLESPACE = 'juke_mlcore_cold'
+DEFAULT_BRIDGE_PARALLEL_WORKERS = 4
 
 STAGING_TABLES = (
     'mlcore_mb_recording_stage',
@@ -49,6 +56,8 @@ class MusicBrainzBridgeResult:
 def import_musicbrainz_bridge(
     manifest_path: str | Path,
     *,
+    resume: bool = True,
+    load_workers: int | None = None,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> MusicBrainzBridgeResult:
     manifest_path = Path(manifest_path)
@@ -58,6 +67,9 @@ def import_musicbrainz_bridge(
     checksum = str(artifact['sha256'])
     archive_path = Path(artifact['path'])
     _validate_archive(archive_path, checksum)
+    resumed_from_run_id, checkpoints = (
+        _resumable_member_checkpoints(source_version, checksum) if resume else ('', {})
+    )
 
     run = SourceIngestionRun.objects.create(
         source=BRIDGE_SOURCE_ID,
@@ -72,7 +84,9 @@ def import_musicbrainz_bridge(
             'phase': 'identity_bridge',
             'manifest_path': str(manifest_path),
             'staging_tables': list(STAGING_TABLES),
-            'tablespace': 'juke_mlcore_cold',
+            'tablespace': STAGING_TABLESPACE,
+            'resumed_from_run_id': resumed_from_run_id,
+            'member_checkpoints': checkpoints,
         },
     )
 
@@ -86,11 +100,19 @@ def import_musicbrainz_bridge(
         'link_rows': 0,
         'link_type_rows': 0,
     }
+    for checkpoint in checkpoints.values():
+        counters.update({key: value for key, value in checkpoint.items() if key in counters})
     try:
-        _truncate_staging_tables()
-        _load_archive(archive_path, counters, progress_callback)
+        _load_archive(
+            archive_path,
+            run,
+            counters,
+            checkpoints,
+            load_workers=load_workers or len(BRIDGE_MEMBERS),
+            progress_callback=progress_callback,
+        )
 
-        summary = _materialize_bridge(source_version)
+        summary = _materialize_bridge(source_version, parallel_workers=configured_bridge_parallel_workers())
         metadata = {
             **run.metadata,
             **counters,
@@ -137,6 +159,10 @@ def import_musicbrainz_bridge(
         raise
 
 
+def configured_bridge_parallel_workers() -> int:
+    return max(0, int(getattr(settings, 'MLCORE_MUSICBRAINZ_BRIDGE_PARALLEL_WORKERS', DEFAULT_BRIDGE_PARALLEL_WORKERS)))
+
+
 def classify_provider(url: str) -> str:
     host = url.lower()
     providers = (
@@ -200,165 +226,354 @@ def _manifest_fingerprint(manifest: dict[str, Any]) -> str:
     return hashlib.sha256(json.dumps(stable, sort_keys=True).encode()).hexdigest()
 
 
-def _truncate_staging_tables() -> None:
-    with connection.cursor() as cursor:
-        cursor.execute(f'TRUNCATE TABLE {", ".join(STAGING_TABLES)}')
+@dataclass(frozen=True)
+class _BridgeMember:
+    name: str
+    table: str
+    columns: tuple[str, ...]
+    counters: tuple[str, ...]
+    project: Callable[[list[bytes], dict[str, int]], bytes | None]
+    # (drop, create) pairs; staging indexes are dropped before COPY and rebuilt after.
+    indexes: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def archive_name(self) -> str:
+        return f'mbdump/{self.name}'
+
+
+class _IterableReader(io.RawIOBase):
+    """Readable binary stream over an iterator of byte blocks."""
+
+    def __init__(self, blocks: Iterator[bytes]):
+        self._blocks = blocks
+        self._pending = memoryview(b'')
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            block = next(self._blocks, None)
+            if block is None:
+                return 0
+            self._pending = memoryview(block)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _present(value: bytes) -> bool:
+    return bool(value) and value != COPY_NULL
+
+
+def _project_recording(row: list[bytes], counters: dict[str, int]) -> bytes | None:
+    counters['recording_rows'] += 1
+    if len(row) >= 2 and _present(row[0]) and _present(row[1]):
+        return b'%s\t%s\n' % (row[0], row[1])
+    return None
+
+
+def _project_isrc(row: list[bytes], counters: dict[str, int]) -> bytes | None:
+    counters['isrc_rows'] += 1
+    isrc = row[2].upper() if len(row) >= 3 else b''
+    if len(row) < 3 or not _present(row[1]) or not ISRC_BYTES_RE.fullmatch(isrc):
+        counters['malformed_isrc_rows'] += 1
+        return None
+    counters['valid_isrc_rows'] += 1
+    return b'%s\t%s\n' % (row[1], isrc)
 
 
-def _member_rows(extracted: Any) -> Iterator[list[str | None]]:
-    lines = (line.decode('utf-8', errors='replace') for line in extracted)
-    for row in csv.reader(lines, delimiter='\t', quoting=csv.QUOTE_NONE):
-        yield [_decode_copy_value(value) for value in row]
+def _project_url(row: list[bytes], counters: dict[str, int]) -> bytes | None:
+    counters['url_rows'] += 1
+    if len(row) >= 3 and _present(row[0]) and _present(row[2]):
+        return b'%s\t%s\n' % (row[0], row[2])
+    return None
 
 
-def _decode_copy_value(value: str) -> str | None:
-    if value == r'\N':
-        return None
-    replacements = {
-        r'\t': '\t',
-        r'\n': '\n',
-        r'\r': '\r',
-        r'\b': '\b',
-        r'\f': '\f',
-        r'\v': '\v',
-        r'\\': '\\',
-    }
-    return re.sub(r'\\(?:[tnrbfv\\])', lambda match: replacements[match.group(0)], value)
+def _project_recording_url(row: list[bytes], counters: dict[str, int]) -> bytes | None:
+    counters['url_relationship_rows'] += 1
+    if len(row) >= 4 and _present(row[1]) and _present(row[2]) and _present(row[3]):
+        return b'%s\t%s\t%s\n' % (row[1], row[2], row[3])
+    return None
 
 
-def _load_archive(
-    archive_path: Path,
-    counters: dict[str, int],
-    progress_callback: Callable[[dict[str, Any]], None] | None,
-) -> None:
-    loaders = {
-        'mbdump/recording': _load_recordings,
-        'mbdump/isrc': _load_isrcs,
-        'mbdump/url': _load_urls,
-        'mbdump/l_recording_url': _load_recording_urls,
-        'mbdump/link': _load_links,
-        'mbdump/link_type': _load_link_types,
-    }
-    loaded: set[str] = set()
-    with tarfile.open(archive_path, mode='r|bz2') as archive:
-        for member in archive:
-            name = member.name.removeprefix('./')
-            loader = loaders.get(name)
-            if loader is None or not member.isfile():
-                continue
-            extracted = archive.extractfile(member)
-            if extracted is None:
-                raise ValueError(f'Unable to read MusicBrainz member: {name}')
-            loader(extracted, counters)
-            loaded.add(name)
-            _report(progress_callback, name.removeprefix('mbdump/'), counters)
-    missing = sorted(set(loaders) - loaded)
-    if missing:
-        raise ValueError(f'MusicBrainz archive is missing bridge members: {", ".join(missing)}')
+def _project_link(row: list[bytes], counters: dict[str, int]) -> bytes | None:
+    counters['link_rows'] += 1
+    if len(row) >= 2 and _present(row[0]) and _present(row[1]):
+        return b'%s\t%s\n' % (row[0], row[1])
+    return None
 
 
-def _load_recordings(extracted: Any, counters: dict[str, int]) -> None:
-    def rows() -> Iterator[tuple[Any, ...]]:
-        for row in _member_rows(extracted):
-            counters['recording_rows'] += 1
-            if len(row) >= 2 and row[0] and row[1]:
-                yield row[0], row[1]
+def _project_link_type(row: list[bytes], counters: dict[str, int]) -> bytes | None:
+    counters['link_type_rows'] += 1
+    if len(row) >= 7 and all(_present(row[index]) for index in (0, 4, 5, 6)):
+        return b'%s\t%s\t%s\t%s\n' % (row[0], row[4], row[5], row[6])
+    return None
 
-    _copy_rows('mlcore_mb_recording_stage', ('recording_id', 'recording_mbid'), rows())
 
+def _primary_key(table: str, column: str) -> tuple[str, str]:
+    return (
+        f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_pkey',
+        f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({column}) '
+        f'USING INDEX TABLESPACE {STAGING_TABLESPACE}',
+    )
 
-def _load_isrcs(extracted: Any, counters: dict[str, int]) -> None:
-    def rows() -> Iterator[tuple[Any, ...]]:
-        for row in _member_rows(extracted):
-            counters['isrc_rows'] += 1
-            isrc = str(row[2]).upper() if len(row) >= 3 and row[2] else ''
-            if len(row) < 3 or not row[1] or not ISRC_RE.fullmatch(isrc):
-                counters['malformed_isrc_rows'] += 1
-                continue
-            counters['valid_isrc_rows'] += 1
-            yield row[1], isrc
 
-    _copy_rows('mlcore_mb_isrc_stage', ('recording_id', 'isrc'), rows())
+def _index(name: str, table: str, column: str) -> tuple[str, str]:
+    return (
+        f'DROP INDEX IF EXISTS {name}',
+        f'CREATE INDEX {name} ON {table} ({column}) TABLESPACE {STAGING_TABLESPACE}',
+    )
 
 
-def _load_urls(extracted: Any, counters: dict[str, int]) -> None:
-    def rows() -> Iterator[tuple[Any, ...]]:
-        for row in _member_rows(extracted):
-            counters['url_rows'] += 1
-            if len(row) >= 3 and row[0] and row[2]:
-                yield row[0], row[2]
+BRIDGE_MEMBERS = (
+    _BridgeMember(
+        name='recording',
+        table='mlcore_mb_recording_stage',
+        columns=('recording_id', 'recording_mbid'),
+        counters=('recording_rows',),
+        project=_project_recording,
+        indexes=(_primary_key('mlcore_mb_recording_stage', 'recording_id'),),
+    ),
+    _BridgeMember(
+        name='isrc',
+        table='mlcore_mb_isrc_stage',
+        columns=('recording_id', 'isrc'),
+        counters=('isrc_rows', 'valid_isrc_rows', 'malformed_isrc_rows'),
+        project=_project_isrc,
+        indexes=(_index('mlcore_mb_isrc_stage_recording_idx', 'mlcore_mb_isrc_stage', 'recording_id'),),
+    ),
+    _BridgeMember(
+        name='url',
+        table='mlcore_mb_url_stage',
+        columns=('url_id', 'url'),
+        counters=('url_rows',),
+        project=_project_url,
+        indexes=(_primary_key('mlcore_mb_url_stage', 'url_id'),),
+    ),
+    _BridgeMember(
+        name='l_recording_url',
+        table='mlcore_mb_recording_url_stage',
+        columns=('link_id', 'recording_id', 'url_id'),
+        counters=('url_relationship_rows',),
+        project=_project_recording_url,
+        indexes=(
+            _index('mlcore_mb_recording_url_stage_recording_idx', 'mlcore_mb_recording_url_stage', 'recording_id'),
+            _index('mlcore_mb_recording_url_stage_url_idx', 'mlcore_mb_recording_url_stage', 'url_id'),
+            _index('mlcore_mb_recording_url_stage_link_idx', 'mlcore_mb_recording_url_stage', 'link_id'),
+        ),
+    ),
+    _BridgeMember(
+        name='link',
+        table='mlcore_mb_link_stage',
+        columns=('link_id', 'link_type_id'),
+        counters=('link_rows',),
+        project=_project_link,
+        indexes=(_primary_key('mlcore_mb_link_stage', 'link_id'),),
+    ),
+    _BridgeMember(
+        name='link_type',
+        table='mlcore_mb_link_type_stage',
+        columns=('link_type_id', 'entity_type0', 'entity_type1', 'name'),
+        counters=('link_type_rows',),
+        project=_project_link_type,
+        indexes=(_primary_key('mlcore_mb_link_type_stage', 'link_type_id'),),
+    ),
+)
 
-    _copy_rows('mlcore_mb_url_stage', ('url_id', 'url'), rows())
 
+def _resumable_member_checkpoints(source_version: str, checksum: str) -> tuple[str, dict[str, dict[str, int]]]:
+    """
+    Return the failed run and member checkpoints whose staged rows are still
+    in place. Only the latest bridge run qualifies, since any later run
+    truncates the shared staging tables; a checkpoint whose table no longer
+    holds the recorded row count (e.g. UNLOGGED tables reset after a crash)
+    is dropped so the member reloads.
+    """
+    latest = SourceIngestionRun.objects.filter(source=BRIDGE_SOURCE_ID).order_by('-started_at').first()
+    if (
+        latest is None
+        or latest.status != 'failed'
+        or latest.source_version != source_version
+        or latest.checksum != checksum
+    ):
+        return '', {}
+    saved = latest.metadata.get('member_checkpoints') or {}
+    checkpoints: dict[str, dict[str, int]] = {}
+    with connection.cursor() as cursor:
+        for member in BRIDGE_MEMBERS:
+            checkpoint = saved.get(member.name)
+            if not checkpoint:
+                continue
+            cursor.execute(f'SELECT COUNT(*) FROM {member.table}')
+            if cursor.fetchone()[0] == int(checkpoint.get('staged_rows', -1)):
+                checkpoints[member.name] = {key: int(value) for key, value in checkpoint.items()}
+    return (str(latest.pk) if checkpoints else ''), checkpoints
 
-def _load_recording_urls(extracted: Any, counters: dict[str, int]) -> None:
-    def rows() -> Iterator[tuple[Any, ...]]:
-        for row in _member_rows(extracted):
-            counters['url_relationship_rows'] += 1
-            if len(row) >= 4 and row[1] and row[2] and row[3]:
-                yield row[1], row[2], row[3]
 
-    _copy_rows(
-        'mlcore_mb_recording_url_stage',
-        ('link_id', 'recording_id', 'url_id'),
-        rows(),
-    )
+def _load_archive(
+    archive_path: Path,
+    run: SourceIngestionRun,
+    counters: dict[str, int],
+    checkpoints: dict[str, dict[str, int]],
+    *,
+    load_workers: int,
+    progress_callback: Callable[[dict[str, Any]], None] | None,
+) -> None:
+    """
+    Stream the archive once, handing each bridge member to its own loader
+    connection. The tar stream is read sequentially, so members overlap in
+    their COPY tail, index builds, and ANALYZE rather than in decompression.
+    Each finished member is checkpointed on the run so a failed import only
+    reloads the members that did not finish.
+    """
+    members = {member.archive_name: member for member in BRIDGE_MEMBERS}
+    seen: set[str] = set(f'mbdump/{name}' for name in checkpoints)
+    pending: dict[Future, _BridgeMember] = {}
+    failures: list[BaseException] = []
+
+    def checkpoint_finished(*, block: bool) -> None:
+        finished = wait(list(pending), return_when=ALL_COMPLETED)[0] if block else [f for f in pending if f.done()]
+        for future in finished:
+            member = pending.pop(future)
+            if future.exception() is not None:
+                failures.append(future.exception())
+                continue
+            _record_member_checkpoint(run, member, future.result(), counters)
+            _report(progress_callback, member.name, counters)
+
+    with ThreadPoolExecutor(max_workers=max(1, load_workers)) as executor:
+        try:
+            with tarfile.open(archive_path, mode='r|bz2') as archive:
+                for tar_member in archive:
+                    name = tar_member.name.removeprefix('./')
+                    member = members.get(name)
+                    if member is None or not tar_member.isfile() or name in seen:
+                        continue
+                    extracted = archive.extractfile(tar_member)
+                    if extracted is None:
+                        raise ValueError(f'Unable to read MusicBrainz member: {name}')
+                    seen.add(name)
+                    chunks: queue.Queue = queue.Queue(maxsize=MEMBER_QUEUE_CHUNKS)
+                    future = executor.submit(_load_member_lane, member, chunks)
+                    pending[future] = member
+                    try:
+                        while chunk := extracted.read(MEMBER_READ_BYTES):
+                            _feed_member(chunks, chunk, future)
+                    except BaseException as exc:
+                        _feed_member(chunks, exc, future)
+                        raise
+                    _feed_member(chunks, None, future)
+                    checkpoint_finished(block=False)
+        finally:
+            checkpoint_finished(block=True)
+    if failures:
+        raise failures[0]
+    missing = sorted(set(members) - seen)
+    if missing:
+        raise ValueError(f'MusicBrainz archive is missing bridge members: {", ".join(missing)}')
 
 
-def _load_links(extracted: Any, counters: dict[str, int]) -> None:
-    def rows() -> Iterator[tuple[Any, ...]]:
-        for row in _member_rows(extracted):
-            counters['link_rows'] += 1
-            if len(row) >= 2 and row[0] and row[1]:
-                yield row[0], row[1]
+def _feed_member(chunks: queue.Queue, item: bytes | BaseException | None, future: Future) -> None:
+    while True:
+        try:
+            chunks.put(item, timeout=1)
+            return
+        except queue.Full:
+            if future.done():
+                # The loader stopped reading; surface its error instead of blocking.
+                future.result()
+                if item is not None and not isinstance(item, BaseException):
+                    raise RuntimeError('MusicBrainz member loader exited before the member was fully read') from None
+                return
 
-    _copy_rows('mlcore_mb_link_stage', ('link_id', 'link_type_id'), rows())
 
+def _queued_chunks(chunks: queue.Queue) -> Iterator[bytes]:
+    while (chunk := chunks.get()) is not None:
+        if isinstance(chunk, BaseException):
+            raise chunk
+        yield chunk
 
-def _load_link_types(extracted: Any, counters: dict[str, int]) -> None:
-    def rows() -> Iterator[tuple[Any, ...]]:
-        for row in _member_rows(extracted):
-            counters['link_type_rows'] += 1
-            if len(row) >= 7 and row[0] and row[4] and row[5] and row[6]:
-                yield row[0], row[4], row[5], row[6]
 
-    _copy_rows(
-        'mlcore_mb_link_type_stage',
-        ('link_type_id', 'entity_type0', 'entity_type1', 'name'),
-        rows(),
-    )
+def _load_member_lane(member: _BridgeMember, chunks: queue.Queue) -> dict[str, int]:
+    close_old_connections()
+    try:
+        return _load_member(member, _queued_chunks(chunks))
+    finally:
+        close_old_connections()
 
 
-def _copy_rows(table: str, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]) -> None:
-    buffer = io.StringIO()
-    writer = csv.writer(buffer, lineterminator='\n')
-    buffered = 0
-    for row in rows:
-        writer.writerow(row)
-        buffered += 1
-        if buffered >= COPY_BATCH_SIZE:
-            _copy_buffer(table, columns, buffer)
-            buffer = io.StringIO()
-            writer = csv.writer(buffer, lineterminator='\n')
-            buffered = 0
-    if buffered:
-        _copy_buffer(table, columns, buffer)
-
-
-def _copy_buffer(table: str, columns: tuple[str, ...], buffer: io.StringIO) -> None:
-    buffer.seek(0)
-    sql = f'COPY {table} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)'
-    connection.ensure_connection()
+def _load_member(member: _BridgeMember, chunks: Iterator[bytes]) -> dict[str, int]:
+    member_counters = {key: 0 for key in (*member.counters, 'staged_rows')}
+    lines = io.BufferedReader(_IterableReader(chunks), buffer_size=MEMBER_READ_BYTES)
     with connection.cursor() as cursor:
-        raw_cursor = getattr(cursor, 'cursor', cursor)
-        if hasattr(raw_cursor, 'copy_expert'):
-            raw_cursor.copy_expert(sql, buffer)
-            return
-    raise RuntimeError('MusicBrainz bridge import requires PostgreSQL COPY support')
+        cursor.execute(f'TRUNCATE TABLE {member.table}')
+        for drop_sql, _ in member.indexes:
+            cursor.execute(drop_sql)
+        _copy_stream(cursor, member.table, member.columns, _projected_blocks(lines, member, member_counters))
+        for _, create_sql in member.indexes:
+            cursor.execute(create_sql)
+        cursor.execute(f'ANALYZE {member.table}')
+    return member_counters
+
+
+def _projected_blocks(lines: Iterable[bytes], member: _BridgeMember, counters: dict[str, int]) -> Iterator[bytes]:
+    """
+    Project dump lines onto the staging columns. Dump members are already in
+    COPY text format, so selected fields are passed through still escaped.
+    """
+    block: list[bytes] = []
+    block_bytes = 0
+    for line in lines:
+        projected = member.project(line.rstrip(b'\n').split(b'\t'), counters)
+        if projected is None:
+            continue
+        counters['staged_rows'] += 1
+        block.append(projected)
+        block_bytes += len(projected)
+        if block_bytes >= MEMBER_READ_BYTES:
+            yield b''.join(block)
+            block = []
+            block_bytes = 0
+    if block:
+        yield b''.join(block)
+
+
+def _copy_stream(cursor, table: str, columns: tuple[str, ...], blocks: Iterator[bytes]) -> None:
+    sql = f'COPY {table} ({", ".join(columns)}) FROM STDIN'
+    raw_cursor = getattr(cursor, 'cursor', cursor)
+    if not hasattr(raw_cursor, 'copy_expert'):
+        raise RuntimeError('MusicBrainz bridge import requires PostgreSQL COPY support')
+    raw_cursor.copy_expert(sql, _IterableReader(blocks), size=MEMBER_READ_BYTES)
+
+
+def _record_member_checkpoint(
+    run: SourceIngestionRun,
+    member: _BridgeMember,
+    member_counters: dict[str, int],
+    counters: dict[str, int],
+) -> None:
+    for key in member.counters:
+        counters[key] = member_counters[key]
+    run.metadata = {
+        **run.metadata,
+        'member_checkpoints': {
+            **run.metadata.get('member_checkpoints', {}),
+            member.name: member_counters,
+        },
+    }
+    run.save(update_fields=['metadata'])
 
 
-def _materialize_bridge(source_version: str) -> dict[str, int]:
-    with connection.cursor() as cursor:
+def _materialize_bridge(source_version: str, *, parallel_workers: int = DEFAULT_BRIDGE_PARALLEL_WORKERS) -> dict[str, int]:
+    """
+    Join the staging tables into the bridge tables. INSERT ... SELECT never
+    runs a parallel plan, so the joins land in temporary tables through
+    CREATE TABLE AS, which can, and the inserts read from those.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute('SET LOCAL max_parallel_workers_per_gather = %s', [parallel_workers])
         cursor.execute('''
             SELECT COUNT(*) - COUNT(DISTINCT (recording_id, isrc))
             FROM mlcore_mb_isrc_stage
@@ -366,18 +581,19 @@ def _materialize_bridge(source_version: str) -> dict[str, int]:
         duplicate_isrc_rows = cursor.fetchone()[0]
 
         cursor.execute('''
-            SELECT COUNT(DISTINCT r.recording_mbid)
+            CREATE TEMPORARY TABLE mlcore_mb_isrc_bridge_rows AS
+            SELECT DISTINCT r.recording_mbid, i.isrc
             FROM mlcore_mb_isrc_stage i
             JOIN mlcore_mb_recording_stage r ON r.recording_id = i.recording_id
         ''')
+        cursor.execute('SELECT COUNT(DISTINCT recording_mbid) FROM mlcore_mb_isrc_bridge_rows')
         unique_recordings_with_isrc = cursor.fetchone()[0]
 
         cursor.execute('''
             INSERT INTO mlcore_musicbrainz_recording_isrc
                 (recording_mbid, isrc, source_version, created_at)
-            SELECT DISTINCT r.recording_mbid, i.isrc, %s, NOW()
-            FROM mlcore_mb_isrc_stage i
-            JOIN mlcore_mb_recording_stage r ON r.recording_id = i.recording_id
+            SELECT recording_mbid, isrc, %s, NOW()
+            FROM mlcore_mb_isrc_bridge_rows
             ON CONFLICT (recording_mbid, isrc, source_version) DO NOTHING
         ''', [source_version])
         inserted_isrc_rows = max(cursor.rowcount, 0)
@@ -393,39 +609,44 @@ def _materialize_bridge(source_version: str) -> dict[str, int]:
         extracted_url_rows = cursor.fetchone()[0]
 
         cursor.execute('''
-            INSERT INTO mlcore_musicbrainz_recording_url
-                (recording_mbid, url, url_fingerprint, provider, link_type_id,
-                 link_type_name, source_version, created_at)
+            CREATE TEMPORARY TABLE mlcore_mb_url_bridge_rows AS
             SELECT DISTINCT ON (r.recording_mbid, md5(u.url))
                 r.recording_mbid,
                 u.url,
-                md5(u.url),
+                md5(u.url) AS url_fingerprint,
                 CASE
-                    WHEN lower(u.url) LIKE '%%open.spotify.com/%%'
-                      OR lower(u.url) LIKE '%%spotify.com/track/%%' THEN 'spotify'
-                    WHEN lower(u.url) LIKE '%%music.apple.com/%%'
-                      OR lower(u.url) LIKE '%%itunes.apple.com/%%' THEN 'apple_music'
-                    WHEN lower(u.url) LIKE '%%youtube.com/%%'
-                      OR lower(u.url) LIKE '%%youtu.be/%%' THEN 'youtube'
-                    WHEN lower(u.url) LIKE '%%soundcloud.com/%%' THEN 'soundcloud'
-                    WHEN lower(u.url) LIKE '%%bandcamp.com/%%' THEN 'bandcamp'
-                    WHEN lower(u.url) LIKE '%%deezer.com/%%' THEN 'deezer'
-                    WHEN lower(u.url) LIKE '%%tidal.com/%%' THEN 'tidal'
+                    WHEN lower(u.url) LIKE '%open.spotify.com/%'
+                      OR lower(u.url) LIKE '%spotify.com/track/%' THEN 'spotify'
+                    WHEN lower(u.url) LIKE '%music.apple.com/%'
+                      OR lower(u.url) LIKE '%itunes.apple.com/%' THEN 'apple_music'
+                    WHEN lower(u.url) LIKE '%youtube.com/%'
+                      OR lower(u.url) LIKE '%youtu.be/%' THEN 'youtube'
+                    WHEN lower(u.url) LIKE '%soundcloud.com/%' THEN 'soundcloud'
+                    WHEN lower(u.url) LIKE '%bandcamp.com/%' THEN 'bandcamp'
+                    WHEN lower(u.url) LIKE '%deezer.com/%' THEN 'deezer'
+                    WHEN lower(u.url) LIKE '%tidal.com/%' THEN 'tidal'
                     ELSE 'other'
-                END,
+                END AS provider,
                 lt.link_type_id,
-                lt.name,
-                %s,
-                NOW()
+                lt.name AS link_type_name
             FROM mlcore_mb_recording_url_stage ru
             JOIN mlcore_mb_recording_stage r ON r.recording_id = ru.recording_id
             JOIN mlcore_mb_url_stage u ON u.url_id = ru.url_id
             JOIN mlcore_mb_link_stage l ON l.link_id = ru.link_id
             JOIN mlcore_mb_link_type_stage lt ON lt.link_type_id = l.link_type_id
             ORDER BY r.recording_mbid, md5(u.url), lt.link_type_id
+        ''')
+        cursor.execute('''
+            INSERT INTO mlcore_musicbrainz_recording_url
+                (recording_mbid, url, url_fingerprint, provider, link_type_id,
+                 link_type_name, source_version, created_at)
+            SELECT recording_mbid, url, url_fingerprint, provider, link_type_id,
+                   link_type_name, %s, NOW()
+            FROM mlcore_mb_url_bridge_rows
             ON CONFLICT (recording_mbid, url_fingerprint, source_version) DO NOTHING
         ''', [source_version])
         inserted_url_rows = max(cursor.rowcount, 0)
+        cursor.execute('DROP TABLE mlcore_mb_isrc_bridge_rows, mlcore_mb_url_bridge_rows')
 
     return {
         'duplicate_isrc_rows': duplicate_isrc_rows,
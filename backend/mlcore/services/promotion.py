@@ -2,7 +2,8 @@
 Promotion gate enforcement + manual approval workflow (arch §9 Phase 1).
 
 A candidate ranker may be promoted over a baseline only if it clears all four
-gates AND a staff user explicitly approves. Gates read from ModelEvaluation;
+quality gates (plus the serving-latency gate when engine-backed evaluations
+exist) AND a staff user explicitly approves. Gates read from ModelEvaluation;
 decisions are recorded in ModelPromotion with full gate-result provenance.
 
 Gate thresholds live in settings (JUKE_PROMOTION_GATE_*) so they can be tuned
@@ -25,12 +26,17 @@ from typing import Callable
 from django.conf import settings
 from django.utils import timezone
 
-from mlcore.models import ModelEvaluation, ModelPromotion
+from mlcore.models import ModelEvaluation, ModelPromotion, SequentialGateDecision
 from mlcore.services.evaluation import (
     METRIC_COLD_RECALL,
     METRIC_COVERAGE,
+    METRIC_LATENCY_P95,
     METRIC_NDCG,
     METRIC_RECALL,
+    SEQUENTIAL_MAX_REGRESSION,
+    SEQUENTIAL_RELATIVE_LIFT,
+    SERVING_METRICS,
+    SequentialGate,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,6 +54,9 @@ class GateCheck:
     baseline_value: float | None
     threshold: float
     message: str
+    # [lower, upper] error bars from the evaluation rows, when recorded.
+    candidate_interval: list[float] | None = None
+    baseline_interval: list[float] | None = None
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -55,17 +64,40 @@ class GateCheck:
 
 # --- metric fetching ---
 
-def _latest_metric(label: str, metric_name: str, dataset_hash: str) -> float | None:
-    """Most recent ModelEvaluation.metric_value for this (label, metric, dataset)."""
-    row = (
+def _latest_metric_row(label: str, metric_name: str, dataset_hash: str) -> ModelEvaluation | None:
+    return (
         ModelEvaluation.objects
         .filter(candidate_label=label, metric_name=metric_name, dataset_hash=dataset_hash)
         .order_by('-created_at')
         .first()
     )
+
+
+def _latest_metric(label: str, metric_name: str, dataset_hash: str) -> float | None:
+    """Most recent ModelEvaluation.metric_value for this (label, metric, dataset)."""
+    row = _latest_metric_row(label, metric_name, dataset_hash)
     return row.metric_value if row else None
 
 
+def _latest_metric_interval(label: str, metric_name: str, dataset_hash: str) -> list[float] | None:
+    """[ci_lower, ci_upper] of the most recent row, or None when no interval was stored."""
+    row = _latest_metric_row(label, metric_name, dataset_hash)
+    if row is None or row.ci_lower is None or row.ci_upper is None:
+        return None
+    return [row.ci_lower, row.ci_upper]
+
+
+def _interval_note(cand_interval: list[float] | None, base_interval: list[float] | None) -> str:
+    if cand_interval is None or base_interval is None:
+        return ''
+    overlap = cand_interval[0] <= base_interval[1] and base_interval[0] <= cand_interval[1]
+    return (
+        f" ci cand=[{cand_interval[0]:.4f}, {cand_interval[1]:.4f}]"
+        f" base=[{base_interval[0]:.4f}, {base_interval[1]:.4f}]"
+        f"{' (overlapping)' if overlap else ''}"
+    )
+
+
 def _latest_shared_dataset_hash(candidate_label: str, baseline_label: str) -> str | None:
     """
     Most recent dataset_hash that BOTH labels have been evaluated on.
@@ -111,8 +143,13 @@ def _check_relative_lift(
         lift = (cand - base) / base
         passed = lift >= min_lift
         lift_s = f"{lift:+.4f}"
-    msg = f"{metric}: cand={cand:.4f} base={base:.4f} lift={lift_s} (need >= {min_lift:+.4f})"
-    return GateCheck(name, passed, cand, base, min_lift, msg)
+    cand_interval = _latest_metric_interval(cand_label, metric, dataset_hash)
+    base_interval = _latest_metric_interval(base_label, metric, dataset_hash)
+    msg = (
+        f"{metric}: cand={cand:.4f} base={base:.4f} lift={lift_s} (need >= {min_lift:+.4f})"
+        f"{_interval_note(cand_interval, base_interval)}"
+    )
+    return GateCheck(name, passed, cand, base, min_lift, msg, cand_interval, base_interval)
 
 
 def _check_max_regression(
@@ -127,8 +164,13 @@ def _check_max_regression(
                          f"no {metric} recorded for '{missing}' on dataset {dataset_hash[:12]}")
     regression = base - cand  # positive = candidate got worse
     passed = regression <= max_regression
-    msg = f"{metric}: cand={cand:.4f} base={base:.4f} regression={regression:+.4f} (max {max_regression:.4f})"
-    return GateCheck(name, passed, cand, base, max_regression, msg)
+    cand_interval = _latest_metric_interval(cand_label, metric, dataset_hash)
+    base_interval = _latest_metric_interval(base_label, metric, dataset_hash)
+    msg = (
+        f"{metric}: cand={cand:.4f} base={base:.4f} regression={regression:+.4f} (max {max_regression:.4f})"
+        f"{_interval_note(cand_interval, base_interval)}"
+    )
+    return GateCheck(name, passed, cand, base, max_regression, msg, cand_interval, base_interval)
 
 
 def _check_absolute_floor(
@@ -144,6 +186,65 @@ def _check_absolute_floor(
     return GateCheck(name, passed, cand, None, floor, msg)
 
 
+def _check_max_relative_increase(
+    name: str, metric: str, cand_label: str, base_label: str,
+    dataset_hash: str, max_increase: float,
+) -> GateCheck:
+    """For lower-is-better metrics (latency): candidate may exceed baseline by at most max_increase."""
+    cand = _latest_metric(cand_label, metric, dataset_hash)
+    base = _latest_metric(base_label, metric, dataset_hash)
+    if cand is None or base is None:
+        missing = cand_label if cand is None else base_label
+        return GateCheck(name, False, cand, base, max_increase,
+                         f"no {metric} recorded for '{missing}' on dataset {dataset_hash[:12]}")
+    if base == 0.0:
+        passed = cand == 0.0
+        increase_s = '0.0' if passed else 'inf'
+    else:
+        increase = (cand - base) / base
+        passed = increase <= max_increase
+        increase_s = f"{increase:+.4f}"
+    msg = f"{metric}: cand={cand:.2f} base={base:.2f} increase={increase_s} (max {max_increase:+.4f})"
+    return GateCheck(name, passed, cand, base, max_increase, msg)
+
+
+def _latest_sequential_decision(
+    name: str, cand_label: str, base_label: str, dataset_hash: str,
+) -> SequentialGateDecision | None:
+    return (
+        SequentialGateDecision.objects
+        .filter(candidate_label=cand_label, baseline_label=base_label, dataset_hash=dataset_hash, gate_name=name)
+        .order_by('-created_at')
+        .first()
+    )
+
+
+def _check_sequential_decision(decision: SequentialGateDecision, cand_label: str, base_label: str) -> GateCheck:
+    """A gate decided by evaluate_sequential_pair; undecided counts as failed."""
+    outcome = {True: 'passed', False: 'failed', None: 'undecided'}[decision.passed]
+    msg = (
+        f"{decision.metric_name}: sequential {outcome} margin={decision.margin:+.4f} "
+        f"ci=[{decision.margin_lower:+.4f}, {decision.margin_upper:+.4f}] z={decision.critical_z:.3f} "
+        f"after {decision.trials_scored}/{decision.dataset_n_trials} trials"
+    )
+    return GateCheck(
+        decision.gate_name,
+        decision.passed is True,
+        _latest_metric(cand_label, decision.metric_name, decision.dataset_hash),
+        _latest_metric(base_label, decision.metric_name, decision.dataset_hash),
+        decision.threshold,
+        msg,
+    )
+
+
+def _has_serving_metrics(cand_label: str, base_label: str, dataset_hash: str) -> bool:
+    return ModelEvaluation.objects.filter(
+        candidate_label__in=[cand_label, base_label],
+        dataset_hash=dataset_hash,
+        metric_name__in=SERVING_METRICS,
+    ).exists()
+
+
 # Gate registry — declarative so Phase 2+ can add rows without touching the driver.
 _GATES: list[tuple[str, Callable[[str, str, str], GateCheck]]] = [
     ('ndcg_lift', lambda c, b, h: _check_relative_lift(
@@ -157,10 +258,52 @@ _GATES: list[tuple[str, Callable[[str, str, str], GateCheck]]] = [
         'coverage_floor', METRIC_COVERAGE, c, h, settings.JUKE_PROMOTION_GATE_COVERAGE_MIN)),
 ]
 
+# Serving gates only apply once either side has an engine-backed evaluation
+# on the dataset; ORM-mirror evaluations record no latency.
+_SERVING_GATES: list[tuple[str, Callable[[str, str, str], GateCheck]]] = [
+    ('latency_p95_regression', lambda c, b, h: _check_max_relative_increase(
+        'latency_p95_regression', METRIC_LATENCY_P95, c, b, h,
+        settings.JUKE_PROMOTION_GATE_LATENCY_P95_MAX_INCREASE)),
+]
+
+
+def sequential_promotion_gates() -> list[SequentialGate]:
+    """
+    The paired gates evaluate_sequential_pair can decide early — the lift and
+    cold-start regression gates above, at the same thresholds. The coverage
+    floor and serving gates are catalog/run-level and only apply to the
+    persisted rows.
+    """
+    return [
+        SequentialGate('ndcg_lift', METRIC_NDCG, SEQUENTIAL_RELATIVE_LIFT, settings.JUKE_PROMOTION_GATE_NDCG_MIN_LIFT),
+        SequentialGate('recall_lift', METRIC_RECALL, SEQUENTIAL_RELATIVE_LIFT, settings.JUKE_PROMOTION_GATE_RECALL_MIN_LIFT),
+        SequentialGate(
+            'cold_start_regression', METRIC_COLD_RECALL, SEQUENTIAL_MAX_REGRESSION,
+            settings.JUKE_PROMOTION_GATE_COLDSTART_MAX_REGRESSION,
+        ),
+    ]
+
 
 def check_promotion_gates(candidate_label: str, baseline_label: str, dataset_hash: str) -> list[GateCheck]:
-    """Run all four gates. Returns every result — callers decide what to do with failures."""
-    return [fn(candidate_label, baseline_label, dataset_hash) for _, fn in _GATES]
+    """
+    Run the four quality gates, plus the serving gates when latency was
+    recorded. Returns every result — callers decide what to do with failures.
+
+    A gate with a stored sequential decision for this pair and dataset uses
+    that decision rather than the point estimates. The one exception is a
+    gate left undecided after every trial was scored, which falls back to the
+    point estimates exactly as a full evaluation would.
+    """
+    checks = []
+    for name, fn in _GATES:
+        decision = _latest_sequential_decision(name, candidate_label, baseline_label, dataset_hash)
+        if decision is not None and (decision.passed is not None or decision.trials_scored < decision.dataset_n_trials):
+            checks.append(_check_sequential_decision(decision, candidate_label, baseline_label))
+        else:
+            checks.append(fn(candidate_label, baseline_label, dataset_hash))
+    if _has_serving_metrics(candidate_label, baseline_label, dataset_hash):
+        checks.extend(fn(candidate_label, baseline_label, dataset_hash) for _, fn in _SERVING_GATES)
+    return checks
 
 
 def gates_passed(checks: list[GateCheck]) -> bool:
@@ -1,24 +1,29 @@
 import base64
+import queue
 import random
 import socket
+import threading
 import time
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from django.conf import settings
-from django.db import connection, transaction
+from django.db import close_old_connections, connection, transaction
 from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
-from mlcore.models import CanonicalItemAlias, ProviderHydrationItem
+from mlcore.models import CanonicalItemAlias, ProviderHydrationItem, ProviderRateLimitBucket
 
 
 SPOTIFY_TOKEN_URL = 'https://accounts.spotify.com/api/token'
 SPOTIFY_SEARCH_URL = 'https://api.spotify.com/v1/search'
-SPOTIFY_WORKER_LOCK_ID = 0x4A554B4553504F54
 TERMINAL_STATUSES = {'matched', 'no_match', 'ambiguous', 'dead'}
+RATE_RECOVERY_GRANTS = 300
+RATE_RECOVERY_STEP_RPS = 0.1
+MIN_RATE_LIMITED_RPS = 0.1
 
 
 class ProviderHydrationError(Exception):
@@ -56,19 +61,30 @@ def normalize_isrc(value):
 
 
 class SpotifyClient:
-    def __init__(self, client_id, client_secret, *, session=None, timeout=None):
+    def __init__(self, client_id, client_secret, *, session=None, timeout=None, pool_size=None):
         if not client_id or not client_secret:
             raise ValueError('Spotify client credentials are required.')
         self.client_id = client_id
         self.client_secret = client_secret
-        self.session = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            if pool_size:
+                # One pooled connection per concurrent hydration lane.
+                session.mount('https://', HTTPAdapter(pool_maxsize=pool_size))
+        self.session = session
         self.timeout = timeout or settings.SPOTIFY_HYDRATION_REQUEST_TIMEOUT_SECONDS
         self._token = None
         self._token_expires_at = 0.0
+        self._token_lock = threading.Lock()
 
-    def _access_token(self, *, force=False):
-        if not force and self._token and time.monotonic() < self._token_expires_at - 60:
-            return self._token
+    def _access_token(self, *, rejected=None):
+        # Lanes share one token; only the first lane to see it rejected or stale refreshes it.
+        with self._token_lock:
+            if self._token and self._token != rejected and time.monotonic() < self._token_expires_at - 60:
+                return self._token
+            return self._refresh_token()
+
+    def _refresh_token(self):
         credentials = base64.b64encode(f'{self.client_id}:{self.client_secret}'.encode()).decode()
         try:
             response = self.session.post(
@@ -92,9 +108,9 @@ class SpotifyClient:
 
     def search_isrc(self, isrc):
         normalized = normalize_isrc(isrc)
-        response = self._search(normalized)
+        response, token = self._search(normalized)
         if response.status_code == 401:
-            response = self._search(normalized, force_token=True)
+            response, _token = self._search(normalized, rejected_token=token)
         if response.status_code == 429:
             retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
             raise ProviderHydrationError(
@@ -116,49 +132,176 @@ class SpotifyClient:
         items = response.json().get('tracks', {}).get('items', [])
         return [candidate for item in items if (candidate := _candidate_from_item(item, normalized))]
 
-    def _search(self, isrc, *, force_token=False):
+    def _search(self, isrc, *, rejected_token=None):
+        token = self._access_token(rejected=rejected_token)
         try:
-            return self.session.get(
+            response = self.session.get(
                 SPOTIFY_SEARCH_URL,
-                headers={'Authorization': f'Bearer {self._access_token(force=force_token)}'},
+                headers={'Authorization': f'Bearer {token}'},
                 params={'q': f'isrc:{isrc}', 'type': 'track', 'limit': 10},
                 timeout=self.timeout,
             )
+            return response, token
         except requests.RequestException as exc:
             raise ProviderHydrationError(f'Spotify search failed: {exc}') from exc
 
 
-class RequestPacer:
-    """Single-worker global pacing with additive recovery and multiplicative decrease."""
+class ProviderTokenBucket:
+    """
+    Global pacing for every hydration worker of one provider, backed by the
+    provider's row in mlcore_provider_rate_limit_bucket.
+
+    Each grant is one atomic UPDATE of that row, so concurrent lanes and
+    processes share a single rate. A 429 halves the refill rate (once per
+    limit event: lanes reporting while the bucket is already blocked leave it
+    alone) and blocks all workers until its Retry-After passes; every
+    RATE_RECOVERY_GRANTS grants then add RATE_RECOVERY_STEP_RPS back, up to
+    the configured rate.
+    """
 
-    def __init__(self, rps, *, sleep=time.sleep, monotonic=time.monotonic, jitter=random.uniform):
+    def __init__(self, provider, *, rps, burst=None, sleep=time.sleep, jitter=random.uniform):
         if rps <= 0:
             raise ValueError('rps must be greater than zero')
+        self.provider = provider
         self.configured_rps = float(rps)
-        self.current_rps = float(rps)
+        self.capacity = max(1.0, float(burst if burst is not None else rps))
         self.sleep = sleep
-        self.monotonic = monotonic
         self.jitter = jitter
-        self._next_request_at = 0.0
-        self._successes_since_limit = 0
 
-    def wait(self):
-        now = self.monotonic()
-        if self._next_request_at > now:
-            self.sleep(self._next_request_at - now)
-        self._next_request_at = self.monotonic() + (1.0 / self.current_rps)
+    def ensure(self):
+        """
+        Create the bucket at this configured rate and burst if it does not exist
+        yet. An existing bucket is shared by every worker and is left as it is;
+        this instance adopts its rate and burst. Use reconfigure() to change them.
+        """
+        bucket, created = ProviderRateLimitBucket.objects.get_or_create(
+            provider=self.provider,
+            defaults={
+                'configured_rps': self.configured_rps,
+                'current_rps': self.configured_rps,
+                'capacity': self.capacity,
+                'tokens': self.capacity,
+                'refilled_at': timezone.now(),
+            },
+        )
+        if not created:
+            self.configured_rps = bucket.configured_rps
+            self.capacity = bucket.capacity
+        return self
 
-    def success(self):
-        self._successes_since_limit += 1
-        if self._successes_since_limit >= 300 and self.current_rps < self.configured_rps:
-            self.current_rps = min(self.configured_rps, self.current_rps + 0.1)
-            self._successes_since_limit = 0
+    def reconfigure(self, rps, *, burst=None):
+        """Re-point the shared bucket, and so every worker draining it, at a new rate and burst."""
+        if rps <= 0:
+            raise ValueError('rps must be greater than zero')
+        self.configured_rps = float(rps)
+        self.capacity = max(1.0, float(burst if burst is not None else rps))
+        with transaction.atomic():
+            bucket = ProviderRateLimitBucket.objects.select_for_update().get(provider=self.provider)
+            bucket.configured_rps = self.configured_rps
+            bucket.current_rps = min(bucket.current_rps, self.configured_rps)
+            bucket.capacity = self.capacity
+            bucket.tokens = min(bucket.tokens, self.capacity)
+            bucket.save(update_fields=['configured_rps', 'current_rps', 'capacity', 'tokens', 'updated_at'])
+        return self
+
+    @property
+    def current_rps(self):
+        return ProviderRateLimitBucket.objects.values_list('current_rps', flat=True).get(provider=self.provider)
+
+    def acquire(self):
+        while True:
+            granted, wait_seconds = self.try_acquire()
+            if granted:
+                return
+            # A little jitter keeps waiting lanes from retrying in lockstep.
+            self.sleep(wait_seconds + self.jitter(0, 0.05))
+
+    def try_acquire(self):
+        """Take one token if the bucket allows it; otherwise return how long to wait."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                '''
+                WITH bucket AS (
+                    SELECT
+                        provider,
+                        now_at,
+                        blocked_until,
+                        available,
+                        available >= 1 AND (blocked_until IS NULL OR blocked_until <= now_at) AS granted
+                    FROM (
+                        SELECT
+                            provider,
+                            blocked_until,
+                            clock_timestamp() AS now_at,
+                            LEAST(
+                                capacity,
+                                tokens + GREATEST(0, EXTRACT(EPOCH FROM clock_timestamp() - refilled_at)) * current_rps
+                            ) AS available
+                        FROM mlcore_provider_rate_limit_bucket
+                        WHERE provider = %s
+                        FOR UPDATE
+                    ) locked
+                )
+                UPDATE mlcore_provider_rate_limit_bucket target
+                SET tokens = bucket.available - CASE WHEN bucket.granted THEN 1 ELSE 0 END,
+                    refilled_at = GREATEST(bucket.now_at, target.refilled_at),
+                    grants_since_limit = CASE
+                        WHEN NOT bucket.granted THEN target.grants_since_limit
+                        WHEN target.grants_since_limit + 1 >= %s AND target.current_rps < target.configured_rps THEN 0
+                        ELSE target.grants_since_limit + 1
+                    END,
+                    current_rps = CASE
+                        WHEN bucket.granted
+                          AND target.grants_since_limit + 1 >= %s
+                          AND target.current_rps < target.configured_rps
+                        THEN LEAST(target.configured_rps, target.current_rps + %s)
+                        ELSE target.current_rps
+                    END,
+                    updated_at = bucket.now_at
+                FROM bucket
+                WHERE target.provider = bucket.provider
+                RETURNING
+                    bucket.granted,
+                    GREATEST(
+                        0,
+                        EXTRACT(EPOCH FROM bucket.blocked_until - bucket.now_at),
+                        (1 - bucket.available) / target.current_rps
+                    )
+                ''',
+                [self.provider, RATE_RECOVERY_GRANTS, RATE_RECOVERY_GRANTS, RATE_RECOVERY_STEP_RPS],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            raise RuntimeError(f'No rate-limit bucket exists for provider {self.provider!r}; call ensure() first.')
+        return bool(row[0]), float(row[1])
 
     def rate_limited(self, retry_after):
-        self.current_rps = max(0.1, self.current_rps / 2.0)
-        self._successes_since_limit = 0
         delay = max(1.0, float(retry_after or 30)) + self.jitter(0.25, 1.25)
-        self._next_request_at = self.monotonic() + delay
+        with connection.cursor() as cursor:
+            cursor.execute(
+                '''
+                UPDATE mlcore_provider_rate_limit_bucket
+                SET current_rps = CASE
+                        WHEN blocked_until IS NULL OR blocked_until <= clock_timestamp()
+                        THEN GREATEST(%s, current_rps / 2.0)
+                        ELSE current_rps
+                    END,
+                    tokens = 0,
+                    grants_since_limit = 0,
+                    blocked_until = GREATEST(
+                        COALESCE(blocked_until, clock_timestamp()),
+                        clock_timestamp() + make_interval(secs => %s)
+                    ),
+                    refilled_at = GREATEST(
+                        COALESCE(blocked_until, clock_timestamp()),
+                        clock_timestamp() + make_interval(secs => %s)
+                    ),
+                    rate_limited_count = rate_limited_count + 1,
+                    updated_at = clock_timestamp()
+                WHERE provider = %s
+                ''',
+                [MIN_RATE_LIMITED_RPS, delay, delay, self.provider],
+            )
 
 
 def seed_spotify_hydration_queue(*, batch_size=10_000, limit=None):
@@ -195,113 +338,310 @@ def seed_spotify_hydration_queue(*, batch_size=10_000, limit=None):
     return created
 
 
-def claim_hydration_item(*, run, worker_id, lease_seconds=120):
+@dataclass
+class HydrationResult:
+    item: ProviderHydrationItem
+    candidates: list[SpotifyCandidate] | None = None
+    error: Exception | None = None
+
+
+def claim_hydration_items(*, run, worker_id, limit, lease_seconds=120):
     now = timezone.now()
+    lease_expires_at = now + timedelta(seconds=lease_seconds)
     with transaction.atomic():
-        item = (
+        items = list(
             ProviderHydrationItem.objects.select_for_update(skip_locked=True)
             .filter(provider=run.provider)
             .filter(Q(status__in=['pending', 'retry']) | Q(status='running', lease_expires_at__lt=now))
             .filter(Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now))
-            .order_by('priority', 'id')
-            .first()
+            .order_by('priority', 'id')[:limit]
         )
-        if item is None:
-            return None
+        if not items:
+            return []
+        ProviderHydrationItem.objects.filter(id__in=[item.id for item in items]).update(
+            status='running',
+            leased_by=worker_id,
+            lease_expires_at=lease_expires_at,
+            last_run=run,
+            updated_at=now,
+        )
+    for item in items:
         item.status = 'running'
         item.leased_by = worker_id
-        item.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        item.lease_expires_at = lease_expires_at
         item.last_run = run
-        item.save(update_fields=['status', 'leased_by', 'lease_expires_at', 'last_run', 'updated_at'])
-        return item
+        item.updated_at = now
+    return items
+
+
+def claim_hydration_item(*, run, worker_id, lease_seconds=120):
+    items = claim_hydration_items(run=run, worker_id=worker_id, limit=1, lease_seconds=lease_seconds)
+    return items[0] if items else None
 
 
 def hydrate_spotify_item(item, *, run, client):
-    item.attempt_count += 1
-    run.attempted_count += 1
-    run.request_count += 1
     try:
-        candidates = client.search_isrc(item.identifier)
+        result = HydrationResult(item, candidates=client.search_isrc(item.identifier))
+    except ProviderHydrationError as exc:
+        result = HydrationResult(item, error=exc)
+    outcome = apply_hydration_results(run, [result])[item.id]
+    if result.error is not None:
+        raise result.error
+    return outcome
+
+
+def apply_hydration_results(run, results):
+    """
+    Write a batch of search results back in one transaction: Spotify aliases,
+    item states, and run counters. Results are applied in order, so when two
+    items in a batch resolve to the same track the first one keeps it. Other
+    workers may claim a track concurrently; new aliases are only inserted,
+    never re-pointed, and an item whose track turns out to be owned elsewhere
+    is quarantined as ambiguous.
+    """
+    outcomes = {}
+    if not results:
+        return outcomes
+    now = timezone.now()
+    track_ids = {
+        result.candidates[0].track_id
+        for result in results
+        if result.error is None and len(result.candidates) == 1
+    }
+    owners = _spotify_track_owners(track_ids)
+    aliases = {}
+    claimants = {}
+    for result in results:
+        item = result.item
+        item.attempt_count += 1
+        item.updated_at = now
+        run.attempted_count += 1
+        run.request_count += 1
+        if result.error is not None:
+            outcomes[item.id] = _fail_item(item, run=run, error=result.error, now=now)
+            continue
+        candidates = result.candidates
         evidence = {'query_isrc': item.identifier, 'candidates': [candidate.evidence() for candidate in candidates]}
         if not candidates:
-            _finish_item(item, status='no_match', evidence=evidence)
-            run.no_match_count += 1
-            return 'no_match'
-        if len(candidates) != 1:
-            _finish_item(item, status='ambiguous', evidence=evidence)
-            run.ambiguous_count += 1
-            return 'ambiguous'
-        candidate = candidates[0]
-        existing = CanonicalItemAlias.objects.filter(
-            source='spotify', resource_type='track', source_id=candidate.track_id,
-        ).first()
-        if existing is not None and existing.canonical_item_id != item.canonical_item_id:
-            evidence['conflict_canonical_item_id'] = str(existing.canonical_item_id)
-            _finish_item(item, status='ambiguous', evidence=evidence)
-            run.ambiguous_count += 1
-            return 'ambiguous'
-        CanonicalItemAlias.objects.update_or_create(
-            source='spotify',
-            resource_type='track',
-            source_id=candidate.track_id,
-            defaults={
-                'canonical_item_id': item.canonical_item_id,
-                'confidence': 1.0,
-                'source_version': 'spotify-search-v1',
-                'status': 'active',
-                'metadata': {
-                    'spotify_uri': candidate.uri,
-                    'match_source': 'isrc',
-                    'match_isrc': item.identifier,
-                    'evidence': candidate.evidence(),
-                },
-            },
-        )
-        _finish_item(item, status='matched', evidence=evidence)
-        run.matched_count += 1
-        return 'matched'
-    except ProviderHydrationError as exc:
-        item.last_http_status = exc.http_status
-        item.last_error = str(exc)
-        item.evidence = {**item.evidence, 'retry_after_seconds': exc.retry_after}
-        if exc.http_status == 429:
-            run.rate_limited_count += 1
-        if exc.retryable and item.attempt_count < settings.SPOTIFY_HYDRATION_MAX_ATTEMPTS:
-            item.status = 'retry'
-            delay = max(float(exc.retry_after or 0), min(3600, 2 ** item.attempt_count))
-            item.next_attempt_at = timezone.now() + timedelta(seconds=delay + random.uniform(0, delay * 0.25))
-            run.retry_count += 1
+            outcome = 'no_match'
+        elif len(candidates) != 1:
+            outcome = 'ambiguous'
         else:
-            item.status = 'dead'
-            item.next_attempt_at = None
-            run.dead_count += 1
-        item.leased_by = ''
-        item.lease_expires_at = None
-        item.save()
-        raise
-    finally:
+            candidate = candidates[0]
+            owner = owners.setdefault(candidate.track_id, item.canonical_item_id)
+            if owner != item.canonical_item_id:
+                evidence['conflict_canonical_item_id'] = str(owner)
+                outcome = 'ambiguous'
+            else:
+                aliases[candidate.track_id] = CanonicalItemAlias(
+                    canonical_item_id=item.canonical_item_id,
+                    source='spotify',
+                    resource_type='track',
+                    source_id=candidate.track_id,
+                    confidence=1.0,
+                    source_version='spotify-search-v1',
+                    status='active',
+                    metadata={
+                        'spotify_uri': candidate.uri,
+                        'match_source': 'isrc',
+                        'match_isrc': item.identifier,
+                        'evidence': candidate.evidence(),
+                    },
+                )
+                claimants[candidate.track_id] = (item, evidence)
+                outcome = 'matched'
+        _finish_item(item, status=outcome, evidence=evidence)
+        setattr(run, f'{outcome}_count', getattr(run, f'{outcome}_count') + 1)
+        outcomes[item.id] = outcome
+    with transaction.atomic():
+        if aliases:
+            CanonicalItemAlias.objects.bulk_create(list(aliases.values()), ignore_conflicts=True)
+            # The locked re-read decides ownership: a track claimed by another
+            # worker since the first read stays with it.
+            owners = _spotify_track_owners(aliases, lock=True)
+            for track_id, alias in list(aliases.items()):
+                owner = owners.get(track_id, alias.canonical_item_id)
+                if owner == alias.canonical_item_id:
+                    continue
+                item, evidence = claimants[track_id]
+                evidence['conflict_canonical_item_id'] = str(owner)
+                _finish_item(item, status='ambiguous', evidence=evidence)
+                run.matched_count -= 1
+                run.ambiguous_count += 1
+                outcomes[item.id] = 'ambiguous'
+                del aliases[track_id]
+        if aliases:
+            # Refresh aliases this batch already owned; ownership never changes here.
+            CanonicalItemAlias.objects.bulk_create(
+                list(aliases.values()),
+                update_conflicts=True,
+                unique_fields=['source', 'resource_type', 'source_id'],
+                update_fields=['confidence', 'source_version', 'status', 'metadata', 'updated_at'],
+            )
+        ProviderHydrationItem.objects.bulk_update(
+            [result.item for result in results],
+            [
+                'status',
+                'attempt_count',
+                'next_attempt_at',
+                'leased_by',
+                'lease_expires_at',
+                'last_http_status',
+                'last_error',
+                'evidence',
+                'updated_at',
+            ],
+        )
         run.save()
+    return outcomes
 
 
-def spotify_worker_lock():
-    return _PostgresAdvisoryLock(SPOTIFY_WORKER_LOCK_ID)
+def _spotify_track_owners(track_ids, *, lock=False):
+    queryset = CanonicalItemAlias.objects.filter(source='spotify', resource_type='track', source_id__in=list(track_ids))
+    if lock:
+        queryset = queryset.select_for_update()
+    return dict(queryset.values_list('source_id', 'canonical_item_id'))
 
 
-class _PostgresAdvisoryLock:
-    def __init__(self, lock_id):
-        self.lock_id = lock_id
-        self.acquired = False
+def renew_hydration_leases(*, worker_id, item_ids, lease_seconds=120):
+    """Push out the lease on items this worker still holds, e.g. while the provider blocks it."""
+    if not item_ids:
+        return 0
+    now = timezone.now()
+    return ProviderHydrationItem.objects.filter(
+        id__in=list(item_ids),
+        status='running',
+        leased_by=worker_id,
+    ).update(lease_expires_at=now + timedelta(seconds=lease_seconds), updated_at=now)
+
+
+def drain_spotify_hydration_queue(
+    *,
+    run,
+    client,
+    limiter,
+    worker_id,
+    concurrency,
+    claim_size=None,
+    max_items=None,
+    lease_seconds=120,
+    progress_callback=None,
+):
+    """
+    Hydrate queued items on `concurrency` request lanes until the claimable
+    queue, or `max_items`, is exhausted.
+
+    Lanes only talk to the provider: each takes a token from `limiter` before a
+    search and reports 429s back to it. This thread claims items in batches
+    with SKIP LOCKED and writes lane results back in bulk, so the drain rate is
+    set by the limiter rather than by request latency. It also renews the
+    leases of claimed items every third of `lease_seconds`, so a long
+    Retry-After block does not let other workers reclaim items still queued
+    here.
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1')
+    claim_size = claim_size or concurrency * 2
+    pending = queue.Queue()
+    results = queue.Queue()
+    lanes = [
+        threading.Thread(
+            target=_hydration_lane,
+            args=(pending, results, client, limiter),
+            name=f'spotify-hydration-{index}',
+            daemon=True,
+        )
+        for index in range(concurrency)
+    ]
+    for lane in lanes:
+        lane.start()
+    outcomes = {}
+    claimed = 0
+    in_flight = set()
+    exhausted = False
+    renew_every = max(1.0, lease_seconds / 3)
+    leases_renewed_at = time.monotonic()
+    try:
+        while True:
+            remaining = claim_size - len(in_flight)
+            if max_items is not None:
+                remaining = min(remaining, max_items - claimed)
+            # Top up once half the claimed window has drained, so leases stay short.
+            if not exhausted and remaining > 0 and len(in_flight) <= claim_size // 2:
+                items = claim_hydration_items(
+                    run=run, worker_id=worker_id, limit=remaining, lease_seconds=lease_seconds,
+                )
+                exhausted = not items
+                for item in items:
+                    pending.put(item)
+                claimed += len(items)
+                in_flight.update(item.id for item in items)
+            if not in_flight:
+                break
+            if time.monotonic() - leases_renewed_at >= renew_every:
+                renew_hydration_leases(worker_id=worker_id, item_ids=in_flight, lease_seconds=lease_seconds)
+                leases_renewed_at = time.monotonic()
+            try:
+                batch = [results.get(timeout=renew_every)]
+            except queue.Empty:
+                continue
+            while True:
+                try:
+                    batch.append(results.get_nowait())
+                except queue.Empty:
+                    break
+            in_flight.difference_update(result.item.id for result in batch)
+            unexpected = next(
+                (
+                    result.error
+                    for result in batch
+                    if result.error is not None and not isinstance(result.error, ProviderHydrationError)
+                ),
+                None,
+            )
+            outcomes.update(apply_hydration_results(
+                run,
+                [result for result in batch if result.error is None or isinstance(result.error, ProviderHydrationError)],
+            ))
+            if unexpected is not None:
+                raise unexpected
+            if progress_callback is not None:
+                progress_callback(run)
+    finally:
+        # Unstarted items keep their lease and are reclaimed once it expires.
+        while True:
+            try:
+                pending.get_nowait()
+            except queue.Empty:
+                break
+        for _lane in lanes:
+            pending.put(None)
+        for lane in lanes:
+            lane.join()
+    return outcomes
+
+
+def _hydration_lane(pending, results, client, limiter):
+    close_old_connections()
+    try:
+        while (item := pending.get()) is not None:
+            try:
+                result = _search_item(item, client=client, limiter=limiter)
+            except Exception as exc:  # noqa: BLE001 - re-raised by the draining thread
+                result = HydrationResult(item, error=exc)
+            results.put(result)
+    finally:
+        close_old_connections()
 
-    def __enter__(self):
-        with connection.cursor() as cursor:
-            cursor.execute('SELECT pg_try_advisory_lock(%s)', [self.lock_id])
-            self.acquired = bool(cursor.fetchone()[0])
-        return self.acquired
 
-    def __exit__(self, exc_type, exc, traceback):
-        if self.acquired:
-            with connection.cursor() as cursor:
-                cursor.execute('SELECT pg_advisory_unlock(%s)', [self.lock_id])
+def _search_item(item, *, client, limiter):
+    limiter.acquire()
+    try:
+        return HydrationResult(item, candidates=client.search_isrc(item.identifier))
+    except ProviderHydrationError as exc:
+        if exc.http_status == 429:
+            limiter.rate_limited(exc.retry_after)
+        return HydrationResult(item, error=exc)
 
 
 def write_hydration_metrics(run, *, path, backlog=None):
@@ -360,7 +700,26 @@ def _finish_item(item, *, status, evidence):
     item.next_attempt_at = None
     item.leased_by = ''
     item.lease_expires_at = None
-    item.save()
+
+
+def _fail_item(item, *, run, error, now):
+    item.last_http_status = error.http_status
+    item.last_error = str(error)
+    item.evidence = {**item.evidence, 'retry_after_seconds': error.retry_after}
+    item.leased_by = ''
+    item.lease_expires_at = None
+    if error.http_status == 429:
+        run.rate_limited_count += 1
+    if error.retryable and item.attempt_count < settings.SPOTIFY_HYDRATION_MAX_ATTEMPTS:
+        item.status = 'retry'
+        delay = max(float(error.retry_after or 0), min(3600, 2 ** item.attempt_count))
+        item.next_attempt_at = now + timedelta(seconds=delay + random.uniform(0, delay * 0.25))
+        run.retry_count += 1
+        return 'retry'
+    item.status = 'dead'
+    item.next_attempt_at = None
+    run.dead_count += 1
+    return 'dead'
 
 
 def worker_identity():
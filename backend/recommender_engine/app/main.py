@@ -463,17 +463,19 @@ _METADATA_CANDIDATES_SQL = """
 """
 
 # Pairs are stored canonically (a < b); query both orientations.
+# Redirects are read through the flattened closure, so every item that
+# resolves to a seed contributes pairs and every neighbour maps to its
+# terminal item in one indexed lookup.
 _COOCCURRENCE_SQL = """
-    WITH RECURSIVE requested_seed(id) AS (
+    WITH requested_seed(id) AS (
         SELECT unnest(%s::uuid[])
     ),
     model_seed(id) AS (
         SELECT id FROM requested_seed
         UNION
-        SELECT redirect.from_canonical_item_id
-        FROM mlcore_canonical_item_redirect redirect
-        JOIN requested_seed ON requested_seed.id = redirect.to_canonical_item_id
-        WHERE redirect.status = 'active'
+        SELECT closure.from_canonical_item_id
+        FROM mlcore_canonical_item_redirect_closure closure
+        JOIN requested_seed ON requested_seed.id = closure.terminal_canonical_item_id
     ),
     pairs AS (
         SELECT item_b_juke_id AS neighbour, pmi_score, co_count
@@ -484,68 +486,33 @@ _COOCCURRENCE_SQL = """
         FROM mlcore_item_cooccurrence
         WHERE item_b_juke_id IN (SELECT id FROM model_seed)
     )
-    SELECT COALESCE(redirect.to_canonical_item_id, pairs.neighbour) AS neighbour,
+    SELECT COALESCE(closure.terminal_canonical_item_id, pairs.neighbour) AS neighbour,
            pairs.pmi_score,
            pairs.co_count
     FROM pairs
-    LEFT JOIN mlcore_canonical_item_redirect redirect
-      ON redirect.from_canonical_item_id = pairs.neighbour
-     AND redirect.status = 'active'
+    LEFT JOIN mlcore_canonical_item_redirect_closure closure
+      ON closure.from_canonical_item_id = pairs.neighbour
 """
 
 _RESOLVE_ALIASES_SQL = """
-    WITH RECURSIVE requested(source, resource_type, source_id) AS (
+    WITH requested(source, resource_type, source_id) AS (
         SELECT *
         FROM unnest(%s::text[], %s::text[], %s::text[])
     ),
-    alias_match AS (
+    resolved AS (
         SELECT
             alias.source,
             alias.resource_type,
             alias.source_id,
             alias.status,
-            alias.canonical_item_id
+            COALESCE(closure.terminal_canonical_item_id, alias.canonical_item_id) AS canonical_item_id
         FROM mlcore_canonical_item_alias alias
         JOIN requested
           ON requested.source = alias.source
          AND requested.resource_type = alias.resource_type
          AND requested.source_id = alias.source_id
-    ),
-    redirect_chain AS (
-        SELECT
-            alias_match.source,
-            alias_match.resource_type,
-            alias_match.source_id,
-            alias_match.status,
-            alias_match.canonical_item_id,
-            ARRAY[alias_match.canonical_item_id]::uuid[] AS path,
-            0 AS depth
-        FROM alias_match
-        UNION ALL
-        SELECT
-            chain.source,
-            chain.resource_type,
-            chain.source_id,
-            chain.status,
-            redirect.to_canonical_item_id,
-            chain.path || redirect.to_canonical_item_id,
-            chain.depth + 1
-        FROM redirect_chain chain
-        JOIN mlcore_canonical_item_redirect redirect
-          ON redirect.from_canonical_item_id = chain.canonical_item_id
-         AND redirect.status = 'active'
-        WHERE chain.depth < 8
-          AND NOT redirect.to_canonical_item_id = ANY(chain.path)
-    ),
-    resolved AS (
-        SELECT DISTINCT ON (source, resource_type, source_id)
-            source,
-            resource_type,
-            source_id,
-            status,
-            canonical_item_id
-        FROM redirect_chain
-        ORDER BY source, resource_type, source_id, depth DESC
+        LEFT JOIN mlcore_canonical_item_redirect_closure closure
+          ON closure.from_canonical_item_id = alias.canonical_item_id
     )
     SELECT
         resolved.source,
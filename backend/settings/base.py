@@ -220,6 +220,7 @@ SPOTIFY_HYDRATION_REQUEST_TIMEOUT_SECONDS = float(
     os.environ.get('SPOTIFY_HYDRATION_REQUEST_TIMEOUT_SECONDS', '15')
 )
 SPOTIFY_HYDRATION_MAX_ATTEMPTS = int(os.environ.get('SPOTIFY_HYDRATION_MAX_ATTEMPTS', '8'))
+SPOTIFY_HYDRATION_CONCURRENCY = int(os.environ.get('SPOTIFY_HYDRATION_CONCURRENCY', '8'))
 
 SOCIAL_AUTH_JSONFIELD_ENABLED = True
 SOCIAL_AUTH_USER_MODEL = AUTH_USER_MODEL
@@ -411,6 +412,9 @@ MLCORE_MUSICBRAINZ_REMOTE_TIMEOUT_SECONDS = int(
 MLCORE_MUSICBRAINZ_MINIMUM_FREE_BYTES = int(
     os.environ.get('MLCORE_MUSICBRAINZ_MINIMUM_FREE_BYTES', str(100 * 1024**3))
 )
+MLCORE_MUSICBRAINZ_BRIDGE_PARALLEL_WORKERS = int(
+    os.environ.get('MLCORE_MUSICBRAINZ_BRIDGE_PARALLEL_WORKERS', '4')
+)
 MLCORE_FULL_INGESTION_SCRATCH_ROOT = os.environ.get(
     'MLCORE_FULL_INGESTION_SCRATCH_ROOT',
     '/srv/data/juke/full-ingestion',
@@ -437,6 +441,22 @@ MLCORE_FULL_INGESTION_DEFAULT_POLICY_MODE = os.environ.get(
 MLCORE_FULL_INGESTION_SCRATCH_SOFT_CAP_BYTES = int(
     os.environ.get('MLCORE_FULL_INGESTION_SCRATCH_SOFT_CAP_BYTES', str(500 * 1024**3))
 )
+MLCORE_FULL_INGESTION_EXTRACT_MODE = os.environ.get('MLCORE_FULL_INGESTION_EXTRACT_MODE', 'stream')
+MLCORE_FULL_INGESTION_STREAM_BUFFER_BYTES = int(
+    os.environ.get('MLCORE_FULL_INGESTION_STREAM_BUFFER_BYTES', str(256 * 1024**2))
+)
+MLCORE_FULL_INGESTION_CHUNK_FORMAT = os.environ.get('MLCORE_FULL_INGESTION_CHUNK_FORMAT', 'csv')
+MLCORE_FULL_INGESTION_SORTED_CHUNKS = _env_flag('MLCORE_FULL_INGESTION_SORTED_CHUNKS', False)
+MLCORE_FULL_INGESTION_REBALANCE_SKEW_FACTOR = float(
+    os.environ.get('MLCORE_FULL_INGESTION_REBALANCE_SKEW_FACTOR', '2.0')
+)
+MLCORE_FULL_INGESTION_SESSION_AGGREGATE_BYTES = int(
+    os.environ.get('MLCORE_FULL_INGESTION_SESSION_AGGREGATE_BYTES', str(128 * 1024**2))
+)
+MLCORE_FULL_INGESTION_INDEX_BUILD_MEMORY_BYTES = int(
+    os.environ.get('MLCORE_FULL_INGESTION_INDEX_BUILD_MEMORY_BYTES', str(2 * 1024**3))
+)
+MLCORE_EVALUATION_CACHE_DIR = os.environ.get('MLCORE_EVALUATION_CACHE_DIR', '').strip()
 MLCORE_FULL_INGESTION_TEXTFILE_METRICS_PATH = os.environ.get(
     'MLCORE_FULL_INGESTION_TEXTFILE_METRICS_PATH',
     '/srv/monitoring/node-exporter/textfile/mlcore_full_ingestion.prom',
@@ -465,6 +485,12 @@ MLCORE_LISTENBRAINZ_USER_HASH_SALT = os.environ.get('MLCORE_LISTENBRAINZ_USER_HA
 MLCORE_LISTENBRAINZ_SESSION_WINDOW_SECONDS = int(
     os.environ.get('MLCORE_LISTENBRAINZ_SESSION_WINDOW_SECONDS', str(30 * 60))
 )
+MLCORE_LISTENBRAINZ_PIPELINE_DEPTH = int(os.environ.get('MLCORE_LISTENBRAINZ_PIPELINE_DEPTH', '2'))
+MLCORE_LISTENBRAINZ_MEMBER_WORKERS = int(os.environ.get('MLCORE_LISTENBRAINZ_MEMBER_WORKERS', '1'))
+MLCORE_LISTENBRAINZ_IDENTITY_EXTRACT_WORKERS = int(os.environ.get('MLCORE_LISTENBRAINZ_IDENTITY_EXTRACT_WORKERS', '1'))
+MLCORE_LISTENBRAINZ_IDENTITY_SORT_MEMORY_BYTES = int(
+    os.environ.get('MLCORE_LISTENBRAINZ_IDENTITY_SORT_MEMORY_BYTES', str(512 * 1024 * 1024))
+)
 
 # ML Core — recommender defaults (arch §2 decision 14)
 JUKE_RECOMMENDER_DEFAULT_LIMIT = int(os.environ.get('JUKE_RECOMMENDER_DEFAULT_LIMIT', '10'))
@@ -475,6 +501,8 @@ JUKE_PROMOTION_GATE_NDCG_MIN_LIFT = float(os.environ.get('JUKE_PROMOTION_GATE_ND
 JUKE_PROMOTION_GATE_RECALL_MIN_LIFT = float(os.environ.get('JUKE_PROMOTION_GATE_RECALL_MIN_LIFT', '0.03'))
 JUKE_PROMOTION_GATE_COLDSTART_MAX_REGRESSION = float(os.environ.get('JUKE_PROMOTION_GATE_COLDSTART_MAX_REGRESSION', '0.02'))
 JUKE_PROMOTION_GATE_COVERAGE_MIN = float(os.environ.get('JUKE_PROMOTION_GATE_COVERAGE_MIN', '0.30'))
+# Serving gate, applied once either label has an engine-backed evaluation: max relative p95 latency increase.
+JUKE_PROMOTION_GATE_LATENCY_P95_MAX_INCREASE = float(os.environ.get('JUKE_PROMOTION_GATE_LATENCY_P95_MAX_INCREASE', '0.10'))
 
 # OpenAI / TuneTrivia
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
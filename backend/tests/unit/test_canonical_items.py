@@ -20,7 +20,9 @@ from mlcore.services.canonical_items import (
     ITEM_TYPE_RECORDING_MBID,
     ITEM_TYPE_RECORDING_MSID,
     ITEM_TYPE_SPOTIFY_TRACK,
+    _materialize_track_alias_batch,
     bulk_ensure_canonical_items_for_tracks,
+    canonical_alias_id_ranges,
     identity_from_listenbrainz_candidates,
     identity_from_parts,
     canonical_item_alias_uuid,
@@ -465,6 +467,123 @@ class CanonicalAliasConcurrencyTests(TransactionTestCase):
         self.assertEqual(CanonicalItemAlias.objects.filter(source='spotify', source_id=track.spotify_id).count(), 1)
 
 
+class CanonicalAliasRangeMaterializationTests(TransactionTestCase):
+    reset_sequences = True
+
+    def test_alias_id_ranges_cover_uuid_space_without_overlap(self):
+        ranges = canonical_alias_id_ranges(4)
+
+        self.assertEqual([alias_range.index for alias_range in ranges], [0, 1, 2, 3])
+        self.assertIsNone(ranges[0].lower_id)
+        self.assertIsNone(ranges[-1].upper_id)
+        for previous, current in zip(ranges, ranges[1:]):
+            self.assertEqual(previous.upper_id, current.lower_id)
+        self.assertEqual(ranges[2].lower_id, uuid.UUID('80000000-0000-0000-0000-000000000000'))
+        with self.assertRaisesMessage(ValueError, 'range_count must be greater than 0'):
+            canonical_alias_id_ranges(0)
+
+    def test_parallel_self_aliases_match_sequential_conflict_semantics(self):
+        identities = [
+            identity_from_parts(item_type=ITEM_TYPE_RECORDING_MSID, key_value=f'msid-range-{index}')
+            for index in range(12)
+        ]
+        CanonicalItem.objects.bulk_create([
+            CanonicalItem(id=identity.item_id, item_type=identity.item_type, canonical_key=identity.canonical_key)
+            for identity in identities
+        ])
+        other = CanonicalItem.objects.create(
+            id=uuid.uuid4(),
+            item_type=ITEM_TYPE_RECORDING_MBID,
+            canonical_key=f'{ITEM_TYPE_RECORDING_MBID}:{uuid.uuid4()}',
+        )
+        CanonicalItemAlias.objects.create(
+            canonical_item_id=identities[0].item_id,
+            source=ALIAS_SOURCE_LISTENBRAINZ,
+            resource_type=ALIAS_RESOURCE_RECORDING,
+            source_id='msid-range-0',
+        )
+        CanonicalItemAlias.objects.create(
+            canonical_item=other,
+            source=ALIAS_SOURCE_LISTENBRAINZ,
+            resource_type=ALIAS_RESOURCE_RECORDING,
+            source_id='msid-range-1',
+        )
+        checkpoints = {}
+
+        result = materialize_canonical_item_self_aliases(
+            batch_size=2,
+            range_count=4,
+            checkpoint_callback=lambda key, last_id, progress: checkpoints.__setitem__(key, last_id),
+        )
+
+        self.assertEqual((result.created_count, result.existing_count, result.conflict_count), (11, 1, 1))
+        self.assertEqual(CanonicalItemAlias.objects.filter(source=ALIAS_SOURCE_LISTENBRAINZ).count(), 12)
+        self.assertTrue(checkpoints)
+        self.assertEqual({key.split(':')[0] for key in checkpoints}, {ITEM_TYPE_RECORDING_MSID, ITEM_TYPE_RECORDING_MBID})
+        self.assertTrue(all(key.endswith('/4') for key in checkpoints))
+        ranges = {alias_range.index: alias_range for alias_range in canonical_alias_id_ranges(4)}
+        for key, last_id in checkpoints.items():
+            alias_range = ranges[int(key.rsplit(':', 1)[1].split('/')[0])]
+            self.assertTrue(alias_range.lower_id is None or last_id >= alias_range.lower_id)
+            self.assertTrue(alias_range.upper_id is None or last_id < alias_range.upper_id)
+
+        resumed = materialize_canonical_item_self_aliases(batch_size=2, range_count=4, start_after_by_range=checkpoints)
+        self.assertEqual((resumed.created_count, resumed.existing_count, resumed.conflict_count), (0, 0, 0))
+
+    def _create_tracks_claiming_shared_spotify_ids(self, count):
+        album = create_album(name='Range Album', total_tracks=count * 2, release_date='2026-01-01')
+        tracks = []
+        for index in range(count):
+            owner = create_track(
+                name=f'Owner {index}', album=album, track_number=index * 2 + 1, duration_ms=1000,
+                spotify_id=f'shared-range-{index}',
+            )
+            claimant = create_track(name=f'Claimant {index}', album=album, track_number=index * 2 + 2, duration_ms=1000)
+            TrackExternalIdentifier.objects.create(track=claimant, source=ALIAS_SOURCE_SPOTIFY, external_id=owner.spotify_id)
+            tracks.extend([owner, claimant])
+        return tracks
+
+    def test_parallel_track_aliases_report_conflicts_across_ranges(self):
+        tracks = self._create_tracks_claiming_shared_spotify_ids(4)
+
+        result = materialize_track_aliases(batch_size=1, range_count=4)
+
+        self.assertEqual((result.created_count, result.existing_count, result.conflict_count), (8, 4, 4))
+        self.assertEqual({conflict.reason for conflict in result.conflicts}, {'existing_mapping'})
+        self.assertEqual(CanonicalItemAlias.objects.filter(source=ALIAS_SOURCE_SPOTIFY).count(), 8)
+        with self.assertRaisesMessage(ValueError, 'range_count requires streaming tracks from the database'):
+            materialize_track_aliases(tracks, range_count=2)
+
+    def test_racing_batches_classify_lost_inserts_as_conflicts(self):
+        tracks = self._create_tracks_claiming_shared_spotify_ids(1)
+        barrier = threading.Barrier(2)
+        results = []
+        errors = []
+
+        def materialize(track):
+            try:
+                close_old_connections()
+                local_track = type(track).objects.get(pk=track.pk)
+                barrier.wait()
+                with transaction.atomic():
+                    results.append(_materialize_track_alias_batch([local_track], shared_lock=True))
+            except Exception as exc:  # pragma: no cover - assertion reports thread failures
+                errors.append(exc)
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=materialize, args=(track,)) for track in tracks]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sum(result.created_count for result in results), 2)
+        self.assertEqual(sum(result.existing_count for result in results), 1)
+        self.assertEqual([conflict.reason for result in results for conflict in result.conflicts], ['existing_mapping'])
+
+
 class CanonicalAliasMaterializationRunTests(TransactionTestCase):
     def test_failed_command_persists_checkpoint_and_resumes(self):
         for index in range(2):
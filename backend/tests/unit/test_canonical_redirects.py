@@ -2,9 +2,14 @@ import uuid
 
 from django.test import TestCase
 
-from mlcore.models import CanonicalItem, CanonicalItemRedirect
+from mlcore.models import CanonicalItem, CanonicalItemRedirect, CanonicalItemRedirectClosure
 from mlcore.services.canonical_items import identity_from_parts
-from mlcore.services.canonical_redirects import resolve_canonical_item_id, upsert_canonical_redirect
+from mlcore.services.canonical_redirects import (
+    MAX_REDIRECT_DEPTH,
+    rebuild_canonical_redirect_closure,
+    resolve_canonical_item_id,
+    upsert_canonical_redirect,
+)
 
 
 class CanonicalRedirectTests(TestCase):
@@ -88,5 +93,114 @@ class CanonicalRedirectTests(TestCase):
                 source_version='v1',
             )
 
+    def _redirect(self, source, target):
+        return upsert_canonical_redirect(
+            from_item_id=source.id,
+            to_item_id=target.id,
+            source='test',
+            source_version='v1',
+        )
+
+    def _closure(self):
+        return {
+            row.from_canonical_item_id: (row.terminal_canonical_item_id, row.depth)
+            for row in CanonicalItemRedirectClosure.objects.all()
+        }
+
+    def test_closure_flattens_chains_as_redirects_are_upserted(self):
+        first = self._item('recording_msid', uuid.uuid4())
+        second = self._item('recording_msid', uuid.uuid4())
+        third = self._item('recording_mbid', uuid.uuid4())
+        self._redirect(second, third)
+        self._redirect(first, second)
+
+        self.assertEqual(self._closure(), {first.id: (third.id, 2), second.id: (third.id, 1)})
+        with self.assertNumQueries(1):
+            self.assertEqual(resolve_canonical_item_id(first.id), third.id)
+
+        fourth = self._item('recording_mbid', uuid.uuid4())
+        self._redirect(third, fourth)
+
+        self.assertEqual(
+            self._closure(),
+            {first.id: (fourth.id, 3), second.id: (fourth.id, 2), third.id: (fourth.id, 1)},
+        )
+
+    def test_conflicting_upsert_repoints_items_that_redirected_through_it(self):
+        first = self._item('recording_msid', uuid.uuid4())
+        second = self._item('recording_msid', uuid.uuid4())
+        third = self._item('recording_mbid', uuid.uuid4())
+        self._redirect(first, second)
+        self._redirect(second, third)
+
+        self._redirect(second, self._item('recording_mbid', uuid.uuid4()))
+
+        self.assertEqual(self._closure(), {first.id: (second.id, 1)})
+        self.assertEqual(resolve_canonical_item_id(second.id), second.id)
+
+    def _truncated(self):
+        return set(
+            CanonicalItemRedirectClosure.objects.filter(truncated=True).values_list('from_canonical_item_id', flat=True)
+        )
+
+    def test_rebuild_keeps_cycles_written_by_bulk_loaders_truncated(self):
+        first = self._item('recording_msid', uuid.uuid4())
+        second = self._item('recording_mbid', uuid.uuid4())
+        source = self._item('recording_msid', uuid.uuid4())
+        target = self._item('recording_mbid', uuid.uuid4())
+        CanonicalItemRedirect.objects.bulk_create([
+            CanonicalItemRedirect(from_canonical_item=first, to_canonical_item=second, source='bulk', source_version='v1'),
+            CanonicalItemRedirect(from_canonical_item=second, to_canonical_item=first, source='bulk', source_version='v1'),
+            CanonicalItemRedirect(from_canonical_item=source, to_canonical_item=target, source='bulk', source_version='v1'),
+        ])
+
+        with self.assertLogs('mlcore.services.canonical_redirects', level='WARNING') as logs:
+            closure_count, truncated_count = rebuild_canonical_redirect_closure()
+
+        self.assertEqual((closure_count, truncated_count), (1, 2))
+        self.assertIn('2 chain(s)', logs.output[0])
+        self.assertEqual(
+            self._closure(),
+            {source.id: (target.id, 1), first.id: (second.id, 1), second.id: (first.id, 1)},
+        )
+        self.assertEqual(self._truncated(), {first.id, second.id})
+        with self.assertRaisesRegex(ValueError, 'cycle'):
+            resolve_canonical_item_id(first.id)
+        self.assertEqual(resolve_canonical_item_id(source.id), target.id)
+
+    def test_rebuild_truncates_chains_deeper_than_the_limit(self):
+        items = [self._item('recording_msid', uuid.uuid4()) for _ in range(MAX_REDIRECT_DEPTH + 2)]
+        CanonicalItemRedirect.objects.bulk_create([
+            CanonicalItemRedirect(from_canonical_item=source, to_canonical_item=target, source='bulk', source_version='v1')
+            for source, target in zip(items, items[1:])
+        ])
+
+        closure_count, truncated_count = rebuild_canonical_redirect_closure()
+
+        self.assertEqual((closure_count, truncated_count), (MAX_REDIRECT_DEPTH, 1))
+        closure = self._closure()
+        self.assertEqual(closure[items[0].id], (items[MAX_REDIRECT_DEPTH].id, MAX_REDIRECT_DEPTH))
+        self.assertEqual(closure[items[1].id], (items[-1].id, MAX_REDIRECT_DEPTH))
+        self.assertEqual(self._truncated(), {items[0].id})
+        with self.assertRaisesRegex(ValueError, 'depth exceeds'):
+            resolve_canonical_item_id(items[0].id)
+        self.assertEqual(resolve_canonical_item_id(items[1].id), items[-1].id)
+
+    def test_upsert_past_the_depth_limit_truncates_the_origin(self):
+        items = [self._item('recording_msid', uuid.uuid4()) for _ in range(MAX_REDIRECT_DEPTH + 2)]
+        for source, target in zip(items[1:], items[2:]):
+            self._redirect(source, target)
+
+        self._redirect(items[0], items[1])
+
+        closure = self._closure()
+        self.assertEqual(closure[items[0].id], (items[MAX_REDIRECT_DEPTH].id, MAX_REDIRECT_DEPTH))
+        self.assertEqual(self._truncated(), {items[0].id})
+        with self.assertRaisesRegex(ValueError, 'depth exceeds'):
+            resolve_canonical_item_id(items[0].id)
+        self.assertEqual(rebuild_canonical_redirect_closure(), (MAX_REDIRECT_DEPTH, 1))
+        self.assertEqual(self._closure(), closure)
+
     def test_redirect_table_is_hot(self):
         self.assertEqual(CanonicalItemRedirect._meta.db_tablespace, 'juke_mlcore_hot')
+        self.assertEqual(CanonicalItemRedirectClosure._meta.db_tablespace, 'juke_mlcore_hot')
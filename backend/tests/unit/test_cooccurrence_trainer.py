@@ -26,6 +26,7 @@ from mlcore.services.cooccurrence import (
     baskets_from_search_history,
     compute_pmi_table,
     train_cooccurrence,
+    user_keyed_baskets_from_behavioral_sources,
 )
 from tests.utils import create_album, create_track
 
@@ -322,6 +323,20 @@ class BasketsFromSearchHistoryTests(TestCase):
         self.assertIn(sorted([self._canonical_id(self.t1), self._canonical_id(self.t2)], key=str), baskets)
         self.assertIn(sorted([self._canonical_id(self.t2), self._canonical_id(self.t3)], key=str), baskets)
 
+    def test_keyed_baskets_share_one_key_per_search_history_user(self):
+        self._mk_session([self.t1, self.t2])
+        self._mk_session([self.t2, self.t3])
+        run = self._mk_listenbrainz_run()
+        self._mk_session_track(run, session_hint='lb:keyed', track=self.t1)
+        self._mk_session_track(run, session_hint='lb:keyed', track=self.t3)
+
+        keyed = user_keyed_baskets_from_behavioral_sources(split='all')
+
+        self.assertEqual([basket for _, basket in keyed], baskets_from_behavioral_sources(split='all'))
+        users = [user for user, _ in keyed]
+        self.assertEqual(users.count(f'{BEHAVIOR_SOURCE_SEARCH_HISTORY}:{self.user.pk}'), 2)
+        self.assertIn(f"{BEHAVIOR_SOURCE_LISTENBRAINZ}:{hashlib.sha256(b'lb:keyed').hexdigest()}", users)
+
     def test_train_from_listenbrainz_source_only(self):
         run = self._mk_listenbrainz_run()
         self._mk_session_track(run, session_hint='lb:train', track=self.t1)
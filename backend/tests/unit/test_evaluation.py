@@ -9,9 +9,12 @@ Three layers:
 import datetime
 import hashlib
 import math
+import tempfile
 import uuid
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import numpy as np
 from django.contrib.auth import get_user_model
 from django.test import SimpleTestCase, TestCase
 
@@ -20,6 +23,7 @@ from mlcore.models import (
     ItemCoOccurrence,
     ListenBrainzSessionTrack,
     ModelEvaluation,
+    SequentialGateDecision,
     SourceIngestionRun,
     TrainingRun,
 )
@@ -28,19 +32,40 @@ from mlcore.services.cooccurrence import BEHAVIOR_SOURCE_LISTENBRAINZ, train_coo
 from mlcore.services.evaluation import (
     METRIC_COLD_RECALL,
     METRIC_COVERAGE,
+    METRIC_LATENCY_P50,
+    METRIC_LATENCY_P95,
+    METRIC_LATENCY_P99,
     METRIC_NDCG,
     METRIC_RECALL,
+    METRIC_THROUGHPUT,
+    RANKED_PAD_ID,
+    SEGMENT_BASKET_SIZE,
+    SEGMENT_POPULARITY_DECILE,
     CoOccurrenceRanker,
     Dataset,
+    EngineRanker,
+    ItemIndex,
     MetadataRanker,
+    RankedListCache,
+    RankedMetricKernel,
+    SEQUENTIAL_MAX_REGRESSION,
+    SEQUENTIAL_RELATIVE_LIFT,
+    SequentialGate,
     Trial,
     DEFAULT_COLD_THRESHOLD,
     build_loo_dataset,
     coverage,
     EvaluationResult,
     evaluate_ranker,
+    evaluate_sequential_pair,
+    hit_positions,
     ndcg_at_k,
+    popularity_decile_segments,
+    ranked_matrix,
+    sequential_prefix_dataset_hash,
+    stratified_basket_sample,
     persist_evaluation,
+    persist_sequential_evaluation,
     recall_at_k,
     run_offline_evaluation,
 )
@@ -139,6 +164,112 @@ class CoverageTests(SimpleTestCase):
         self.assertEqual(coverage([], catalog_size=10), 0.0)
 
 
+# --- vectorized kernel ---
+
+class RankedMetricKernelTests(SimpleTestCase):
+
+    def test_ranked_matrix_truncates_and_pads(self):
+        index = ItemIndex()
+        matrix = ranked_matrix([[_uid(1), _uid(2), _uid(3)], [_uid(2)], []], k=2, index=index)
+        self.assertEqual(matrix.shape, (3, 2))
+        self.assertEqual(matrix[0].tolist(), [index.encode(_uid(1)), index.encode(_uid(2))])
+        self.assertEqual(matrix[1].tolist(), [index.encode(_uid(2)), RANKED_PAD_ID])
+        self.assertEqual(matrix[2].tolist(), [RANKED_PAD_ID, RANKED_PAD_ID])
+
+    def test_hit_positions_broadcast(self):
+        ranked = np.array([[5, 6, 7], [7, 6, 5], [1, 2, 3]])
+        held_out = np.array([7, 7, 9])
+        self.assertEqual(hit_positions(ranked, held_out).tolist(), [2, 0, -1])
+
+    def test_matches_reference_metric_functions(self):
+        ranked_lists = [
+            [_uid(9), _uid(8), _uid(1)],
+            [_uid(2)],
+            [_uid(3), _uid(4)],
+            [],
+        ]
+        trials = [
+            Trial(seeds=(_uid(10),), held_out=_uid(1), is_cold=False),
+            Trial(seeds=(_uid(10),), held_out=_uid(2), is_cold=True),
+            Trial(seeds=(_uid(10),), held_out=_uid(99), is_cold=True),
+            Trial(seeds=(_uid(10),), held_out=_uid(5), is_cold=False),
+        ]
+        kernel = RankedMetricKernel(trials, k=10)
+        kernel.add_batch(ranked_lists[:2])
+        kernel.add_batch(ranked_lists[2:])
+
+        expected_recall = [recall_at_k(r, {t.held_out}, 10) for r, t in zip(ranked_lists, trials)]
+        expected_ndcg = [ndcg_at_k(r, {t.held_out}, 10) for r, t in zip(ranked_lists, trials)]
+        metrics = kernel.metrics(catalog_size=10)
+        self.assertAlmostEqual(metrics[METRIC_RECALL], sum(expected_recall) / 4)
+        self.assertAlmostEqual(metrics[METRIC_NDCG], sum(expected_ndcg) / 4)
+        self.assertAlmostEqual(metrics[METRIC_COLD_RECALL], 0.5)
+        self.assertAlmostEqual(metrics[METRIC_COVERAGE], 0.6)  # {9, 8, 1, 2, 3, 4}
+
+    def test_running_sums_track_scored_prefix(self):
+        trials = [
+            Trial(seeds=(_uid(1),), held_out=_uid(2), is_cold=True),
+            Trial(seeds=(_uid(2),), held_out=_uid(1), is_cold=False),
+        ]
+        kernel = RankedMetricKernel(trials, k=10)
+        kernel.add_batch([[_uid(2)]])
+        self.assertEqual(kernel.scored, 1)
+        self.assertEqual(kernel.recall_sum, 1.0)
+        self.assertEqual(kernel.cold_trials_scored, 1)
+        self.assertEqual(kernel.distinct_recommended_count, 1)
+
+    def test_segments_by_basket_size_and_popularity(self):
+        a, b, c, d = [_uid(i) for i in range(1, 5)]
+        trials = [
+            Trial(seeds=(a,), held_out=b, is_cold=False),
+            Trial(seeds=tuple(_uid(100 + i) for i in range(11)), held_out=c, is_cold=True),
+        ]
+        kernel = RankedMetricKernel(trials, k=10)
+        kernel.add_batch([[b], [d]])
+
+        segments = kernel.segments({a: 1, b: 5, c: 1, d: 1})
+
+        self.assertEqual(segments[SEGMENT_BASKET_SIZE]['2'][METRIC_RECALL], 1.0)
+        self.assertEqual(segments[SEGMENT_BASKET_SIZE]['10+'][METRIC_RECALL], 0.0)
+        self.assertEqual(segments[SEGMENT_BASKET_SIZE]['10+']['n_trials'], 1.0)
+        deciles = segments[SEGMENT_POPULARITY_DECILE]
+        self.assertEqual(sum(v['n_trials'] for v in deciles.values()), 2.0)
+        self.assertEqual(len(deciles), 2)  # popular b and tail c land in different deciles
+
+    def test_confidence_intervals_cluster_on_basket(self):
+        # Eight two-trial baskets: four score both trials as hits, four as misses.
+        trials = []
+        ranked_lists = []
+        for basket in range(8):
+            a, b = _uid(2 * basket + 1), _uid(2 * basket + 2)
+            trials += [
+                Trial(seeds=(a,), held_out=b, is_cold=False, basket_index=basket),
+                Trial(seeds=(b,), held_out=a, is_cold=False, basket_index=basket),
+            ]
+            ranked_lists += [[b], [a]] if basket < 4 else [[], []]
+        kernel = RankedMetricKernel(trials, k=10)
+        kernel.add_batch(ranked_lists)
+        lower, upper = kernel.confidence_intervals(0.95)[METRIC_RECALL]
+        # mean 0.5, per-basket residual sums ±1 → se = sqrt(8) / 16
+        half_width = 1.959963984540054 * math.sqrt(8) / 16
+        self.assertAlmostEqual(lower, 0.5 - half_width)
+        self.assertAlmostEqual(upper, 0.5 + half_width)
+        self.assertNotIn(METRIC_COVERAGE, kernel.confidence_intervals())
+
+    def test_confidence_interval_empty_cold_slice(self):
+        trials = [Trial(seeds=(_uid(1),), held_out=_uid(2), is_cold=False)]
+        kernel = RankedMetricKernel(trials, k=10)
+        kernel.add_batch([[_uid(2)]])
+        self.assertEqual(kernel.confidence_intervals()[METRIC_COLD_RECALL], (0.0, 0.0))
+        self.assertEqual(kernel.confidence_intervals()[METRIC_RECALL], (1.0, 1.0))
+
+    def test_popularity_deciles_keep_ties_together(self):
+        items = [_uid(i) for i in range(1, 21)]
+        freq = {item: 1 for item in items}
+        trials = [Trial(seeds=(items[0],), held_out=item, is_cold=True) for item in items[1:]]
+        self.assertEqual(set(popularity_decile_segments(trials, freq).tolist()), {9})
+
+
 # --- dataset construction ---
 
 class BuildLOODatasetTests(SimpleTestCase):
@@ -222,12 +353,73 @@ class BuildLOODatasetTests(SimpleTestCase):
         self.assertEqual(ds.item_frequency[b], 1)
         self.assertEqual(ds.item_frequency[c], 1)
 
+    def test_trials_record_source_basket(self):
+        ds = build_loo_dataset(baskets=[[_uid(1), _uid(2)], [_uid(3), _uid(4), _uid(5)]])
+        self.assertEqual([t.basket_index for t in ds.trials], [0, 0, 1, 1, 1])
+
     def test_empty_baskets(self):
         ds = build_loo_dataset(baskets=[])
         self.assertEqual(ds.trials, [])
         self.assertEqual(len(ds.dataset_hash), 64)  # hash of empty still well-defined
 
 
+class StratifiedSampleTests(SimpleTestCase):
+
+    def _baskets(self):
+        # 40 pairs plus 10 larger baskets so the size strata are uneven.
+        pairs = [[_uid(2 * i), _uid(2 * i + 1)] for i in range(1, 41)]
+        triples = [[_uid(1000 + 3 * i), _uid(1001 + 3 * i), _uid(1002 + 3 * i)] for i in range(10)]
+        return pairs + triples
+
+    def test_same_seed_same_sample(self):
+        ds1 = build_loo_dataset(baskets=self._baskets(), sample_rate=0.25, sample_seed=7)
+        ds2 = build_loo_dataset(baskets=list(reversed(self._baskets())), sample_rate=0.25, sample_seed=7)
+        self.assertEqual(ds1.dataset_hash, ds2.dataset_hash)
+        self.assertEqual(ds1.sample_rate, 0.25)
+        self.assertEqual(ds1.sample_seed, 7)
+        self.assertEqual(ds1.population_n_baskets, 50)
+
+    def test_sample_hash_differs_from_full_split_and_other_seed(self):
+        full = build_loo_dataset(baskets=self._baskets())
+        sampled = build_loo_dataset(baskets=self._baskets(), sample_rate=0.25, sample_seed=1)
+        reseeded = build_loo_dataset(baskets=self._baskets(), sample_rate=0.25, sample_seed=2)
+        self.assertNotEqual(full.dataset_hash, sampled.dataset_hash)
+        self.assertNotEqual(sampled.dataset_hash, reseeded.dataset_hash)
+        # Even a rate-1.0 "sample" gets its own hash.
+        self.assertNotEqual(full.dataset_hash, build_loo_dataset(baskets=self._baskets(), sample_rate=1.0).dataset_hash)
+
+    def test_every_basket_size_stratum_represented(self):
+        sampled = stratified_basket_sample(self._baskets(), {}, sample_rate=0.05, seed=0)
+        self.assertIn(2, {len(b) for b in sampled})
+        self.assertIn(3, {len(b) for b in sampled})
+        self.assertLess(len(sampled), 50)
+
+    def test_baskets_of_one_user_share_a_stratum(self):
+        baskets = [[_uid(2 * i), _uid(2 * i + 1)] for i in range(40)]
+        users = ['user:a' if i % 2 else 'user:b' for i in range(40)]
+
+        sampled = stratified_basket_sample(baskets, {}, sample_rate=0.05, seed=0, users=users)
+
+        # Same size and popularity tier, so at most one cell per user survives.
+        self.assertLessEqual(len(sampled), 2)
+        self.assertGreater(len(stratified_basket_sample(baskets, {}, sample_rate=0.05, seed=0)), 2)
+        with self.assertRaises(ValueError):
+            stratified_basket_sample(baskets, {}, sample_rate=0.05, users=users[:1])
+
+    def test_cold_tagging_uses_population_frequency(self):
+        a, b = _uid(1), _uid(2)
+        baskets = [[a, b]] * 5
+        ds = build_loo_dataset(baskets=baskets, sample_rate=0.2, cold_threshold=2)
+        self.assertTrue(ds.trials)
+        self.assertTrue(all(not t.is_cold for t in ds.trials))
+
+    def test_rejects_invalid_rate_and_max_baskets_combo(self):
+        with self.assertRaises(ValueError):
+            stratified_basket_sample(self._baskets(), {}, sample_rate=0.0)
+        with self.assertRaises(ValueError):
+            build_loo_dataset(sample_rate=0.5, max_baskets=10)
+
+
 class BuildLOODatasetFromBehaviorSourcesTests(TestCase):
 
     def setUp(self):
@@ -354,6 +546,14 @@ class EvaluateRankerTests(SimpleTestCase):
         self.assertEqual(result.n_trials, 0)
         self.assertEqual(result.metrics[METRIC_RECALL], 0.0)
 
+    def test_result_carries_segment_breakdown(self):
+        a, b = _uid(1), _uid(2)
+        trials = [Trial(seeds=(a,), held_out=b, is_cold=False)]
+        ds = Dataset(trials=trials, dataset_hash='x' * 64, item_frequency={a: 1, b: 1})
+        result = evaluate_ranker(_PerfectRanker({(a,): b}), ds, k=10, catalog_size=10)
+        self.assertEqual(result.segments[SEGMENT_BASKET_SIZE]['2'][METRIC_NDCG], 1.0)
+        self.assertIn(SEGMENT_POPULARITY_DECILE, result.segments)
+
     def test_result_carries_hash_and_label(self):
         trials = [Trial(seeds=(_uid(1),), held_out=_uid(2), is_cold=False)]
         ds = Dataset(trials=trials, dataset_hash='abc123' + '0' * 58)
@@ -362,6 +562,193 @@ class EvaluateRankerTests(SimpleTestCase):
         self.assertEqual(result.candidate_label, 'useless')
 
 
+class _CountingRanker(_PerfectRanker):
+    """Perfect ranker pinned to a training run; counts rank() calls."""
+    label = 'pinned'
+    def __init__(self, answers, training_run):
+        super().__init__(answers)
+        self.training_run = training_run
+        self.calls = 0
+    def rank(self, seeds, exclude, limit):
+        self.calls += 1
+        return super().rank(seeds, exclude, limit)
+
+
+class RankedListCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = RankedListCache(tmp.name)
+        a, b, c = _uid(1), _uid(2), _uid(3)
+        self.trials = [
+            Trial(seeds=(a,), held_out=b, is_cold=True, basket_index=0),
+            Trial(seeds=(b,), held_out=a, is_cold=False, basket_index=0),
+            Trial(seeds=(c,), held_out=a, is_cold=False, basket_index=1),
+        ]
+        # Third trial misses, and 256 ends in a zero byte — both must survive the round trip.
+        self.answers = {(a,): b, (b,): a, (c,): _uid(256)}
+        self.dataset = Dataset(trials=self.trials, dataset_hash='c' * 64)
+
+    def _evaluate(self, ranker, **kwargs):
+        return evaluate_ranker(ranker, self.dataset, k=10, catalog_size=10, cache=self.cache, **kwargs)
+
+    def test_second_evaluation_replays_cached_ranked_lists(self):
+        first_ranker = _CountingRanker(self.answers, SimpleNamespace(pk=7))
+        first = self._evaluate(first_ranker)
+        second_ranker = _CountingRanker(self.answers, SimpleNamespace(pk=7))
+        second = self._evaluate(second_ranker)
+
+        self.assertEqual(first_ranker.calls, 3)
+        self.assertEqual(second_ranker.calls, 0)
+        self.assertFalse(first.ranked_lists_cached)
+        self.assertTrue(second.ranked_lists_cached)
+        self.assertEqual(second.metrics, first.metrics)
+        self.assertEqual(second.confidence_intervals, first.confidence_intervals)
+        self.assertEqual(second.segments, first.segments)
+
+    def test_new_training_run_or_k_rescores(self):
+        self._evaluate(_CountingRanker(self.answers, SimpleNamespace(pk=7)))
+        other_run = _CountingRanker(self.answers, SimpleNamespace(pk=8))
+        self._evaluate(other_run)
+        other_k = _CountingRanker(self.answers, SimpleNamespace(pk=7))
+        evaluate_ranker(other_k, self.dataset, k=5, catalog_size=10, cache=self.cache)
+        self.assertEqual(other_run.calls, 3)
+        self.assertEqual(other_k.calls, 3)
+
+    def test_reordered_trials_do_not_replay_rows(self):
+        self._evaluate(_CountingRanker(self.answers, SimpleNamespace(pk=7)))
+        self.dataset = Dataset(trials=list(reversed(self.trials)), dataset_hash=self.dataset.dataset_hash)
+        reordered = _CountingRanker(self.answers, SimpleNamespace(pk=7))
+
+        result = self._evaluate(reordered)
+
+        self.assertEqual(reordered.calls, 3)
+        self.assertFalse(result.ranked_lists_cached)
+
+    def test_unpinned_ranker_is_never_cached(self):
+        self._evaluate(_PerfectRanker(self.answers))
+        result = self._evaluate(_PerfectRanker(self.answers))
+        self.assertFalse(result.ranked_lists_cached)
+        self.assertEqual(list(self.cache.root.iterdir()), [])
+
+
+class SequentialPairTests(SimpleTestCase):
+
+    def setUp(self):
+        self.trials = [
+            Trial(seeds=(_uid(i),), held_out=_uid(10_000 + i), is_cold=i % 2 == 0, basket_index=i)
+            for i in range(400)
+        ]
+        self.answers = {trial.seeds: trial.held_out for trial in self.trials}
+        self.dataset = Dataset(trials=self.trials, dataset_hash='s' * 64)
+
+    def _run(self, candidate, baseline, gates):
+        return evaluate_sequential_pair(
+            candidate, baseline, self.dataset, gates,
+            k=10, catalog_size=10, batch_size=50, min_trials=100, seed=3,
+        )
+
+    def test_clear_winner_stops_early_and_passes(self):
+        lift = SequentialGate('recall_lift', METRIC_RECALL, SEQUENTIAL_RELATIVE_LIFT, 0.05)
+        seq = self._run(_PerfectRanker(self.answers), _UselessRanker(), [lift])
+        self.assertTrue(seq.stopped_early)
+        self.assertEqual(seq.trials_scored, 100)
+        self.assertIs(seq.decisions[0].passed, True)
+        self.assertEqual(seq.candidate.n_trials, 100)
+        self.assertEqual(seq.baseline.n_trials, 100)
+        self.assertEqual(seq.candidate.metrics[METRIC_RECALL], 1.0)
+        self.assertEqual(seq.candidate.sequential_decisions, seq.decisions)
+        # A prefix is not the full split: both sides are stored under the prefix's own hash.
+        self.assertEqual(seq.dataset_hash, sequential_prefix_dataset_hash(self.dataset.dataset_hash, 3, 100))
+        self.assertEqual({seq.candidate.dataset_hash, seq.baseline.dataset_hash}, {seq.dataset_hash})
+        self.assertEqual(seq.decisions[0].threshold, 0.05)
+
+    def test_any_failed_gate_stops_the_stream(self):
+        gates = [
+            SequentialGate('recall_lift', METRIC_RECALL, SEQUENTIAL_RELATIVE_LIFT, 0.05),
+            SequentialGate('cold_start_regression', METRIC_COLD_RECALL, SEQUENTIAL_MAX_REGRESSION, 0.02),
+        ]
+        seq = self._run(_UselessRanker(), _PerfectRanker(self.answers), gates)
+        self.assertEqual(seq.trials_scored, 100)
+        # The cold slice (every other trial) is still under min_trials when recall fails.
+        self.assertEqual([d.passed for d in seq.decisions], [False, None])
+
+    def test_undecided_gate_runs_to_the_end(self):
+        tie = SequentialGate('cold_start_regression', METRIC_COLD_RECALL, SEQUENTIAL_MAX_REGRESSION, 0.0)
+        seq = self._run(_PerfectRanker(self.answers), _PerfectRanker(self.answers), [tie])
+        self.assertFalse(seq.stopped_early)
+        self.assertIsNone(seq.decisions[0].passed)
+        self.assertEqual(seq.decisions[0].n_trials, 200)
+        self.assertEqual(seq.candidate.dataset_hash, self.dataset.dataset_hash)
+
+    def test_requires_a_gate(self):
+        with self.assertRaises(ValueError):
+            self._run(_UselessRanker(), _UselessRanker(), [])
+
+
+class _FakeEngineTransport:
+    """Answers /engine/recommend/<ranker> with a fixed neighbour per seed."""
+    def __init__(self, neighbours):
+        self.neighbours = neighbours
+        self.calls = []
+
+    def post(self, path, payload):
+        self.calls.append((path, payload))
+        items = [
+            {'juke_id': str(self.neighbours[uuid.UUID(seed)]), 'score': 1.0, 'components': {}}
+            for seed in payload['seed_item_ids']
+            if uuid.UUID(seed) in self.neighbours
+        ]
+        return {'items': items, 'ranker': path.rsplit('/', 1)[-1], 'seed_count': len(payload['seed_item_ids'])}
+
+
+class EngineRankerTests(SimpleTestCase):
+
+    def test_rank_posts_canonical_request(self):
+        a, b = _uid(1), _uid(2)
+        transport = _FakeEngineTransport({a: b})
+        ranker = EngineRanker('cooccurrence', transport, concurrency=1)
+        self.assertEqual(ranker.rank((a,), {a}, 10), [b])
+        self.assertEqual(ranker.label, 'engine:cooccurrence')
+        path, payload = transport.calls[0]
+        self.assertEqual(path, '/engine/recommend/cooccurrence')
+        self.assertEqual(payload, {'seed_item_ids': [str(a)], 'exclude_ids': [str(a)], 'limit': 10})
+
+    def test_empty_seeds_skip_engine(self):
+        transport = _FakeEngineTransport({})
+        self.assertEqual(EngineRanker('metadata', transport).rank((), set(), 10), [])
+        self.assertEqual(transport.calls, [])
+
+    def test_unknown_ranker_rejected(self):
+        with self.assertRaises(ValueError):
+            EngineRanker('nope', _FakeEngineTransport({}))
+
+    def test_evaluation_records_serving_metrics(self):
+        a, b, c = _uid(1), _uid(2), _uid(3)
+        trials = [
+            Trial(seeds=(a,), held_out=b, is_cold=False),
+            Trial(seeds=(b,), held_out=a, is_cold=False),
+            Trial(seeds=(c,), held_out=a, is_cold=False),
+        ]
+        transport = _FakeEngineTransport({a: b, b: a, c: b})
+        ranker = EngineRanker('cooccurrence', transport, concurrency=2)
+        result = evaluate_ranker(ranker, Dataset(trials=trials, dataset_hash='e' * 64), k=10, catalog_size=10, batch_size=2)
+
+        self.assertEqual(len(transport.calls), 3)
+        self.assertAlmostEqual(result.metrics[METRIC_RECALL], 2 / 3)
+        for name in (METRIC_LATENCY_P50, METRIC_LATENCY_P95, METRIC_LATENCY_P99, METRIC_THROUGHPUT):
+            self.assertIn(name, result.metrics)
+        self.assertLessEqual(result.metrics[METRIC_LATENCY_P50], result.metrics[METRIC_LATENCY_P99])
+        self.assertGreater(result.metrics[METRIC_THROUGHPUT], 0.0)
+        self.assertNotIn(METRIC_LATENCY_P95, result.confidence_intervals)
+
+    def test_orm_rankers_record_no_serving_metrics(self):
+        trials = [Trial(seeds=(_uid(1),), held_out=_uid(2), is_cold=False)]
+        result = evaluate_ranker(_UselessRanker(), Dataset(trials=trials, dataset_hash='x' * 64), k=10, catalog_size=10)
+        self.assertNotIn(METRIC_LATENCY_P95, result.metrics)
+
+
 # --- DB-integrated: ranker adapters + persistence ---
 
 def _mk_album(name='A'):
@@ -469,6 +856,52 @@ class PersistEvaluationTests(TestCase):
         self.assertEqual(row.n_trials, 5)
         self.assertEqual(row.n_cold_trials, 1)
         self.assertIsNone(row.model_id)
+        self.assertIsNone(row.ci_lower)
+
+    def test_sequential_run_writes_decisions_under_the_prefix_hash(self):
+        trials = [
+            Trial(seeds=(_uid(i),), held_out=_uid(10_000 + i), is_cold=False, basket_index=i)
+            for i in range(400)
+        ]
+        answers = {trial.seeds: trial.held_out for trial in trials}
+        lift = SequentialGate('recall_lift', METRIC_RECALL, SEQUENTIAL_RELATIVE_LIFT, 0.05)
+        seq = evaluate_sequential_pair(
+            _PerfectRanker(answers), _UselessRanker(), Dataset(trials=trials, dataset_hash='s' * 64), [lift],
+            k=10, catalog_size=10, batch_size=50, min_trials=100, seed=3,
+        )
+
+        persist_sequential_evaluation(seq)
+
+        self.assertEqual(set(ModelEvaluation.objects.values_list('dataset_hash', flat=True)), {seq.dataset_hash})
+        decision = SequentialGateDecision.objects.get()
+        self.assertEqual(
+            (decision.candidate_label, decision.baseline_label, decision.gate_name, decision.passed),
+            (seq.candidate.candidate_label, seq.baseline.candidate_label, 'recall_lift', True),
+        )
+        self.assertEqual((decision.trials_scored, decision.dataset_n_trials), (100, 400))
+        self.assertEqual(decision.dataset_hash, seq.dataset_hash)
+        self.assertGreater(decision.margin_lower, 0.0)
+        self.assertGreater(decision.critical_z, 1.96)
+
+    def test_writes_intervals_and_sample_parameters(self):
+        result = EvaluationResult(
+            candidate_label='metadata',
+            dataset_hash='s' * 64,
+            n_trials=5,
+            n_cold_trials=1,
+            metrics={METRIC_RECALL: 0.4, METRIC_COVERAGE: 0.2},
+            confidence_level=0.95,
+            confidence_intervals={METRIC_RECALL: (0.3, 0.5)},
+            sample_rate=0.1,
+            sample_seed=3,
+        )
+        persist_evaluation(result)
+        recall = ModelEvaluation.objects.get(metric_name=METRIC_RECALL)
+        self.assertEqual((recall.ci_lower, recall.ci_upper, recall.confidence_level), (0.3, 0.5, 0.95))
+        self.assertEqual((recall.sample_rate, recall.sample_seed), (0.1, 3))
+        coverage_row = ModelEvaluation.objects.get(metric_name=METRIC_COVERAGE)
+        self.assertIsNone(coverage_row.ci_lower)
+        self.assertIsNone(coverage_row.confidence_level)
 
     def test_writes_training_run_for_cooccurrence_metrics(self):
         run = TrainingRun.objects.create(
@@ -561,6 +994,22 @@ class RunOfflineEvaluationTests(TestCase):
         self.assertEqual(len(results), 2)
         self.assertEqual(results[0].dataset_hash, results[1].dataset_hash)
 
+    def test_engine_rankers_evaluated_after_orm_rankers(self):
+        self._session([self.t1, self.t2])
+        canonical = bulk_ensure_canonical_items_for_tracks([self.t1, self.t2])
+        c1, c2 = canonical[self.t1.juke_id].pk, canonical[self.t2.juke_id].pk
+        results = run_offline_evaluation(
+            labels=[],
+            engine_rankers=['metadata'],
+            engine_transport=_FakeEngineTransport({c1: c2, c2: c1}),
+            persist=True,
+        )
+        self.assertEqual([r.candidate_label for r in results], ['engine:metadata'])
+        self.assertEqual(results[0].metrics[METRIC_RECALL], 1.0)
+        self.assertTrue(
+            ModelEvaluation.objects.filter(candidate_label='engine:metadata', metric_name=METRIC_LATENCY_P95).exists()
+        )
+
     def test_unknown_ranker_label_raises(self):
         self._session([self.t1, self.t2])
         with self.assertRaises(ValueError):
@@ -1,14 +1,17 @@
 import json
+import pickle
 import tarfile
+import uuid
 import tempfile
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from io import BytesIO, StringIO
 from pathlib import Path
+from unittest import mock
 
 from django.core.management import call_command
 from django.db import connection
-from django.test import TransactionTestCase, override_settings
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
 
 from catalog.models import Album, Track
 from mlcore.models import (
@@ -19,13 +22,21 @@ from mlcore.models import (
 )
 from mlcore.services.full_ingestion import (
     FULL_INGESTION_POLICY_THROUGHPUT,
+    LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE,
     LISTENBRAINZ_EVENT_LOAD_TABLE,
     LISTENBRAINZ_FINALIZE_CHECKPOINT_TABLE,
     LISTENBRAINZ_SESSION_LOAD_TABLE,
     LISTENBRAINZ_SESSION_STAGE_TABLE,
+    LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE,
     LISTENBRAINZ_FINALIZE_PHASE_PARTITION_DRAIN,
     _create_empty_listenbrainz_event_ledger_build_table,
     _create_empty_listenbrainz_session_track_build_table,
+    _create_listenbrainz_shadow_constraints_and_indexes,
+    _listenbrainz_shadow_index_phase,
+    _listenbrainz_shadow_index_statements,
+    _mark_finalize_checkpoint,
+    LISTENBRAINZ_IDENTITY_SNAPSHOT_FILENAME,
+    _ListenBrainzStreamExtractPool,
     _ensure_listenbrainz_session_stage_table,
     _finalize_listenbrainz_partition_into_build_tables,
     build_full_ingestion_partition_estimates,
@@ -38,8 +49,11 @@ from mlcore.services.full_ingestion import (
     ensure_listenbrainz_load_tables,
     full_ingestion_copy_manifest_path,
     initialize_full_ingestion_plan,
+    listenbrainz_load_partition_table_name,
     load_full_ingestion_plan,
+    plan_full_ingestion_partition_rebalance,
     write_full_ingestion_metrics,
+    write_listenbrainz_identity_snapshot,
 )
 from mlcore.ingestion.listenbrainz import infer_source_version_from_path
 from mlcore.services.listenbrainz_shards import materialize_listenbrainz_shards
@@ -209,6 +223,9 @@ class FullIngestionPlanningTests(FullIngestionMixin, TransactionTestCase):
         self.assertGreaterEqual(extracted.counters['chunk_bytes_written'], 1)
         self.assertEqual(extracted.counters['spool_bytes_estimated'], 0)
         self.assertEqual(extracted.counters['spooled_members_in_flight'], 0)
+        self.assertEqual(extracted.counters['stream_bytes_in_flight'], 0)
+        self.assertEqual(extracted.counters['streamed_members_in_flight'], 0)
+        self.assertFalse((Path(extracted.run_root) / 'spool').exists())
         self.assertTrue(all(partition.state == 'partitioned' for partition in extracted.partitions))
 
         manifests = sorted(Path(extracted.partition_root).glob('p*/manifest.json'))
@@ -220,6 +237,29 @@ class FullIngestionPlanningTests(FullIngestionMixin, TransactionTestCase):
         )
         self.assertIn('event_chunks', populated_manifest)
         self.assertEqual(populated_manifest['event_chunks'][0]['relative_path'].split('/')[0], 'events')
+        self.assertEqual(populated_manifest['event_chunks'][0]['format'], 'csv')
+        self.assertTrue(populated_manifest['event_chunks'][0]['relative_path'].endswith('.csv'))
+
+    @override_settings(MLCORE_FULL_INGESTION_EXTRACT_MODE='spool')
+    def test_extract_stage_spool_mode_matches_stream_mode_counters(self):
+        archive_path = self._build_archive()
+        plan = build_full_ingestion_plan(
+            'listenbrainz',
+            archive_path,
+            scratch_root=self.temp_dir / 'scratch',
+            partition_count=4,
+        )
+
+        initialize_full_ingestion_plan(plan)
+        extracted = execute_full_ingestion_partition_stage(plan)
+
+        self.assertEqual(extracted.counters['rows_parsed'], 3)
+        self.assertEqual(extracted.counters['rows_resolved'], 3)
+        self.assertEqual(extracted.counters['chunks_written'], 3)
+        self.assertEqual(extracted.counters['spool_bytes_estimated'], 0)
+        self.assertEqual(extracted.counters['spooled_members_in_flight'], 0)
+        self.assertTrue((Path(extracted.run_root) / 'spool').is_dir())
+        self.assertEqual(list((Path(extracted.run_root) / 'spool').iterdir()), [])
 
     @override_settings(
         MLCORE_FULL_INGESTION_PARTITION_COUNT=6,
@@ -349,6 +389,100 @@ class FullIngestionPlanningTests(FullIngestionMixin, TransactionTestCase):
         self.assertEqual(payload['runtime_control']['merge_worker_budget'], 2)
 
 
+class ListenBrainzIdentitySnapshotTests(SimpleTestCase):
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def test_snapshot_file_resolves_mbid_and_spotify_keys_after_pickling(self):
+        mbid_to_track_id = {str(uuid.uuid4()): str(uuid.uuid4()) for _ in range(50)}
+        spotify_to_track_id = {f'spotify-{index}': str(uuid.uuid4()) for index in range(50)}
+        snapshot = write_listenbrainz_identity_snapshot(
+            self.temp_dir / LISTENBRAINZ_IDENTITY_SNAPSHOT_FILENAME,
+            mbid_to_track_id=mbid_to_track_id,
+            spotify_to_track_id=spotify_to_track_id,
+        )
+
+        self.assertEqual(snapshot.mbid_count, 50)
+        self.assertEqual(snapshot.spotify_count, 50)
+        restored = pickle.loads(pickle.dumps(snapshot))
+        self.assertLess(len(pickle.dumps(snapshot)), 512)
+        for mbid, track_id in mbid_to_track_id.items():
+            self.assertEqual(restored.track_id_for_mbid(mbid), track_id)
+            self.assertEqual(restored.track_id_for_mbid(mbid.upper()), track_id)
+        for spotify_id, track_id in spotify_to_track_id.items():
+            self.assertEqual(restored.track_id_for_spotify(spotify_id), track_id)
+        self.assertEqual(restored.track_id_for_mbid(str(uuid.uuid4())), '')
+        self.assertEqual(restored.track_id_for_mbid('not-a-uuid'), '')
+        self.assertEqual(restored.track_id_for_spotify('spotify-missing'), '')
+        self.assertEqual(restored.track_id_for_spotify(''), '')
+
+    def test_empty_snapshot_resolves_nothing(self):
+        snapshot = write_listenbrainz_identity_snapshot(
+            self.temp_dir / LISTENBRAINZ_IDENTITY_SNAPSHOT_FILENAME,
+            mbid_to_track_id={},
+            spotify_to_track_id={},
+        )
+
+        self.assertEqual(snapshot.mbid_count, 0)
+        self.assertEqual(snapshot.track_id_for_mbid(str(uuid.uuid4())), '')
+        self.assertEqual(snapshot.track_id_for_spotify('spotify-may'), '')
+
+
+class FullIngestionRebalancePlanTests(SimpleTestCase):
+    def test_splits_oversized_and_coalesces_small_partitions(self):
+        row_counts = {'p000': 1000, 'p001': 100, 'p002': 40, 'p003': 30, 'p004': 0}
+
+        splits, groups = plan_full_ingestion_partition_rebalance(row_counts, skew_factor=2.0)
+
+        self.assertEqual(splits, {'p000': 5})
+        self.assertEqual(groups, [['p001', 'p002', 'p003']])
+        self.assertEqual(
+            plan_full_ingestion_partition_rebalance(row_counts, skew_factor=2.0, min_split_rows=1000),
+            ({}, [['p001', 'p002', 'p003']]),
+        )
+        self.assertEqual(plan_full_ingestion_partition_rebalance(row_counts, skew_factor=1.0), ({}, []))
+
+
+class ListenBrainzStreamExtractPoolTests(FullIngestionMixin, SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        # Forked workers must not inherit a live database socket.
+        connection.close()
+
+    def test_pool_parses_streamed_members_within_one_block_budget(self):
+        partition_root = self.temp_dir / 'partitions'
+        partition_root.mkdir()
+        members = {
+            'may': self.may_payload,
+            'june': self.june_payload,
+        }
+
+        with _ListenBrainzStreamExtractPool(
+            worker_count=2,
+            budget_bytes=1,
+            identity_snapshot=write_listenbrainz_identity_snapshot(
+                self.temp_dir / LISTENBRAINZ_IDENTITY_SNAPSHOT_FILENAME,
+                mbid_to_track_id={},
+                spotify_to_track_id={},
+            ),
+            partition_root=str(partition_root),
+            run_id=str(uuid.uuid4()),
+            partition_count=4,
+            chunk_target_rows=100,
+        ) as pool:
+            for token, payload in members.items():
+                pool.stream_member(token, f'listens/{token}.listens', BytesIO(payload), active_workers=2)
+            results = []
+            while pool.members_in_flight:
+                results.extend(pool.collect(block=True))
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(sum(result.counters['rows_parsed'] for result in results), 3)
+        self.assertEqual(sum(result.streamed_bytes for result in results), sum(len(payload) for payload in members.values()))
+        self.assertEqual(sum(result.spool_size_bytes for result in results), 0)
+        self.assertEqual(len(list(partition_root.glob('p*/events/*'))), 3)
+
+
 class FullIngestionExecutionTests(FullIngestionMixin, TransactionTestCase):
     def _create_track(self, *, spotify_id: str) -> Track:
         album = Album.objects.create(
@@ -418,6 +552,122 @@ class FullIngestionExecutionTests(FullIngestionMixin, TransactionTestCase):
         self.assertIn('rows_loaded', copy_payload)
         self.assertIn('session_rows_loaded', copy_payload)
 
+    def test_binary_and_csv_chunk_formats_load_identical_event_rows(self):
+        self._create_track(spotify_id='spotify-may')
+        archive_path = self._build_archive()
+        loaded_rows = {}
+        for chunk_format in ('binary', 'csv'):
+            with override_settings(MLCORE_FULL_INGESTION_CHUNK_FORMAT=chunk_format):
+                plan = build_full_ingestion_plan(
+                    'listenbrainz',
+                    archive_path,
+                    scratch_root=self.temp_dir / f'scratch-{chunk_format}',
+                    partition_count=4,
+                )
+                initialize_full_ingestion_plan(plan)
+                extracted = execute_full_ingestion_partition_stage(plan)
+                chunk_paths = [path.name for path in Path(extracted.partition_root).glob('p*/events/*')]
+                self.assertTrue(chunk_paths)
+                self.assertTrue(all(path.endswith('.pgcopy' if chunk_format == 'binary' else '.csv') for path in chunk_paths))
+                loaded = execute_full_ingestion_copy_stage(extracted)
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT partition_key, event_signature, played_at, session_key, canonical_item_id,
+                           canonical_item_type, canonical_item_key, track_id, resolution_state, cold_ref
+                    FROM {LISTENBRAINZ_EVENT_LOAD_TABLE}
+                    WHERE run_id = %s
+                    ORDER BY cold_ref
+                    """,
+                    [loaded.run_id],
+                )
+                loaded_rows[chunk_format] = [
+                    tuple(bytes(value) if isinstance(value, memoryview) else value for value in row)
+                    for row in cursor.fetchall()
+                ]
+
+        self.assertEqual(len(loaded_rows['binary']), 3)
+        self.assertEqual(loaded_rows['binary'], loaded_rows['csv'])
+        self.assertEqual(sum(1 for row in loaded_rows['binary'] if row[7] is not None), 1)
+
+    def test_copy_stage_loads_chunks_by_their_recorded_format_not_the_setting(self):
+        self._create_track(spotify_id='spotify-may')
+        archive_path = self._build_archive()
+        loaded_counts = {}
+        for label, chunk_format in (('binary-run', 'binary'), ('legacy-run', 'csv')):
+            with override_settings(MLCORE_FULL_INGESTION_CHUNK_FORMAT=chunk_format):
+                plan = build_full_ingestion_plan(
+                    'listenbrainz',
+                    archive_path,
+                    scratch_root=self.temp_dir / f'scratch-{label}',
+                    partition_count=4,
+                )
+                initialize_full_ingestion_plan(plan)
+                extracted = execute_full_ingestion_partition_stage(plan)
+            if label == 'legacy-run':
+                # Manifests written before chunk formats existed carry no `format`.
+                for manifest_path in Path(extracted.partition_root).glob('p*/manifest.json'):
+                    payload = json.loads(manifest_path.read_text(encoding='utf-8'))
+                    for chunk in payload.get('event_chunks', []):
+                        chunk.pop('format', None)
+                    manifest_path.write_text(json.dumps(payload), encoding='utf-8')
+            # Resumed under the default (csv) setting.
+            loaded = execute_full_ingestion_copy_stage(extracted)
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT COUNT(*) FROM {LISTENBRAINZ_EVENT_LOAD_TABLE} WHERE run_id = %s', [loaded.run_id])
+                loaded_counts[label] = cursor.fetchone()[0]
+
+        self.assertEqual(loaded_counts, {'binary-run': 3, 'legacy-run': 3})
+
+    @override_settings(MLCORE_FULL_INGESTION_SESSION_AGGREGATE_BYTES=1)
+    def test_copy_stage_merges_spilled_session_runs_across_members(self):
+        self._create_track(spotify_id='spotify-may')
+        # The May listen appears in both members, so its session aggregate is
+        # split across runs from different members and must merge to one row.
+        self.june_payload = self.june_payload + self.may_payload + self.may_payload
+        archive_path = self._build_archive()
+        plan = build_full_ingestion_plan(
+            'listenbrainz',
+            archive_path,
+            scratch_root=self.temp_dir / 'scratch',
+            partition_count=2,
+        )
+
+        initialize_full_ingestion_plan(plan)
+        extracted = execute_full_ingestion_partition_stage(plan)
+        self.assertGreaterEqual(extracted.counters['session_runs_written'], 4)
+        loaded = execute_full_ingestion_copy_stage(extracted)
+
+        self.assertEqual(loaded.counters['rows_staged'], 5)
+        self.assertEqual(loaded.counters['session_rows_loaded'], 3)
+        self.assertFalse(any(Path(loaded.partition_root).glob('p*/sessions')))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT session_key, canonical_item_id, track_id, MIN(played_at), MAX(played_at), COUNT(*)
+                FROM {LISTENBRAINZ_EVENT_LOAD_TABLE}
+                WHERE run_id = %s AND canonical_item_id IS NOT NULL
+                GROUP BY session_key, canonical_item_id, track_id
+                ORDER BY session_key, canonical_item_id
+                """,
+                [loaded.run_id],
+            )
+            grouped = [(bytes(row[0]), *row[1:]) for row in cursor.fetchall()]
+            cursor.execute(
+                f"""
+                SELECT session_key, canonical_item_id, track_id, first_played_at, last_played_at, play_count
+                FROM {LISTENBRAINZ_SESSION_LOAD_TABLE}
+                WHERE run_id = %s
+                ORDER BY session_key, canonical_item_id
+                """,
+                [loaded.run_id],
+            )
+            pre_aggregated = [(bytes(row[0]), *row[1:]) for row in cursor.fetchall()]
+        self.assertEqual(pre_aggregated, grouped)
+        self.assertEqual(sorted(row[5] for row in pre_aggregated), [1, 1, 3])
+        self.assertEqual(sum(1 for row in pre_aggregated if row[2] is not None), 1)
+
     def test_load_tables_have_partition_lookup_indexes(self):
         ensure_listenbrainz_load_tables()
 
@@ -444,6 +694,51 @@ class FullIngestionExecutionTests(FullIngestionMixin, TransactionTestCase):
         self.assertIn(f'{LISTENBRAINZ_EVENT_LOAD_TABLE}_run_partition_idx', index_names)
         self.assertIn(f'{LISTENBRAINZ_SESSION_LOAD_TABLE}_run_partition_idx', index_names)
 
+    @override_settings(MLCORE_FULL_INGESTION_TARGET_CHUNK_ROWS=2)
+    def test_copy_stage_loads_each_partition_into_its_own_unlogged_child(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest('LIST-partitioned load tables are PostgreSQL-only')
+        self._create_track(spotify_id='spotify-may')
+        plan = build_full_ingestion_plan(
+            'listenbrainz',
+            self._build_archive(),
+            scratch_root=self.temp_dir / 'scratch',
+            partition_count=4,
+        )
+        initialize_full_ingestion_plan(plan)
+        loaded = execute_full_ingestion_copy_stage(execute_full_ingestion_partition_stage(plan))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT parent.relname, child.relname, child.relpersistence
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname IN (%s, %s) AND parent.relkind = 'p'
+                """,
+                [LISTENBRAINZ_EVENT_LOAD_TABLE, LISTENBRAINZ_SESSION_LOAD_TABLE],
+            )
+            children = cursor.fetchall()
+            cursor.execute(
+                f"""
+                SELECT tableoid::regclass::text, partition_key
+                FROM {LISTENBRAINZ_EVENT_LOAD_TABLE}
+                WHERE run_id = %s
+                """,
+                [loaded.run_id],
+            )
+            event_rows = cursor.fetchall()
+
+        self.assertTrue(all(persistence == 'u' for _, _, persistence in children))
+        self.assertEqual(len(event_rows), 3)
+        for child_table, partition_key in event_rows:
+            self.assertEqual(child_table, listenbrainz_load_partition_table_name(LISTENBRAINZ_EVENT_LOAD_TABLE, partition_key))
+        self.assertEqual(
+            {child for parent, child, _ in children if parent == LISTENBRAINZ_EVENT_LOAD_TABLE},
+            {child_table for child_table, _ in event_rows},
+        )
+
     def test_load_tables_are_rebuilt_when_stale_schema_exists(self):
         with connection.cursor() as cursor:
             cursor.execute(f'DROP TABLE IF EXISTS {LISTENBRAINZ_FINALIZE_CHECKPOINT_TABLE}')
@@ -680,6 +975,100 @@ class FullIngestionExecutionTests(FullIngestionMixin, TransactionTestCase):
                 shadow_tables_exist = cursor.fetchone()[0]
             self.assertFalse(shadow_tables_exist)
 
+    @override_settings(MLCORE_FULL_INGESTION_SORTED_CHUNKS=True)
+    def test_sorted_chunks_are_deduplicated_before_load_and_drained_without_sorting(self):
+        self._create_track(spotify_id='spotify-may')
+        # The May listen repeats within the June member and across members.
+        self.june_payload = self.june_payload + self.may_payload + self.may_payload
+        archive_path = self._build_archive()
+        plan = build_full_ingestion_plan(
+            'listenbrainz',
+            archive_path,
+            scratch_root=self.temp_dir / 'scratch',
+            partition_count=2,
+        )
+
+        initialize_full_ingestion_plan(plan)
+        extracted = execute_full_ingestion_partition_stage(plan)
+        self.assertEqual(extracted.counters['rows_parsed'], 5)
+        loaded = execute_full_ingestion_copy_stage(extracted)
+
+        self.assertEqual(loaded.counters['rows_staged'], 3)
+        self.assertEqual(loaded.counters['rows_deduplicated_before_load'], 2)
+        copy_manifests = [
+            json.loads(full_ingestion_copy_manifest_path(loaded, partition_key=partition.partition_key).read_text())
+            for partition in loaded.partitions
+            if full_ingestion_copy_manifest_path(loaded, partition_key=partition.partition_key).exists()
+        ]
+        self.assertTrue(copy_manifests)
+        self.assertTrue(all(manifest['presorted'] for manifest in copy_manifests))
+        self.assertEqual(sum(manifest['rows_deduplicated'] for manifest in copy_manifests), 2)
+
+        merged = execute_full_ingestion_merge_stage(loaded)
+
+        self.assertEqual(merged.status, 'succeeded')
+        self.assertEqual(merged.counters['rows_merged'], 3)
+        self.assertEqual(merged.counters['rows_deduplicated'], 2)
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 3)
+        self.assertEqual(
+            sorted(ListenBrainzSessionTrack.objects.values_list('play_count', flat=True)),
+            [1, 1, 3],
+        )
+
+    @override_settings(MLCORE_FULL_INGESTION_TARGET_CHUNK_ROWS=2, MLCORE_FULL_INGESTION_REBALANCE_SKEW_FACTOR=1.01)
+    @mock.patch('mlcore.services.full_ingestion.FULL_INGESTION_REBALANCE_MIN_SPLIT_ROWS', 0)
+    def test_extract_rebalances_skewed_partitions_before_copy(self):
+        self.june_payload = b''.join(
+            self._build_listen_row(
+                user_name=f'user-{index % 3}',
+                listened_at=1000 * index,
+                track_name=f'Song {index}',
+                artist_name='Artist',
+                release_name='Release',
+                spotify_id=f'spotify-{index}',
+            )
+            for index in range(40)
+        )
+        archive_path = self._build_archive()
+        plan = build_full_ingestion_plan(
+            'listenbrainz',
+            archive_path,
+            scratch_root=self.temp_dir / 'scratch',
+            partition_count=4,
+        )
+
+        initialize_full_ingestion_plan(plan)
+        extracted = execute_full_ingestion_partition_stage(plan)
+
+        self.assertGreaterEqual(extracted.counters['partitions_split'] + extracted.counters['partitions_coalesced'], 1)
+        partition_keys = {partition.partition_key for partition in extracted.partitions}
+        self.assertNotEqual(partition_keys, {'p000', 'p001', 'p002', 'p003'})
+        self.assertEqual(
+            {path.parent.name for path in Path(extracted.partition_root).glob('*/manifest.json')},
+            partition_keys,
+        )
+        manifest_rows = sum(
+            int(chunk['row_count'])
+            for partition_key in partition_keys
+            for chunk in json.loads(
+                (Path(extracted.partition_root) / partition_key / 'manifest.json').read_text(encoding='utf-8')
+            )['event_chunks']
+        )
+        self.assertEqual(manifest_rows, 41)
+
+        merged = execute_full_ingestion_merge_stage(execute_full_ingestion_copy_stage(extracted))
+
+        self.assertEqual(merged.status, 'succeeded')
+        self.assertEqual(merged.counters['rows_merged'], 41)
+        self.assertEqual(merged.counters['partitions_merged'], len(partition_keys))
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 41)
+        self.assertEqual(sum(ListenBrainzSessionTrack.objects.values_list('play_count', flat=True)), 41)
+
+        # A forced re-extract writes to the hash buckets again before rebalancing.
+        reextracted = execute_full_ingestion_partition_stage(merged, force=True)
+        self.assertEqual(reextracted.counters['rows_parsed'], 41)
+        self.assertEqual({partition.partition_key for partition in reextracted.partitions}, partition_keys)
+
     def test_merge_stage_force_can_rerun_failed_all_merged_state_from_load_tables(self):
         self._create_track(spotify_id='spotify-may')
         archive_path = self._build_archive()
@@ -784,6 +1173,57 @@ class FullIngestionExecutionTests(FullIngestionMixin, TransactionTestCase):
             retained_checkpoint_count = cursor.fetchone()[0]
         self.assertEqual(retained_checkpoint_count, 0)
 
+    def _drop_shadow_build_tables(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DROP TABLE IF EXISTS {LISTENBRAINZ_EVENT_LEDGER_BUILD_TABLE}, {LISTENBRAINZ_SESSION_TRACK_BUILD_TABLE} CASCADE'
+            )
+
+    def test_shadow_indexes_build_in_parallel_and_skip_checkpointed_indexes(self):
+        run_id = str(uuid.uuid4())
+        statements = _listenbrainz_shadow_index_statements()
+        ensure_listenbrainz_load_tables()
+        self.addCleanup(self._drop_shadow_build_tables)
+
+        with connection.cursor() as cursor:
+            _create_empty_listenbrainz_event_ledger_build_table(cursor)
+            _create_empty_listenbrainz_session_track_build_table(cursor)
+            _mark_finalize_checkpoint(
+                cursor,
+                run_id=run_id,
+                phase=_listenbrainz_shadow_index_phase('mlcore_lbe_build_played_at_idx'),
+            )
+            built = _create_listenbrainz_shadow_constraints_and_indexes(
+                cursor,
+                run_id=run_id,
+                lane_budget=4,
+                maintenance_work_mem_bytes=256 * 1024 * 1024,
+            )
+            cursor.execute(
+                f'''
+                SELECT COUNT(*)
+                FROM {LISTENBRAINZ_FINALIZE_CHECKPOINT_TABLE}
+                WHERE run_id = %s
+                  AND phase LIKE %s
+                ''',
+                [run_id, 'shadow_index:%'],
+            )
+            checkpoint_count = cursor.fetchone()[0]
+            cursor.execute(
+                '''
+                SELECT indexname
+                FROM pg_indexes
+                WHERE indexname LIKE 'mlcore_lbe_build_%%' OR indexname LIKE 'mlcore_lst_build_%%'
+                '''
+            )
+            index_names = {row[0] for row in cursor.fetchall()}
+
+        self.assertEqual(built, len(statements) - 1)
+        self.assertEqual(checkpoint_count, len(statements))
+        self.assertNotIn('mlcore_lbe_build_played_at_idx', index_names)
+        self.assertIn('mlcore_lbe_build_pkey', index_names)
+        self.assertIn('mlcore_lst_build_last_played_idx', index_names)
+
     def test_pipeline_executor_completes_end_to_end(self):
         self._create_track(spotify_id='spotify-may')
         archive_path = self._build_archive()
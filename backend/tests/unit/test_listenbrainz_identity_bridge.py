@@ -7,12 +7,13 @@ from pathlib import Path
 
 from django.core.management import call_command
 from django.db import connection
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from mlcore.models import (
     CanonicalItem,
     CanonicalItemAlias,
     CanonicalItemRedirect,
+    CanonicalItemRedirectClosure,
     ListenBrainzIdentityShard,
     ListenBrainzMSIDMBIDConflictResolution,
     ListenBrainzMSIDMBIDMapping,
@@ -21,6 +22,8 @@ from mlcore.models import (
 from mlcore.services.canonical_items import identity_from_parts
 from mlcore.services.listenbrainz_identity_bridge import (
     CONFLICT_RESOLVER_SOURCE_ID,
+    PAIR_RECORD_MEMORY_BYTES,
+    _extract_identity_shard_files,
     expand_listenbrainz_identity_graph,
     import_listenbrainz_identity_bridge,
     materialize_listenbrainz_isrc_aliases,
@@ -28,6 +31,48 @@ from mlcore.services.listenbrainz_identity_bridge import (
 )
 
 
+class IdentityShardExtractionTests(SimpleTestCase):
+
+    def test_spilled_runs_merge_into_sort_unique_output_with_exact_counts(self):
+        msids = sorted(str(uuid.uuid4()) for _ in range(6))
+        mbids = [str(uuid.uuid4()) for _ in range(3)]
+        lines = []
+        for index in range(40):
+            msid = msids[index % len(msids)]
+            lines.append(json.dumps({
+                'recording_msid': msid,
+                'track_metadata': {
+                    'mbid_mapping': {'recording_mbid': mbids[index % len(mbids)]},
+                    'additional_info': {'isrc': f'USAAA24{index % 5:05d}'},
+                },
+            }))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            source_path = root / 'shard.jsonl'
+            source_path.write_text('\n'.join(lines) + '\n')
+
+            counts = _extract_identity_shard_files(
+                source_path,
+                shard_key='shard.jsonl',
+                output_path=root / 'shard.msid-mbid.tsv',
+                isrc_output_path=root / 'shard.msid-isrc.tsv',
+                memory_budget_bytes=PAIR_RECORD_MEMORY_BYTES * 6,
+            )
+
+            expected_pairs = sorted({f'{msids[i % 6]}\t{mbids[i % 3]}\n' for i in range(40)})
+            expected_isrcs = sorted({f'{msids[i % 6]}\tUSAAA24{i % 5:05d}\n' for i in range(40)})
+            self.assertEqual((root / 'shard.msid-mbid.tsv').read_text().splitlines(keepends=True), expected_pairs)
+            self.assertEqual((root / 'shard.msid-isrc.tsv').read_text().splitlines(keepends=True), expected_isrcs)
+            self.assertEqual(counts['unique_pair_count'], len(expected_pairs))
+            self.assertEqual(counts['unique_isrc_pair_count'], len(expected_isrcs))
+            self.assertEqual(counts['mapped_row_count'], 40)
+            self.assertEqual(sorted(path.name for path in root.iterdir()), [
+                'shard.jsonl',
+                'shard.msid-isrc.tsv',
+                'shard.msid-mbid.tsv',
+            ])
+
+
 class ListenBrainzIdentityBridgeTests(TestCase):
     source_version = 'listenbrainz-test-v1'
 
@@ -190,6 +235,24 @@ class ListenBrainzIdentityBridgeTests(TestCase):
         self.assertEqual(result.isrc_observation_count, 6)
         self.assertEqual(result.malformed_row_count, 2)
 
+    def test_parallel_extraction_matches_sequential_counts_and_files(self):
+        sequential_root = self.output_root.parent / 'sequential'
+        sequential = import_listenbrainz_identity_bridge(self.manifest_path, output_root=sequential_root)
+        ListenBrainzIdentityShard.objects.all().delete()
+
+        parallel = import_listenbrainz_identity_bridge(self.manifest_path, output_root=self.output_root, extract_workers=2)
+
+        self.assertEqual(parallel.source_row_count, sequential.source_row_count)
+        self.assertEqual(parallel.mapped_row_count, sequential.mapped_row_count)
+        self.assertEqual(parallel.unique_pair_count, sequential.unique_pair_count)
+        self.assertEqual(parallel.isrc_observation_count, sequential.isrc_observation_count)
+        self.assertEqual(
+            sorted(path.name for path in self.output_root.rglob('*.tsv')),
+            sorted(path.name for path in sequential_root.rglob('*.tsv')),
+        )
+        for path in sequential_root.rglob('*.tsv'):
+            self.assertEqual((self.output_root / path.relative_to(sequential_root)).read_bytes(), path.read_bytes())
+
     def test_pre_isrc_checkpoint_is_reextracted_once(self):
         first = import_listenbrainz_identity_bridge(self.manifest_path, output_root=self.output_root)
         ListenBrainzIdentityShard.objects.filter(source_version=self.source_version).update(
@@ -222,6 +285,13 @@ class ListenBrainzIdentityBridgeTests(TestCase):
 
         self.assertEqual(final.redirect_count, 2)
         self.assertEqual(CanonicalItemRedirect.objects.filter(status='active').count(), 2)
+        self.assertEqual(
+            set(CanonicalItemRedirectClosure.objects.values_list('from_canonical_item_id', 'terminal_canonical_item_id')),
+            set(CanonicalItemRedirect.objects.filter(status='active').values_list(
+                'from_canonical_item_id',
+                'to_canonical_item_id',
+            )),
+        )
         self.assertEqual(
             CanonicalItemRedirect.objects.filter(
                 from_canonical_item__canonical_key=f'recording_msid:{self.msid_conflict}',
@@ -304,6 +374,13 @@ class ListenBrainzIdentityBridgeTests(TestCase):
         self.assertEqual(result.resolved_msid_count, 1)
         self.assertEqual(result.redirect_count, 1)
         self.assertEqual(result.redirect_conflict_count, 0)
+        self.assertTrue(
+            CanonicalItemRedirectClosure.objects.filter(
+                from_canonical_item__canonical_key=f'recording_msid:{dominant_msid}',
+                terminal_canonical_item__canonical_key=f'recording_mbid:{self.mbid_one}',
+                depth=1,
+            ).exists()
+        )
         resolution = ListenBrainzMSIDMBIDConflictResolution.objects.get(recording_msid=dominant_msid)
         self.assertEqual(resolution.chosen_recording_mbid, self.mbid_one)
         self.assertAlmostEqual(resolution.winner_share, 20 / 21)
@@ -323,6 +400,46 @@ class ListenBrainzIdentityBridgeTests(TestCase):
             ).exists()
         )
 
+    def test_conflict_resolution_creates_missing_winner_msid_items_in_one_pass(self):
+        import_listenbrainz_identity_bridge(self.manifest_path, output_root=self.output_root)
+        loser_mbid = uuid.uuid4()
+        self._create_item('recording_mbid', loser_mbid)
+        dominant_msids = [uuid.uuid4() for _ in range(3)]
+        ListenBrainzMSIDMBIDMapping.objects.bulk_create([
+            ListenBrainzMSIDMBIDMapping(
+                recording_msid=msid,
+                recording_mbid=mbid,
+                source_version=self.source_version,
+                shard_observation_count=count,
+                first_shard='manual',
+                last_shard='manual',
+                status='conflict',
+            )
+            for msid in dominant_msids
+            for mbid, count in ((self.mbid_one, 30), (loser_mbid, 1))
+        ])
+        progress = []
+
+        result = resolve_listenbrainz_identity_conflicts(
+            self.source_version,
+            batch_size=2,
+            progress_callback=progress.append,
+        )
+
+        self.assertEqual(result.resolved_msid_count, 3)
+        self.assertEqual(result.created_msid_count, 3)
+        self.assertEqual(result.redirect_count, 3)
+        self.assertEqual([event['staged_msid_count'] for event in progress], [2, 3])
+        for msid in dominant_msids:
+            item = CanonicalItem.objects.get(canonical_key=f'recording_msid:{msid}')
+            self.assertEqual(item.id, identity_from_parts(item_type='recording_msid', key_value=msid).item_id)
+            self.assertTrue(
+                CanonicalItemRedirectClosure.objects.filter(
+                    from_canonical_item=item,
+                    terminal_canonical_item__canonical_key=f'recording_mbid:{self.mbid_one}',
+                ).exists()
+            )
+
     def test_cold_evidence_and_unlogged_stage_placement(self):
         self.assertEqual(ListenBrainzMSIDMBIDMapping._meta.db_tablespace, 'juke_mlcore_cold')
         self.assertEqual(ListenBrainzIdentityShard._meta.db_tablespace, 'juke_mlcore_cold')
@@ -334,6 +451,7 @@ class ListenBrainzIdentityBridgeTests(TestCase):
                 JOIN pg_tablespace t ON t.oid = c.reltablespace
                 WHERE c.relname IN (
                     'mlcore_listenbrainz_identity_pair_stage',
+                    'mlcore_listenbrainz_identity_classification',
                     'mlcore_listenbrainz_msid_mbid_mapping',
                     'mlcore_listenbrainz_identity_shard',
                     'mlcore_canonical_item_redirect'
@@ -342,6 +460,7 @@ class ListenBrainzIdentityBridgeTests(TestCase):
             placement = {name: (tablespace, persistence) for name, tablespace, persistence in cursor.fetchall()}
 
         self.assertEqual(placement['mlcore_listenbrainz_identity_pair_stage'], ('juke_mlcore_cold', 'u'))
+        self.assertEqual(placement['mlcore_listenbrainz_identity_classification'], ('juke_mlcore_cold', 'u'))
         self.assertEqual(placement['mlcore_listenbrainz_msid_mbid_mapping'][0], 'juke_mlcore_cold')
         self.assertEqual(placement['mlcore_listenbrainz_identity_shard'][0], 'juke_mlcore_cold')
         self.assertEqual(placement['mlcore_canonical_item_redirect'][0], 'juke_mlcore_hot')
@@ -3,18 +3,25 @@ import io
 import json
 import tarfile
 import tempfile
+import threading
 import uuid
 from unittest import mock
 from pathlib import Path
 
+from django.db import connection
 from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from mlcore.ingestion.listenbrainz import (
+    PayloadCursor,
+    ResumeCheckpoint,
+    _build_track_resolver,
+    _iter_listen_payloads,
     _maybe_release_memory,
     configured_source_version,
     import_listenbrainz_dump,
 )
+from catalog.models import TrackExternalIdentifier
 from mlcore.models import (
     ListenBrainzEventLedger,
     ListenBrainzRawListen,
@@ -342,6 +349,8 @@ class ListenBrainzImportTests(TestCase):
                 'canonicalized_row_count': 1,
                 'unresolved_row_count': 0,
                 'malformed_row_count': 0,
+                'line_offset': 0,
+                'member_offset': 0,
             },
         )
 
@@ -366,6 +375,283 @@ class ListenBrainzImportTests(TestCase):
         )
         self.assertEqual(str(resumed_run.metadata['resumed_from_run_id']), str(failed_run.pk))
 
+    def test_pipelined_parse_commits_same_checkpoints_as_inline_parse(self):
+        lines = [
+            json.dumps(_listen_payload(user_name='alice', listened_at=1710000000 + index, recording_msid=f'pipe-{index}'))
+            for index in range(5)
+        ]
+        lines.insert(2, lines[1])
+        archive_path = _write_tar({'listenbrainz/listens/2026/03/chunk-0001.listens': '\n'.join(lines)})
+
+        checkpoints = {}
+        for depth in (0, 2):
+            ListenBrainzEventLedger.objects.all().delete()
+            with override_settings(MLCORE_LISTENBRAINZ_PIPELINE_DEPTH=depth):
+                result = import_listenbrainz_dump(
+                    archive_path,
+                    source_version=f'2026-03-22-pipeline-{depth}',
+                    import_mode='full',
+                    batch_size=2,
+                    resume=False,
+                )
+            self.assertEqual(result.source_row_count, 6)
+            self.assertEqual(result.imported_row_count, 5)
+            self.assertEqual(result.duplicate_row_count, 1)
+            checkpoints[depth] = SourceIngestionRun.objects.get(pk=result.run_id).metadata['last_committed_checkpoint']
+
+        self.assertEqual(checkpoints[0], checkpoints[2])
+        self.assertEqual(checkpoints[2]['line_number'], 6)
+
+    @override_settings(MLCORE_LISTENBRAINZ_PIPELINE_DEPTH=1)
+    def test_pipelined_parse_error_keeps_last_flushed_checkpoint(self):
+        archive_path = _write_tar({
+            'listenbrainz/listens/2026/03/chunk-0001.listens': '\n'.join([
+                json.dumps(_listen_payload(user_name='alice', listened_at=1710000000, recording_msid='pipe-ok-1')),
+                json.dumps(_listen_payload(user_name='alice', listened_at=1710000001, recording_msid='pipe-ok-2')),
+                json.dumps(_listen_payload(user_name='alice', listened_at=1710000002, recording_msid='pipe-ok-3')),
+                '{"user_name": ',
+            ]),
+        })
+
+        with self.assertRaisesMessage(ValueError, 'invalid JSON'):
+            import_listenbrainz_dump(archive_path, source_version='2026-03-22-pipe-err', import_mode='full', batch_size=2)
+
+        run = SourceIngestionRun.objects.get()
+        self.assertEqual(run.status, 'failed')
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 2)
+        checkpoint = run.metadata['last_committed_checkpoint']
+        self.assertEqual(checkpoint['line_number'], 2)
+        self.assertEqual(checkpoint['source_row_count'], 2)
+        self.assertEqual(checkpoint['malformed_row_count'], 0)
+
+    def test_parallel_member_workers_match_sequential_import(self):
+        members = {
+            f'listenbrainz/listens/2026/03/chunk-{member:04d}.listens': '\n'.join(
+                json.dumps(
+                    _listen_payload(
+                        user_name=f'user-{member}',
+                        listened_at=1710000000 + index,
+                        recording_msid=f'member-{member}-{index}',
+                    )
+                )
+                for index in range(3)
+            )
+            for member in range(1, 4)
+        }
+        archive_path = _write_tar(members, suffix='.tar', mode='w')
+
+        results = {}
+        for workers in (1, 2):
+            ListenBrainzEventLedger.objects.all().delete()
+            with override_settings(MLCORE_LISTENBRAINZ_MEMBER_WORKERS=workers):
+                results[workers] = import_listenbrainz_dump(
+                    archive_path,
+                    source_version=f'2026-03-22-members-{workers}',
+                    import_mode='incremental',
+                    batch_size=2,
+                    resume=False,
+                )
+
+        for field in ('source_row_count', 'imported_row_count', 'duplicate_row_count', 'malformed_row_count'):
+            self.assertEqual(getattr(results[1], field), getattr(results[2], field))
+        self.assertEqual(results[2].imported_row_count, 9)
+        checkpoint = SourceIngestionRun.objects.get(pk=results[2].run_id).metadata['last_committed_checkpoint']
+        self.assertEqual(checkpoint['origin'], 'listenbrainz/listens/2026/03/chunk-0003.listens')
+        self.assertEqual(checkpoint['line_number'], 3)
+        self.assertEqual(list(Path(archive_path).parent.glob('listenbrainz-members-*')), [])
+
+    @override_settings(MLCORE_LISTENBRAINZ_MEMBER_WORKERS=2, MLCORE_LISTENBRAINZ_PIPELINE_DEPTH=2)
+    def test_parallel_member_workers_force_only_the_archive_final_batch(self):
+        members = {
+            f'listenbrainz/listens/2026/03/chunk-{member:04d}.listens': '\n'.join(
+                json.dumps(
+                    _listen_payload(
+                        user_name=f'user-{member}',
+                        listened_at=1710000000 + index,
+                        recording_msid=f'last-{member}-{index}',
+                    )
+                )
+                for index in range(3)
+            )
+            for member in range(1, 4)
+        }
+        archive_path = _write_tar(members, suffix='.tar', mode='w')
+
+        from mlcore.ingestion import listenbrainz
+
+        pool_threads = []
+        real_start_pool = listenbrainz._start_member_worker_pool
+
+        def recording_start_pool(workers):
+            pool_threads.append(threading.current_thread())
+            return real_start_pool(workers)
+
+        with (
+            mock.patch('mlcore.ingestion.listenbrainz._start_member_worker_pool', side_effect=recording_start_pool),
+            mock.patch(
+                'mlcore.ingestion.listenbrainz._maybe_report_progress',
+                wraps=listenbrainz._maybe_report_progress,
+            ) as report_progress,
+        ):
+            result = import_listenbrainz_dump(
+                archive_path,
+                source_version='2026-03-22-members-last',
+                import_mode='incremental',
+                batch_size=2,
+                resume=False,
+            )
+
+        self.assertEqual(result.imported_row_count, 9)
+        self.assertEqual(pool_threads, [threading.main_thread()])
+        forced = [call.kwargs['last_origin'] for call in report_progress.call_args_list if call.kwargs['force']]
+        self.assertEqual(forced, ['listenbrainz/listens/2026/03/chunk-0003.listens'])
+
+    @override_settings(MLCORE_LISTENBRAINZ_MEMBER_WORKERS=2)
+    def test_parallel_member_workers_flush_held_batch_before_malformed_limit(self):
+        archive_path = _write_tar(
+            {
+                'listenbrainz/listens/2026/03/chunk-0001.listens': '\n'.join(
+                    json.dumps(_listen_payload(user_name='alice', listened_at=1710000000 + index, recording_msid=f'held-{index}'))
+                    for index in range(3)
+                ),
+                'listenbrainz/listens/2026/03/chunk-0002.listens': '{"user_name": ',
+            },
+            suffix='.tar',
+            mode='w',
+        )
+
+        with self.assertRaisesMessage(ValueError, 'chunk-0002.listens:1: invalid JSON'):
+            import_listenbrainz_dump(archive_path, source_version='2026-03-22-held', import_mode='incremental', batch_size=2)
+
+        checkpoint = SourceIngestionRun.objects.get(status='failed').metadata['last_committed_checkpoint']
+        self.assertEqual(checkpoint['origin'], 'listenbrainz/listens/2026/03/chunk-0001.listens')
+        self.assertEqual(checkpoint['line_number'], 3)
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 3)
+
+    @override_settings(MLCORE_LISTENBRAINZ_MEMBER_WORKERS=2)
+    def test_parallel_member_workers_resume_and_enforce_malformed_limit_in_order(self):
+        archive_path = _write_tar(
+            {
+                'listenbrainz/listens/2026/03/chunk-0001.listens': '\n'.join([
+                    json.dumps(_listen_payload(user_name='alice', listened_at=1710000000, recording_msid='par-1')),
+                    json.dumps(_listen_payload(user_name='alice', listened_at=1710000001, recording_msid='par-2')),
+                ]),
+                'listenbrainz/listens/2026/03/chunk-0002.listens': '\n'.join([
+                    json.dumps(_listen_payload(user_name='bob', listened_at=1710000002, recording_msid='par-3')),
+                    '{"user_name": ',
+                ]),
+            },
+            suffix='.tar',
+            mode='w',
+        )
+
+        with self.assertRaisesMessage(ValueError, 'chunk-0002.listens:2: invalid JSON'):
+            import_listenbrainz_dump(archive_path, source_version='2026-03-22-par', import_mode='incremental', batch_size=2)
+        failed_run = SourceIngestionRun.objects.get(status='failed')
+        self.assertEqual(failed_run.metadata['last_committed_checkpoint']['origin'], 'listenbrainz/listens/2026/03/chunk-0001.listens')
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 2)
+
+        with override_settings(MLCORE_LISTENBRAINZ_MAX_MALFORMED_ROWS=1):
+            resumed = import_listenbrainz_dump(archive_path, source_version='2026-03-22-par', import_mode='incremental', batch_size=2)
+
+        self.assertEqual(resumed.status, 'succeeded')
+        self.assertEqual(resumed.source_row_count, 3)
+        self.assertEqual(resumed.imported_row_count, 3)
+        self.assertEqual(resumed.malformed_row_count, 1)
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 3)
+
+    def test_resume_seeks_to_recorded_member_and_line_offsets(self):
+        first_member = 'listenbrainz/listens/2026/03/chunk-0001.listens'
+        second_member = 'listenbrainz/listens/2026/03/chunk-0002.listens'
+        archive_path = _write_tar(
+            {
+                first_member: json.dumps(
+                    _listen_payload(user_name='alice', listened_at=1710000000, recording_msid='seek-msid-1')
+                ),
+                second_member: '\n'.join(
+                    json.dumps(
+                        _listen_payload(user_name='bob', listened_at=1710000000 + index, recording_msid=f'seek-msid-{index}')
+                    )
+                    for index in range(2, 5)
+                ),
+            },
+            suffix='.tar',
+            mode='w',
+        )
+        original_flush_batch = import_listenbrainz_dump.__globals__['_flush_batch']
+        flush_calls = {'count': 0}
+
+        def flaky_flush_batch(*args, **kwargs):
+            flush_calls['count'] += 1
+            result = original_flush_batch(*args, **kwargs)
+            if flush_calls['count'] == 2:
+                raise RuntimeError('simulated worker crash inside second member')
+            return result
+
+        with mock.patch('mlcore.ingestion.listenbrainz._flush_batch', side_effect=flaky_flush_batch):
+            with self.assertRaisesMessage(RuntimeError, 'simulated worker crash'):
+                import_listenbrainz_dump(
+                    archive_path,
+                    source_version='2026-03-22-seek',
+                    import_mode='full',
+                    batch_size=1,
+                )
+
+        checkpoint = SourceIngestionRun.objects.get(status='failed').metadata['last_committed_checkpoint']
+        self.assertEqual(checkpoint['origin'], second_member)
+        self.assertEqual(checkpoint['line_number'], 1)
+        self.assertEqual(checkpoint['line_offset'], 0)
+        self.assertGreater(checkpoint['member_offset'], 0)
+
+        with tarfile.open(archive_path) as archive:
+            self.assertEqual(archive.getmember(second_member).offset, checkpoint['member_offset'])
+
+        resumed = import_listenbrainz_dump(
+            archive_path,
+            source_version='2026-03-22-seek',
+            import_mode='full',
+            batch_size=1,
+        )
+
+        self.assertEqual(resumed.status, 'succeeded')
+        self.assertEqual(resumed.imported_row_count, 4)
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 4)
+
+    def test_plain_dump_resume_seeks_to_line_offset(self):
+        dump_path = Path(tempfile.mkdtemp()) / 'listens.listens'
+        lines = [
+            json.dumps(_listen_payload(user_name='alice', listened_at=1710000000 + index, recording_msid=f'plain-{index}'))
+            for index in range(4)
+        ]
+        dump_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        cursor = PayloadCursor()
+        offsets = {}
+        for _, _, _, line_number, _ in _iter_listen_payloads(dump_path, cursor=cursor):
+            offsets[line_number] = cursor.line_offset
+        self.assertEqual(offsets[3], sum(len(line) + 1 for line in lines[:2]))
+
+        checkpoint = ResumeCheckpoint(
+            origin=dump_path.name,
+            line_number=3,
+            entry_index=1,
+            source_row_count=3,
+            imported_row_count=3,
+            duplicate_row_count=0,
+            canonicalized_row_count=3,
+            unresolved_row_count=0,
+            malformed_row_count=0,
+            line_offset=offsets[3],
+        )
+        # Overwrite the lines before the checkpoint so a re-read would fail.
+        with dump_path.open('r+b') as handle:
+            handle.write(b'{' * offsets[3])
+
+        resumed = list(_iter_listen_payloads(dump_path, resume_after=checkpoint, cursor=cursor))
+
+        self.assertEqual([(error, line_number) for _, error, _, line_number, _ in resumed], [(None, 4)])
+        self.assertEqual(resumed[0][0]['track_metadata']['recording_msid'], 'plain-3')
+        self.assertEqual(cursor.line_offset, offsets[4])
+
     def test_resume_skips_newer_failed_run_without_checkpoint(self):
         archive_path = _write_tar({
             'listenbrainz/listens/2026/03/chunk-0001.listens': '\n'.join([
@@ -417,6 +703,105 @@ class ListenBrainzImportTests(TestCase):
         self.assertEqual(str(resumed_run.metadata['resumed_from_run_id']), str(checkpointed_run.pk))
         self.assertEqual(resumed.imported_row_count, 2)
 
+    def test_track_resolver_resolves_batch_with_set_queries_and_caches_misses(self):
+        linked_track = create_track(
+            name='Linked Track',
+            album=self.track.album,
+            track_number=2,
+            duration_ms=123000,
+        )
+        TrackExternalIdentifier.objects.create(track=linked_track, source='spotify', external_id='spotify-linked')
+        spotify_track = create_track(
+            name='Spotify Column Track',
+            album=self.track.album,
+            track_number=3,
+            duration_ms=123000,
+            spotify_id='spotify-column',
+        )
+        candidates = [
+            {'recording_mbid': str(self.track.mbid), 'spotify_id': 'spotify-linked'},
+            {'recording_mbid': str(uuid.uuid4())},
+            {'recording_mbid': 'not-a-uuid'},
+            {'spotify_id': 'spotify-linked'},
+            {'spotify_id': 'spotify-column'},
+            {'spotify_id': 'spotify-missing'},
+            {'recording_msid': 'msid-only'},
+        ]
+        resolver = _build_track_resolver(maxsize=100)
+
+        with self.assertNumQueries(3):
+            resolved = resolver.resolve_many(candidates)
+
+        self.assertEqual(
+            resolved,
+            [self.track.juke_id, None, None, linked_track.juke_id, spotify_track.juke_id, None, None],
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.resolve_many(candidates), resolved)
+
+    def test_track_resolver_evicts_least_recently_used_entries(self):
+        resolver = _build_track_resolver(maxsize=2)
+        resolver.resolve_many([{'spotify_id': 'a'}, {'spotify_id': 'b'}])
+        resolver.resolve_many([{'spotify_id': 'a'}, {'spotify_id': 'c'}])
+
+        self.assertEqual(list(resolver.by_spotify), ['a', 'c'])
+        with self.assertNumQueries(2):
+            resolver.resolve_many([{'spotify_id': 'b'}])
+
+    def test_batches_merge_session_tracks_and_count_ledger_conflicts_as_duplicates(self):
+        rows = [
+            _listen_payload(user_name='alice', listened_at=1710000060, recording_mbid=self.track.mbid),
+            _listen_payload(user_name='alice', listened_at=1710000000, recording_mbid=self.track.mbid),
+            _listen_payload(user_name='alice', listened_at=1710000120, recording_mbid=self.track.mbid),
+        ]
+        first_path = _write_tar({'listenbrainz/listens/a.listens': '\n'.join(json.dumps(row) for row in rows[:2])})
+        second_path = _write_tar({'listenbrainz/listens/b.listens': '\n'.join(json.dumps(row) for row in rows[1:])})
+
+        first = import_listenbrainz_dump(first_path, source_version='2026-03-22-batch-a', batch_size=1)
+        second = import_listenbrainz_dump(second_path, source_version='2026-03-22-batch-b', batch_size=1)
+
+        self.assertEqual((first.imported_row_count, first.duplicate_row_count), (2, 0))
+        self.assertEqual((second.imported_row_count, second.duplicate_row_count), (1, 1))
+        self.assertEqual(ListenBrainzEventLedger.objects.count(), 3)
+        session_track = ListenBrainzSessionTrack.objects.get()
+        self.assertEqual(session_track.play_count, 3)
+        self.assertEqual(session_track.first_played_at, datetime.datetime.fromtimestamp(1710000000, tz=datetime.UTC))
+        self.assertEqual(session_track.last_played_at, datetime.datetime.fromtimestamp(1710000120, tz=datetime.UTC))
+        self.assertEqual(session_track.track_id, self.track.juke_id)
+        self.assertEqual(str(session_track.import_run_id), str(first.run_id))
+
+    def test_copy_writer_resolves_only_rows_the_ledger_inserts(self):
+        rows = [
+            _listen_payload(user_name='alice', listened_at=1710000000, recording_mbid=self.track.mbid),
+            _listen_payload(user_name='alice', listened_at=1710000060, recording_mbid=self.track.mbid),
+            _listen_payload(user_name='alice', listened_at=1710000120, recording_mbid=self.track.mbid),
+        ]
+        first_path = _write_tar({'listenbrainz/listens/a.listens': json.dumps(rows[0])})
+        second_path = _write_tar({'listenbrainz/listens/b.listens': '\n'.join(json.dumps(row) for row in rows)})
+        import_listenbrainz_dump(first_path, source_version='2026-03-22-resolve-a')
+
+        from mlcore.ingestion import listenbrainz
+
+        resolved_batches: list[list[int]] = []
+        real_resolve = listenbrainz._resolve_listen_batch
+
+        def recording_resolve(parsed_listens, **kwargs):
+            resolved_batches.append([int(parsed.played_at.timestamp()) for parsed in parsed_listens])
+            return real_resolve(parsed_listens, **kwargs)
+
+        # The test transaction never commits, so the ON COMMIT DELETE ROWS
+        # staging table would still hold earlier batches without the TRUNCATE.
+        with mock.patch('mlcore.ingestion.listenbrainz._resolve_listen_batch', side_effect=recording_resolve):
+            second = import_listenbrainz_dump(second_path, source_version='2026-03-22-resolve-b', batch_size=1)
+
+        self.assertEqual((second.imported_row_count, second.duplicate_row_count), (2, 1))
+        self.assertEqual(resolved_batches, [[1710000060], [1710000120]])
+        self.assertEqual(ListenBrainzEventLedger.objects.filter(resolution_state=1).count(), 3)
+        self.assertEqual(ListenBrainzSessionTrack.objects.get().play_count, 3)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {listenbrainz.LISTENBRAINZ_LEDGER_BATCH_TEMP_TABLE}')
+            self.assertEqual(cursor.fetchone()[0], 1)
+
     def test_session_track_keeps_first_import_run_and_survives_run_deletion(self):
         first_archive_path = _write_tar({
             'listenbrainz/listens/2026/03/chunk-0001.listens': json.dumps(
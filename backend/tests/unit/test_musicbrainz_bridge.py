@@ -4,20 +4,22 @@ import json
 import tarfile
 import tempfile
 from pathlib import Path
+from unittest import mock
 
 from django.core.management import call_command
 from django.db import connection
-from django.test import TestCase
+from django.test import TransactionTestCase
 
 from mlcore.models import (
     MusicBrainzRecordingISRC,
     MusicBrainzRecordingURL,
     SourceIngestionRun,
 )
+from mlcore.services import musicbrainz_bridge
 from mlcore.services.musicbrainz_bridge import classify_provider, import_musicbrainz_bridge
 
 
-class MusicBrainzBridgeTests(TestCase):
+class MusicBrainzBridgeTests(TransactionTestCase):
     source_version = '20260613-002047'
     recording_mbid = '12345678-1234-4234-9234-123456789abc'
 
@@ -101,6 +103,43 @@ class MusicBrainzBridgeTests(TestCase):
         self.assertEqual(run.malformed_row_count, 1)
         self.assertEqual(run.metadata['tablespace'], 'juke_mlcore_cold')
 
+    def test_failed_member_is_the_only_one_reloaded_on_resume(self):
+        load_member = musicbrainz_bridge._load_member
+        loaded = []
+
+        def fail_urls(member, chunks):
+            if member.name == 'url':
+                raise RuntimeError('url load failed')
+            return load_member(member, chunks)
+
+        def record_loads(member, chunks):
+            loaded.append(member.name)
+            return load_member(member, chunks)
+
+        with mock.patch.object(musicbrainz_bridge, '_load_member', side_effect=fail_urls):
+            with self.assertRaisesRegex(RuntimeError, 'url load failed'):
+                import_musicbrainz_bridge(self.manifest_path)
+        failed = SourceIngestionRun.objects.get(status='failed')
+        self.assertNotIn('url', failed.metadata['member_checkpoints'])
+        self.assertEqual(failed.metadata['member_checkpoints']['recording']['staged_rows'], 2)
+
+        with mock.patch.object(musicbrainz_bridge, '_load_member', side_effect=record_loads):
+            resumed = import_musicbrainz_bridge(self.manifest_path)
+
+        self.assertEqual(loaded, ['url'])
+        self.assertEqual(resumed.recording_rows, 2)
+        self.assertEqual(resumed.malformed_isrc_rows, 1)
+        self.assertEqual(resumed.inserted_isrc_rows, 2)
+        self.assertEqual(resumed.inserted_url_rows, 2)
+        run = SourceIngestionRun.objects.get(pk=resumed.run_id)
+        self.assertEqual(run.metadata['resumed_from_run_id'], str(failed.pk))
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT conname FROM pg_constraint
+                WHERE conname IN ('mlcore_mb_recording_stage_pkey', 'mlcore_mb_url_stage_pkey')
+            """)
+            self.assertEqual(len(cursor.fetchall()), 2)
+
     def test_checksum_failure_records_no_run(self):
         manifest = json.loads(self.manifest_path.read_text())
         manifest['artifacts'][0]['sha256'] = '0' * 64
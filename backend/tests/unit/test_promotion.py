@@ -7,10 +7,11 @@ full evaluator, so each gate's pass/fail boundary can be hit precisely.
 from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 
-from mlcore.models import ModelEvaluation, ModelPromotion
+from mlcore.models import ModelEvaluation, ModelPromotion, SequentialGateDecision
 from mlcore.services.evaluation import (
     METRIC_COLD_RECALL,
     METRIC_COVERAGE,
+    METRIC_LATENCY_P95,
     METRIC_NDCG,
     METRIC_RECALL,
 )
@@ -23,6 +24,7 @@ from mlcore.services.promotion import (
     gates_passed,
     reject_promotion,
     request_promotion,
+    sequential_promotion_gates,
 )
 
 User = get_user_model()
@@ -31,6 +33,15 @@ HASH_A = 'a' * 64
 HASH_B = 'b' * 64
 
 
+def _seed_decision(gate_name, metric, *, passed, trials_scored, dataset_n_trials=400, dataset_hash=HASH_A):
+    return SequentialGateDecision.objects.create(
+        candidate_label='cand', baseline_label='base', dataset_hash=dataset_hash,
+        gate_name=gate_name, metric_name=metric, threshold=0.05, passed=passed,
+        margin=0.1, margin_lower=0.02, margin_upper=0.18, critical_z=2.9, confidence_level=0.95,
+        n_trials=trials_scored, trials_scored=trials_scored, dataset_n_trials=dataset_n_trials,
+    )
+
+
 def _seed(label, dataset_hash=HASH_A, *, recall, ndcg, coverage, cold):
     """Write all four metrics for a ranker label on one dataset."""
     for name, val in [(METRIC_RECALL, recall), (METRIC_NDCG, ndcg),
@@ -186,7 +197,92 @@ class GateCheckTests(TestCase):
         c = GateCheck('x', True, 0.5, 0.4, 0.05, 'msg')
         d = c.to_dict()
         self.assertEqual(d, {'name': 'x', 'passed': True, 'candidate_value': 0.5,
-                             'baseline_value': 0.4, 'threshold': 0.05, 'message': 'msg'})
+                             'baseline_value': 0.4, 'threshold': 0.05, 'message': 'msg',
+                             'candidate_interval': None, 'baseline_interval': None})
+
+    # --- serving latency gate ---
+
+    def _seed_latency(self, label, p95):
+        ModelEvaluation.objects.create(
+            candidate_label=label, metric_name=METRIC_LATENCY_P95, metric_value=p95, dataset_hash=HASH_A,
+        )
+
+    def test_latency_gate_absent_without_engine_evaluations(self):
+        _seed('base', recall=0.40, ndcg=0.30, coverage=0.10, cold=0.20)
+        _seed('cand', recall=0.42, ndcg=0.318, coverage=0.35, cold=0.19)
+        names = {c.name for c in check_promotion_gates('cand', 'base', HASH_A)}
+        self.assertNotIn('latency_p95_regression', names)
+
+    @override_settings(JUKE_PROMOTION_GATE_LATENCY_P95_MAX_INCREASE=0.10)
+    def test_latency_regression_blocks(self):
+        _seed('base', recall=0.40, ndcg=0.30, coverage=0.10, cold=0.20)
+        _seed('cand', recall=0.42, ndcg=0.318, coverage=0.35, cold=0.19)
+        self._seed_latency('base', 20.0)
+        self._seed_latency('cand', 25.0)  # +25%
+        checks = check_promotion_gates('cand', 'base', HASH_A)
+        c = self._check_by_name(checks, 'latency_p95_regression')
+        self.assertFalse(c.passed)
+        self.assertFalse(gates_passed(checks))
+
+    @override_settings(JUKE_PROMOTION_GATE_LATENCY_P95_MAX_INCREASE=0.10)
+    def test_latency_within_budget_passes(self):
+        _seed('base', recall=0.40, ndcg=0.30, coverage=0.10, cold=0.20)
+        _seed('cand', recall=0.42, ndcg=0.318, coverage=0.35, cold=0.19)
+        self._seed_latency('base', 20.0)
+        self._seed_latency('cand', 21.0)  # +5%
+        self.assertTrue(self._check_by_name(check_promotion_gates('cand', 'base', HASH_A), 'latency_p95_regression').passed)
+
+    def test_latency_missing_on_one_side_fails(self):
+        _seed('base', recall=0.40, ndcg=0.30, coverage=0.10, cold=0.20)
+        _seed('cand', recall=0.42, ndcg=0.318, coverage=0.35, cold=0.19)
+        self._seed_latency('cand', 21.0)
+        c = self._check_by_name(check_promotion_gates('cand', 'base', HASH_A), 'latency_p95_regression')
+        self.assertFalse(c.passed)
+        self.assertIn("'base'", c.message)
+
+    def test_lift_gate_reports_stored_intervals(self):
+        _seed('base', recall=0.50, ndcg=0.50, coverage=0.50, cold=0.30)
+        _seed('cand', recall=0.60, ndcg=0.60, coverage=0.50, cold=0.30)
+        ModelEvaluation.objects.filter(candidate_label='base', metric_name=METRIC_NDCG).update(ci_lower=0.45, ci_upper=0.55)
+        ModelEvaluation.objects.filter(candidate_label='cand', metric_name=METRIC_NDCG).update(ci_lower=0.56, ci_upper=0.64)
+        c = self._check_by_name(check_promotion_gates('cand', 'base', HASH_A), 'ndcg_lift')
+        self.assertEqual(c.candidate_interval, [0.56, 0.64])
+        self.assertEqual(c.baseline_interval, [0.45, 0.55])
+        self.assertIn('ci cand=[0.5600, 0.6400]', c.message)
+        self.assertNotIn('overlapping', c.message)
+
+    def test_sequential_decision_overrides_prefix_point_estimates(self):
+        # The prefix's point estimates alone would fail ndcg_lift.
+        _seed('base', recall=0.50, ndcg=0.50, coverage=0.50, cold=0.30)
+        _seed('cand', recall=0.60, ndcg=0.51, coverage=0.50, cold=0.30)
+        _seed_decision('ndcg_lift', METRIC_NDCG, passed=True, trials_scored=100)
+        c = self._check_by_name(check_promotion_gates('cand', 'base', HASH_A), 'ndcg_lift')
+        self.assertTrue(c.passed)
+        self.assertIn('sequential passed', c.message)
+        self.assertIn('after 100/400 trials', c.message)
+
+    def test_gate_undecided_on_a_prefix_fails(self):
+        _seed('base', recall=0.50, ndcg=0.50, coverage=0.50, cold=0.30)
+        _seed('cand', recall=0.60, ndcg=0.60, coverage=0.50, cold=0.30)
+        _seed_decision('cold_start_regression', METRIC_COLD_RECALL, passed=None, trials_scored=100)
+        c = self._check_by_name(check_promotion_gates('cand', 'base', HASH_A), 'cold_start_regression')
+        self.assertFalse(c.passed)
+        self.assertIn('undecided', c.message)
+
+    def test_gate_undecided_over_the_full_split_uses_point_estimates(self):
+        _seed('base', recall=0.50, ndcg=0.50, coverage=0.50, cold=0.30)
+        _seed('cand', recall=0.60, ndcg=0.60, coverage=0.50, cold=0.30)
+        _seed_decision('cold_start_regression', METRIC_COLD_RECALL, passed=None, trials_scored=400)
+        c = self._check_by_name(check_promotion_gates('cand', 'base', HASH_A), 'cold_start_regression')
+        self.assertTrue(c.passed)
+        self.assertNotIn('sequential', c.message)
+
+    def test_sequential_gates_mirror_paired_gate_thresholds(self):
+        gates = {g.name: g for g in sequential_promotion_gates()}
+        self.assertEqual(set(gates), {'ndcg_lift', 'recall_lift', 'cold_start_regression'})
+        self.assertEqual((gates['ndcg_lift'].metric, gates['ndcg_lift'].threshold), (METRIC_NDCG, 0.05))
+        self.assertEqual((gates['cold_start_regression'].metric, gates['cold_start_regression'].threshold),
+                         (METRIC_COLD_RECALL, 0.02))
 
 
 @override_settings(
@@ -1,17 +1,31 @@
 import tempfile
+import threading
+import time
 import uuid
 from unittest import mock
 
 import requests
-from django.test import SimpleTestCase, TestCase, override_settings
-
-from mlcore.models import CanonicalItem, CanonicalItemAlias, ProviderHydrationItem, ProviderHydrationRun
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from mlcore.models import (
+    CanonicalItem,
+    CanonicalItemAlias,
+    ProviderHydrationItem,
+    ProviderHydrationRun,
+    ProviderRateLimitBucket,
+)
+from mlcore.services import provider_hydration
 from mlcore.services.provider_hydration import (
+    RATE_RECOVERY_GRANTS,
+    HydrationResult,
     ProviderHydrationError,
-    RequestPacer,
+    ProviderTokenBucket,
     SpotifyCandidate,
     SpotifyClient,
+    apply_hydration_results,
     claim_hydration_item,
+    claim_hydration_items,
+    drain_spotify_hydration_queue,
     hydrate_spotify_item,
     normalize_isrc,
     write_hydration_metrics,
@@ -87,15 +101,57 @@ class SpotifyClientTests(SimpleTestCase):
         }
 
 
-class RequestPacerTests(SimpleTestCase):
-    def test_rate_limit_halves_rate_and_honors_retry_after(self):
-        clock = mock.Mock(side_effect=[10.0])
-        pacer = RequestPacer(4, sleep=mock.Mock(), monotonic=clock, jitter=lambda _a, _b: 0.5)
+class ProviderTokenBucketTests(TestCase):
+    def test_burst_is_granted_then_callers_wait_for_refill(self):
+        bucket = ProviderTokenBucket('spotify', rps=2).ensure()
+
+        self.assertEqual([bucket.try_acquire()[0] for _ in range(2)], [True, True])
+        granted, wait_seconds = bucket.try_acquire()
+
+        self.assertFalse(granted)
+        self.assertGreater(wait_seconds, 0.3)
+        self.assertLessEqual(wait_seconds, 0.5)
+
+    def test_rate_limit_halves_rate_and_blocks_every_caller_for_retry_after(self):
+        bucket = ProviderTokenBucket('spotify', rps=4, jitter=lambda _low, _high: 0.5).ensure()
+
+        bucket.rate_limited(20)
+        granted, wait_seconds = ProviderTokenBucket('spotify', rps=4).try_acquire()
+
+        self.assertFalse(granted)
+        self.assertGreaterEqual(wait_seconds, 20)
+        self.assertEqual(bucket.current_rps, 2)
+        self.assertEqual(ProviderRateLimitBucket.objects.get(provider='spotify').rate_limited_count, 1)
+
+    def test_rate_recovers_after_clean_grants_up_to_configured(self):
+        bucket = ProviderTokenBucket('spotify', rps=4).ensure()
+        ProviderRateLimitBucket.objects.filter(provider='spotify').update(
+            current_rps=3.95, grants_since_limit=RATE_RECOVERY_GRANTS - 1,
+        )
+
+        self.assertTrue(bucket.try_acquire()[0])
+
+        state = ProviderRateLimitBucket.objects.get(provider='spotify')
+        self.assertEqual(state.current_rps, 4)
+        self.assertEqual(state.grants_since_limit, 0)
+
+    def test_ensure_leaves_an_existing_bucket_at_its_rate(self):
+        ProviderTokenBucket('spotify', rps=4).ensure()
+
+        bucket = ProviderTokenBucket('spotify', rps=10).ensure()
 
-        pacer.rate_limited(20)
+        state = ProviderRateLimitBucket.objects.get(provider='spotify')
+        self.assertEqual((state.configured_rps, state.current_rps, state.capacity), (4, 4, 4))
+        self.assertEqual((bucket.configured_rps, bucket.capacity), (4, 4))
 
-        self.assertEqual(pacer.current_rps, 2)
-        self.assertEqual(pacer._next_request_at, 30.5)
+    def test_reconfigure_repoints_the_shared_bucket(self):
+        ProviderTokenBucket('spotify', rps=4).ensure()
+
+        ProviderTokenBucket('spotify', rps=4).ensure().reconfigure(2)
+
+        state = ProviderRateLimitBucket.objects.get(provider='spotify')
+        self.assertEqual((state.configured_rps, state.current_rps, state.capacity), (2, 2, 2))
+        self.assertLessEqual(state.tokens, 2)
 
     def test_normalize_isrc_removes_punctuation(self):
         self.assertEqual(normalize_isrc('us-rc1-76-07839'), 'USRC17607839')
@@ -167,6 +223,66 @@ class HydrationStateTests(TestCase):
         self.assertEqual(claimed.id, self.item.id)
         self.assertEqual(claimed.leased_by, 'replacement')
 
+    def test_batch_claim_leases_items_in_priority_order(self):
+        urgent = ProviderHydrationItem.objects.create(
+            canonical_item=self.canonical, provider='spotify', identifier_type='isrc', identifier='GBAYE0601696', priority=1,
+        )
+
+        claimed = claim_hydration_items(run=self.run, worker_id='worker', limit=5)
+
+        self.assertEqual([item.id for item in claimed], [urgent.id, self.item.id])
+        self.assertEqual(
+            set(ProviderHydrationItem.objects.values_list('status', 'leased_by', 'last_run')),
+            {('running', 'worker', self.run.id)},
+        )
+        self.assertEqual(claim_hydration_items(run=self.run, worker_id='other', limit=5), [])
+
+    def test_bulk_results_give_a_shared_track_to_the_first_item(self):
+        other = CanonicalItem.objects.create(
+            id=uuid.uuid4(), item_type='recording_mbid', canonical_key=f'recording_mbid:{uuid.uuid4()}',
+        )
+        second = ProviderHydrationItem.objects.create(
+            canonical_item=other, provider='spotify', identifier_type='isrc', identifier='GBAYE0601696',
+        )
+
+        outcomes = apply_hydration_results(self.run, [
+            HydrationResult(self.item, candidates=[self._candidate('spotify-id')]),
+            HydrationResult(second, candidates=[self._candidate('spotify-id')]),
+        ])
+
+        self.assertEqual(outcomes, {self.item.id: 'matched', second.id: 'ambiguous'})
+        self.assertEqual(CanonicalItemAlias.objects.get(source='spotify').canonical_item, self.canonical)
+        second.refresh_from_db()
+        self.assertEqual(second.evidence['conflict_canonical_item_id'], str(self.canonical.id))
+        self.run.refresh_from_db()
+        self.assertEqual((self.run.attempted_count, self.run.matched_count, self.run.ambiguous_count), (2, 1, 1))
+
+    def test_track_claimed_by_another_worker_after_the_owner_read_is_quarantined(self):
+        other = CanonicalItem.objects.create(
+            id=uuid.uuid4(), item_type='recording_mbid', canonical_key=f'recording_mbid:{uuid.uuid4()}',
+        )
+        CanonicalItemAlias.objects.create(
+            canonical_item=other, source='spotify', resource_type='track', source_id='spotify-id',
+        )
+        real_owners = provider_hydration._spotify_track_owners
+
+        def stale_first_read(track_ids, *, lock=False):
+            # The other worker's alias lands between the unlocked read and the insert.
+            return real_owners(track_ids, lock=lock) if lock else {}
+
+        with mock.patch('mlcore.services.provider_hydration._spotify_track_owners', side_effect=stale_first_read):
+            outcomes = apply_hydration_results(self.run, [
+                HydrationResult(self.item, candidates=[self._candidate('spotify-id')]),
+            ])
+
+        self.assertEqual(outcomes, {self.item.id: 'ambiguous'})
+        self.assertEqual(CanonicalItemAlias.objects.get(source='spotify').canonical_item, other)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.status, 'ambiguous')
+        self.assertEqual(self.item.evidence['conflict_canonical_item_id'], str(other.id))
+        self.run.refresh_from_db()
+        self.assertEqual((self.run.matched_count, self.run.ambiguous_count), (0, 1))
+
     def test_metrics_include_backlog_and_eta(self):
         self.run.attempted_count = 10
         self.run.matched_count = 7
@@ -189,3 +305,135 @@ class HydrationStateTests(TestCase):
             duration_ms=1234,
             popularity=50,
         )
+
+
+class FakeSearchClient:
+    def __init__(self, responses):
+        self.responses = responses
+
+    def search_isrc(self, isrc):
+        response = self.responses[isrc]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@override_settings(SPOTIFY_HYDRATION_MAX_ATTEMPTS=3)
+class HydrationDrainTests(TransactionTestCase):
+    def test_concurrent_lanes_drain_queue_and_share_rate_limits(self):
+        responses = {
+            'USRC17607839': [HydrationStateTests._candidate('spotify-id')],
+            'GBAYE0601696': [],
+            'USUM71703861': ProviderHydrationError('busy', http_status=503),
+            'GBUM71029604': ProviderHydrationError('slow down', http_status=429, retry_after=1),
+        }
+        items = {}
+        for isrc in responses:
+            canonical = CanonicalItem.objects.create(
+                id=uuid.uuid4(), item_type='recording_mbid', canonical_key=f'recording_mbid:{uuid.uuid4()}',
+            )
+            items[isrc] = ProviderHydrationItem.objects.create(
+                canonical_item=canonical, provider='spotify', identifier_type='isrc', identifier=isrc,
+            )
+        run = ProviderHydrationRun.objects.create(provider='spotify')
+        limiter = ProviderTokenBucket('spotify', rps=1000, jitter=lambda low, _high: low).ensure()
+        progress = mock.Mock()
+
+        outcomes = drain_spotify_hydration_queue(
+            run=run,
+            client=FakeSearchClient(responses),
+            limiter=limiter,
+            worker_id='worker',
+            concurrency=3,
+            claim_size=2,
+            progress_callback=progress,
+        )
+
+        self.assertEqual(
+            {isrc: outcomes[item.id] for isrc, item in items.items()},
+            {'USRC17607839': 'matched', 'GBAYE0601696': 'no_match', 'USUM71703861': 'retry', 'GBUM71029604': 'retry'},
+        )
+        self.assertEqual(
+            CanonicalItemAlias.objects.get(source='spotify').canonical_item_id,
+            items['USRC17607839'].canonical_item_id,
+        )
+        self.assertFalse(ProviderHydrationItem.objects.filter(status='running').exists())
+        run.refresh_from_db()
+        self.assertEqual((run.attempted_count, run.rate_limited_count, run.retry_count), (4, 1, 2))
+        self.assertTrue(progress.called)
+        bucket = ProviderRateLimitBucket.objects.get(provider='spotify')
+        self.assertEqual(bucket.rate_limited_count, 1)
+        self.assertEqual(bucket.current_rps, 500)
+        self.assertIsNotNone(bucket.blocked_until)
+
+    def test_simultaneous_429s_on_every_lane_halve_the_rate_once(self):
+        isrcs = ['USRC17607839', 'GBAYE0601696', 'USUM71703861', 'GBUM71029604']
+        for isrc in isrcs:
+            canonical = CanonicalItem.objects.create(
+                id=uuid.uuid4(), item_type='recording_mbid', canonical_key=f'recording_mbid:{uuid.uuid4()}',
+            )
+            ProviderHydrationItem.objects.create(
+                canonical_item=canonical, provider='spotify', identifier_type='isrc', identifier=isrc,
+            )
+        run = ProviderHydrationRun.objects.create(provider='spotify')
+        limiter = ProviderTokenBucket('spotify', rps=1000, jitter=lambda low, _high: low).ensure()
+        # Every lane has its search in flight before any of them sees the 429.
+        barrier = threading.Barrier(len(isrcs), timeout=10)
+
+        class SimultaneousLimitClient:
+            def search_isrc(self, isrc):
+                barrier.wait()
+                raise ProviderHydrationError('slow down', http_status=429, retry_after=1)
+
+        outcomes = drain_spotify_hydration_queue(
+            run=run,
+            client=SimultaneousLimitClient(),
+            limiter=limiter,
+            worker_id='worker',
+            concurrency=len(isrcs),
+            claim_size=len(isrcs),
+        )
+
+        self.assertEqual(set(outcomes.values()), {'retry'})
+        bucket = ProviderRateLimitBucket.objects.get(provider='spotify')
+        self.assertEqual(bucket.rate_limited_count, len(isrcs))
+        self.assertEqual(bucket.current_rps, 500)
+
+    def test_leases_are_renewed_while_the_provider_blocks_the_lanes(self):
+        isrcs = ['USRC17607839', 'GBAYE0601696']
+        for isrc in isrcs:
+            canonical = CanonicalItem.objects.create(
+                id=uuid.uuid4(), item_type='recording_mbid', canonical_key=f'recording_mbid:{uuid.uuid4()}',
+            )
+            ProviderHydrationItem.objects.create(
+                canonical_item=canonical, provider='spotify', identifier_type='isrc', identifier=isrc,
+            )
+        run = ProviderHydrationRun.objects.create(provider='spotify')
+        limiter = ProviderTokenBucket('spotify', rps=1000, jitter=lambda low, _high: low).ensure()
+        renewed = []
+        real_renew = provider_hydration.renew_hydration_leases
+
+        def recording_renew(*, worker_id, item_ids, lease_seconds):
+            renewed.append(set(item_ids))
+            return real_renew(worker_id=worker_id, item_ids=item_ids, lease_seconds=lease_seconds)
+
+        class SlowClient:
+            def search_isrc(self, isrc):
+                # Long enough for the drain thread to wake up once with nothing to write.
+                time.sleep(1.2)
+                return []
+
+        with mock.patch('mlcore.services.provider_hydration.renew_hydration_leases', side_effect=recording_renew):
+            outcomes = drain_spotify_hydration_queue(
+                run=run,
+                client=SlowClient(),
+                limiter=limiter,
+                worker_id='worker',
+                concurrency=1,
+                claim_size=2,
+                lease_seconds=3,
+            )
+
+        self.assertEqual(set(outcomes.values()), {'no_match'})
+        item_ids = set(ProviderHydrationItem.objects.values_list('id', flat=True))
+        self.assertIn(item_ids, renewed)